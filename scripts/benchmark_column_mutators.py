@@ -0,0 +1,102 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the column type mutators of the engine specs that define them.
+
+Compares mutating every fetched row before building the result set with applying
+the mutators column-wise inside ``SupersetResultSet``.
+
+Usage: python scripts/benchmark_column_mutators.py --rows 100000 --columns 20
+"""
+import time
+from typing import Any
+
+import click
+
+from superset.db_engine_specs import load_engine_specs
+from superset.db_engine_specs.base import BaseEngineSpec
+from superset.result_set import SupersetResultSet
+
+
+def mutate_rows(
+    spec: type[BaseEngineSpec],
+    data: list[tuple[Any, ...]],
+    description: list[tuple[Any, ...]],
+) -> list[tuple[Any, ...]]:
+    """
+    Apply the mutators row by row, as ``fetch_data`` used to.
+    """
+    column_mutators = spec.get_column_mutators(description)
+    for row_idx, row in enumerate(data):
+        new_row = list(row)
+        for col_idx, func in column_mutators.items():
+            new_row[col_idx] = func(row[col_idx])
+        data[row_idx] = tuple(new_row)
+    return data
+
+
+@click.command()
+@click.option("--rows", default=100_000, help="Number of rows to fetch.")
+@click.option("--columns", default=20, help="Number of columns to fetch.")
+def main(rows: int, columns: int) -> None:
+    for spec in load_engine_specs():
+        if not spec.column_type_mutators:
+            continue
+
+        # use the first mutated type found in the engine spec type mappings, every
+        # other column is left as a plain string
+        native_type = next(
+            (
+                mapping[0].pattern.lstrip("^")
+                for mapping in spec.column_type_mappings
+                if type(mapping[1]) in spec.column_type_mutators
+            ),
+            None,
+        )
+        if native_type is None:
+            continue
+
+        description = [
+            (f"col{idx}", native_type if idx % 2 else "varchar")
+            for idx in range(columns)
+        ]
+        data = [tuple("1.5" for _ in range(columns)) for _ in range(rows)]
+        unmutated_spec = type(spec.__name__, (spec,), {"column_type_mutators": {}})
+
+        start = time.perf_counter()
+        SupersetResultSet(
+            mutate_rows(spec, list(data), description), description, unmutated_spec
+        )
+        row_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        SupersetResultSet(list(data), description, spec)
+        column_time = time.perf_counter() - start
+
+        print(
+            f"{spec.engine_name or spec.__name__}: row by row {row_time:.3f}s, "
+            f"column-wise {column_time:.3f}s ({row_time / column_time:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
@@ -0,0 +1,726 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the hot spots of the chart data path.
+
+The benchmarks run offline against generated birth names data, loaded into a scratch
+SQLite database for the end-to-end ones, and time the access checks of a scratch user
+granted access to many datasets. Their timings are written as JSON, and can
+be compared with the timings of another commit, e.g.
+
+    git checkout master
+    python scripts/benchmark_data_path.py --output master.json
+    git checkout my-branch
+    python scripts/benchmark_data_path.py --output my-branch.json --compare master.json
+
+The comparison lists the benchmarks slower than the baseline by more than the
+threshold, and exits with an error if there's any.
+
+Usage: python scripts/benchmark_data_path.py --rows 100000 --filter postprocessing
+"""
+from __future__ import annotations
+
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, TYPE_CHECKING
+from unittest import mock
+
+import click
+import numpy as np
+import pandas as pd
+import sqlparse
+from flask import current_app, g
+
+from superset import db
+from superset.charts.post_processing import apply_post_process
+from superset.common.chart_data import ChartDataResultFormat
+from superset.dataframe import df_to_records
+from superset.db_engine_specs.sqlite import SqliteEngineSpec
+from superset.extensions import cache_manager
+from superset.jinja_context import get_template_processor
+from superset.result_set import SupersetResultSet
+from superset.sql_parse import insert_rls, ParsedQuery
+from superset.utils import pandas_postprocessing as pp
+from superset.utils.core import (
+    PostProcessingBoxplotWhiskerType,
+    PostProcessingContributionOrientation,
+)
+from superset.utils.csv import df_to_escaped_csv
+from superset.utils.date_parser import get_since_until
+from tests.example_data.data_generator.birth_names.birth_names_generator import (
+    BirthNamesGenerator,
+)
+from tests.example_data.data_generator.string_generator_factory import (
+    StringGeneratorFactory,
+)
+
+if TYPE_CHECKING:
+    from flask_appbuilder.security.sqla.models import User
+
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.core import Database
+
+YEARS = 60
+
+Benchmarks = dict[str, Callable[[], Any]]
+
+
+def generate_data(rows: int) -> pd.DataFrame:
+    """
+    Generate birth names rows, with coordinates for the geography operators.
+    """
+    generator = BirthNamesGenerator(
+        StringGeneratorFactory.make_lowercase_based(3, 10),
+        start_year=1960,
+        years_amount=YEARS,
+        rows_per_year=max(rows // YEARS, 1),
+    )
+    df = pd.DataFrame(generator.generate())
+    df["latitude"] = np.random.uniform(-90, 90, len(df))
+    df["longitude"] = np.random.uniform(-180, 180, len(df))
+    return df
+
+
+def result_set_benchmarks(df: pd.DataFrame) -> Benchmarks:
+    data = list(df.itertuples(index=False, name=None))
+    description = [(column, None, None, None, None, None, None) for column in df]
+    # cells of varied types, as the JSON and CSV encodings handle them one by one
+    result_df = SupersetResultSet(data, description, SqliteEngineSpec).to_pandas_df()
+    return {
+        "result_set": lambda: SupersetResultSet(data, description, SqliteEngineSpec),
+        "df_to_records": lambda: df_to_records(result_df),
+        "df_to_escaped_csv": lambda: df_to_escaped_csv(result_df, index=False),
+    }
+
+
+def post_process_benchmarks(df: pd.DataFrame) -> Benchmarks:
+    aggregated = df.groupby(["state", "gender"], as_index=False)["num"].sum()
+    records = df_to_records(aggregated)
+
+    def post_process(form_data: dict[str, Any]) -> dict[str, Any]:
+        result = {
+            "queries": [{"result_format": ChartDataResultFormat.JSON, "data": records}]
+        }
+        return apply_post_process(result, form_data)
+
+    return {
+        "apply_post_process.pivot_table_v2": lambda: post_process(
+            {
+                "viz_type": "pivot_table_v2",
+                "groupbyRows": ["state"],
+                "groupbyColumns": ["gender"],
+                "metrics": ["num"],
+                "aggregateFunction": "Sum",
+                "rowTotals": True,
+                "colTotals": True,
+            }
+        ),
+        "apply_post_process.table": lambda: post_process(
+            {"viz_type": "table", "column_config": {"num": {"d3NumberFormat": ",d"}}}
+        ),
+    }
+
+
+def postprocessing_benchmarks(df: pd.DataFrame) -> Benchmarks:
+    # a time series per gender, as post-processed by the time series charts
+    series = df.groupby(["ds", "gender"])["num"].sum().unstack()
+    pivoted = pp.pivot(
+        df,
+        index=["ds"],
+        columns=["gender"],
+        aggregates={"num": {"operator": "sum"}},
+    )
+    geohashes = pp.geohash_encode(
+        df, geohash="geohash", longitude="longitude", latitude="latitude"
+    )
+    geodetic = df.assign(
+        geodetic=df["latitude"].astype(str) + ", " + df["longitude"].astype(str)
+    )
+
+    benchmarks: Benchmarks = {
+        "aggregate": lambda: pp.aggregate(
+            df, groupby=["state"], aggregates={"num": {"operator": "sum"}}
+        ),
+        "boxplot": lambda: pp.boxplot(
+            df,
+            groupby=["state"],
+            metrics=["num"],
+            whisker_type=PostProcessingBoxplotWhiskerType.TUKEY,
+        ),
+        "compare": lambda: pp.compare(
+            series,
+            source_columns=["boy"],
+            compare_columns=["girl"],
+            compare_type="difference",
+        ),
+        "contribution": lambda: pp.contribution(
+            series, orientation=PostProcessingContributionOrientation.ROW
+        ),
+        "cum": lambda: pp.cum(series, operator="sum", columns={"boy": "boy"}),
+        "diff": lambda: pp.diff(series, columns={"boy": "boy"}),
+        "flatten": lambda: pp.flatten(pivoted),
+        "geohash_encode": lambda: pp.geohash_encode(
+            df, geohash="geohash", longitude="longitude", latitude="latitude"
+        ),
+        "geohash_decode": lambda: pp.geohash_decode(
+            geohashes, geohash="geohash", longitude="lon", latitude="lat"
+        ),
+        "geodetic_parse": lambda: pp.geodetic_parse(
+            geodetic, geodetic="geodetic", longitude="lon", latitude="lat"
+        ),
+        "pivot": lambda: pp.pivot(
+            df,
+            index=["ds"],
+            columns=["gender", "state"],
+            aggregates={"num": {"operator": "sum"}},
+        ),
+        "rename": lambda: pp.rename(series, columns={"boy": "boys"}, level=0),
+        "resample": lambda: pp.resample(series, rule="1W", method="linear"),
+        "rolling": lambda: pp.rolling(
+            series, rolling_type="mean", columns={"boy": "boy"}, window=5
+        ),
+        "select": lambda: pp.select(
+            df, columns=["ds", "name", "num"], rename={"num": "total"}
+        ),
+        "sort": lambda: pp.sort(df, by=["state", "num"], ascending=[True, False]),
+    }
+    # the forecasts need the optional prophet package
+    try:
+        import prophet  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        pass
+    else:
+        benchmarks["prophet"] = lambda: pp.prophet(
+            series.reset_index().rename(columns={"ds": "__timestamp"}),
+            time_grain="P1Y",
+            periods=5,
+            confidence_interval=0.8,
+        )
+
+    return {f"pandas_postprocessing.{name}": func for name, func in benchmarks.items()}
+
+
+def sql_benchmarks() -> Benchmarks:
+    sql = """
+        SELECT state, gender, SUM(num) AS total
+        FROM birth_names
+        JOIN (SELECT state FROM states WHERE region = 'West') AS west USING (state)
+        WHERE ds >= '2000-01-01' AND name IN ('Aaron', 'Amy', 'Brian')
+        GROUP BY state, gender
+        ORDER BY total DESC
+        LIMIT 100
+    """
+    predicate = sqlparse.parse("gender = 'girl'")[0]
+
+    def rewrite() -> str:
+        statement = sqlparse.parse(sql)[0]
+        # the predicates are fixed, to time the rewrite rather than the lookups
+        with mock.patch("superset.sql_parse.get_rls_for_table", return_value=predicate):
+            return str(insert_rls(statement, 1, None))
+
+    return {
+        "parsed_query": lambda: ParsedQuery(sql).tables,
+        "insert_rls": rewrite,
+    }
+
+
+def time_range_benchmarks() -> Benchmarks:
+    time_ranges = [
+        "Last week",
+        "previous calendar month",
+        "2000-01-01 : 2020-12-31",
+        'DATEADD(DATETIME("today"), -7, day) : today',
+        "Last 90 days : now",
+    ]
+    return {
+        "get_since_until": lambda: [
+            get_since_until(time_range, time_shift="1 year ago")
+            for time_range in time_ranges
+        ]
+    }
+
+
+def cache_key_benchmarks(table: SqlaTable) -> Benchmarks:
+    # pylint: disable=import-outside-toplevel
+    from superset.charts.schemas import ChartDataQueryContextSchema
+    from superset.utils.cache import generate_cache_key
+
+    # a query object with a long IN filter, as sent by dashboards with native filters
+    values = {
+        "datasource": "1__table",
+        "columns": ["state", "gender"],
+        "metrics": [{"label": "SUM(num)", "aggregate": "SUM", "column": "num"}],
+        "filter": [
+            {
+                "col": "name",
+                "op": "IN",
+                "val": [f"name_{idx}" for idx in range(5000)],
+            }
+        ],
+        "from_dttm": datetime(2000, 1, 1),
+        "to_dttm": datetime(2020, 1, 1),
+        "extras": {"where": "", "having": "", "time_grain_sqla": "P1D"},
+        "row_limit": 10000,
+    }
+    # the queries of a chart with many adhoc filters, and of a time comparison
+    metric = {
+        "expressionType": "SIMPLE",
+        "column": {"column_name": "num"},
+        "aggregate": "SUM",
+        "label": "sum__num",
+    }
+    adhoc_filters_query = {
+        "columns": ["state", "gender"],
+        "metrics": [metric],
+        "filters": [
+            {"col": "ds", "op": "TEMPORAL_RANGE", "val": "Last 10 years"},
+            *({"col": "name", "op": "!=", "val": f"name_{idx}"} for idx in range(20)),
+            *(
+                {
+                    "col": {
+                        "label": f"name_length_{idx}",
+                        "sqlExpression": f"LENGTH(name) + {idx}",
+                    },
+                    "op": ">",
+                    "val": idx,
+                }
+                for idx in range(10)
+            ),
+        ],
+        "extras": {
+            "where": " AND ".join(
+                f"(num > {idx} OR state = 'CA')" for idx in range(10)
+            ),
+            "having": "SUM(num) > 10",
+        },
+        "orderby": [["sum__num", False]],
+        "row_limit": 10000,
+    }
+    time_offsets_query = {
+        "columns": [
+            {
+                "label": "ds",
+                "sqlExpression": "ds",
+                "columnType": "BASE_AXIS",
+                "timeGrain": "P1M",
+            },
+        ],
+        "metrics": [metric],
+        "filters": [{"col": "ds", "op": "TEMPORAL_RANGE", "val": "Last 10 years"}],
+        "time_offsets": ["1 year ago", "2 years ago", "5 years ago"],
+        "post_processing": [
+            {
+                "operation": "pivot",
+                "options": {
+                    "index": ["ds"],
+                    "columns": [],
+                    "aggregates": {"sum__num": {"operator": "mean"}},
+                },
+            },
+            {
+                "operation": "compare",
+                "options": {
+                    "source_columns": ["sum__num"],
+                    "compare_columns": ["sum__num__1 year ago"],
+                    "compare_type": "difference",
+                },
+            },
+            {"operation": "flatten"},
+        ],
+        "row_limit": 10000,
+    }
+    query_context = ChartDataQueryContextSchema().load(
+        {
+            "datasource": {"id": table.id, "type": "table"},
+            "result_format": "json",
+            "result_type": "full",
+            "queries": [adhoc_filters_query, time_offsets_query],
+        }
+    )
+    adhoc_filters, time_offsets = query_context.queries
+
+    benchmarks: Benchmarks = {}
+    for version in (1, 2):
+        benchmarks[
+            f"generate_cache_key.v{version}"
+        ] = lambda version=version: generate_cache_key(values, version=version)
+        benchmarks[
+            f"query_object.cache_key.adhoc_filters.v{version}"
+        ] = lambda version=version: adhoc_filters.cache_key(version=version)
+        benchmarks[
+            f"query_object.cache_key.time_offsets.v{version}"
+        ] = lambda version=version: time_offsets.cache_key(version=version)
+        # with the keys of the dataset, e.g. its row level security filters
+        benchmarks[
+            f"query_context.query_cache_key.v{version}"
+        ] = lambda version=version: query_context.query_cache_key(
+            adhoc_filters, version=version
+        )
+    return benchmarks
+
+
+def jinja_benchmarks(database: Database) -> Benchmarks:
+    processor = get_template_processor(database=database)
+    sql = """
+        SELECT state, SUM(num)
+        FROM birth_names
+        WHERE ds >= '{{ from_dttm }}'
+        {% for state in states %}
+          {% if loop.first %}AND state IN ({% endif %}
+          '{{ state }}'{% if not loop.last %},{% else %}){% endif %}
+        {% endfor %}
+        GROUP BY state
+    """
+    return {
+        "jinja.process_template": lambda: processor.process_template(
+            sql, from_dttm="2000-01-01", states=["CA", "NY", "TX"]
+        )
+    }
+
+
+def chart_data_benchmarks(table: SqlaTable) -> Benchmarks:
+    # pylint: disable=import-outside-toplevel
+    from superset.charts.data.commands.get_data_command import ChartDataCommand
+    from superset.charts.schemas import ChartDataQueryContextSchema
+
+    def run(payload: dict[str, Any]) -> dict[str, Any]:
+        query_context = ChartDataQueryContextSchema().load(payload)
+        return ChartDataCommand(query_context).run()
+
+    payload = {
+        "datasource": {"id": table.id, "type": "table"},
+        "force": True,
+        "result_format": "json",
+        "result_type": "full",
+        "queries": [
+            {
+                "columns": ["state", "gender"],
+                "metrics": [
+                    {
+                        "expressionType": "SIMPLE",
+                        "column": {"column_name": "num"},
+                        "aggregate": "SUM",
+                        "label": "sum__num",
+                    }
+                ],
+                "filters": [{"col": "ds", "op": "TEMPORAL_RANGE", "val": "No filter"}],
+                "orderby": [["sum__num", False]],
+                "row_limit": 10000,
+            }
+        ],
+    }
+    timeseries_payload = {
+        **payload,
+        "queries": [
+            {
+                **payload["queries"][0],
+                "columns": [
+                    {
+                        "label": "ds",
+                        "sqlExpression": "ds",
+                        "columnType": "BASE_AXIS",
+                        "timeGrain": "P1Y",
+                    },
+                    "gender",
+                ],
+                "post_processing": [
+                    {
+                        "operation": "pivot",
+                        "options": {
+                            "index": ["ds"],
+                            "columns": ["gender"],
+                            "aggregates": {"sum__num": {"operator": "mean"}},
+                        },
+                    },
+                    {"operation": "flatten"},
+                ],
+            }
+        ],
+    }
+    return {
+        "chart_data_command.table": lambda: run(payload),
+        "chart_data_command.timeseries": lambda: run(timeseries_payload),
+    }
+
+
+def security_benchmarks(user: User) -> Benchmarks:
+    # pylint: disable=import-outside-toplevel
+    from superset import security_manager
+
+    view_menu_name = user.roles[0].permissions[-1].view_menu.name
+
+    def as_user(func: Callable[[], Any], cached: bool) -> Callable[[], Any]:
+        def run() -> Any:
+            current_app.config["CACHE_PERMISSIONS"] = cached
+            g.user = user
+            return func()
+
+        return run
+
+    benchmarks: Benchmarks = {}
+    for cached in (False, True):
+        suffix = "cached" if cached else "uncached"
+        benchmarks[f"security.can_access.{suffix}"] = as_user(
+            lambda: security_manager.can_access("datasource_access", view_menu_name),
+            cached,
+        )
+        benchmarks[f"security.user_view_menu_names.{suffix}"] = as_user(
+            lambda: security_manager.user_view_menu_names("datasource_access"),
+            cached,
+        )
+    return benchmarks
+
+
+@contextmanager
+def scratch_dataset(df: pd.DataFrame) -> Iterator[SqlaTable]:
+    """
+    Load the data into a scratch SQLite database, and register it as a dataset for
+    the duration of the benchmarks.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.core import Database
+
+    # the names of the datasets used to be unique
+    name = f"benchmark_birth_names_{os.getpid()}"
+    with tempfile.TemporaryDirectory() as tmpdir:
+        database = Database(
+            database_name=name,
+            sqlalchemy_uri=f"sqlite:///{os.path.join(tmpdir, 'benchmark.db')}",
+        )
+        with database.get_sqla_engine_with_context() as engine:
+            df.drop(columns=["latitude", "longitude"]).to_sql(name, engine, index=False)
+
+        table = SqlaTable(table_name=name, database=database)
+        db.session.add(table)
+        db.session.commit()
+        try:
+            table.fetch_metadata()
+            table.main_dttm_col = "ds"
+            db.session.commit()
+            yield table
+        finally:
+            db.session.delete(table)
+            db.session.delete(database)
+            db.session.commit()
+
+
+@contextmanager
+def scratch_user(datasets: int) -> Iterator[User]:
+    """
+    Create a user granted access to the given number of datasets through a single
+    role, for the duration of the benchmarks.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset import security_manager
+
+    name = f"benchmark_user_{os.getpid()}"
+    permission = security_manager.add_permission("datasource_access")
+    view_menus = [
+        security_manager.viewmenu_model(name=f"[{name}].[table_{idx}](id:{idx})")
+        for idx in range(datasets)
+    ]
+    role = security_manager.role_model(
+        name=name,
+        permissions=[
+            security_manager.permissionview_model(
+                permission=permission, view_menu=view_menu
+            )
+            for view_menu in view_menus
+        ],
+    )
+    user = security_manager.user_model(
+        first_name="benchmark",
+        last_name="user",
+        username=name,
+        email=f"{name}@example.com",
+        active=True,
+        roles=[role],
+    )
+    db.session.add(user)
+    db.session.commit()
+    cache_permissions = current_app.config["CACHE_PERMISSIONS"]
+    try:
+        yield user
+    finally:
+        current_app.config["CACHE_PERMISSIONS"] = cache_permissions
+        g.pop("user", None)
+        pvms = list(role.permissions)
+        db.session.delete(user)
+        db.session.delete(role)
+        for pvm in pvms:
+            db.session.delete(pvm)
+        for view_menu in view_menus:
+            db.session.delete(view_menu)
+        db.session.commit()
+
+
+def measure(func: Callable[[], Any], rounds: int) -> dict[str, Any]:
+    """
+    Time the function, calling it as many times per round as needed for a round to
+    last at least 0.2 seconds, and return the statistics of the time of a call.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    times = [total / number for total in timer.repeat(repeat=rounds, number=number)]
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "rounds": rounds,
+        "iterations": number,
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]],
+    threshold: float,
+) -> list[str]:
+    """
+    Print the ratio of the median times to the baseline ones, and return the
+    benchmarks slower by more than the threshold.
+    """
+    regressions = []
+    for name, stats in results.items():
+        if name not in baseline:
+            continue
+        ratio = stats["median"] / baseline[name]["median"]
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "  <- regression"
+        print(f"{name:<45} {ratio:6.2f}x{flag}")
+    return regressions
+
+
+@click.command()
+@click.option("--rows", default=100_000, help="Number of rows to generate.")
+@click.option("--rounds", default=5, help="Number of timed rounds per benchmark.")
+@click.option("--seed", default=42, help="Seed of the generated data.")
+@click.option(
+    "--datasets",
+    default=5000,
+    help="Number of datasets the user of the access checks can access.",
+)
+@click.option("--filter", "pattern", help="Only run the benchmarks matching a regex.")
+@click.option("--output", type=click.Path(), help="Write the results to a JSON file.")
+@click.option(
+    "--compare",
+    "baseline_path",
+    type=click.Path(exists=True),
+    help="Compare with the results of a previous run.",
+)
+@click.option(
+    "--threshold",
+    default=0.1,
+    help="Relative slowdown above which a benchmark is a regression.",
+)
+def main(  # pylint: disable=too-many-arguments,too-many-locals
+    rows: int,
+    rounds: int,
+    seed: int,
+    datasets: int,
+    pattern: str | None,
+    output: str | None,
+    baseline_path: str | None,
+    threshold: float,
+) -> None:
+    random.seed(seed)
+    np.random.seed(seed)
+    df = generate_data(rows)
+
+    results: dict[str, dict[str, Any]] = {}
+    with scratch_dataset(df) as table, scratch_user(datasets) as user:
+        benchmarks = {
+            **result_set_benchmarks(df),
+            **post_process_benchmarks(df),
+            **postprocessing_benchmarks(df),
+            **sql_benchmarks(),
+            **time_range_benchmarks(),
+            **cache_key_benchmarks(table),
+            **jinja_benchmarks(table.database),
+            **chart_data_benchmarks(table),
+            **security_benchmarks(user),
+        }
+        for name, func in benchmarks.items():
+            if pattern and not re.search(pattern, name):
+                continue
+            results[name] = measure(func, rounds)
+            print(
+                f"{name:<45} {results[name]['median'] * 1000:10.3f} ms "
+                f"(± {results[name]['stddev'] * 1000:.3f})"
+            )
+
+    if output:
+        with open(output, "w") as file:
+            json.dump(
+                {
+                    "revision": git_revision(),
+                    "date": datetime.utcnow().isoformat(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "rows": len(df),
+                    "seed": seed,
+                    "benchmarks": results,
+                },
+                file,
+                indent=2,
+            )
+
+    if baseline_path:
+        with open(baseline_path) as file:
+            baseline = json.load(file)
+        print(f"\nCompared with {baseline.get('revision') or baseline_path}:")
+        if regressions := compare(results, baseline["benchmarks"], threshold):
+            print(f"{len(regressions)} regression(s) over {threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    # time the computations rather than the cache backend, which may not be reachable,
+    # the permission indexes being kept in memory rather than not cached at all
+    app.config["DATA_CACHE_CONFIG"] = {"CACHE_TYPE": "NullCache"}
+    app.config["CACHE_CONFIG"] = {"CACHE_TYPE": "SimpleCache"}
+    cache_manager.init_app(app)
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
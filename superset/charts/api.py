@@ -18,11 +18,10 @@
 import json
 import logging
 from datetime import datetime
-from io import BytesIO
 from typing import Any, cast, Optional
 from zipfile import is_zipfile, ZipFile
 
-from flask import redirect, request, Response, send_file, url_for
+from flask import redirect, request, Response, url_for
 from flask_appbuilder.api import expose, protect, rison, safe
 from flask_appbuilder.hooks import before_request
 from flask_appbuilder.models.sqla.interface import SQLAInterface
@@ -81,8 +80,13 @@ from superset.extensions import event_logger
 from superset.models.slice import Slice
 from superset.tasks.thumbnails import cache_chart_thumbnail
 from superset.tasks.utils import get_current_user
-from superset.utils.screenshots import ChartScreenshot, DEFAULT_CHART_WINDOW_SIZE
+from superset.utils.screenshots import (
+    ChartScreenshot,
+    DEFAULT_CHART_WINDOW_SIZE,
+    get_image_formats,
+)
 from superset.utils.urls import get_url_path
+from superset.views.base import zip_bundle_response
 from superset.views.base_api import (
     BaseSupersetModelRestApi,
     RelatedFieldFilter,
@@ -653,10 +657,19 @@ class ChartRestApi(BaseSupersetModelRestApi):
             return self.response_404()
 
         # fetch the chart screenshot using the current user and cache if set
-        if img := ChartScreenshot.get_from_cache_key(thumbnail_cache, digest):
-            return Response(
-                FileWrapper(img), mimetype="image/png", direct_passthrough=True
-            )
+        for image_format in get_image_formats(request.accept_mimetypes):
+            if img := ChartScreenshot.get_from_cache_key(
+                thumbnail_cache, ChartScreenshot.format_cache_key(digest, image_format)
+            ):
+                response = Response(
+                    FileWrapper(img),
+                    mimetype=f"image/{image_format}",
+                    direct_passthrough=True,
+                )
+                # the format of the image depends on the formats the client accepts
+                if config["THUMBNAIL_IMAGE_FORMATS"]:
+                    response.vary.add("Accept")
+                return response
         # TODO: return an empty image
         return self.response_404()
 
@@ -719,8 +732,8 @@ class ChartRestApi(BaseSupersetModelRestApi):
             )
             return self.response(202, message="OK Async")
         # fetch the chart screenshot using the current user and cache if set
-        screenshot = ChartScreenshot(url, chart.digest).get_from_cache(
-            cache=thumbnail_cache
+        screenshot = ChartScreenshot(url, chart.digest).get_from_cache_in_formats(
+            thumbnail_cache, get_image_formats(request.accept_mimetypes)
         )
         # If not screenshot then send request to compute thumb to celery
         if not screenshot:
@@ -743,9 +756,16 @@ class ChartRestApi(BaseSupersetModelRestApi):
                 )
             )
         self.incr_stats("from_cache", self.thumbnail.__name__)
-        return Response(
-            FileWrapper(screenshot), mimetype="image/png", direct_passthrough=True
+        image, image_format = screenshot
+        response = Response(
+            FileWrapper(image),
+            mimetype=f"image/{image_format}",
+            direct_passthrough=True,
         )
+        # the format of the image depends on the formats the client accepts
+        if config["THUMBNAIL_IMAGE_FORMATS"]:
+            response.vary.add("Accept")
+        return response
 
     @expose("/export/", methods=("GET",))
     @protect()
@@ -789,24 +809,14 @@ class ChartRestApi(BaseSupersetModelRestApi):
         requested_ids = kwargs["rison"]
         timestamp = datetime.now().strftime("%Y%m%dT%H%M%S")
         root = f"chart_export_{timestamp}"
-        filename = f"{root}.zip"
 
-        buf = BytesIO()
-        with ZipFile(buf, "w") as bundle:
-            try:
-                for file_name, file_content in ExportChartsCommand(requested_ids).run():
-                    with bundle.open(f"{root}/{file_name}", "w") as fp:
-                        fp.write(file_content.encode())
-            except ChartNotFoundError:
-                return self.response_404()
-        buf.seek(0)
+        try:
+            response = zip_bundle_response(
+                root, ExportChartsCommand(requested_ids).run()
+            )
+        except ChartNotFoundError:
+            return self.response_404()
 
-        response = send_file(
-            buf,
-            mimetype="application/zip",
-            as_attachment=True,
-            download_name=filename,
-        )
         if token := request.args.get("token"):
             response.set_cookie(token, "done", max_age=600)
         return response
@@ -19,8 +19,10 @@
 import json
 import logging
 from collections.abc import Iterator
+from typing import Any
 
 import yaml
+from sqlalchemy.orm import selectinload
 
 from superset.charts.commands.exceptions import ChartNotFoundError
 from superset.daos.chart import ChartDAO
@@ -71,5 +73,11 @@ class ExportChartsCommand(ExportModelsCommand):
         file_content = yaml.safe_dump(payload, sort_keys=False)
         yield file_path, file_content
 
-        if model.table and export_related:
-            yield from ExportDatasetsCommand([model.table.id]).run()
+    def _load_options(self) -> list[Any]:
+        return [selectinload(Slice.table)]
+
+    def _export_related(self, models: list[Slice]) -> Iterator[tuple[str, str]]:
+        if dataset_ids := list(
+            dict.fromkeys(model.table.id for model in models if model.table)
+        ):
+            yield from ExportDatasetsCommand(dataset_ids).run()
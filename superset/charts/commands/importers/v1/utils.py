@@ -37,7 +37,7 @@ def import_chart(
     ignore_permissions: bool = False,
 ) -> Slice:
     can_write = ignore_permissions or security_manager.can_access("can_write", "Chart")
-    existing = session.query(Slice).filter_by(uuid=config["uuid"]).first()
+    existing = Slice.find_by_uuid(session, config["uuid"])
     if existing:
         if not overwrite or not can_write:
             return existing
@@ -16,6 +16,7 @@
 # under the License.
 
 
+from datetime import datetime, timedelta
 from typing import Any, Optional, Union
 
 import simplejson as json
@@ -26,26 +27,47 @@ from superset.charts.commands.exceptions import (
     WarmUpCacheChartNotFoundError,
 )
 from superset.charts.data.commands.get_data_command import ChartDataCommand
+from superset.charts.schemas import ChartDataQueryContextSchema
 from superset.commands.base import BaseCommand
 from superset.extensions import db
 from superset.models.slice import Slice
+from superset.utils.admission import query_priority, QueryPriority
 from superset.utils.core import error_msg_from_exception
 from superset.views.utils import get_dashboard_extra_filters, get_form_data, get_viz
 from superset.viz import viz_types
 
 
 class ChartWarmUpCacheCommand(BaseCommand):
+    """
+    Warm up the cache of a chart, with its saved query context or the given one.
+
+    Unless `force` is set, the results which are cached already aren't queried again,
+    except when they expire within `refresh_within` seconds.
+    """
+
+    # pylint: disable=too-many-arguments
     def __init__(
         self,
         chart_or_id: Union[int, Slice],
         dashboard_id: Optional[int],
         extra_filters: Optional[str],
+        query_context: Optional[dict[str, Any]] = None,
+        force: bool = True,
+        refresh_within: Optional[int] = None,
     ):
         self._chart_or_id = chart_or_id
         self._dashboard_id = dashboard_id
         self._extra_filters = extra_filters
+        self._query_context = query_context
+        self._force = force
+        self._refresh_within = refresh_within
 
     def run(self) -> dict[str, Any]:
+        # the warm-up queries give way to the interactive ones of the users
+        with query_priority(QueryPriority.BACKGROUND):
+            return self._run()
+
+    def _run(self) -> dict[str, Any]:
         self.validate()
         chart: Slice = self._chart_or_id  # type: ignore
 
@@ -69,23 +91,33 @@ class ChartWarmUpCacheCommand(BaseCommand):
                     datasource_type=chart.datasource.type,
                     datasource_id=chart.datasource.id,
                     form_data=form_data,
-                    force=True,
+                    force=self._force,
                 ).get_payload()
                 delattr(g, "form_data")
                 error = payload["errors"] or None
                 status = payload["status"]
             else:
                 # Non-legacy visualizations.
-                query_context = chart.get_query_context()
+                query_context = (
+                    ChartDataQueryContextSchema().load(self._query_context)
+                    if self._query_context
+                    else chart.get_query_context()
+                )
 
                 if not query_context:
                     raise ChartInvalidError("Chart's query context does not exist")
 
-                query_context.force = True
+                query_context.force = self._force
                 command = ChartDataCommand(query_context)
                 command.validate()
                 payload = command.run()
 
+                if not self._force and any(
+                    self._expires_soon(query) for query in payload["queries"]
+                ):
+                    query_context.force = True
+                    payload = command.run()
+
                 # Report the first error.
                 for query in payload["queries"]:
                     error = query["error"]
@@ -99,6 +131,16 @@ class ChartWarmUpCacheCommand(BaseCommand):
 
         return {"chart_id": chart.id, "viz_error": error, "viz_status": status}
 
+    def _expires_soon(self, query: dict[str, Any]) -> bool:
+        if self._refresh_within is None or not query.get("is_cached"):
+            return False
+        if not (cache_timeout := query.get("cache_timeout")):
+            return False
+        expires_at = datetime.fromisoformat(query["cached_dttm"]) + timedelta(
+            seconds=cache_timeout
+        )
+        return expires_at - datetime.utcnow() < timedelta(seconds=self._refresh_within)
+
     def validate(self) -> None:
         if isinstance(self._chart_or_id, Slice):
             return
@@ -18,7 +18,7 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 
 import simplejson
 from flask import current_app, g, make_response, request, Response
@@ -40,6 +40,10 @@ from superset.charts.data.query_context_cache_loader import QueryContextCacheLoa
 from superset.charts.post_processing import apply_post_process
 from superset.charts.schemas import ChartDataQueryContextSchema
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.utils.response_cache_manager import (
+    EncodedResult,
+    ResponseCacheManager,
+)
 from superset.connectors.base.models import BaseDatasource
 from superset.daos.exceptions import DatasourceNotFound
 from superset.exceptions import QueryObjectValidationError
@@ -47,6 +51,8 @@ from superset.extensions import event_logger
 from superset.models.sql_lab import Query
 from superset.utils.async_query_manager import AsyncQueryTokenException
 from superset.utils.core import create_zip, get_user_id, json_int_dttm_ser
+from superset.utils.query_memo import query_memo
+from superset.utils.tracing import span
 from superset.views.base import CsvResponse, generate_download_headers, XlsxResponse
 from superset.views.base_api import statsd_metrics
 
@@ -177,8 +183,12 @@ class ChartDataRestApi(ChartRestApi):
     @event_logger.log_this_with_context(
         action=lambda self, *args, **kwargs: f"{self.__class__.__name__}.data",
         log_to_statsd=False,
+        allow_extra_payload=True,
     )
-    def data(self) -> Response:
+    def data(
+        self,
+        add_extra_log_payload: Callable[..., None] = lambda **kwargs: None,
+    ) -> Response:
         """
         Takes a query context constructed in the client and returns payload
         data response for the given query.
@@ -244,6 +254,15 @@ class ChartDataRestApi(ChartRestApi):
                 )
             )
 
+        form_data = json_body.get("form_data")
+        add_extra_log_payload(
+            slice_id=(form_data or {}).get("slice_id"),
+            dashboard_id=(form_data or {}).get("dashboardId"),
+        )
+        # the query context, which usage driven cache warm up strategies replay
+        if current_app.config["LOG_CHART_DATA_QUERY_CONTEXT"]:
+            add_extra_log_payload(query_context=json_body)
+
         # TODO: support CSV, SQL query and other non-JSON types
         if (
             is_feature_enabled("GLOBAL_ASYNC_QUERIES")
@@ -252,7 +271,6 @@ class ChartDataRestApi(ChartRestApi):
         ):
             return self._run_async(json_body, command)
 
-        form_data = json_body.get("form_data")
         return self._get_data_response(
             command, form_data=form_data, datasource=query_context.datasource
         )
@@ -348,8 +366,9 @@ class ChartDataRestApi(ChartRestApi):
         form_data: dict[str, Any] | None = None,
         datasource: BaseDatasource | Query | None = None,
     ) -> Response:
-        result_type = result["query_context"].result_type
-        result_format = result["query_context"].result_format
+        query_context = result["query_context"]
+        result_type = query_context.result_type
+        result_format = query_context.result_format
 
         # Post-process the data so it matches the data presented in the chart.
         # This is needed for sending reports based on text charts that do the
@@ -365,44 +384,71 @@ class ChartDataRestApi(ChartRestApi):
             if not result["queries"]:
                 return self.response_400(_("Empty query result"))
 
+            data = [query["data"] for query in result["queries"]]
+        elif result_format == ChartDataResultFormat.JSON:
+            with span("chart_data.serialize"):
+                data = [
+                    simplejson.dumps(query, default=json_int_dttm_ser, ignore_nan=True)
+                    for query in result["queries"]
+                ]
+        else:
+            return self.response_400(
+                message=f"Unsupported result_format: {result_format}"
+            )
+
+        etag = ResponseCacheManager.set(query_context, result["queries"], data)
+        return self._make_chart_response(result_format, data, etag)
+
+    @staticmethod
+    def _make_chart_response(
+        result_format: ChartDataResultFormat,
+        data: list[EncodedResult],
+        etag: str | None = None,
+    ) -> Response:
+        """
+        Returns the response made out of the encoded results of the query objects.
+        """
+        if result_format in ChartDataResultFormat.table_like():
             is_csv_format = result_format == ChartDataResultFormat.CSV
 
-            if len(result["queries"]) == 1:
+            if len(data) == 1:
                 # return single query results
-                data = result["queries"][0]["data"]
                 if is_csv_format:
-                    return CsvResponse(data, headers=generate_download_headers("csv"))
-
-                return XlsxResponse(data, headers=generate_download_headers("xlsx"))
-
-            # return multi-query results bundled as a zip file
-            def _process_data(query_data: Any) -> Any:
-                if result_format == ChartDataResultFormat.CSV:
-                    encoding = current_app.config["CSV_EXPORT"].get("encoding", "utf-8")
-                    return query_data.encode(encoding)
-                return query_data
-
-            files = {
-                f"query_{idx + 1}.{result_format}": _process_data(query["data"])
-                for idx, query in enumerate(result["queries"])
-            }
-            return Response(
-                create_zip(files),
-                headers=generate_download_headers("zip"),
-                mimetype="application/zip",
-            )
-
-        if result_format == ChartDataResultFormat.JSON:
-            response_data = simplejson.dumps(
-                {"result": result["queries"]},
-                default=json_int_dttm_ser,
-                ignore_nan=True,
-            )
-            resp = make_response(response_data, 200)
+                    resp = CsvResponse(
+                        data[0], headers=generate_download_headers("csv")
+                    )
+                else:
+                    resp = XlsxResponse(
+                        data[0], headers=generate_download_headers("xlsx")
+                    )
+            else:
+                # return multi-query results bundled as a zip file
+                def _process_data(query_data: Any) -> Any:
+                    if is_csv_format:
+                        encoding = current_app.config["CSV_EXPORT"].get(
+                            "encoding", "utf-8"
+                        )
+                        return query_data.encode(encoding)
+                    return query_data
+
+                files = {
+                    f"query_{idx + 1}.{result_format}": _process_data(query_data)
+                    for idx, query_data in enumerate(data)
+                }
+                resp = Response(
+                    create_zip(files),
+                    headers=generate_download_headers("zip"),
+                    mimetype="application/zip",
+                )
+        else:
+            # the results are JSON documents already, which only need to be listed
+            resp = make_response(f'{{"result": [{", ".join(data)}]}}', 200)
             resp.headers["Content-Type"] = "application/json; charset=utf-8"
-            return resp
 
-        return self.response_400(message=f"Unsupported result_format: {result_format}")
+        if etag:
+            resp.set_etag(etag)
+            resp = resp.make_conditional(request)
+        return resp
 
     def _get_data_response(
         self,
@@ -411,12 +457,25 @@ class ChartDataRestApi(ChartRestApi):
         form_data: dict[str, Any] | None = None,
         datasource: BaseDatasource | Query | None = None,
     ) -> Response:
-        try:
-            result = command.run(force_cached=force_cached)
-        except ChartDataCacheLoadError as exc:
-            return self.response_422(message=exc.message)
-        except ChartDataQueryFailedError as exc:
-            return self.response_400(message=exc.message)
+        query_context = command.query_context
+        # the queries of the query objects are only built once for both the lookup of
+        # their encoded results and running them
+        with query_memo("chart_data.query_build_time"):
+            if cached := ResponseCacheManager.get(query_context):
+                if query_context.result_format in ChartDataResultFormat.table_like():
+                    if not security_manager.can_access("can_csv", "Superset"):
+                        return self.response_403()
+                data, etag = cached
+                return self._make_chart_response(
+                    query_context.result_format, data, etag
+                )
+
+            try:
+                result = command.run(force_cached=force_cached)
+            except ChartDataCacheLoadError as exc:
+                return self.response_422(message=exc.message)
+            except ChartDataQueryFailedError as exc:
+                return self.response_400(message=exc.message)
 
         return self._send_chart_response(result, form_data, datasource)
 
@@ -429,7 +488,8 @@ class ChartDataRestApi(ChartRestApi):
         self, form_data: dict[str, Any]
     ) -> QueryContext:
         try:
-            return ChartDataQueryContextSchema().load(form_data)
+            with span("chart_data.load_query_context"):
+                return ChartDataQueryContextSchema().load(form_data)
         except KeyError as ex:
             raise ValidationError("Request is incorrect") from ex
         except ValidationError as error:
@@ -38,6 +38,7 @@ from superset.utils.core import (
     get_column_names,
     get_metric_names,
 )
+from superset.utils.tracing import traced
 
 if TYPE_CHECKING:
     from superset.connectors.base.models import BaseDatasource
@@ -274,6 +275,7 @@ post_processors = {
 }
 
 
+@traced("chart_data.apply_post_process")
 def apply_post_process(
     result: dict[Any, Any],
     form_data: Optional[dict[str, Any]] = None,
@@ -56,12 +56,27 @@ logger = logging.getLogger(__name__)
     default=False,
     help="Force refresh, even if previously cached",
 )
+@click.option(
+    "--incremental",
+    "-n",
+    is_flag=True,
+    default=False,
+    help="Only compute the thumbnails whose digest changed, the most viewed first",
+)
+@click.option(
+    "--since",
+    "-s",
+    default="7 days ago",
+    help="Prioritize the incremental refresh by the views since then",
+)
 @click.option("--model_id", "-i", multiple=True)
-def compute_thumbnails(
+def compute_thumbnails(  # pylint: disable=too-many-arguments
     asynchronous: bool,
     dashboards_only: bool,
     charts_only: bool,
     force: bool,
+    incremental: bool,
+    since: str,
     model_id: int,
 ) -> None:
     """Compute thumbnails"""
@@ -71,8 +86,29 @@ def compute_thumbnails(
     from superset.tasks.thumbnails import (
         cache_chart_thumbnail,
         cache_dashboard_thumbnail,
+        refresh_thumbnails,
     )
 
+    if incremental:
+        counts = refresh_thumbnails(
+            dashboards=not charts_only,
+            charts=not dashboards_only,
+            model_ids=list(model_id),
+            since=since,
+            asynchronous=asynchronous,
+        )
+        action, count = (
+            ("triggered", counts["queued"])
+            if asynchronous
+            else ("rendered", counts["rendered"])
+        )
+        click.secho(
+            f"{count} thumbnails {action}, {counts['skipped']} up to "
+            f"date, {counts['failed']} failed",
+            fg="green",
+        )
+        return
+
     def compute_generic_thumbnail(
         friendly_type: str,
         model_cls: Union[type[Dashboard], type[Slice]],
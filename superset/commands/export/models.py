@@ -17,10 +17,12 @@
 
 from collections.abc import Iterator
 from datetime import datetime, timezone
+from typing import Any
 
 import yaml
 from flask_appbuilder import Model
 
+from superset import db
 from superset.commands.base import BaseCommand
 from superset.commands.exceptions import CommandException
 from superset.daos.base import BaseDAO
@@ -28,6 +30,9 @@ from superset.utils.dict_import_export import EXPORT_VERSION
 
 METADATA_FILE_NAME = "metadata.yaml"
 
+# the models are exported this many at a time, along with their related objects
+CHUNK_SIZE = 100
+
 
 class ExportModelsCommand(BaseCommand):
     dao: type[BaseDAO[Model]] = BaseDAO
@@ -44,6 +49,24 @@ class ExportModelsCommand(BaseCommand):
     def _export(model: Model, export_related: bool = True) -> Iterator[tuple[str, str]]:
         raise NotImplementedError("Subclasses MUST implement _export")
 
+    def _load_options(self) -> list[Any]:
+        """
+        The loader options of the relationships used by `_export`, for them to be
+        loaded for a chunk of models at once rather than for each model.
+        """
+        return []
+
+    def _export_related(self, models: list[Model]) -> Iterator[tuple[str, str]]:
+        """Export the related objects of a chunk of models, if `export_related`"""
+        return iter([])
+
+    def _prefetch(self, models: list[Model]) -> None:
+        if options := self._load_options():
+            model_cls = self.dao.model_cls
+            db.session.query(model_cls).options(*options).filter(
+                model_cls.id.in_([model.id for model in models])  # type: ignore
+            ).all()
+
     def run(self) -> Iterator[tuple[str, str]]:
         self.validate()
 
@@ -54,12 +77,26 @@ class ExportModelsCommand(BaseCommand):
         }
         yield METADATA_FILE_NAME, yaml.safe_dump(metadata, sort_keys=False)
 
+        # the models are released as they're exported, for the memory to be bound by
+        # the size of a chunk and of its related objects
+        models, self._models = list(self._models), []
         seen = {METADATA_FILE_NAME}
-        for model in self._models:
-            for file_name, file_content in self._export(model, self.export_related):
-                if file_name not in seen:
-                    yield file_name, file_content
-                    seen.add(file_name)
+        while models:
+            chunk = models[:CHUNK_SIZE]
+            del models[:CHUNK_SIZE]
+            self._prefetch(chunk)
+
+            for model in chunk:
+                for file_name, file_content in self._export(model, self.export_related):
+                    if file_name not in seen:
+                        yield file_name, file_content
+                        seen.add(file_name)
+
+            if self.export_related:
+                for file_name, file_content in self._export_related(chunk):
+                    if file_name not in seen:
+                        yield file_name, file_content
+                        seen.add(file_name)
 
     def validate(self) -> None:
         self._models = self.dao.find_by_ids(self.model_ids)
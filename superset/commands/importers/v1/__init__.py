@@ -32,6 +32,7 @@ from superset.commands.importers.v1.utils import (
 )
 from superset.daos.base import BaseDAO
 from superset.models.core import Database
+from superset.models.helpers import prefetching
 
 
 class ImportModelsCommand(BaseCommand):
@@ -67,14 +68,15 @@ class ImportModelsCommand(BaseCommand):
 
     @classmethod
     def _get_uuids(cls) -> set[str]:
-        return {str(model.uuid) for model in db.session.query(cls.dao.model_cls).all()}
+        return {str(uuid) for (uuid,) in db.session.query(cls.dao.model_cls.uuid).all()}
 
     def run(self) -> None:
         self.validate()
 
         # rollback to prevent partial imports
         try:
-            self._import(db.session, self._configs, self.overwrite)
+            with prefetching(db.session):
+                self._import(db.session, self._configs, self.overwrite)
             db.session.commit()
         except CommandException as ex:
             db.session.rollback()
@@ -31,6 +31,7 @@ from superset.commands.importers.v1.utils import (
     load_metadata,
     validate_metadata_type,
 )
+from superset.connectors.sqla.models import SqlaTable
 from superset.dashboards.commands.importers.v1.utils import (
     find_chart_uuids,
     import_dashboard,
@@ -39,9 +40,16 @@ from superset.dashboards.commands.importers.v1.utils import (
 from superset.dashboards.schemas import ImportV1DashboardSchema
 from superset.databases.commands.importers.v1.utils import import_database
 from superset.databases.schemas import ImportV1DatabaseSchema
-from superset.datasets.commands.importers.v1.utils import import_dataset
+from superset.datasets.commands.importers.v1.utils import (
+    import_dataset,
+    load_data_concurrently,
+)
 from superset.datasets.schemas import ImportV1DatasetSchema
-from superset.models.dashboard import dashboard_slices
+from superset.models.core import Database
+from superset.models.dashboard import Dashboard, dashboard_slices
+from superset.models.helpers import ImportPrefetch, prefetching
+from superset.models.slice import Slice
+from superset.models.sql_lab import SavedQuery
 from superset.queries.saved_queries.commands.importers.v1.utils import (
     import_saved_query,
 )
@@ -82,7 +90,15 @@ class ImportAssetsCommand(BaseCommand):
     # pylint: disable=too-many-locals
     @staticmethod
     def _import(session: Session, configs: dict[str, Any]) -> None:
+        def get_configs(prefix: str) -> list[dict[str, Any]]:
+            return [
+                config
+                for file_name, config in configs.items()
+                if file_name.startswith(prefix)
+            ]
+
         # import databases first
+        ImportPrefetch.load(session, Database, get_configs("databases/"))
         database_ids: dict[str, int] = {}
         for file_name, config in configs.items():
             if file_name.startswith("databases/"):
@@ -93,21 +109,32 @@ class ImportAssetsCommand(BaseCommand):
         for file_name, config in configs.items():
             if file_name.startswith("queries/"):
                 config["db_id"] = database_ids[config["database_uuid"]]
+        ImportPrefetch.load(session, SavedQuery, get_configs("queries/"))
+        for file_name, config in configs.items():
+            if file_name.startswith("queries/"):
                 import_saved_query(session, config, overwrite=True)
 
         # import datasets
-        dataset_info: dict[str, dict[str, Any]] = {}
         for file_name, config in configs.items():
             if file_name.startswith("datasets/"):
                 config["database_id"] = database_ids[config["database_uuid"]]
-                dataset = import_dataset(session, config, overwrite=True)
+        ImportPrefetch.load(session, SqlaTable, get_configs("datasets/"))
+        dataset_info: dict[str, dict[str, Any]] = {}
+        data_loads: list[tuple[str, SqlaTable]] = []
+        for file_name, config in configs.items():
+            if file_name.startswith("datasets/"):
+                dataset = import_dataset(
+                    session, config, overwrite=True, data_loads=data_loads
+                )
                 dataset_info[str(dataset.uuid)] = {
                     "datasource_id": dataset.id,
                     "datasource_type": dataset.datasource_type,
                     "datasource_name": dataset.table_name,
                 }
+        load_data_concurrently(data_loads, session)
 
         # import charts
+        ImportPrefetch.load(session, Slice, get_configs("charts/"))
         chart_ids: dict[str, int] = {}
         for file_name, config in configs.items():
             if file_name.startswith("charts/"):
@@ -122,6 +149,7 @@ class ImportAssetsCommand(BaseCommand):
                 chart_ids[str(chart.uuid)] = chart.id
 
         # import dashboards
+        ImportPrefetch.load(session, Dashboard, get_configs("dashboards/"))
         for file_name, config in configs.items():
             if file_name.startswith("dashboards/"):
                 config = update_id_refs(config, chart_ids, dataset_info)
@@ -151,7 +179,8 @@ class ImportAssetsCommand(BaseCommand):
 
         # rollback to prevent partial imports
         try:
-            self._import(db.session, self._configs)
+            with prefetching(db.session):
+                self._import(db.session, self._configs)
             db.session.commit()
         except Exception as ex:
             db.session.rollback()
@@ -27,6 +27,7 @@ from superset.charts.commands.importers.v1.utils import import_chart
 from superset.charts.schemas import ImportV1ChartSchema
 from superset.commands.exceptions import CommandException
 from superset.commands.importers.v1 import ImportModelsCommand
+from superset.connectors.sqla.models import SqlaTable
 from superset.daos.base import BaseDAO
 from superset.dashboards.commands.importers.v1 import ImportDashboardsCommand
 from superset.dashboards.commands.importers.v1.utils import (
@@ -39,9 +40,15 @@ from superset.databases.commands.importers.v1 import ImportDatabasesCommand
 from superset.databases.commands.importers.v1.utils import import_database
 from superset.databases.schemas import ImportV1DatabaseSchema
 from superset.datasets.commands.importers.v1 import ImportDatasetsCommand
-from superset.datasets.commands.importers.v1.utils import import_dataset
+from superset.datasets.commands.importers.v1.utils import (
+    import_dataset,
+    load_data_concurrently,
+)
 from superset.datasets.schemas import ImportV1DatasetSchema
-from superset.models.dashboard import dashboard_slices
+from superset.models.core import Database
+from superset.models.dashboard import Dashboard, dashboard_slices
+from superset.models.helpers import ImportPrefetch, prefetching
+from superset.models.slice import Slice
 from superset.utils.core import get_example_default_schema
 from superset.utils.database import get_example_database
 
@@ -69,12 +76,13 @@ class ImportExamplesCommand(ImportModelsCommand):
 
         # rollback to prevent partial imports
         try:
-            self._import(
-                db.session,
-                self._configs,
-                self.overwrite,
-                self.force_data,
-            )
+            with prefetching(db.session):
+                self._import(
+                    db.session,
+                    self._configs,
+                    self.overwrite,
+                    self.force_data,
+                )
             db.session.commit()
         except Exception as ex:
             db.session.rollback()
@@ -97,7 +105,15 @@ class ImportExamplesCommand(ImportModelsCommand):
         overwrite: bool = False,
         force_data: bool = False,
     ) -> None:
+        def get_configs(prefix: str) -> list[dict[str, Any]]:
+            return [
+                config
+                for file_name, config in configs.items()
+                if file_name.startswith(prefix)
+            ]
+
         # import databases
+        ImportPrefetch.load(session, Database, get_configs("databases/"))
         database_ids: dict[str, int] = {}
         for file_name, config in configs.items():
             if file_name.startswith("databases/"):
@@ -114,7 +130,6 @@ class ImportExamplesCommand(ImportModelsCommand):
         # database was created before its UUID was frozen, so it has a random UUID.
         # We need to determine its ID so we can point the dataset to it.
         examples_db = get_example_database()
-        dataset_info: dict[str, dict[str, Any]] = {}
         for file_name, config in configs.items():
             if file_name.startswith("datasets/"):
                 # find the ID of the corresponding database
@@ -129,6 +144,11 @@ class ImportExamplesCommand(ImportModelsCommand):
                 if config["schema"] is None:
                     config["schema"] = get_example_default_schema()
 
+        ImportPrefetch.load(session, SqlaTable, get_configs("datasets/"))
+        dataset_info: dict[str, dict[str, Any]] = {}
+        data_loads: list[tuple[str, SqlaTable]] = []
+        for file_name, config in configs.items():
+            if file_name.startswith("datasets/"):
                 try:
                     dataset = import_dataset(
                         session,
@@ -136,6 +156,7 @@ class ImportExamplesCommand(ImportModelsCommand):
                         overwrite=overwrite,
                         force_data=force_data,
                         ignore_permissions=True,
+                        data_loads=data_loads,
                     )
                 except MultipleResultsFound:
                     # Multiple results can be found for datasets. There was a bug in
@@ -151,8 +172,10 @@ class ImportExamplesCommand(ImportModelsCommand):
                     "datasource_type": "table",
                     "datasource_name": dataset.table_name,
                 }
+        load_data_concurrently(data_loads, session)
 
         # import charts
+        ImportPrefetch.load(session, Slice, get_configs("charts/"))
         chart_ids: dict[str, int] = {}
         for file_name, config in configs.items():
             if (
@@ -170,11 +193,14 @@ class ImportExamplesCommand(ImportModelsCommand):
                 chart_ids[str(chart.uuid)] = chart.id
 
         # store the existing relationship between dashboards and charts
-        existing_relationships = session.execute(
-            select([dashboard_slices.c.dashboard_id, dashboard_slices.c.slice_id])
-        ).fetchall()
+        existing_relationships = set(
+            session.execute(
+                select([dashboard_slices.c.dashboard_id, dashboard_slices.c.slice_id])
+            ).fetchall()
+        )
 
         # import dashboards
+        ImportPrefetch.load(session, Dashboard, get_configs("dashboards/"))
         dashboard_chart_ids: list[tuple[int, int]] = []
         for file_name, config in configs.items():
             if file_name.startswith("dashboards/"):
@@ -30,6 +30,9 @@ from superset.models.core import Database
 METADATA_FILE_NAME = "metadata.yaml"
 IMPORT_VERSION = "1.0.0"
 
+# the C implementation of the YAML parser is several times faster, if available
+YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,7 +52,7 @@ class MetadataSchema(Schema):
 def load_yaml(file_name: str, content: str) -> dict[str, Any]:
     """Try to load a YAML file"""
     try:
-        return yaml.safe_load(content)
+        return yaml.load(content, Loader=YAMLLoader)  # nosec
     except yaml.parser.ParserError as ex:
         logger.exception("Invalid YAML in %s", file_name)
         raise ValidationError({file_name: "Not a valid YAML file"}) from ex
@@ -19,10 +19,14 @@ from __future__ import annotations
 import copy
 import logging
 import re
-from typing import Any, ClassVar, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
+from typing import Any, Callable, ClassVar, TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
+from flask import copy_current_request_context, g, has_request_context
 from flask_babel import gettext as _
 from pandas import DateOffset
 from typing_extensions import TypedDict
@@ -33,6 +37,7 @@ from superset.common.db_query_status import QueryStatus
 from superset.common.query_actions import get_query_results
 from superset.common.utils import dataframe_utils
 from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.common.utils.query_derivation import get_derivation, MAX_DERIVABLE_RESULTS
 from superset.common.utils.time_range_utils import (
     get_since_until_from_query_object,
     get_since_until_from_time_range,
@@ -47,9 +52,10 @@ from superset.exceptions import (
     SupersetException,
 )
 from superset.extensions import cache_manager, security_manager
-from superset.models.helpers import QueryResult
+from superset.models.helpers import QueryResult, QueryStringExtended
 from superset.models.sql_lab import Query
 from superset.utils import csv, excel
+from superset.utils.admission import get_query_priority, query_priority
 from superset.utils.cache import generate_cache_key, set_and_log_cache
 from superset.utils.core import (
     DatasourceType,
@@ -60,12 +66,17 @@ from superset.utils.core import (
     get_column_names_from_columns,
     get_column_names_from_metrics,
     get_metric_names,
+    get_username,
     get_xaxis_label,
     normalize_dttm_col,
+    override_user,
     TIME_COMPARISON,
 )
 from superset.utils.date_parser import get_past_or_future, normalize_time_delta
+from superset.utils.decorators import stats_timing
 from superset.utils.pandas_postprocessing.utils import unescape_separator
+from superset.utils.query_memo import query_memo
+from superset.utils.tracing import traced, with_current_span
 from superset.views.utils import get_viz
 from superset.viz import viz_types
 
@@ -122,10 +133,14 @@ class QueryContextProcessor:
     cache_type: ClassVar[str] = "df"
     enforce_numerical_metrics: ClassVar[bool] = True
 
+    @query_memo("chart_data.query_build_time")
     def get_df_payload(
         self, query_obj: QueryObject, force_cached: bool | None = False
     ) -> dict[str, Any]:
-        """Handles caching around the df payload retrieval"""
+        """
+        Handles caching around the df payload retrieval. The query of the query object
+        is built once for both its cache key and its execution.
+        """
         cache_key = self.query_cache_key(query_obj)
         timeout = self.get_cache_timeout()
         force_query = self._query_context.force or timeout == -1
@@ -134,6 +149,7 @@ class QueryContextProcessor:
             region=CacheRegion.DATA,
             force_query=force_query,
             force_cached=force_cached,
+            fallback_key=partial(self.fallback_query_cache_key, query_obj),
         )
 
         if query_obj and cache_key and not cache.is_loaded:
@@ -202,6 +218,7 @@ class QueryContextProcessor:
             "label_map": label_map,
         }
 
+    @traced("chart_data.cache_key")
     def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
         """
         Returns a QueryObject cache key for objects in self.queries
@@ -222,6 +239,198 @@ class QueryContextProcessor:
         )
         return cache_key
 
+    def fallback_query_cache_key(self, query_obj: QueryObject) -> str | None:
+        """
+        Returns the cache key of a QueryObject with `CACHE_KEY_FALLBACK_VERSION`, under
+        which results cached before switching the version of cache keys are read
+        """
+        if version := config["CACHE_KEY_FALLBACK_VERSION"]:
+            return self.query_cache_key(query_obj, version=version)
+        return None
+
+    def raw_query_cache_key(self, sql: str) -> str:
+        """
+        Returns the cache key of the raw result of a query, which depends only on the
+        compiled SQL and on who it runs on behalf of.
+        """
+        datasource = self._qc_datasource
+        database = datasource.database
+        return generate_cache_key(
+            {
+                "database": database.id,
+                "schema": datasource.schema,
+                "sql": sql,
+                "rls": security_manager.get_rls_cache_key(datasource),
+                "impersonation": get_username() if database.impersonate_user else None,
+            },
+            key_prefix="raw_",
+        )
+
+    def derivable_results_cache_key(self) -> str:
+        """
+        Returns the cache key of the raw results of the datasource that other query
+        results can be derived from. Results aren't shared between users, as RLS
+        clauses and custom SQL may render differently for each of them.
+        """
+        datasource = self._qc_datasource
+        return generate_cache_key(
+            {
+                "datasource": datasource.uid,
+                "changed_on": datasource.changed_on,
+                "rls": security_manager.get_rls_cache_key(datasource),
+                "username": get_username(),
+            },
+            key_prefix="raw_index_",
+        )
+
+    def get_raw_query_result(self, query_object: QueryObject) -> QueryResult:
+        """
+        Returns the result of the query object before any processing.
+
+        With `CACHE_RAW_QUERY_RESULTS` enabled, the result is looked up in the data
+        cache by the compiled SQL first, so that query objects which only differ in
+        their post-processing share the same database query. With
+        `DERIVE_QUERY_RESULTS` also enabled, it is then computed from the cached raw
+        result of a broader query when possible.
+        """
+        datasource = self._qc_datasource
+        query_obj = query_object.to_dict()
+        if not config["CACHE_RAW_QUERY_RESULTS"] or not hasattr(
+            datasource, "get_query_str_extended"
+        ):
+            return datasource.query(query_obj)
+
+        query_str_ext = datasource.get_query_str_extended(query_obj)
+        cache_key = self.raw_query_cache_key(query_str_ext.sql)
+        timeout = self.get_cache_timeout()
+        use_cache = not (self._query_context.force or timeout == -1)
+        if use_cache and (cache_value := cache_manager.data_cache.get(cache_key)):
+            stats_logger.incr("raw_data_cache_hit")
+            return QueryResult(
+                df=cache_value["df"],
+                query=cache_value["query"],
+                duration=timedelta(0),
+                applied_template_filters=cache_value["applied_template_filters"],
+                applied_filter_columns=cache_value["applied_filter_columns"],
+                rejected_filter_columns=cache_value["rejected_filter_columns"],
+            )
+
+        stats_logger.incr("raw_data_cache_miss")
+        derive = config["DERIVE_QUERY_RESULTS"] and not self._is_templated(query_obj)
+        if (
+            use_cache
+            and derive
+            and (result := self._derive_query_result(query_obj, query_str_ext))
+        ):
+            return result
+
+        result = datasource.query(query_obj)
+        if result.status != QueryStatus.FAILED:
+            set_and_log_cache(
+                cache_manager.data_cache,
+                cache_key,
+                {
+                    "df": result.df,
+                    "query": result.query,
+                    "applied_template_filters": result.applied_template_filters,
+                    "applied_filter_columns": result.applied_filter_columns,
+                    "rejected_filter_columns": result.rejected_filter_columns,
+                },
+                timeout,
+                datasource.uid,
+            )
+            if derive:
+                self._add_derivable_result(query_obj, cache_key, result.df, timeout)
+        return result
+
+    def _is_templated(self, query_obj: dict[str, Any]) -> bool:
+        """
+        Whether the SQL of the datasource depends on Jinja templating, e.g. through
+        `filter_values`, in which case its results can't be derived from one another.
+        """
+        datasource = self._qc_datasource
+        expressions = [
+            getattr(datasource, "sql", None),
+            *[column.expression for column in datasource.columns],
+            *[metric.expression for metric in datasource.metrics],
+        ]
+        return bool(datasource.get_extra_cache_keys(query_obj)) or any(
+            expression and ("{{" in expression or "{%" in expression)
+            for expression in expressions
+        )
+
+    def _derive_query_result(
+        self, query_obj: dict[str, Any], query_str_ext: QueryStringExtended
+    ) -> QueryResult | None:
+        datasource = self._qc_datasource
+        saved_metrics = {
+            metric.metric_name: metric.expression for metric in datasource.metrics
+        }
+        for entry in (
+            cache_manager.data_cache.get(self.derivable_results_cache_key()) or []
+        ):
+            derivation = get_derivation(
+                query_obj,
+                query_str_ext.labels_expected,
+                entry["query_obj"],
+                entry["labels"],
+                entry["rowcount"],
+                saved_metrics,
+            )
+            if derivation is None or not (
+                cache_value := cache_manager.data_cache.get(entry["cache_key"])
+            ):
+                continue
+            if (df := derivation.apply(cache_value["df"])) is not None:
+                logger.debug(
+                    "Derived query result from cache key: %s", entry["cache_key"]
+                )
+                stats_logger.incr("derived_data_cache_hit")
+                return QueryResult(
+                    df=df,
+                    query=query_str_ext.sql,
+                    duration=timedelta(0),
+                    applied_template_filters=query_str_ext.applied_template_filters,
+                    applied_filter_columns=query_str_ext.applied_filter_columns,
+                    rejected_filter_columns=query_str_ext.rejected_filter_columns,
+                )
+
+        stats_logger.incr("derived_data_cache_miss")
+        return None
+
+    def _add_derivable_result(
+        self,
+        query_obj: dict[str, Any],
+        cache_key: str,
+        df: pd.DataFrame,
+        timeout: int,
+    ) -> None:
+        row_limit = query_obj.get("row_limit")
+        if not query_obj.get("metrics") or not row_limit or len(df) >= row_limit:
+            return
+
+        key = self.derivable_results_cache_key()
+        entries = [
+            entry
+            for entry in cache_manager.data_cache.get(key) or []
+            if entry["cache_key"] != cache_key
+        ]
+        entries.insert(
+            0,
+            {
+                "cache_key": cache_key,
+                "query_obj": query_obj,
+                "labels": list(df.columns),
+                "rowcount": len(df),
+            },
+        )
+        try:
+            cache_manager.data_cache.set(
+                key, entries[:MAX_DERIVABLE_RESULTS], timeout=timeout
+            )
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Could not cache key %s", key)
+
     def get_query_result(self, query_object: QueryObject) -> QueryResult:
         """Returns a pandas dataframe based on the query object"""
         query_context = self._query_context
@@ -234,7 +443,7 @@ class QueryContextProcessor:
             # todo(hugh): add logic to manage all sip68 models here
             result = query_context.datasource.exc_query(query_object.to_dict())
         else:
-            result = query_context.datasource.query(query_object.to_dict())
+            result = self.get_raw_query_result(query_object)
             query = result.query + ";\n\n"
 
         df = result.df
@@ -588,15 +797,7 @@ class QueryContextProcessor:
         """Returns the query results with both metadata and data"""
 
         # Get all the payloads from the QueryObjects
-        query_results = [
-            get_query_results(
-                query_obj.result_type or self._query_context.result_type,
-                self._query_context,
-                query_obj,
-                force_cached,
-            )
-            for query_obj in self._query_context.queries
-        ]
+        query_results = self._get_query_results(force_cached)
         return_value = {"queries": query_results}
 
         if cache_query_context:
@@ -611,6 +812,61 @@ class QueryContextProcessor:
 
         return return_value
 
+    def _get_query_results(self, force_cached: bool) -> list[dict[str, Any]]:
+        """
+        Returns the payloads of all the QueryObjects, in order.
+
+        Up to `CHART_DATA_QUERY_CONCURRENCY` query objects are executed concurrently.
+        Each one runs in a fresh app context, with a copy of the current request
+        context when there is one, on behalf of the current user, so that security
+        and RLS are applied as if they ran one after another. The first failing query
+        object raises, as when they run sequentially.
+        """
+        queries = self._query_context.queries
+        max_workers = min(config["CHART_DATA_QUERY_CONCURRENCY"], len(queries))
+        if max_workers <= 1:
+            return [
+                self._get_query_object_results(query_obj, force_cached)
+                for query_obj in queries
+            ]
+
+        # Load the datasource relationships upfront, the worker threads should only
+        # read from the instance bound to the session of this thread
+        datasource = self._qc_datasource
+        for attr in ("columns", "metrics", "database"):
+            getattr(datasource, attr, None)
+
+        flask_app = app._get_current_object()  # pylint: disable=protected-access
+        user = getattr(g, "user", None)
+        priority = get_query_priority()
+        get_results = with_current_span(self._get_query_object_results)
+
+        def run(query_obj: QueryObject) -> dict[str, Any]:
+            with flask_app.app_context(), override_user(user), query_priority(priority):
+                return get_results(query_obj, force_cached)
+
+        def task() -> Callable[[QueryObject], dict[str, Any]]:
+            # each task pushes a copy of its own, the copies of a request context
+            # can't be pushed from several threads at once
+            if has_request_context():
+                return copy_current_request_context(run)
+            return run
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(task(), query_obj) for query_obj in queries]
+            return [future.result() for future in futures]
+
+    def _get_query_object_results(
+        self, query_obj: QueryObject, force_cached: bool
+    ) -> dict[str, Any]:
+        with stats_timing("chart_data.query_object", stats_logger):
+            return get_query_results(
+                query_obj.result_type or self._query_context.result_type,
+                self._query_context,
+                query_obj,
+                force_cached,
+            )
+
     def get_cache_timeout(self) -> int:
         if cache_timeout_rv := self._query_context.get_cache_timeout():
             return cache_timeout_rv
@@ -23,7 +23,7 @@ from datetime import datetime
 from pprint import pformat
 from typing import Any, NamedTuple, TYPE_CHECKING
 
-from flask import g
+from flask import current_app, g
 from flask_babel import gettext as _
 from pandas import DataFrame
 
@@ -46,7 +46,8 @@ from superset.utils.core import (
     json_int_dttm_ser,
     QueryObjectFilterClause,
 )
-from superset.utils.hashing import md5_sha_from_dict
+from superset.utils.hashing import hash_from_dict
+from superset.utils.tracing import traced
 
 if TYPE_CHECKING:
     from superset.connectors.base.models import BaseDatasource
@@ -346,13 +347,15 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
             default=str,
         )
 
-    def cache_key(self, **extra: Any) -> str:
+    def cache_key(self, version: int | None = None, **extra: Any) -> str:
         """
         The cache key is made out of the key/values from to_dict(), plus any
         other key/values in `extra`
         We remove datetime bounds that are hard values, and replace them with
         the use-provided inputs to bounds, which may be time-relative (as in
         "5 days ago" or "now").
+        The key is hashed with the given version of cache keys, by default
+        `CACHE_KEY_VERSION`.
         """
         cache_dict = self.to_dict()
         cache_dict.update(extra)
@@ -415,8 +418,14 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
             # datasource or database do not exist
             pass
 
-        return md5_sha_from_dict(cache_dict, default=json_int_dttm_ser, ignore_nan=True)
+        return hash_from_dict(
+            cache_dict,
+            version=version or current_app.config["CACHE_KEY_VERSION"],
+            ignore_nan=True,
+            default=json_int_dttm_ser,
+        )
 
+    @traced("chart_data.post_processing")
     def exec_post_processing(self, df: DataFrame) -> DataFrame:
         """
         Perform post processing operations on DataFrame.
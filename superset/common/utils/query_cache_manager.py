@@ -17,13 +17,14 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Callable
 
 from flask_caching import Cache
 from pandas import DataFrame
 
 from superset import app
 from superset.common.db_query_status import QueryStatus
+from superset.common.utils.response_cache_manager import ResponseCacheManager
 from superset.constants import CacheRegion
 from superset.exceptions import CacheLoadError
 from superset.extensions import cache_manager
@@ -126,6 +127,8 @@ class QueryCacheManager:
                     datasource_uid=datasource_uid,
                     region=region,
                 )
+                # the encoded results of the previous query result are now stale
+                ResponseCacheManager.delete(key)
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
             if not self.error_message:
@@ -140,15 +143,23 @@ class QueryCacheManager:
         region: CacheRegion = CacheRegion.DEFAULT,
         force_query: bool | None = False,
         force_cached: bool | None = False,
+        fallback_key: Callable[[], str | None] | None = None,
     ) -> QueryCacheManager:
         """
-        Initialize QueryCacheManager by query-cache key
+        Initialize QueryCacheManager by query-cache key, or by the key returned by
+        `fallback_key` when nothing is cached under it
         """
         query_cache = cls()
         if not key or not _cache[region] or force_query:
             return query_cache
 
-        if cache_value := _cache[region].get(key):
+        cache_value = _cache[region].get(key)
+        if not cache_value and fallback_key and (legacy_key := fallback_key()):
+            cache_value = _cache[region].get(legacy_key)
+            if cache_value:
+                stats_logger.incr("loading_from_fallback_cache_key")
+
+        if cache_value:
             logger.debug("Cache key: %s", key)
             stats_logger.incr("loading_from_cache")
             try:
@@ -0,0 +1,410 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Derive the result of a query object from the cached raw result of a broader one.
+
+A query object can be answered from a cached result without querying the database
+when it is a strict refinement of the cached query: the same datasource, time range
+and extras, additional filters on columns the cached query is grouped by, a subset
+of its groupby columns or a coarser time grain of its temporal column, and a subset
+of its metrics. Collapsing rows is only possible for metrics that can be aggregated
+again, i.e. SUM, COUNT, MIN and MAX.
+
+The eligibility checks are deliberately conservative: anything that isn't known to
+give the same result as the database is rejected.
+"""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+import pandas as pd
+
+from superset.constants import NULL_STRING, TimeGrain
+from superset.superset_typing import Column, Metric
+from superset.utils.core import (
+    AdhocMetricExpressionType,
+    FilterOperator,
+    get_column_name,
+    get_metric_name,
+    is_adhoc_column,
+    is_adhoc_metric,
+)
+
+# Number of cached raw results per datasource and user considered for deriving others
+MAX_DERIVABLE_RESULTS = 20
+
+# Aggregate functions that can be computed from partial aggregates, and the function
+# that combines them
+REAGGREGATIONS = {"SUM": "sum", "COUNT": "count", "MIN": "min", "MAX": "max"}
+
+_AGGREGATE_EXPRESSION = re.compile(
+    r"^\s*(SUM|COUNT|MIN|MAX)\s*\(\s*(\*|[\w.\"`\[\]]+)\s*\)\s*$",
+    re.IGNORECASE,
+)
+
+# Time grains that can be computed from timestamps truncated to a finer grain, with
+# the pandas period they correspond to and the finer grains they can be computed from
+COARSER_TIME_GRAINS: dict[str, tuple[str, set[str | None]]] = {
+    TimeGrain.MONTH: (
+        "M",
+        {None, TimeGrain.SECOND, TimeGrain.MINUTE, TimeGrain.HOUR, TimeGrain.DAY},
+    ),
+    TimeGrain.QUARTER: (
+        "Q",
+        {
+            None,
+            TimeGrain.SECOND,
+            TimeGrain.MINUTE,
+            TimeGrain.HOUR,
+            TimeGrain.DAY,
+            TimeGrain.MONTH,
+        },
+    ),
+    TimeGrain.YEAR: (
+        "Y",
+        {
+            None,
+            TimeGrain.SECOND,
+            TimeGrain.MINUTE,
+            TimeGrain.HOUR,
+            TimeGrain.DAY,
+            TimeGrain.MONTH,
+            TimeGrain.QUARTER,
+        },
+    ),
+}
+
+FILTER_OPERATORS = {
+    FilterOperator.EQUALS,
+    FilterOperator.NOT_EQUALS,
+    FilterOperator.IN,
+    FilterOperator.NOT_IN,
+    FilterOperator.IS_NULL,
+    FilterOperator.IS_NOT_NULL,
+}
+
+# Query object fields that must be identical in both queries
+_IDENTICAL_FIELDS = (
+    "apply_fetch_values_predicate",
+    "extras",
+    "from_dttm",
+    "granularity",
+    "inner_from_dttm",
+    "inner_to_dttm",
+    "time_shift",
+    "to_dttm",
+)
+
+
+@dataclass
+class Derivation:
+    """
+    The operations computing a query result from the raw result of a broader query.
+    """
+
+    # filters to apply on the columns of the cached result
+    filters: list[dict[str, Any]] = field(default_factory=list)
+    # cached column label to the period its timestamps are truncated to
+    time_grains: dict[str, str] = field(default_factory=dict)
+    # cached column label to output label, for the columns of the result
+    columns: dict[str, str] = field(default_factory=dict)
+    metrics: list[str] = field(default_factory=list)
+    # metric label to the function combining its partial aggregates, `None` when rows
+    # don't need to be collapsed
+    aggregates: dict[str, str] | None = None
+    orderby: list[tuple[str, bool]] = field(default_factory=list)
+    row_limit: int | None = None
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame | None:
+        """
+        Compute the result from the cached raw result.
+
+        :param df: The cached raw result
+        :return: The result, or `None` if the data doesn't allow deriving it
+        """
+        for flt in self.filters:
+            if (mask := _get_filter_mask(df[flt["col"]], flt)) is None:
+                return None
+            df = df[mask]
+
+        df = df[[*self.columns, *self.metrics]].copy()
+        for label, period in self.time_grains.items():
+            if not pd.api.types.is_datetime64_dtype(df[label]):
+                try:
+                    df[label] = pd.to_datetime(df[label])
+                except (TypeError, ValueError):
+                    return None
+            if not pd.api.types.is_datetime64_dtype(df[label]):
+                return None
+            df[label] = df[label].dt.to_period(period).dt.start_time
+
+        df = df.rename(columns=self.columns)
+        if self.aggregates is not None:
+            df = _aggregate(df, list(self.columns.values()), self.aggregates)
+
+        if self.orderby:
+            labels = [label for label, _ in self.orderby]
+            if df[labels].isna().any(axis=None):
+                return None
+            df = df.sort_values(
+                labels,
+                ascending=[ascending for _, ascending in self.orderby],
+                kind="stable",
+            )
+        if self.row_limit:
+            df = df.head(self.row_limit)
+        return df.reset_index(drop=True)
+
+
+def get_reaggregation(metric: Metric, saved_metrics: dict[str, str]) -> str | None:
+    """
+    Return the function combining partial aggregates of the metric, if any.
+
+    :param metric: The metric
+    :param saved_metrics: The expressions of the datasource metrics, by name
+    :return: A key of `REAGGREGATIONS`, or `None` if it can't be aggregated again
+    """
+    if is_adhoc_metric(metric):
+        if metric.get("expressionType") == AdhocMetricExpressionType.SIMPLE:
+            aggregate = str(metric.get("aggregate") or "").upper()
+            return aggregate if aggregate in REAGGREGATIONS else None
+        expression = metric.get("sqlExpression") or ""
+    else:
+        expression = saved_metrics.get(metric, "")
+
+    if match := _AGGREGATE_EXPRESSION.match(expression):
+        return match.group(1).upper()
+    return None
+
+
+def get_derivation(  # pylint: disable=too-many-arguments,too-many-return-statements
+    query_obj: dict[str, Any],
+    labels: list[str],
+    cached_query_obj: dict[str, Any],
+    cached_labels: list[str],
+    cached_rowcount: int,
+    saved_metrics: dict[str, str],
+) -> Derivation | None:
+    """
+    Check whether a query object can be answered from the cached raw result of
+    another query object on the same datasource.
+
+    :param query_obj: The query object to answer, as a dict
+    :param labels: The labels of the columns the query object would return
+    :param cached_query_obj: The query object of the cached result, as a dict
+    :param cached_labels: The columns of the cached result
+    :param cached_rowcount: The number of rows of the cached result
+    :param saved_metrics: The expressions of the datasource metrics, by name
+    :return: How to derive the result, or `None` if it can't be derived
+    """
+    for query in (query_obj, cached_query_obj):
+        if (
+            query.get("is_timeseries")
+            or query.get("is_rowcount")
+            or query.get("series_columns")
+            or query.get("series_limit")
+            or query.get("row_offset")
+            or not query.get("metrics")
+        ):
+            return None
+
+    if any(
+        query_obj.get(key) != cached_query_obj.get(key) for key in _IDENTICAL_FIELDS
+    ):
+        return None
+
+    # the cached result must not have been truncated by its row limit
+    cached_row_limit = cached_query_obj.get("row_limit")
+    if not cached_row_limit or cached_rowcount >= cached_row_limit:
+        return None
+
+    columns: list[Column] = query_obj.get("columns") or []
+    metrics: list[Metric] = query_obj["metrics"]
+    metric_labels = [get_metric_name(metric) for metric in metrics]
+    if labels != [get_column_name(column) for column in columns] + metric_labels:
+        return None
+    if len(set(labels)) != len(labels):
+        return None
+
+    cached_columns: list[Column] = cached_query_obj.get("columns") or []
+    if cached_labels != [get_column_name(column) for column in cached_columns] + [
+        get_metric_name(metric) for metric in cached_query_obj["metrics"]
+    ]:
+        return None
+
+    derivation = Derivation(metrics=metric_labels, row_limit=query_obj.get("row_limit"))
+
+    # every metric must be in the cached result
+    cached_metrics = cached_query_obj["metrics"]
+    if any(metric not in cached_metrics for metric in metrics):
+        return None
+
+    # every column must be in the cached result, possibly at a finer time grain
+    for column in columns:
+        if (cached_column := _find_cached_column(column, cached_columns)) is None:
+            return None
+        cached_label = get_column_name(cached_column)
+        if cached_label in derivation.columns:
+            return None
+        derivation.columns[cached_label] = get_column_name(column)
+        if column != cached_column:
+            derivation.time_grains[cached_label] = COARSER_TIME_GRAINS[
+                column["timeGrain"]  # type: ignore
+            ][0]
+
+    # the cached filters must all apply, extra filters must be on plain groupby
+    # columns of the cached result
+    filters: list[dict[str, Any]] = query_obj.get("filter") or []
+    cached_filters: list[dict[str, Any]] = cached_query_obj.get("filter") or []
+    if any(flt not in filters for flt in cached_filters):
+        return None
+    for flt in filters:
+        if flt in cached_filters:
+            continue
+        if not _is_derivable_filter(flt, cached_columns, query_obj.get("granularity")):
+            return None
+        derivation.filters.append(flt)
+
+    # rows must be collapsed when grouping by fewer or coarser columns
+    if len(derivation.columns) < len(cached_columns) or derivation.time_grains:
+        aggregates = {
+            get_metric_name(metric): get_reaggregation(metric, saved_metrics)
+            for metric in metrics
+        }
+        if any(aggregate is None for aggregate in aggregates.values()):
+            return None
+        derivation.aggregates = {
+            label: REAGGREGATIONS[aggregate]  # type: ignore
+            for label, aggregate in aggregates.items()
+        }
+
+    # ordering is only reproduced for metrics, the database may sort strings and
+    # nulls differently
+    for metric, ascending in query_obj.get("orderby") or []:
+        if metric not in metrics and metric not in metric_labels:
+            return None
+        label = metric if isinstance(metric, str) else get_metric_name(metric)
+        derivation.orderby.append((label, bool(ascending)))
+
+    return derivation
+
+
+def _find_cached_column(column: Column, cached_columns: list[Column]) -> Column | None:
+    if column in cached_columns:
+        return column
+    if not is_adhoc_column(column) or column.get("columnType") != "BASE_AXIS":
+        return None
+
+    time_grain = column.get("timeGrain")
+    if time_grain not in COARSER_TIME_GRAINS:
+        return None
+    for cached_column in cached_columns:
+        if (
+            is_adhoc_column(cached_column)
+            and cached_column.get("columnType") == "BASE_AXIS"
+            and cached_column["sqlExpression"] == column["sqlExpression"]
+            and cached_column.get("timeGrain") in COARSER_TIME_GRAINS[time_grain][1]
+        ):
+            return cached_column
+    return None
+
+
+def _is_derivable_filter(
+    flt: dict[str, Any],
+    cached_columns: list[Column],
+    granularity: str | None,
+) -> bool:
+    col = flt.get("col")
+    if not isinstance(col, str) or col not in cached_columns or col == granularity:
+        return False
+    if flt.get("op") not in FILTER_OPERATORS:
+        return False
+    if flt["op"] in (FilterOperator.IS_NULL, FilterOperator.IS_NOT_NULL):
+        return True
+
+    values = flt.get("val")
+    values = values if isinstance(values, (list, tuple)) else [values]
+    return bool(values) and all(
+        isinstance(value, (str, int, float))
+        and not isinstance(value, bool)
+        and value != NULL_STRING
+        for value in values
+    )
+
+
+def _get_filter_mask(series: pd.Series, flt: dict[str, Any]) -> pd.Series | None:
+    """
+    Evaluate a filter on a column like the database would, or return `None` when the
+    values of the column and of the filter aren't comparable.
+    """
+    op = flt["op"]
+    if op == FilterOperator.IS_NULL:
+        return series.isna()
+    if op == FilterOperator.IS_NOT_NULL:
+        return series.notna()
+
+    values = flt["val"] if isinstance(flt["val"], (list, tuple)) else [flt["val"]]
+    inferred_type = pd.api.types.infer_dtype(series, skipna=True)
+    if inferred_type == "string":
+        if not all(isinstance(value, str) for value in values):
+            return None
+    elif inferred_type in ("integer", "floating", "mixed-integer-float"):
+        if not all(isinstance(value, (int, float)) for value in values):
+            return None
+    elif inferred_type != "empty":
+        return None
+
+    # comparisons with NULL are never true in SQL
+    mask = series.isin(values)
+    if op in (FilterOperator.NOT_EQUALS, FilterOperator.NOT_IN):
+        mask = ~mask & series.notna()
+    return mask
+
+
+def _aggregate(
+    df: pd.DataFrame, groupby: list[str], aggregates: dict[str, str]
+) -> pd.DataFrame:
+    def combine(series: pd.Series, aggregate: str) -> Any:
+        if aggregate == "count":
+            # the count of no rows is 0, not NULL
+            return series.sum()
+        if aggregate == "sum":
+            return series.sum(min_count=1)
+        return getattr(series, aggregate)()
+
+    if not groupby:
+        return pd.DataFrame(
+            [
+                {
+                    label: combine(df[label], aggregate)
+                    for label, aggregate in aggregates.items()
+                }
+            ]
+        )
+
+    grouped = df.groupby(groupby, dropna=False, sort=False)
+    return pd.concat(
+        [
+            grouped[label].sum(min_count=0 if aggregate == "count" else 1)
+            if aggregate in ("sum", "count")
+            else getattr(grouped[label], aggregate)()
+            for label, aggregate in aggregates.items()
+        ],
+        axis=1,
+    ).reset_index()
@@ -0,0 +1,177 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import hashlib
+import logging
+from datetime import datetime
+from typing import Any, TYPE_CHECKING, Union
+
+from superset import app
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.extensions import cache_manager
+from superset.stats_logger import BaseStatsLogger
+from superset.utils.cache import set_and_log_cache
+from superset.utils.core import json_int_dttm_ser
+from superset.utils.hashing import md5_sha_from_dict, md5_sha_from_str
+
+if TYPE_CHECKING:
+    from superset.common.query_context import QueryContext
+    from superset.common.query_object import QueryObject
+
+config = app.config
+stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_KEY_PREFIX = "response_"
+
+# The encoded result of a query object, a JSON document for the JSON format, CSV text
+# or XLSX bytes otherwise
+EncodedResult = Union[str, bytes]
+
+
+class ResponseCacheManager:
+    """
+    Class for managing the encoded results of chart data requests.
+
+    The results of each query object are encoded once and kept in the data cache next
+    to the query result they come from, under a key derived from its cache key, so that
+    they share its timeout and are dropped whenever the query result is written again.
+    Each entry holds the encodings of every variant of the request which leads to the
+    same query result, i.e. the result format, the cache timeout and the time bounds.
+    """
+
+    @staticmethod
+    def is_enabled(query_context: QueryContext) -> bool:
+        return (
+            config["CACHE_CHART_DATA_RESPONSES"]
+            and not query_context.force
+            and bool(query_context.queries)
+            and query_context.result_format
+            in (ChartDataResultFormat.JSON, *ChartDataResultFormat.table_like())
+            and all(
+                (query_obj.result_type or query_context.result_type)
+                == ChartDataResultType.FULL
+                for query_obj in query_context.queries
+            )
+        )
+
+    @staticmethod
+    def cache_key(query_cache_key: str) -> str:
+        return f"{RESPONSE_CACHE_KEY_PREFIX}{query_cache_key}"
+
+    @staticmethod
+    def variant(query_context: QueryContext, query_obj: QueryObject) -> str:
+        """
+        Returns the key of an encoding in the entry of a query result, made out of what
+        the encoding depends on besides the query result.
+        """
+        return md5_sha_from_dict(
+            {
+                "result_format": query_context.result_format,
+                "cache_timeout": query_context.get_cache_timeout(),
+                "from_dttm": query_obj.from_dttm,
+                "to_dttm": query_obj.to_dttm,
+            },
+            default=json_int_dttm_ser,
+        )
+
+    @staticmethod
+    def etag(etags: list[str]) -> str:
+        return md5_sha_from_str(",".join(etags))
+
+    @classmethod
+    def get(cls, query_context: QueryContext) -> tuple[list[EncodedResult], str] | None:
+        """
+        Returns the encoded results of all the query objects of the query context and
+        their ETag, or None if any of them isn't cached.
+        """
+        if not cls.is_enabled(query_context):
+            return None
+
+        keys = []
+        for query_obj in query_context.queries:
+            if not (query_cache_key := query_context.query_cache_key(query_obj)):
+                return None
+            keys.append(cls.cache_key(query_cache_key))
+
+        entries = []
+        for query_obj, value in zip(
+            query_context.queries, cache_manager.data_cache.get_many(*keys)
+        ):
+            if not (entry := (value or {}).get(cls.variant(query_context, query_obj))):
+                stats_logger.incr("chart_data_response_cache_miss")
+                return None
+            entries.append(entry)
+
+        stats_logger.incr("chart_data_response_cache_hit")
+        return (
+            [entry["data"] for entry in entries],
+            cls.etag([entry["etag"] for entry in entries]),
+        )
+
+    @classmethod
+    def set(
+        cls,
+        query_context: QueryContext,
+        queries: list[dict[str, Any]],
+        data: list[EncodedResult],
+    ) -> str | None:
+        """
+        Caches the encoded results of the query objects of the query context and
+        returns their ETag.
+
+        Only results loaded from the data cache are kept, their payload then reads the
+        same whether it is encoded again or served from this cache.
+        """
+        if not cls.is_enabled(query_context) or not all(
+            query.get("is_cached") and query.get("cache_key") for query in queries
+        ):
+            return None
+
+        etags = []
+        for query_obj, query, value in zip(query_context.queries, queries, data):
+            etag = hashlib.md5(
+                value.encode("utf-8") if isinstance(value, str) else value
+            ).hexdigest()
+            etags.append(etag)
+
+            # expire along with the query result, which was cached at `cached_dttm`
+            timeout = query["cache_timeout"]
+            if timeout:
+                cached_dttm = datetime.fromisoformat(query["cached_dttm"])
+                timeout -= int((datetime.utcnow() - cached_dttm).total_seconds())
+                if timeout <= 0:
+                    continue
+
+            key = cls.cache_key(query["cache_key"])
+            entry = cache_manager.data_cache.get(key) or {}
+            entry[cls.variant(query_context, query_obj)] = {"data": value, "etag": etag}
+            set_and_log_cache(
+                cache_manager.data_cache,
+                key,
+                entry,
+                timeout,
+                query_context.datasource.uid,
+            )
+
+        return cls.etag(etags)
+
+    @classmethod
+    def delete(cls, query_cache_key: str) -> None:
+        if config["CACHE_CHART_DATA_RESPONSES"]:
+            cache_manager.data_cache.delete(cls.cache_key(query_cache_key))
@@ -68,11 +68,17 @@ if TYPE_CHECKING:
     from superset.models.core import Database
     from superset.models.dashboard import Dashboard
     from superset.models.slice import Slice
+    from superset.utils.tracing import BaseSpanExporter
 
 # Realtime stats logger, a StatsD implementation exists
 STATS_LOGGER = DummyStatsLogger()
 EVENT_LOGGER = DBEventLogger()
 
+# Log the query context of the chart data requests, filter values included, for the
+# `chart_data_usage` and `dashboard_native_filters` cache warm up strategies to
+# replay them. This stores the body of each chart data request in the logs.
+LOG_CHART_DATA_QUERY_CONTEXT = False
+
 SUPERSET_LOG_VIEW = True
 
 BASE_DIR = pkg_resources.resource_filename("superset", "")
@@ -152,6 +158,19 @@ SAMPLES_ROW_LIMIT = 1000
 NATIVE_FILTER_DEFAULT_ROW_LIMIT = 1000
 # max rows retrieved by filter select auto complete
 FILTER_SELECT_ROW_LIMIT = 10000
+# max number of query objects of a single chart data request that are executed
+# concurrently, e.g. the queries of mixed timeseries charts or of big numbers with a
+# trendline. Each query runs in its own thread on behalf of the requesting user.
+# Set to 1 to run them one after another.
+CHART_DATA_QUERY_CONCURRENCY = 1
+# The chart queries of a database can be capped with the `concurrency_limit` of its
+# extra, see `superset.utils.admission`. The slots of the running queries are kept
+# in the cache of `CACHE_CONFIG`, and expire after this many seconds in case the
+# process running the query dies. It should exceed the duration of any chart query.
+DATABASE_QUERY_SLOT_TIMEOUT = 300
+# How often the first query waiting for a slot looks for one freed by another web
+# server or worker, in seconds
+DATABASE_QUERY_QUEUE_POLL_INTERVAL = 0.1
 # default time filter in explore
 # values may be "Last day", "Last week", "<ISO date> : now", etc.
 DEFAULT_TIME_FILTER = NO_TIME_RANGE
@@ -255,6 +274,33 @@ FLASK_USE_RELOAD = True
 # to the page to see the call stack.
 PROFILING = False
 
+# Sample the stacks of the requests and Celery tasks being served, in the background,
+# and aggregate them per endpoint and task as collapsed stacks, i.e. what flame graph
+# tools read. The aggregates are written to the RESULTS_BACKEND every
+# ``flush_interval`` seconds, and admins can list and download them through the
+# ``/api/v1/profiling/`` endpoints. Sampling happens every ``interval`` seconds,
+# less often if needed to stay within ``cpu_budget`` of a CPU.
+SAMPLING_PROFILER_ENABLED = False
+SAMPLING_PROFILER_CONFIG: dict[str, Any] = {
+    "interval": 0.01,
+    "cpu_budget": 0.01,
+    "flush_interval": 60,
+    "max_depth": 128,
+    "retention": 7 * 24 * 60 * 60,
+    "max_windows": 500,
+}
+
+# Trace the steps requests go through, e.g. building, compiling and executing the
+# queries of a chart, and hand the spans of each request to these exporters. Without
+# exporters nothing is recorded. For instance:
+#
+#   from superset.utils.tracing import LoggingSpanExporter, OTLPJsonSpanExporter
+#   TRACING_SPAN_EXPORTERS = [
+#       LoggingSpanExporter(),
+#       OTLPJsonSpanExporter("http://localhost:4318/v1/traces"),
+#   ]
+TRACING_SPAN_EXPORTERS: list[BaseSpanExporter] = []
+
 # Superset allows server-side python stacktraces to be surfaced to the
 # user when this feature is on. This may have security implications
 # and it's more secure to turn it off in production settings.
@@ -648,11 +694,35 @@ THUMBNAIL_DASHBOARD_DIGEST_FUNC: None | (
 ) = None
 THUMBNAIL_CHART_DIGEST_FUNC: Callable[[Slice, ExecutorType, str], str] | None = None
 
+# The digests above can include the data the charts show as well, for the thumbnails
+# to be refreshed when it changes rather than only when the charts/dashboards are
+# edited. The parts of the data to include, in any combination:
+# - "changed_on": when the datasets of the charts were last changed
+# - "cache_key": the cache keys of the data queries of the charts, which change
+#   along with the queries, the datasets and the Jinja cache keys
+# - "freshness": the token returned by THUMBNAIL_DATA_FRESHNESS_FUNC for each dataset
+# Note that the digests are computed when listing charts and dashboards as well, and
+# that the "cache_key" part requires building the query context of each chart.
+THUMBNAIL_DIGEST_DATA_PARTS: list[str] = []
+# A callback that receives a dataset and returns a token that changes along with its
+# data, e.g. the time the underlying table was last loaded:
+THUMBNAIL_DATA_FRESHNESS_FUNC: Callable[[SqlaTable], str | None] | None = None
+
 THUMBNAIL_CACHE_CONFIG: CacheConfig = {
     "CACHE_TYPE": "NullCache",
     "CACHE_NO_NULL_WARNING": True,
 }
 
+# The sizes of the thumbnails generated from each capture of a chart or dashboard
+# besides the requested one, by thumbnail type, e.g. {"chart": [(400, 300)]}, for
+# the thumbnails used in different places to come out of a single capture
+THUMBNAIL_SIZES: dict[str, list[tuple[int, int]]] = {}
+# The image formats the thumbnails are encoded in besides PNG, e.g. ["webp", "avif"],
+# provided that Pillow supports them. They are served to the browsers accepting them.
+THUMBNAIL_IMAGE_FORMATS: list[str] = []
+# The number of threads the thumbnails of a capture are resized and encoded in
+THUMBNAIL_IMAGE_THREADS = 4
+
 # Time before selenium times out after trying to locate an element on the page and wait
 # for that element to load for a screenshot.
 SCREENSHOT_LOCATE_WAIT = int(timedelta(seconds=10).total_seconds())
@@ -697,6 +767,50 @@ CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# Also cache chart data query results before post-processing, keyed on the compiled
+# SQL. Charts that share the same SQL but differ in their post-processing (pivot,
+# rolling windows, sorting etc.) then reuse the same raw result from the data cache
+# instead of querying the database again.
+CACHE_RAW_QUERY_RESULTS = False
+# Answer chart data queries that are strict refinements of a cached raw result (extra
+# filters on its groupby columns, fewer groupby columns, a coarser time grain or fewer
+# metrics) with pandas, instead of querying the database. Rows are only re-aggregated
+# for SUM, COUNT, MIN and MAX metrics. Requires CACHE_RAW_QUERY_RESULTS. Filters are
+# evaluated the way Python compares values, so only enable this for databases that
+# compare strings case-sensitively.
+DERIVE_QUERY_RESULTS = False
+
+# Keep the row level security rules in memory and in the CACHE_CONFIG cache, instead of
+# reading them from the metadata database each time a chart is queried. Changes to the
+# rules stamp them with a new version in the cache, which all workers check, so the
+# cache must be shared between them, e.g. Redis or Memcached.
+CACHE_RLS_FILTERS = False
+# Keep the permissions granted to each set of roles in memory and in the CACHE_CONFIG
+# cache, so that access checks, e.g. for each chart of a dashboard or each dataset of
+# a list, are set lookups instead of permission queries against the metadata database.
+# As for CACHE_RLS_FILTERS, the cache must be shared by all workers.
+CACHE_PERMISSIONS = False
+# Keep the encoded chart data responses, i.e. the JSON, CSV or XLSX results of each
+# query object, in the DATA_CACHE_CONFIG cache next to the results they are encoded
+# from, so that cached charts are served without encoding them again, along with an
+# ETag. They expire and are invalidated along with the results.
+CACHE_CHART_DATA_RESPONSES = False
+
+# The version of the hashes in the cache keys of chart data. Version 1 hashes the JSON
+# encoding of the query with MD5, version 2 hashes its canonical encoding with SHA-1,
+# which is several times faster for large queries, e.g. with long IN filters.
+# Switching versions changes all the keys: while results cached with the previous
+# version are still around, set CACHE_KEY_FALLBACK_VERSION to it so that they are
+# read when missing under the new key.
+CACHE_KEY_VERSION = 1
+CACHE_KEY_FALLBACK_VERSION: int | None = None
+
+# Timeout in seconds for the latest partition lookups of Presto, Trino and Hive
+# tables, which back `select_star`, `where_latest_partition` and the
+# `{{ presto.latest_partition() }}` family of Jinja macros. Lookups are stored in
+# the data cache; set to 0 to disable.
+PARTITION_CACHE_TIMEOUT = int(timedelta(minutes=1).total_seconds())
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -767,6 +881,11 @@ CSV_EXTENSIONS = {"csv", "tsv", "txt"}
 COLUMNAR_EXTENSIONS = {"parquet", "zip"}
 ALLOWED_EXTENSIONS = {*EXCEL_EXTENSIONS, *CSV_EXTENSIONS, *COLUMNAR_EXTENSIONS}
 
+# Number of rows read and written at a time when uploading CSV files to a database,
+# so that large files are never fully loaded in memory. Each chunk is written with
+# the engine's bulk loading path when available, e.g., `COPY` for Postgres.
+CSV_UPLOAD_CHUNK_SIZE = 100_000
+
 # CSV Options: key/value pairs that will be passed as argument to DataFrame.to_csv
 # method.
 # note: index option should not be overridden
@@ -1306,6 +1425,10 @@ ALERT_REPORTS_NOTIFICATION_DRY_RUN = False
 # Max tries to run queries to prevent false errors caused by transient errors
 # being returned to users. Set to a value >1 to enable retries.
 ALERT_REPORTS_QUERY_EXECUTION_MAX_TRIES = 1
+# Seconds an alert query result is shared between alerts that render to the same
+# SQL on the same database for the same executor. Useful when many alerts watch
+# the same metric on staggered schedules. Set to 0 to disable.
+ALERT_REPORTS_QUERY_CACHE_TIMEOUT = 0
 # Custom width for screenshots
 ALERT_REPORTS_MIN_CUSTOM_SCREENSHOT_WIDTH = 600
 ALERT_REPORTS_MAX_CUSTOM_SCREENSHOT_WIDTH = 2400
@@ -1483,6 +1606,10 @@ PREVENT_UNSAFE_DEFAULT_URLS_ON_DATASET = True
 # ]
 DATASET_IMPORT_ALLOWED_DATA_URLS = [r".*"]
 
+# Download the data of the imported datasets in this many threads. Set to 1 to
+# download it in the current thread.
+IMPORT_DATA_THREADS = 4
+
 # Path used to store SSL certificates that are generated when using custom certs.
 # Defaults to temporary directory.
 # Example: SSL_CERT_PATH = "/certs"
@@ -111,7 +111,9 @@ from superset.superset_typing import (
     ResultSetColumnType,
 )
 from superset.utils import core as utils
+from superset.utils.admission import admit_query
 from superset.utils.core import GenericDataType, MediumText
+from superset.utils.query_memo import memoized, query_obj_key
 
 config = app.config
 metadata = Model.metadata  # pylint: disable=no-member
@@ -839,19 +841,24 @@ class SqlaTable(
         query_obj: QueryObjectDict,
         mutate: bool = True,
     ) -> QueryStringExtended:
-        sqlaq = self.get_sqla_query(**query_obj)
-        sql = self.database.compile_sqla_query(sqlaq.sqla_query)
-        sql = self._apply_cte(sql, sqlaq.cte)
-        sql = sqlparse.format(sql, reindent=True)
-        if mutate:
-            sql = self.mutate_query_from_config(sql)
-        return QueryStringExtended(
-            applied_template_filters=sqlaq.applied_template_filters,
-            applied_filter_columns=sqlaq.applied_filter_columns,
-            rejected_filter_columns=sqlaq.rejected_filter_columns,
-            labels_expected=sqlaq.labels_expected,
-            prequeries=sqlaq.prequeries,
-            sql=sql,
+        def build() -> QueryStringExtended:
+            sqlaq = self.get_memoized_sqla_query(query_obj)
+            sql = self.database.compile_sqla_query(sqlaq.sqla_query)
+            sql = self._apply_cte(sql, sqlaq.cte)
+            sql = sqlparse.format(sql, reindent=True)
+            if mutate:
+                sql = self.mutate_query_from_config(sql)
+            return QueryStringExtended(
+                applied_template_filters=sqlaq.applied_template_filters,
+                applied_filter_columns=sqlaq.applied_filter_columns,
+                rejected_filter_columns=sqlaq.rejected_filter_columns,
+                labels_expected=sqlaq.labels_expected,
+                prequeries=sqlaq.prequeries,
+                sql=sql,
+            )
+
+        return memoized(
+            ("query_str", self.uid, query_obj_key(query_obj), mutate), build
         )
 
     def get_query_str(self, query_obj: QueryObjectDict) -> str:
@@ -1210,19 +1217,21 @@ class SqlaTable(
                 df.columns = labels_expected
             return df
 
-        try:
-            df = self.database.get_df(sql, self.schema, mutator=assign_column_label)
-        except Exception as ex:  # pylint: disable=broad-except
-            df = pd.DataFrame()
-            status = QueryStatus.FAILED
-            logger.warning(
-                "Query %s on schema %s failed", sql, self.schema, exc_info=True
-            )
-            db_engine_spec = self.db_engine_spec
-            errors = [
-                dataclasses.asdict(error) for error in db_engine_spec.extract_errors(ex)
-            ]
-            error_message = utils.error_msg_from_exception(ex)
+        with admit_query(self.database):
+            try:
+                df = self.database.get_df(sql, self.schema, mutator=assign_column_label)
+            except Exception as ex:  # pylint: disable=broad-except
+                df = pd.DataFrame()
+                status = QueryStatus.FAILED
+                logger.warning(
+                    "Query %s on schema %s failed", sql, self.schema, exc_info=True
+                )
+                db_engine_spec = self.db_engine_spec
+                errors = [
+                    dataclasses.asdict(error)
+                    for error in db_engine_spec.extract_errors(ex)
+                ]
+                error_message = utils.error_msg_from_exception(ex)
 
         return QueryResult(
             applied_template_filters=query_str_ext.applied_template_filters,
@@ -1422,7 +1431,7 @@ class SqlaTable(
         """
         extra_cache_keys = super().get_extra_cache_keys(query_obj)
         if self.has_extra_cache_key_calls(query_obj):
-            sqla_query = self.get_sqla_query(**query_obj)
+            sqla_query = self.get_memoized_sqla_query(query_obj)
             extra_cache_keys += sqla_query.extra_cache_keys
         return extra_cache_keys
 
@@ -1543,3 +1552,34 @@ class RowLevelSecurityFilter(Model, AuditMixinNullable):
         backref="row_level_security_filters",
     )
     clause = Column(Text, nullable=False)
+
+    @staticmethod
+    def after_change(
+        mapper: Mapper,
+        connection: Connection,
+        target: RowLevelSecurityFilter,
+    ) -> None:
+        """
+        Flag the session, so that the cached rules are invalidated once the change is
+        committed. Invalidating them earlier would let other workers cache the rules
+        as they were before the change.
+        """
+        if session := inspect(target).session:
+            session.info["rls_filters_changed"] = True
+
+    @staticmethod
+    def after_commit(session: Session) -> None:
+        if session.info.pop("rls_filters_changed", False):
+            security_manager.on_rls_filters_changed()
+
+
+sa.event.listen(
+    RowLevelSecurityFilter, "after_insert", RowLevelSecurityFilter.after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_update", RowLevelSecurityFilter.after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_delete", RowLevelSecurityFilter.after_change
+)
+sa.event.listen(Session, "after_commit", RowLevelSecurityFilter.after_commit)
@@ -19,11 +19,10 @@ import functools
 import json
 import logging
 from datetime import datetime
-from io import BytesIO
 from typing import Any, Callable, cast, Optional
 from zipfile import is_zipfile, ZipFile
 
-from flask import make_response, redirect, request, Response, send_file, url_for
+from flask import make_response, redirect, request, Response, url_for
 from flask_appbuilder import permission_name
 from flask_appbuilder.api import expose, protect, rison, safe
 from flask_appbuilder.hooks import before_request
@@ -84,9 +83,9 @@ from superset.models.embedded_dashboard import EmbeddedDashboard
 from superset.tasks.thumbnails import cache_dashboard_thumbnail
 from superset.tasks.utils import get_current_user
 from superset.utils.cache import etag_cache
-from superset.utils.screenshots import DashboardScreenshot
+from superset.utils.screenshots import DashboardScreenshot, get_image_formats
 from superset.utils.urls import get_url_path
-from superset.views.base import generate_download_headers
+from superset.views.base import generate_download_headers, zip_bundle_response
 from superset.views.base_api import (
     BaseSupersetModelRestApi,
     RelatedFieldFilter,
@@ -794,26 +793,14 @@ class DashboardRestApi(BaseSupersetModelRestApi):
         if is_feature_enabled("VERSIONED_EXPORT"):
             timestamp = datetime.now().strftime("%Y%m%dT%H%M%S")
             root = f"dashboard_export_{timestamp}"
-            filename = f"{root}.zip"
 
-            buf = BytesIO()
-            with ZipFile(buf, "w") as bundle:
-                try:
-                    for file_name, file_content in ExportDashboardsCommand(
-                        requested_ids
-                    ).run():
-                        with bundle.open(f"{root}/{file_name}", "w") as fp:
-                            fp.write(file_content.encode())
-                except DashboardNotFoundError:
-                    return self.response_404()
-            buf.seek(0)
+            try:
+                response = zip_bundle_response(
+                    root, ExportDashboardsCommand(requested_ids).run()
+                )
+            except DashboardNotFoundError:
+                return self.response_404()
 
-            response = send_file(
-                buf,
-                mimetype="application/zip",
-                as_attachment=True,
-                download_name=filename,
-            )
             if token:
                 response.set_cookie(token, "done", max_age=600)
             return response
@@ -911,7 +898,9 @@ class DashboardRestApi(BaseSupersetModelRestApi):
         # fetch the dashboard screenshot using the current user and cache if set
         screenshot = DashboardScreenshot(
             dashboard_url, dashboard.digest
-        ).get_from_cache(cache=thumbnail_cache)
+        ).get_from_cache_in_formats(
+            thumbnail_cache, get_image_formats(request.accept_mimetypes)
+        )
         # If the screenshot does not exist, request one from the workers
         if not screenshot:
             self.incr_stats("async", self.thumbnail.__name__)
@@ -932,9 +921,16 @@ class DashboardRestApi(BaseSupersetModelRestApi):
                 )
             )
         self.incr_stats("from_cache", self.thumbnail.__name__)
-        return Response(
-            FileWrapper(screenshot), mimetype="image/png", direct_passthrough=True
+        image, image_format = screenshot
+        response = Response(
+            FileWrapper(image),
+            mimetype=f"image/{image_format}",
+            direct_passthrough=True,
         )
+        # the format of the image depends on the formats the client accepts
+        if self.appbuilder.app.config["THUMBNAIL_IMAGE_FORMATS"]:
+            response.vary.add("Accept")
+        return response
 
     @expose("/favorite_status/", methods=("GET",))
     @protect()
@@ -24,6 +24,7 @@ from typing import Any, Optional
 from collections.abc import Iterator
 
 import yaml
+from sqlalchemy.orm import selectinload
 
 from superset.charts.commands.export import ExportChartsCommand
 from superset.dashboards.commands.exceptions import DashboardNotFoundError
@@ -102,14 +103,35 @@ def append_charts(position: dict[str, Any], charts: set[Slice]) -> dict[str, Any
     return position
 
 
+def get_native_filter_dataset_ids(dashboards: list[Dashboard]) -> list[int]:
+    """Return the ids of the datasets targeted by the native filters of dashboards."""
+    dataset_ids: dict[int, None] = {}
+    for dashboard in dashboards:
+        try:
+            metadata = json.loads(dashboard.json_metadata or "{}")
+        except json.decoder.JSONDecodeError:
+            continue
+        for native_filter in metadata.get("native_filter_configuration", []):
+            for target in native_filter.get("targets", []):
+                if (dataset_id := target.get("datasetId")) is not None:
+                    dataset_ids[dataset_id] = None
+    return list(dataset_ids)
+
+
 class ExportDashboardsCommand(ExportModelsCommand):
     dao = DashboardDAO
     not_found = DashboardNotFoundError
 
+    def __init__(self, model_ids: list[int], export_related: bool = True):
+        super().__init__(model_ids, export_related)
+
+        # the UUIDs of the native filter datasets of the chunk being exported, among
+        # the ones the user can access
+        self._dataset_uuids: dict[int, str] = {}
+
     # pylint: disable=too-many-locals
-    @staticmethod
     def _export(
-        model: Dashboard, export_related: bool = True
+        self, model: Dashboard, export_related: bool = True
     ) -> Iterator[tuple[str, str]]:
         file_name = get_filename(model.dashboard_title, model.id)
         file_path = f"dashboards/{file_name}.yaml"
@@ -138,12 +160,8 @@ class ExportDashboardsCommand(ExportModelsCommand):
         ):
             for target in native_filter.get("targets", []):
                 dataset_id = target.pop("datasetId", None)
-                if dataset_id is not None:
-                    dataset = DatasetDAO.find_by_id(dataset_id)
-                    if dataset:
-                        target["datasetUuid"] = str(dataset.uuid)
-                        if export_related:
-                            yield from ExportDatasetsCommand([dataset_id]).run()
+                if dataset_uuid := self._dataset_uuids.get(dataset_id):
+                    target["datasetUuid"] = dataset_uuid
 
         # the mapping between dashboard -> charts is inferred from the position
         # attribute, so if it's not present we need to add a default config
@@ -165,6 +183,25 @@ class ExportDashboardsCommand(ExportModelsCommand):
         file_content = yaml.safe_dump(payload, sort_keys=False)
         yield file_path, file_content
 
-        if export_related:
-            chart_ids = [chart.id for chart in model.slices]
+    def _load_options(self) -> list[Any]:
+        return [selectinload(Dashboard.slices)]
+
+    def _prefetch(self, models: list[Dashboard]) -> None:
+        super()._prefetch(models)
+        self._dataset_uuids = (
+            {
+                dataset.id: str(dataset.uuid)
+                for dataset in DatasetDAO.find_by_ids(dataset_ids)
+            }
+            if (dataset_ids := get_native_filter_dataset_ids(models))
+            else {}
+        )
+
+    def _export_related(self, models: list[Dashboard]) -> Iterator[tuple[str, str]]:
+        if self._dataset_uuids:
+            yield from ExportDatasetsCommand(list(self._dataset_uuids)).run()
+
+        if chart_ids := list(
+            dict.fromkeys(chart.id for model in models for chart in model.slices)
+        ):
             yield from ExportChartsCommand(chart_ids).run()
@@ -24,6 +24,7 @@ from sqlalchemy.sql import select
 from superset.charts.commands.importers.v1.utils import import_chart
 from superset.charts.schemas import ImportV1ChartSchema
 from superset.commands.importers.v1 import ImportModelsCommand
+from superset.connectors.sqla.models import SqlaTable
 from superset.daos.dashboard import DashboardDAO
 from superset.dashboards.commands.exceptions import DashboardImportError
 from superset.dashboards.commands.importers.v1.utils import (
@@ -35,9 +36,15 @@ from superset.dashboards.commands.importers.v1.utils import (
 from superset.dashboards.schemas import ImportV1DashboardSchema
 from superset.databases.commands.importers.v1.utils import import_database
 from superset.databases.schemas import ImportV1DatabaseSchema
-from superset.datasets.commands.importers.v1.utils import import_dataset
+from superset.datasets.commands.importers.v1.utils import (
+    import_dataset,
+    load_data_concurrently,
+)
 from superset.datasets.schemas import ImportV1DatasetSchema
-from superset.models.dashboard import dashboard_slices
+from superset.models.core import Database
+from superset.models.dashboard import Dashboard, dashboard_slices
+from superset.models.helpers import ImportPrefetch
+from superset.models.slice import Slice
 
 
 class ImportDashboardsCommand(ImportModelsCommand):
@@ -82,7 +89,17 @@ class ImportDashboardsCommand(ImportModelsCommand):
             if file_name.startswith("datasets/") and config["uuid"] in dataset_uuids:
                 database_uuids.add(config["database_uuid"])
 
+        def get_configs(prefix: str, uuids: set[str]) -> list[dict[str, Any]]:
+            return [
+                config
+                for file_name, config in configs.items()
+                if file_name.startswith(prefix) and config["uuid"] in uuids
+            ]
+
         # import related databases
+        ImportPrefetch.load(
+            session, Database, get_configs("databases/", database_uuids)
+        )
         database_ids: dict[str, int] = {}
         for file_name, config in configs.items():
             if file_name.startswith("databases/") and config["uuid"] in database_uuids:
@@ -90,21 +107,30 @@ class ImportDashboardsCommand(ImportModelsCommand):
                 database_ids[str(database.uuid)] = database.id
 
         # import datasets with the correct parent ref
-        dataset_info: dict[str, dict[str, Any]] = {}
+        dataset_configs: list[dict[str, Any]] = []
         for file_name, config in configs.items():
             if (
                 file_name.startswith("datasets/")
                 and config["database_uuid"] in database_ids
             ):
                 config["database_id"] = database_ids[config["database_uuid"]]
-                dataset = import_dataset(session, config, overwrite=False)
-                dataset_info[str(dataset.uuid)] = {
-                    "datasource_id": dataset.id,
-                    "datasource_type": dataset.datasource_type,
-                    "datasource_name": dataset.table_name,
-                }
+                dataset_configs.append(config)
+        ImportPrefetch.load(session, SqlaTable, dataset_configs)
+        dataset_info: dict[str, dict[str, Any]] = {}
+        data_loads: list[tuple[str, SqlaTable]] = []
+        for config in dataset_configs:
+            dataset = import_dataset(
+                session, config, overwrite=False, data_loads=data_loads
+            )
+            dataset_info[str(dataset.uuid)] = {
+                "datasource_id": dataset.id,
+                "datasource_type": dataset.datasource_type,
+                "datasource_name": dataset.table_name,
+            }
+        load_data_concurrently(data_loads, session)
 
         # import charts with the correct parent ref
+        ImportPrefetch.load(session, Slice, get_configs("charts/", chart_uuids))
         chart_ids: dict[str, int] = {}
         for file_name, config in configs.items():
             if (
@@ -124,11 +150,22 @@ class ImportDashboardsCommand(ImportModelsCommand):
                 chart_ids[str(chart.uuid)] = chart.id
 
         # store the existing relationship between dashboards and charts
-        existing_relationships = session.execute(
-            select([dashboard_slices.c.dashboard_id, dashboard_slices.c.slice_id])
-        ).fetchall()
+        existing_relationships = set(
+            session.execute(
+                select([dashboard_slices.c.dashboard_id, dashboard_slices.c.slice_id])
+            ).fetchall()
+        )
 
         # import dashboards
+        ImportPrefetch.load(
+            session,
+            Dashboard,
+            [
+                config
+                for file_name, config in configs.items()
+                if file_name.startswith("dashboards/")
+            ],
+        )
         dashboard_chart_ids: list[tuple[int, int]] = []
         for file_name, config in configs.items():
             if file_name.startswith("dashboards/"):
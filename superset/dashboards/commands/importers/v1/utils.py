@@ -155,7 +155,7 @@ def import_dashboard(
         "can_write",
         "Dashboard",
     )
-    existing = session.query(Dashboard).filter_by(uuid=config["uuid"]).first()
+    existing = Dashboard.find_by_uuid(session, config["uuid"])
     if existing:
         if not overwrite or not can_write:
             return existing
@@ -18,11 +18,10 @@
 import json
 import logging
 from datetime import datetime
-from io import BytesIO
 from typing import Any, cast, Optional
 from zipfile import is_zipfile, ZipFile
 
-from flask import request, Response, send_file
+from flask import request, Response
 from flask_appbuilder.api import expose, protect, rison, safe
 from flask_appbuilder.models.sqla.interface import SQLAInterface
 from marshmallow import ValidationError
@@ -93,7 +92,7 @@ from superset.models.core import Database
 from superset.superset_typing import FlaskResponse
 from superset.utils.core import error_msg_from_exception, parse_js_uri_path_item
 from superset.utils.ssh_tunnel import mask_password_info
-from superset.views.base import json_errors_response
+from superset.views.base import json_errors_response, zip_bundle_response
 from superset.views.base_api import (
     BaseSupersetModelRestApi,
     requires_form_data,
@@ -1078,26 +1077,14 @@ class DatabaseRestApi(BaseSupersetModelRestApi):
         requested_ids = kwargs["rison"]
         timestamp = datetime.now().strftime("%Y%m%dT%H%M%S")
         root = f"database_export_{timestamp}"
-        filename = f"{root}.zip"
 
-        buf = BytesIO()
-        with ZipFile(buf, "w") as bundle:
-            try:
-                for file_name, file_content in ExportDatabasesCommand(
-                    requested_ids
-                ).run():
-                    with bundle.open(f"{root}/{file_name}", "w") as fp:
-                        fp.write(file_content.encode())
-            except DatabaseNotFoundError:
-                return self.response_404()
-        buf.seek(0)
+        try:
+            response = zip_bundle_response(
+                root, ExportDatabasesCommand(requested_ids).run()
+            )
+        except DatabaseNotFoundError:
+            return self.response_404()
 
-        response = send_file(
-            buf,
-            mimetype="application/zip",
-            as_attachment=True,
-            download_name=filename,
-        )
         if token := request.args.get("token"):
             response.set_cookie(token, "done", max_age=600)
         return response
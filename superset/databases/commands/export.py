@@ -22,7 +22,9 @@ from typing import Any
 from collections.abc import Iterator
 
 import yaml
+from sqlalchemy.orm import selectinload
 
+from superset.connectors.sqla.models import SqlaTable
 from superset.databases.commands.exceptions import DatabaseNotFoundError
 from superset.daos.database import DatabaseDAO
 from superset.commands.export.models import ExportModelsCommand
@@ -120,3 +122,11 @@ class ExportDatabasesCommand(ExportModelsCommand):
 
                 file_content = yaml.safe_dump(payload, sort_keys=False)
                 yield file_path, file_content
+
+    def _load_options(self) -> list[Any]:
+        if not self.export_related:
+            return []
+        return [
+            selectinload(Database.tables).selectinload(SqlaTable.columns),
+            selectinload(Database.tables).selectinload(SqlaTable.metrics),
+        ]
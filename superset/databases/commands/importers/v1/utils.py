@@ -39,7 +39,7 @@ def import_database(
         "can_write",
         "Database",
     )
-    existing = session.query(Database).filter_by(uuid=config["uuid"]).first()
+    existing = Database.find_by_uuid(session, config["uuid"])
     if existing:
         if not overwrite or not can_write:
             return existing
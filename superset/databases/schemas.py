@@ -24,7 +24,7 @@ from typing import Any
 from flask import current_app
 from flask_babel import lazy_gettext as _
 from marshmallow import EXCLUDE, fields, pre_load, Schema, validates_schema
-from marshmallow.validate import Length, ValidationError
+from marshmallow.validate import Length, Range, ValidationError
 from sqlalchemy import MetaData
 
 from superset import db, is_feature_enabled
@@ -132,7 +132,13 @@ extra_description = markdown(
     "5. The ``allows_virtual_table_explore`` field is a boolean specifying "
     "whether or not the Explore button in SQL Lab results is shown.<br/>"
     "6. The ``disable_data_preview`` field is a boolean specifying whether or not data "
-    "preview queries will be run when fetching table metadata in SQL Lab.",
+    "preview queries will be run when fetching table metadata in SQL Lab.<br/>"
+    "7. The ``concurrency_limit`` caps the number of chart queries running at once "
+    'against the database. Specify it as **"concurrency_limit": {"max_queries": 50, '
+    '"max_background_queries": 10, "queue_timeout": 60}**, where '
+    "``max_background_queries`` is the number of queries cache warm-ups and reports "
+    "may run, and ``queue_timeout`` the number of seconds a query waits for its turn "
+    "before failing.",
     True,
 )
 get_export_ids_schema = {"type": "array", "items": {"type": "integer"}}
@@ -200,6 +206,24 @@ def encrypted_extra_validator(value: str) -> str:
     return value
 
 
+class PositiveNumber(fields.Float):
+    """A float given as a JSON number, and greater than zero"""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(validate=Range(min=0, min_inclusive=False), **kwargs)
+
+    def _deserialize(self, value: Any, attr: Any, data: Any, **kwargs: Any) -> Any:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise self.make_error("invalid")
+        return super()._deserialize(value, attr, data, **kwargs)
+
+
+class ConcurrencyLimitSchema(Schema):
+    max_queries = fields.Integer(strict=True, validate=Range(min=1))
+    max_background_queries = fields.Integer(strict=True, validate=Range(min=1))
+    queue_timeout = PositiveNumber()
+
+
 def extra_validator(value: str) -> str:
     """
     Validate that extra is a valid JSON string, and that metadata_params
@@ -226,6 +250,18 @@ def extra_validator(value: str) -> str:
                             )
                         ]
                     )
+            if "concurrency_limit" in extra_ and (
+                errors := ConcurrencyLimitSchema().validate(extra_["concurrency_limit"])
+            ):
+                raise ValidationError(
+                    [
+                        _(
+                            "The concurrency_limit in Extra field "
+                            "is not configured correctly. %(errors)s",
+                            errors=json.dumps(errors),
+                        )
+                    ]
+                )
     return value
 
 
@@ -738,6 +774,7 @@ class ImportV1DatabaseExtraSchema(Schema):
     allows_virtual_table_explore = fields.Boolean(required=False)
     cancel_query_on_windows_unload = fields.Boolean(required=False)
     disable_data_preview = fields.Boolean(required=False)
+    concurrency_limit = fields.Nested(ConcurrencyLimitSchema, required=False)
 
 
 class ImportV1DatabaseSchema(Schema):
@@ -53,3 +53,21 @@ def df_to_records(dframe: pd.DataFrame) -> list[dict[str, Any]]:
         dict(zip(columns, map(_convert_big_integers, row)))
         for row in zip(*[dframe[col] for col in columns])
     )
+
+
+def df_to_columns(dframe: pd.DataFrame) -> dict[str, list[Any]]:
+    """
+    Convert a DataFrame to a mapping of column names to column values.
+
+    Values are converted the same way as in ``df_to_records``.
+
+    :param dframe: the DataFrame to convert
+    :returns: a dictionary with a list of values for each column of the DataFrame
+    """
+    if not dframe.columns.is_unique:
+        logger.warning(
+            "DataFrame columns are not unique, some columns will be omitted."
+        )
+    return {
+        col: list(map(_convert_big_integers, dframe[col])) for col in dframe.columns
+    }
@@ -18,12 +18,11 @@
 import json
 import logging
 from datetime import datetime
-from io import BytesIO
 from typing import Any
 from zipfile import is_zipfile, ZipFile
 
 import yaml
-from flask import request, Response, send_file
+from flask import request, Response
 from flask_appbuilder.api import expose, protect, rison, safe
 from flask_appbuilder.models.sqla.interface import SQLAInterface
 from flask_babel import ngettext
@@ -67,7 +66,11 @@ from superset.datasets.schemas import (
     GetOrCreateDatasetSchema,
 )
 from superset.utils.core import parse_boolean_string
-from superset.views.base import DatasourceFilter, generate_download_headers
+from superset.views.base import (
+    DatasourceFilter,
+    generate_download_headers,
+    zip_bundle_response,
+)
 from superset.views.base_api import (
     BaseSupersetModelRestApi,
     RelatedFieldFilter,
@@ -512,26 +515,14 @@ class DatasetRestApi(BaseSupersetModelRestApi):
             token = request.args.get("token")
             timestamp = datetime.now().strftime("%Y%m%dT%H%M%S")
             root = f"dataset_export_{timestamp}"
-            filename = f"{root}.zip"
 
-            buf = BytesIO()
-            with ZipFile(buf, "w") as bundle:
-                try:
-                    for file_name, file_content in ExportDatasetsCommand(
-                        requested_ids
-                    ).run():
-                        with bundle.open(f"{root}/{file_name}", "w") as fp:
-                            fp.write(file_content.encode())
-                except DatasetNotFoundError:
-                    return self.response_404()
-            buf.seek(0)
+            try:
+                response = zip_bundle_response(
+                    root, ExportDatasetsCommand(requested_ids).run()
+                )
+            except DatasetNotFoundError:
+                return self.response_404()
 
-            response = send_file(
-                buf,
-                mimetype="application/zip",
-                as_attachment=True,
-                download_name=filename,
-            )
             if token:
                 response.set_cookie(token, "done", max_age=600)
             return response
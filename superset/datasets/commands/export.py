@@ -19,8 +19,10 @@
 import json
 import logging
 from collections.abc import Iterator
+from typing import Any
 
 import yaml
+from sqlalchemy.orm import selectinload
 
 from superset.commands.export.models import ExportModelsCommand
 from superset.connectors.sqla.models import SqlaTable
@@ -111,3 +113,10 @@ class ExportDatasetsCommand(ExportModelsCommand):
 
             file_content = yaml.safe_dump(payload, sort_keys=False)
             yield file_path, file_content
+
+    def _load_options(self) -> list[Any]:
+        return [
+            selectinload(SqlaTable.columns),
+            selectinload(SqlaTable.metrics),
+            selectinload(SqlaTable.database),
+        ]
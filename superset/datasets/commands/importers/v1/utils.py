@@ -18,7 +18,8 @@ import gzip
 import json
 import logging
 import re
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 from urllib import request
 
 import pandas as pd
@@ -105,12 +106,18 @@ def import_dataset(
     overwrite: bool = False,
     force_data: bool = False,
     ignore_permissions: bool = False,
+    data_loads: Optional[list[tuple[str, SqlaTable]]] = None,
 ) -> SqlaTable:
+    """
+    Import a dataset, loading its data if any and the table doesn't exist. When
+    `data_loads` is given, the data is appended to it rather than loaded, for the
+    caller to load the data of all the datasets with `load_data_concurrently`.
+    """
     can_write = ignore_permissions or security_manager.can_access(
         "can_write",
         "Dataset",
     )
-    existing = session.query(SqlaTable).filter_by(uuid=config["uuid"]).first()
+    existing = SqlaTable.find_by_uuid(session, config["uuid"])
     if existing:
         if not overwrite or not can_write:
             return existing
@@ -172,7 +179,10 @@ def import_dataset(
         table_exists = True
 
     if data_uri and (not table_exists or force_data):
-        load_data(data_uri, dataset, dataset.database, session)
+        if data_loads is None:
+            load_data(data_uri, dataset, dataset.database, session)
+        else:
+            data_loads.append((data_uri, dataset))
 
     if hasattr(g, "user") and g.user:
         dataset.owners.append(g.user)
@@ -180,21 +190,23 @@ def import_dataset(
     return dataset
 
 
-def load_data(
-    data_uri: str, dataset: SqlaTable, database: Database, session: Session
-) -> None:
+def fetch_data(data_uri: str) -> pd.DataFrame:
     """
-    Load data from a data URI into a dataset.
-
-    :raises DatasetUnAllowedDataURI: If a dataset is trying
-    to load data from a URI that is not allowed.
+    Download the CSV data of a dataset.
     """
-    validate_data_uri(data_uri)
     logger.info("Downloading data from %s", data_uri)
     data = request.urlopen(data_uri)  # pylint: disable=consider-using-with
     if data_uri.endswith(".gz"):
         data = gzip.open(data)
-    df = pd.read_csv(data, encoding="utf-8")
+    return pd.read_csv(data, encoding="utf-8")
+
+
+def write_data(
+    df: pd.DataFrame, dataset: SqlaTable, database: Database, session: Session
+) -> None:
+    """
+    Write the data of a dataset into its table, replacing it.
+    """
     dtype = get_dtype(df, dataset)
 
     # convert temporal columns
@@ -229,3 +241,42 @@ def load_data(
                 index=False,
                 method="multi",
             )
+
+
+def load_data(
+    data_uri: str, dataset: SqlaTable, database: Database, session: Session
+) -> None:
+    """
+    Load data from a data URI into a dataset.
+
+    :raises DatasetUnAllowedDataURI: If a dataset is trying
+    to load data from a URI that is not allowed.
+    """
+    validate_data_uri(data_uri)
+    write_data(fetch_data(data_uri), dataset, database, session)
+
+
+def load_data_concurrently(
+    data_loads: list[tuple[str, SqlaTable]], session: Session
+) -> None:
+    """
+    Load data from data URIs into datasets, see `load_data`.
+
+    The data is downloaded in `IMPORT_DATA_THREADS` threads, and written in the
+    current one as the downloads complete, within the import transaction if possible.
+
+    :raises DatasetUnAllowedDataURI: If a dataset is trying
+    to load data from a URI that is not allowed.
+    """
+    for data_uri, _ in data_loads:
+        validate_data_uri(data_uri)
+
+    with ThreadPoolExecutor(
+        max_workers=current_app.config["IMPORT_DATA_THREADS"]
+    ) as executor:
+        downloads = [
+            (executor.submit(fetch_data, data_uri), dataset)
+            for data_uri, dataset in data_loads
+        ]
+        for download, dataset in downloads:
+            write_data(download.result(), dataset, dataset.database, session)
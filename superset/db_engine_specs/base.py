@@ -21,11 +21,15 @@ from __future__ import annotations
 import json
 import logging
 import re
+import time
+import uuid
+from collections.abc import Iterable, Iterator
 from datetime import datetime
 from re import Match, Pattern
 from typing import Any, Callable, cast, ContextManager, NamedTuple, TYPE_CHECKING, Union
 
 import pandas as pd
+import pyarrow as pa
 import sqlparse
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
@@ -35,7 +39,7 @@ from flask_appbuilder.security.sqla.models import User
 from flask_babel import gettext as __, lazy_gettext as _
 from marshmallow import fields, Schema
 from marshmallow.validate import Range
-from sqlalchemy import column, select, types
+from sqlalchemy import column, MetaData, select, Table as SqlTable, types
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.engine.interfaces import Compiled, Dialect
 from sqlalchemy.engine.reflection import Inspector
@@ -51,9 +55,15 @@ from typing_extensions import TypedDict
 from superset import security_manager, sql_parse
 from superset.constants import TimeGrain as TimeGrainConstants
 from superset.databases.utils import make_url_safe
+from superset.dataframe import df_to_records
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
+from superset.exceptions import SupersetException
 from superset.sql_parse import ParsedQuery, Table
-from superset.superset_typing import ResultSetColumnType, SQLAColumnType
+from superset.superset_typing import (
+    DbapiDescription,
+    ResultSetColumnType,
+    SQLAColumnType,
+)
 from superset.utils import core as utils
 from superset.utils.core import ColumnSpec, GenericDataType
 from superset.utils.hashing import md5_sha_from_str
@@ -139,6 +149,35 @@ def compile_timegrain_expression(
     return element.name.replace("{col}", compiler.process(element.col, **kwargs))
 
 
+def get_upload_dtypes(sample: pd.DataFrame) -> dict[Any, Any]:
+    """
+    Return the dtypes the chunks of an upload are cast to, from its first chunk.
+
+    Each chunk would otherwise get its own dtypes, e.g. an integer column with a
+    missing value in a following chunk would be uploaded as floats. Integers and
+    booleans are thus made nullable, and the columns without any value in the sample
+    are uploaded as strings.
+
+    :param sample: The first chunk of the upload
+    :return: The dtype of each column
+    """
+    dtypes: dict[Any, Any] = {}
+    for name, series in sample.items():
+        if series.isna().all():
+            dtypes[name] = "string"
+        elif pd.api.types.is_bool_dtype(series):
+            dtypes[name] = "boolean"
+        elif pd.api.types.is_integer_dtype(series):
+            dtypes[name] = "Int64"
+        else:
+            dtypes[name] = series.dtype
+    return dtypes
+
+
+def get_sql_table(table: Table) -> SqlTable:
+    return SqlTable(table.table, MetaData(), schema=table.schema)
+
+
 class LimitMethod:  # pylint: disable=too-few-public-methods
     """Enum the ways that limits can be applied"""
 
@@ -373,6 +412,10 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # if True, database will be listed as option in the upload file form
     supports_file_upload = True
 
+    # Whether uploaded files can be written in chunks, i.e., the first chunk
+    # creates the table and the following ones are appended to it
+    supports_chunked_upload = True
+
     # Is the DB engine spec able to change the default schema? This requires implementing
     # a custom `adjust_engine_params` method.
     supports_dynamic_schema = False
@@ -734,32 +777,54 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         try:
             if cls.limit_method == LimitMethod.FETCH_MANY and limit:
                 return cursor.fetchmany(limit)
-            data = cursor.fetchall()
-            description = cursor.description or []
-            # Create a mapping between column name and a mutator function to normalize
-            # values with. The first two items in the description row are
-            # the column name and type.
-            column_mutators = {
-                row[0]: func
-                for row in description
-                if (
-                    func := cls.column_type_mutators.get(
-                        type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
-                    )
+            return cursor.fetchall()
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
+    @classmethod
+    def get_column_mutators(
+        cls, cursor_description: DbapiDescription
+    ) -> dict[int, Callable[[Any], Any]]:
+        """
+        Map the index of each column that needs normalizing to the mutator function
+        from ``column_type_mutators`` that applies to its type.
+
+        Mutators are applied column-wise once the rows have been transposed, see
+        ``SupersetResultSet`` and ``mutate_columns``.
+
+        :param cursor_description: Cursor description
+        :return: Mutator function for each column index
+        """
+        # The first two items in the description row are the column name and type.
+        return {
+            idx: func
+            for idx, row in enumerate(cursor_description or [])
+            if (
+                func := cls.column_type_mutators.get(
+                    type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
                 )
-            }
-            if column_mutators:
-                indexes = {row[0]: idx for idx, row in enumerate(description)}
-                for row_idx, row in enumerate(data):
-                    new_row = list(row)
-                    for col, func in column_mutators.items():
-                        col_idx = indexes[col]
-                        new_row[col_idx] = func(row[col_idx])
-                    data[row_idx] = tuple(new_row)
+            )
+        }
+
+    @staticmethod
+    def mutate_columns(
+        data: list[tuple[Any, ...]],
+        column_mutators: dict[int, Callable[[Any], Any]],
+    ) -> list[tuple[Any, ...]]:
+        """
+        Apply mutator functions to whole columns of rows fetched from a cursor.
 
+        :param data: Rows as returned by the cursor
+        :param column_mutators: Mutator function for each column index
+        :return: Rows with the mutated values
+        """
+        if not data or not column_mutators:
             return data
-        except Exception as ex:
-            raise cls.get_dbapi_mapped_exception(ex) from ex
+
+        columns = list(zip(*data))
+        for idx, func in column_mutators.items():
+            columns[idx] = tuple(map(func, columns[idx]))
+        return list(zip(*columns))
 
     @classmethod
     def expand_data(
@@ -778,6 +843,29 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         """
         return columns, data, []
 
+    @classmethod
+    def expand_table(
+        cls, columns: list[ResultSetColumnType], table: pa.Table
+    ) -> tuple[
+        list[ResultSetColumnType], list[dict[Any, Any]], list[ResultSetColumnType]
+    ]:
+        """
+        Convert a result set table to records, expanding nested fields.
+
+        Engines that support expanding nested fields can override this to expand
+        the data column by column instead of going through ``expand_data``.
+
+        :param columns: columns selected in the query
+        :param table: the Arrow table holding the result set
+        :return: list of all columns(selected columns and their nested fields),
+                 expanded data set, listed of nested fields
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.result_set import SupersetResultSet
+
+        data = df_to_records(SupersetResultSet.convert_table_to_df(table)) or []
+        return cls.expand_data(columns, data)
+
     @classmethod
     def alter_new_orm_column(cls, orm_col: TableColumn) -> None:
         """Allow altering default column attributes when first detected/added
@@ -1025,11 +1113,147 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             to_sql_kwargs["schema"] = table.schema
 
         with cls.get_engine(database) as engine:
-            if engine.dialect.supports_multivalues_insert:
-                to_sql_kwargs["method"] = "multi"
+            if method := cls.get_df_to_sql_method(engine):
+                to_sql_kwargs["method"] = method
 
             df.to_sql(con=engine, **to_sql_kwargs)
 
+    @classmethod
+    def get_df_to_sql_method(
+        cls, engine: Engine  # pylint: disable=unused-argument
+    ) -> str | Callable[..., Any] | None:
+        """
+        Return the insertion ``method`` passed to `pandas.DataFrame.to_sql`.
+
+        By default multi-row ``INSERT`` statements are used when the dialect supports
+        them, otherwise rows are inserted with ``executemany``. Engines with a native
+        bulk loading path can return a callable implementing it, see
+        https://pandas.pydata.org/docs/user_guide/io.html#io-sql-method.
+
+        :param engine: The engine the data is uploaded through
+        :return: The method, or ``None`` to use the pandas default
+        """
+        if engine.dialect.supports_multivalues_insert:
+            return "multi"
+        return None
+
+    @classmethod
+    def chunked_df_to_sql(
+        cls,
+        database: Database,
+        table: Table,
+        chunks: Iterable[pd.DataFrame],
+        to_sql_kwargs: dict[str, Any],
+    ) -> int:
+        """
+        Upload data from a stream of Pandas DataFrames to a database.
+
+        The first chunk is uploaded honoring ``if_exists``, and the following ones are
+        appended to it, so that the whole file is never held in memory. All the chunks
+        are cast to the dtypes of the first one, see `get_upload_dtypes`. When
+        replacing a table, the chunks are uploaded to a staging table which then
+        replaces it, for the table to be left untouched if the upload fails. Engines
+        that don't support appending (see ``supports_chunked_upload``) receive a single
+        DataFrame instead.
+
+        :param database: The database to upload the data to
+        :param table: The table to upload the data to
+        :param chunks: The dataframes with data to be uploaded
+        :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
+        :return: The number of uploaded rows
+        """
+        if not cls.supports_chunked_upload:
+            df = pd.concat(chunks)
+            cls.df_to_sql(database, table, df, to_sql_kwargs)
+            return len(df)
+
+        if to_sql_kwargs.get("if_exists") != "replace":
+            return cls._chunks_to_sql(database, table, iter(chunks), to_sql_kwargs)
+
+        staging_table = Table(
+            f"{table.table[:32]}_{uuid.uuid4().hex[:16]}", table.schema, table.catalog
+        )
+        try:
+            rows = cls._chunks_to_sql(
+                database,
+                staging_table,
+                iter(chunks),
+                {**to_sql_kwargs, "if_exists": "fail"},
+            )
+            cls.replace_table(database, staging_table, table)
+        except Exception:
+            with cls.get_engine(database, schema=table.schema) as engine:
+                get_sql_table(staging_table).drop(engine, checkfirst=True)
+            raise
+
+        return rows
+
+    @classmethod
+    def _chunks_to_sql(
+        cls,
+        database: Database,
+        table: Table,
+        chunks: Iterator[pd.DataFrame],
+        to_sql_kwargs: dict[str, Any],
+    ) -> int:
+        if (df := next(chunks, None)) is None:
+            return 0
+
+        dtypes = get_upload_dtypes(df)
+        rows = 0
+        start = time.time()
+        while df is not None:
+            try:
+                df = df.astype({name: dtypes[name] for name in df if name in dtypes})
+            except (TypeError, ValueError) as ex:
+                raise SupersetException(
+                    f"Rows {rows + 1} to {rows + len(df)} don't match the column "
+                    f"types of the first rows: {ex}"
+                ) from ex
+
+            cls.df_to_sql(
+                database,
+                table,
+                df,
+                {**to_sql_kwargs, "if_exists": "append"} if rows else {**to_sql_kwargs},
+            )
+            rows += len(df)
+            elapsed = time.time() - start
+            logger.info(
+                "Uploaded %d rows to %s (%.0f rows/s)",
+                rows,
+                table,
+                rows / elapsed if elapsed else rows,
+            )
+            df = next(chunks, None)
+
+        return rows
+
+    @classmethod
+    def replace_table(cls, database: Database, source: Table, target: Table) -> None:
+        """
+        Replace a table with another one of the same schema, e.g. the staging table of
+        an upload.
+
+        The table is dropped and the other one renamed to it in a single transaction,
+        which is atomic for the engines with transactional DDL. Can be overridden for
+        engines that don't support ``ALTER TABLE ... RENAME TO``.
+
+        :param database: The database of the tables
+        :param source: The table to rename
+        :param target: The table to replace
+        """
+        with cls.get_engine(database, schema=target.schema) as engine:
+            preparer = engine.dialect.identifier_preparer
+            with engine.begin() as connection:
+                get_sql_table(target).drop(connection, checkfirst=True)
+                connection.execute(
+                    text(
+                        f"ALTER TABLE {preparer.format_table(get_sql_table(source))} "
+                        f"RENAME TO {preparer.quote(target.table)}"
+                    )
+                )
+
     @classmethod
     def convert_dttm(  # pylint: disable=unused-argument
         cls, target_type: str, dttm: datetime, db_extra: dict[str, Any] | None = None
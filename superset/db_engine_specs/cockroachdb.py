@@ -25,6 +25,7 @@ from superset.db_engine_specs.postgres import PostgresEngineSpec
 class CockroachDbEngineSpec(PostgresEngineSpec):
     engine = "cockroachdb"
     engine_name = "CockroachDB"
+    supports_copy_from_stdin = False
 
     @classmethod
     def convert_dttm(
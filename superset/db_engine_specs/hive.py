@@ -102,6 +102,9 @@ class HiveEngineSpec(PrestoEngineSpec):
 
     supports_dynamic_schema = True
 
+    # uploads are written as a single Parquet file, and appends are not supported
+    supports_chunked_upload = False
+
     # When running `SHOW FUNCTIONS`, what is the name of the column with the
     # function names?
     _show_functions_column = "tab_name"
@@ -334,29 +334,16 @@ class OcientEngineSpec(BaseEngineSpec):
             )
 
             if columns_to_sanitize:
-                # At least 1 column has to be sanitized.
-
-                def identity(x: Any) -> Any:
-                    return x
-
-                # Use the identity function if the column type doesn't need to be
-                # sanitized.
-                sanitization_functions: list[SanitizeFunc] = [
-                    identity for _ in range(len(cursor.description))
-                ]
-                for info in columns_to_sanitize:
-                    sanitization_functions[info.column_index] = info.sanitize_func
-
-                # pyocient returns a list of NamedTuple objects which represent a
-                # single row. We have to do this copy because that data type is
-                # NamedTuple's are immutable.
-                rows = [
-                    tuple(
-                        sanitize_func(val)
-                        for sanitize_func, val in zip(sanitization_functions, row)
-                    )
-                    for row in rows
-                ]
+                # At least 1 column has to be sanitized. pyocient returns a list of
+                # NamedTuple objects which represent a single row, so the sanitized
+                # columns are mapped and the rows rebuilt as plain tuples.
+                rows = cls.mutate_columns(
+                    rows,
+                    {
+                        info.column_index: info.sanitize_func
+                        for info in columns_to_sanitize
+                    },
+                )
         return rows
 
     @classmethod
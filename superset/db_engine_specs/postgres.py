@@ -17,17 +17,21 @@
 
 from __future__ import annotations
 
+import csv
+import io
 import json
 import logging
 import re
+from collections.abc import Iterator
 from datetime import datetime
 from re import Pattern
-from typing import Any, TYPE_CHECKING
+from typing import Any, Callable, TYPE_CHECKING
 
 import sqlparse
 from flask_babel import gettext as __
 from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, ENUM, JSON
 from sqlalchemy.dialects.postgresql.base import PGInspector
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 from sqlalchemy.types import Date, DateTime, String
@@ -41,6 +45,8 @@ from superset.utils import core as utils
 from superset.utils.core import GenericDataType
 
 if TYPE_CHECKING:
+    from pandas.io.sql import SQLTable
+
     from superset.models.core import Database  # pragma: no cover
 
 logger = logging.getLogger()
@@ -95,6 +101,38 @@ def parse_options(connect_args: dict[str, Any]) -> dict[str, str]:
     return {token[0]: token[1] for token in tokens}
 
 
+def copy_from_stdin(
+    pd_table: SQLTable,
+    conn: Connection,
+    keys: list[str],
+    data_iter: Iterator[tuple[Any, ...]],
+) -> None:
+    """
+    Insert rows with ``COPY ... FROM STDIN``, for `pandas.DataFrame.to_sql`.
+
+    Rows are streamed to the server as CSV, which is much faster than issuing
+    ``INSERT`` statements. ``NULL`` values are written as ``\\N`` so that they are
+    not confused with empty strings.
+    """
+    preparer = conn.dialect.identifier_preparer
+    table_name = preparer.quote(pd_table.name)
+    if pd_table.schema:
+        table_name = f"{preparer.quote_schema(pd_table.schema)}.{table_name}"
+    columns = ", ".join(preparer.quote(key) for key in keys)
+
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        [r"\N" if value is None else value for value in row] for row in data_iter
+    )
+    buffer.seek(0)
+
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buffer,
+        )
+
+
 class PostgresBaseEngineSpec(BaseEngineSpec):
     """Abstract class for Postgres 'like' databases"""
 
@@ -198,6 +236,9 @@ class PostgresEngineSpec(PostgresBaseEngineSpec, BasicParametersMixin):
     max_column_name_length = 63
     try_remove_schema_from_table_name = False
 
+    # Whether file uploads are loaded with ``COPY ... FROM STDIN`` (psycopg2 only)
+    supports_copy_from_stdin = True
+
     column_type_mappings = (
         (
             re.compile(r"^double precision", re.IGNORECASE),
@@ -394,6 +435,12 @@ WHERE datistemplate = false;
             extra["engine_params"] = engine_params
         return extra
 
+    @classmethod
+    def get_df_to_sql_method(cls, engine: Engine) -> str | Callable[..., Any] | None:
+        if cls.supports_copy_from_stdin and engine.dialect.driver == "psycopg2":
+            return copy_from_stdin
+        return super().get_df_to_sql_method(engine)
+
     @classmethod
     def get_datatype(cls, type_code: Any) -> str | None:
         # pylint: disable=import-outside-toplevel
@@ -23,15 +23,19 @@ import time
 from abc import ABCMeta
 from collections import defaultdict, deque
 from datetime import datetime
+from itertools import chain
 from re import Pattern
 from textwrap import dedent
-from typing import Any, cast, Optional, TYPE_CHECKING
+from typing import Any, Callable, cast, Iterable, Optional, TYPE_CHECKING
 from urllib import parse
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import simplejson as json
 from flask import current_app
 from flask_babel import gettext as __, lazy_gettext as _
+from numpy.typing import NDArray
 from packaging.version import Version
 from sqlalchemy import Column, literal_column, types
 from sqlalchemy.engine.base import Engine
@@ -45,6 +49,7 @@ from superset import cache_manager, is_feature_enabled
 from superset.common.db_query_status import QueryStatus
 from superset.constants import TimeGrain
 from superset.databases.utils import make_url_safe
+from superset.dataframe import df_to_columns
 from superset.db_engine_specs.base import BaseEngineSpec
 from superset.errors import SupersetErrorType
 from superset.exceptions import SupersetTemplateException
@@ -58,7 +63,7 @@ from superset.models.sql_types.presto_sql_types import (
     TimeStamp,
     TinyInteger,
 )
-from superset.result_set import destringify
+from superset.result_set import destringify, SupersetResultSet
 from superset.superset_typing import ResultSetColumnType
 from superset.utils import core as utils
 from superset.utils.core import GenericDataType
@@ -159,6 +164,66 @@ def get_children(column: ResultSetColumnType) -> list[ResultSetColumnType]:
     raise Exception(f"Unknown type {type_}!")
 
 
+# marks cells that ``expand_data`` leaves out of the row dictionary
+_MISSING = object()
+
+
+def _to_object_array(values: Iterable[Any], count: int = -1) -> NDArray[Any]:
+    """
+    Build a 1D object array, without numpy unpacking nested lists.
+    """
+    return np.fromiter(values, dtype=object, count=count)
+
+
+def _unnest_arrays(
+    frame: dict[str, list[Any]],
+    arrays: dict[str, list[Any]],
+    block_sizes: list[int],
+) -> tuple[dict[str, list[Any]], int]:
+    """
+    Unnest array columns into new rows.
+
+    Each row expands into a block of ``block_sizes[i]`` rows. Array columns have
+    their elements spread over the block, while the other columns keep their value
+    in the first row of the block only.
+
+    :param frame: mapping of column names to their values
+    :param arrays: the array columns to unnest
+    :param block_sizes: the number of rows each row expands into
+    :return: the unnested columns and the new number of rows
+    """
+    sizes = np.array(block_sizes, dtype=np.int64)
+    starts = np.cumsum(sizes) - sizes
+    num_rows = int(sizes.sum())
+
+    unnested = {}
+    for name, values in frame.items():
+        column = np.full(num_rows, _MISSING, dtype=object)
+        column[starts] = _to_object_array(values, len(values))
+
+        if name in arrays:
+            lengths = np.array(
+                [
+                    len(value) if value and value is not _MISSING else 0
+                    for value in values
+                ],
+                dtype=np.int64,
+            )
+            offsets = np.cumsum(lengths) - lengths
+            total = int(lengths.sum())
+            positions = np.repeat(starts - offsets, lengths) + np.arange(total)
+            column[positions] = _to_object_array(
+                chain.from_iterable(
+                    value for value in values if value and value is not _MISSING
+                ),
+                total,
+            )
+
+        unnested[name] = column.tolist()
+
+    return unnested, num_rows
+
+
 class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
     """
     A base class that share common functions between Presto and Trino
@@ -526,7 +591,84 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         return None
 
     @classmethod
-    @cache_manager.data_cache.memoize(timeout=60)
+    def _partition_cache_key(
+        cls, table_name: str, schema: str | None, database: Database
+    ) -> str:
+        return f"db:{database.id}:schema:{schema}:table:{table_name}:partitions"
+
+    @classmethod
+    def _get_cached_partition(
+        cls,
+        table_name: str,
+        schema: str | None,
+        database: Database,
+        lookup: str,
+        compute: Callable[[], Any],
+    ) -> Any:
+        """
+        Return a partition lookup for a table, computing it on a miss.
+
+        All lookups for a given table are stored in a single data cache entry so
+        that ``latest_partition``, ``latest_sub_partition``,
+        ``where_latest_partition`` and the Jinja macros share one set of results,
+        and so that ``invalidate_partition_cache`` can drop them at once. Each
+        lookup keeps its own timestamp, so adding a lookup to the entry does not
+        extend the lifetime of the others.
+
+        :param table_name: the name of the table
+        :param schema: schema / database / namespace
+        :param database: database query will be run against
+        :param lookup: identifies the lookup within the table entry
+        :param compute: callable returning the value on a cache miss
+        :return: the cached or freshly computed value
+        """
+        timeout = current_app.config["PARTITION_CACHE_TIMEOUT"]
+        if not timeout:
+            return compute()
+
+        cache_key = cls._partition_cache_key(table_name, schema, database)
+        now = time.time()
+        try:
+            entry = cache_manager.data_cache.get(cache_key) or {}
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Could not read partition cache key %s", cache_key)
+            entry = {}
+
+        if lookup in entry:
+            computed_at, value = entry[lookup]
+            if now - computed_at < timeout:
+                return value
+
+        value = compute()
+        entry = {
+            key: (computed_at, cached_value)
+            for key, (computed_at, cached_value) in entry.items()
+            if now - computed_at < timeout
+        }
+        entry[lookup] = (now, value)
+        try:
+            cache_manager.data_cache.set(cache_key, entry, timeout=timeout)
+        except Exception:  # pylint: disable=broad-except
+            logger.warning("Could not cache partition key %s", cache_key)
+        return value
+
+    @classmethod
+    def invalidate_partition_cache(
+        cls, table_name: str, schema: str | None, database: Database
+    ) -> None:
+        """
+        Drop all cached partition lookups for a table, e.g. after a new
+        partition has landed.
+
+        :param table_name: the name of the table
+        :param schema: schema / database / namespace
+        :param database: database the partitions were fetched from
+        """
+        cache_manager.data_cache.delete(
+            cls._partition_cache_key(table_name, schema, database)
+        )
+
+    @classmethod
     def latest_partition(  # pylint: disable=too-many-arguments
         cls,
         table_name: str,
@@ -537,6 +679,8 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
     ) -> tuple[list[str], list[str] | None]:
         """Returns col name and the latest (max) partition value for a table
 
+        Results are cached per table for ``PARTITION_CACHE_TIMEOUT`` seconds.
+
         :param table_name: the name of the table
         :param schema: schema / database / namespace
         :param database: database query will be run against
@@ -549,6 +693,33 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         >>> latest_partition('foo_table')
         (['ds'], ('2018-01-01',))
         """
+        column_names, values = cls._get_cached_partition(
+            table_name,
+            schema,
+            database,
+            lookup="latest",
+            compute=lambda: cls._latest_partition(
+                table_name, schema, database, indexes
+            ),
+        )
+
+        if not show_first and len(column_names) > 1:
+            raise SupersetTemplateException(
+                "The table should have a single partitioned field "
+                "to use this function. You may want to use "
+                "`presto.latest_sub_partition`"
+            )
+
+        return column_names, values
+
+    @classmethod
+    def _latest_partition(
+        cls,
+        table_name: str,
+        schema: str | None,
+        database: Database,
+        indexes: list[dict[str, Any]] | None = None,
+    ) -> tuple[list[str], list[str] | None]:
         if indexes is None:
             indexes = database.get_indexes(table_name, schema)
 
@@ -563,13 +734,6 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
                 "The table should have one partitioned field"
             )
 
-        if not show_first and len(indexes[0]["column_names"]) > 1:
-            raise SupersetTemplateException(
-                "The table should have a single partitioned field "
-                "to use this function. You may want to use "
-                "`presto.latest_sub_partition`"
-            )
-
         column_names = indexes[0]["column_names"]
 
         return column_names, cls._latest_partition_from_df(
@@ -615,6 +779,20 @@ class PrestoBaseEngineSpec(BaseEngineSpec, metaclass=ABCMeta):
         >>> latest_sub_partition('sub_partition_table', event_type='click')
         '2018-01-01'
         """
+        return cls._get_cached_partition(
+            table_name,
+            schema,
+            database,
+            lookup=f"sub:{json.dumps(kwargs, sort_keys=True, default=str)}",
+            compute=lambda: cls._latest_sub_partition(
+                table_name, schema, database, **kwargs
+            ),
+        )
+
+    @classmethod
+    def _latest_sub_partition(
+        cls, table_name: str, schema: str | None, database: Database, **kwargs: Any
+    ) -> Any:
         indexes = database.get_indexes(table_name, schema)
         part_fields = indexes[0]["column_names"]
         for k in kwargs.keys():  # pylint: disable=consider-iterating-dictionary
@@ -1218,6 +1396,112 @@ class PrestoEngineSpec(PrestoBaseEngineSpec):
 
         return all_columns, data, expanded_columns
 
+    @classmethod
+    def expand_table(  # pylint: disable=too-many-locals
+        cls, columns: list[ResultSetColumnType], table: pa.Table
+    ) -> tuple[
+        list[ResultSetColumnType], list[dict[Any, Any]], list[ResultSetColumnType]
+    ]:
+        """
+        Columnar equivalent of ``expand_data``, working directly on the result set
+        table.
+
+        Instead of inserting rows into a list of dictionaries one by one, each level
+        of nested arrays is unnested in a single pass: every row at the start of the
+        level owns a block of rows, as long as its longest array at that level, and
+        all columns are then scattered into the new blocks with numpy index arrays.
+        Records are only built once, at the end.
+
+        :param columns: columns selected in the query
+        :param table: the Arrow table holding the result set
+        :return: list of all columns(selected columns and their nested fields),
+                 expanded data set, listed of nested fields
+        """
+        if not is_feature_enabled("PRESTO_EXPAND_DATA"):
+            return super().expand_table(columns, table)
+
+        frame = df_to_columns(SupersetResultSet.convert_table_to_df(table))
+        num_rows = table.num_rows
+
+        to_process = deque((column, 0) for column in columns)
+        all_columns: list[ResultSetColumnType] = []
+        expanded_columns = []
+        current_array_level = None
+        # arrays to unnest at the current level, and the number of rows each row
+        # at the start of the level expands into
+        arrays: dict[str, list[Any]] = {}
+        block_sizes: list[int] = [1] * num_rows
+        while to_process:
+            column, level = to_process.popleft()
+            if column["column_name"] not in [
+                column["column_name"] for column in all_columns
+            ]:
+                all_columns.append(column)
+
+            if level != current_array_level:
+                if arrays:
+                    frame, num_rows = _unnest_arrays(frame, arrays, block_sizes)
+                arrays = {}
+                block_sizes = [1] * num_rows
+                current_array_level = level
+
+            name = column["column_name"]
+            values = frame.get(name) or [_MISSING] * num_rows
+
+            if column["type"] and column["type"].startswith("ARRAY("):
+                to_process.append((get_children(column)[0], level + 1))
+
+                values = [
+                    destringify(value) if isinstance(value, str) else value
+                    for value in values
+                ]
+                frame[name] = values
+                arrays[name] = values
+                block_sizes = [
+                    max(size, len(value)) if value and value is not _MISSING else size
+                    for size, value in zip(block_sizes, values)
+                ]
+
+            if column["type"] and column["type"].startswith("ROW("):
+                expanded = get_children(column)
+                to_process.extendleft((column, level) for column in expanded[::-1])
+                expanded_columns.extend(expanded)
+
+                children: list[list[Any]] = [
+                    list(frame.get(col["column_name"]) or [_MISSING] * num_rows)
+                    for col in expanded
+                ]
+                parsed = []
+                for i, value in enumerate(values):
+                    if isinstance(value, str) and value:
+                        value = cast(Optional[list[Any]], destringify(value))
+                    parsed.append(value)
+                    if value and value is not _MISSING:
+                        for child, child_value in zip(children, value):
+                            child[i] = child_value
+                frame[name] = parsed
+                for col, child in zip(expanded, children):
+                    frame[col["column_name"]] = child
+
+        if arrays:
+            frame, num_rows = _unnest_arrays(frame, arrays, block_sizes)
+
+        names = [column["column_name"] for column in all_columns]
+        data = [
+            dict(zip(names, row))
+            for row in zip(
+                *[
+                    [
+                        "" if value is _MISSING else value
+                        for value in frame.get(name) or [_MISSING] * num_rows
+                    ]
+                    for name in names
+                ]
+            )
+        ]
+
+        return all_columns, data, expanded_columns
+
     @classmethod
     def extra_table_metadata(
         cls, database: Database, table_name: str, schema_name: str | None
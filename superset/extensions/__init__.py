@@ -34,7 +34,7 @@ from superset.utils.cache_manager import CacheManager
 from superset.utils.encrypt import EncryptedFieldFactory
 from superset.utils.feature_flag_manager import FeatureFlagManager
 from superset.utils.machine_auth import MachineAuthProviderFactory
-from superset.utils.profiler import SupersetProfiler
+from superset.utils.profiler import SamplingProfiler, SupersetProfiler
 
 
 class ResultsBackendManager:
@@ -126,6 +126,7 @@ manifest_processor = UIManifestProcessor(APP_DIR)
 migrate = Migrate()
 profiling = ProfilingExtension()
 results_backend_manager = ResultsBackendManager()
+sampling_profiler = SamplingProfiler()
 security_manager = LocalProxy(lambda: appbuilder.sm)
 ssh_manager_factory = SSHManagerFactory()
 stats_logger_manager = BaseStatsLoggerManager()
@@ -16,10 +16,9 @@
 # under the License.
 import json
 from datetime import datetime
-from io import BytesIO
 from zipfile import is_zipfile, ZipFile
 
-from flask import request, Response, send_file
+from flask import request, Response
 from flask_appbuilder.api import expose, protect
 
 from superset.commands.export.assets import ExportAssetsCommand
@@ -30,6 +29,7 @@ from superset.commands.importers.exceptions import (
 from superset.commands.importers.v1.assets import ImportAssetsCommand
 from superset.commands.importers.v1.utils import get_contents_from_bundle
 from superset.extensions import event_logger
+from superset.views.base import zip_bundle_response
 from superset.views.base_api import BaseSupersetApi, requires_form_data, statsd_metrics
 
 
@@ -74,22 +74,8 @@ class ImportExportRestApi(BaseSupersetApi):
         """
         timestamp = datetime.now().strftime("%Y%m%dT%H%M%S")
         root = f"assets_export_{timestamp}"
-        filename = f"{root}.zip"
 
-        buf = BytesIO()
-        with ZipFile(buf, "w") as bundle:
-            for file_name, file_content in ExportAssetsCommand().run():
-                with bundle.open(f"{root}/{file_name}", "w") as fp:
-                    fp.write(file_content.encode())
-        buf.seek(0)
-
-        response = send_file(
-            buf,
-            mimetype="application/zip",
-            as_attachment=True,
-            download_name=filename,
-        )
-        return response
+        return zip_bundle_response(root, ExportAssetsCommand().run())
 
     @expose("/import/", methods=("POST",))
     @protect()
@@ -46,6 +46,7 @@ from superset.extensions import (
     migrate,
     profiling,
     results_backend_manager,
+    sampling_profiler,
     ssh_manager_factory,
     stats_logger_manager,
     talisman,
@@ -53,6 +54,7 @@ from superset.extensions import (
 from superset.security import SupersetSecurityManager
 from superset.superset_typing import FlaskResponse
 from superset.tags.core import register_sqla_event_listeners
+from superset.utils import tracing
 from superset.utils.core import is_test, pessimistic_connection_handling
 from superset.utils.log import DBEventLogger, get_event_logger_from_cfg_value
 
@@ -147,6 +149,7 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         from superset.explore.form_data.api import ExploreFormDataRestApi
         from superset.explore.permalink.api import ExplorePermalinkRestApi
         from superset.importexport.api import ImportExportRestApi
+        from superset.profiling.api import ProfilingRestApi
         from superset.queries.api import QueryRestApi
         from superset.queries.saved_queries.api import SavedQueryRestApi
         from superset.reports.api import ReportScheduleRestApi
@@ -220,6 +223,7 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         appbuilder.add_api(ExplorePermalinkRestApi)
         appbuilder.add_api(FilterSetRestApi)
         appbuilder.add_api(ImportExportRestApi)
+        appbuilder.add_api(ProfilingRestApi)
         appbuilder.add_api(QueryRestApi)
         appbuilder.add_api(ReportScheduleRestApi)
         appbuilder.add_api(ReportExecutionLogRestApi)
@@ -490,6 +494,7 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         self.setup_db()
         self.configure_celery()
         self.enable_profiling()
+        self.configure_tracing()
         self.setup_event_logger()
         self.setup_bundle_manifest()
         self.register_blueprints()
@@ -681,6 +686,11 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
     def enable_profiling(self) -> None:
         if self.config["PROFILING"]:
             profiling.init_app(self.superset_app)
+        if self.config["SAMPLING_PROFILER_ENABLED"]:
+            sampling_profiler.init_app(self.superset_app)
+
+    def configure_tracing(self) -> None:
+        tracing.init_app(self.superset_app)
 
 
 class SupersetIndexView(IndexView):
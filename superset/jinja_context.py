@@ -22,7 +22,7 @@ from typing import Any, Callable, cast, Optional, TYPE_CHECKING, Union
 
 from flask import current_app, g, has_request_context, request
 from flask_babel import gettext as _
-from jinja2 import DebugUndefined
+from jinja2 import DebugUndefined, Template
 from jinja2.sandbox import SandboxedEnvironment
 from sqlalchemy.engine.interfaces import Dialect
 from sqlalchemy.types import String
@@ -37,6 +37,7 @@ from superset.utils.core import (
     get_user_id,
     merge_extra_filters,
 )
+from superset.utils.tracing import traced
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import SqlaTable
@@ -416,6 +417,31 @@ def where_in(values: list[Any], mark: str = "'") -> str:
     return f"({joined_values})"
 
 
+def _create_environment() -> SandboxedEnvironment:
+    env = SandboxedEnvironment(undefined=DebugUndefined)
+
+    # custom filters
+    env.filters["where_in"] = where_in
+    return env
+
+
+# The environment is shared by all template processors. Compiled templates do not
+# hold any per-request state, the context is only bound when rendering.
+_environment = _create_environment()
+
+
+@lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+def compile_template(sql: str) -> Template:
+    """
+    Compile a SQL template with the shared sandboxed environment.
+
+    Parsing and compiling a template is considerably more expensive than rendering
+    it, and the same dataset or chart SQL is processed on every request, so the
+    compiled templates are kept in an LRU cache keyed by the template text.
+    """
+    return _environment.from_string(sql)
+
+
 class BaseTemplateProcessor:
     """
     Base class for database-specific jinja context
@@ -445,16 +471,14 @@ class BaseTemplateProcessor:
         self._applied_filters = applied_filters
         self._removed_filters = removed_filters
         self._context: dict[str, Any] = {}
-        self._env = SandboxedEnvironment(undefined=DebugUndefined)
+        self._env = _environment
         self.set_context(**kwargs)
 
-        # custom filters
-        self._env.filters["where_in"] = where_in
-
     def set_context(self, **kwargs: Any) -> None:
         self._context.update(kwargs)
         self._context.update(context_addons())
 
+    @traced("jinja.render")
     def process_template(self, sql: str, **kwargs: Any) -> str:
         """Processes a sql template
 
@@ -462,7 +486,7 @@ class BaseTemplateProcessor:
         >>> process_template(sql)
         "SELECT '2017-01-01T00:00:00'"
         """
-        template = self._env.from_string(sql)
+        template = compile_template(sql)
         kwargs.update(self._context)
 
         context = validate_template_context(self.engine, kwargs)
@@ -575,8 +599,9 @@ class HiveTemplateProcessor(PrestoTemplateProcessor):
 class TrinoTemplateProcessor(PrestoTemplateProcessor):
     engine = "trino"
 
+    @traced("jinja.render")
     def process_template(self, sql: str, **kwargs: Any) -> str:
-        template = self._env.from_string(sql)
+        template = compile_template(sql)
         kwargs.update(self._context)
 
         # Backwards compatibility if migrating from Presto.
@@ -75,6 +75,7 @@ from superset.superset_typing import ResultSetColumnType
 from superset.utils import cache as cache_util, core as utils
 from superset.utils.backports import StrEnum
 from superset.utils.core import get_username
+from superset.utils.tracing import span, traced
 
 config = app.config
 custom_password_store = config["SQLALCHEMY_CUSTOM_PASSWORD_STORE"]
@@ -429,6 +430,7 @@ class Database(
                 sqlalchemy_uri=sqlalchemy_uri,
             )
 
+    @traced("db.create_engine")
     def _get_sqla_engine(
         self,
         schema: str | None = None,
@@ -527,7 +529,9 @@ class Database(
         with self.get_sqla_engine_with_context(
             schema=schema, nullpool=nullpool, source=source
         ) as engine:
-            with closing(engine.raw_connection()) as conn:
+            with span("db.connect"):
+                raw_connection = engine.raw_connection()
+            with closing(raw_connection) as conn:
                 # pre-session queries are used to set the selected schema and, in the
                 # future, the selected catalog
                 for prequery in self.db_engine_spec.get_prequeries(schema=schema):
@@ -560,7 +564,55 @@ class Database(
     def get_reserved_words(self) -> set[str]:
         return self.get_dialect().preparer.reserved_words
 
-    def get_df(  # pylint: disable=too-many-locals
+    @traced("db.execute")
+    def _execute_sql(
+        self,
+        cursor: Any,
+        sqls: list[str],
+        schema: str | None,
+        engine_url: URL,
+    ) -> None:
+        """
+        Execute the statements in ``sqls``, leaving the results of the last one in
+        the cursor.
+        """
+        mutate_after_split = config["MUTATE_AFTER_SPLIT"]
+        sql_query_mutator = config["SQL_QUERY_MUTATOR"]
+
+        def _log_query(sql: str) -> None:
+            if log_query:
+                log_query(
+                    engine_url,
+                    sql,
+                    schema,
+                    __name__,
+                    security_manager,
+                )
+
+        for sql_ in sqls[:-1]:
+            if mutate_after_split:
+                sql_ = sql_query_mutator(
+                    sql_,
+                    security_manager=security_manager,
+                    database=None,
+                )
+            _log_query(sql_)
+            self.db_engine_spec.execute(cursor, sql_)
+            cursor.fetchall()
+
+        if mutate_after_split:
+            last_sql = sql_query_mutator(
+                sqls[-1],
+                security_manager=security_manager,
+                database=None,
+            )
+            _log_query(last_sql)
+            self.db_engine_spec.execute(cursor, last_sql)
+        else:
+            _log_query(sqls[-1])
+            self.db_engine_spec.execute(cursor, sqls[-1])
+
+    def get_df(
         self,
         sql: str,
         schema: str | None = None,
@@ -569,8 +621,6 @@ class Database(
         sqls = self.db_engine_spec.parse_sql(sql)
         with self.get_sqla_engine_with_context(schema) as engine:
             engine_url = engine.url
-        mutate_after_split = config["MUTATE_AFTER_SPLIT"]
-        sql_query_mutator = config["SQL_QUERY_MUTATOR"]
 
         def needs_conversion(df_series: pd.Series) -> bool:
             return (
@@ -579,46 +629,17 @@ class Database(
                 and isinstance(df_series[0], (list, dict))
             )
 
-        def _log_query(sql: str) -> None:
-            if log_query:
-                log_query(
-                    engine_url,
-                    sql,
-                    schema,
-                    __name__,
-                    security_manager,
-                )
-
         with self.get_raw_connection(schema=schema) as conn:
             cursor = conn.cursor()
-            for sql_ in sqls[:-1]:
-                if mutate_after_split:
-                    sql_ = sql_query_mutator(
-                        sql_,
-                        security_manager=security_manager,
-                        database=None,
-                    )
-                _log_query(sql_)
-                self.db_engine_spec.execute(cursor, sql_)
-                cursor.fetchall()
+            self._execute_sql(cursor, sqls, schema, engine_url)
 
-            if mutate_after_split:
-                last_sql = sql_query_mutator(
-                    sqls[-1],
-                    security_manager=security_manager,
-                    database=None,
+            with span("db.fetch"):
+                data = self.db_engine_spec.fetch_data(cursor)
+            with span("result_set.build"):
+                result_set = SupersetResultSet(
+                    data, cursor.description, self.db_engine_spec
                 )
-                _log_query(last_sql)
-                self.db_engine_spec.execute(cursor, last_sql)
-            else:
-                _log_query(sqls[-1])
-                self.db_engine_spec.execute(cursor, sqls[-1])
-
-            data = self.db_engine_spec.fetch_data(cursor)
-            result_set = SupersetResultSet(
-                data, cursor.description, self.db_engine_spec
-            )
-            df = result_set.to_pandas_df()
+                df = result_set.to_pandas_df()
             if mutator:
                 df = mutator(df)
 
@@ -628,6 +649,39 @@ class Database(
 
             return df
 
+    def get_rows(
+        self,
+        sql: str,
+        schema: str | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[str], list[tuple[Any, ...]]]:
+        """
+        Execute SQL and return the raw rows, without building a DataFrame.
+
+        Useful when only a handful of values are needed from the result.
+
+        :param sql: the SQL to execute
+        :param schema: the schema to execute the SQL in
+        :param limit: fetch at most this many rows
+        :return: the column names and the fetched rows
+        """
+        sqls = self.db_engine_spec.parse_sql(sql)
+        with self.get_sqla_engine_with_context(schema) as engine:
+            engine_url = engine.url
+
+        with self.get_raw_connection(schema=schema) as conn:
+            cursor = conn.cursor()
+            self._execute_sql(cursor, sqls, schema, engine_url)
+
+            with span("db.fetch"):
+                rows = self.db_engine_spec.fetch_data(cursor, limit) or []
+            columns = [col[0] for col in cursor.description or []]
+            return columns, self.db_engine_spec.mutate_columns(
+                [tuple(row) for row in rows],
+                self.db_engine_spec.get_column_mutators(cursor.description),
+            )
+
+    @traced("sqla.compile")
     def compile_sqla_query(self, qry: Select, schema: str | None = None) -> str:
         with self.get_sqla_engine_with_context(schema) as engine:
             sql = str(qry.compile(
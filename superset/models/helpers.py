@@ -23,8 +23,10 @@ import logging
 import re
 import uuid
 from collections import defaultdict
-from collections.abc import Hashable
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from functools import partial
 from json.decoder import JSONDecodeError
 from typing import Any, cast, NamedTuple, Optional, TYPE_CHECKING, Union
 
@@ -79,6 +81,7 @@ from superset.superset_typing import (
     QueryObjectDict,
 )
 from superset.utils import core as utils
+from superset.utils.admission import admit_query
 from superset.utils.core import (
     GenericDataType,
     get_column_name,
@@ -87,6 +90,8 @@ from superset.utils.core import (
     remove_duplicates,
 )
 from superset.utils.dates import datetime_to_epoch
+from superset.utils.query_memo import memoized, query_obj_key
+from superset.utils.tracing import traced
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import SqlMetric, TableColumn
@@ -101,6 +106,8 @@ VIRTUAL_TABLE_ALIAS = "virtual_table"
 SERIES_LIMIT_SUBQ_ALIAS = "series_limit"
 ADVANCED_DATA_TYPES = config["ADVANCED_DATA_TYPES"]
 
+IMPORT_PREFETCH_KEY = "import_prefetch"
+
 
 def validate_adhoc_subquery(
     sql: str,
@@ -159,6 +166,142 @@ def convert_uuids(obj: Any) -> Any:
     return obj
 
 
+def _import_key(value: Any) -> Any:
+    return str(value) if isinstance(value, uuid.UUID) else value
+
+
+class ImportPrefetch:
+    """
+    The existing objects of a model that an import may update, loaded up front in a
+    few queries rather than looked up one at a time.
+
+    Within `prefetching`, `ImportExportMixin.import_from_dict` looks the objects of
+    the prefetched models up in memory, as per the unique constraints it would query,
+    and creates the children of new objects without looking them up, since they can't
+    exist yet. Objects whose UUID wasn't prefetched are still looked up with a query.
+    """
+
+    def __init__(self, cls: type["ImportExportMixin"]) -> None:
+        self.cls = cls
+        self.constraints = [
+            sorted(constraint) for constraint in cls._unique_constraints()
+        ]
+        self.uuids: set[str] = set()
+        self.objects: dict[int, Any] = {}
+        # the objects by the values of the columns of each unique constraint
+        self.indexes: list[defaultdict[tuple[Any, ...], dict[int, Any]]] = [
+            defaultdict(dict) for _ in self.constraints
+        ]
+        self._keys: dict[int, list[tuple[Any, ...]]] = {}
+
+    @classmethod
+    def get(cls, session: Session, model: type[Any]) -> Optional["ImportPrefetch"]:
+        return session.info.get(IMPORT_PREFETCH_KEY, {}).get(model)
+
+    @classmethod
+    def load(
+        cls,
+        session: Session,
+        model: type["ImportExportMixin"],
+        dict_reps: list[dict[str, Any]],
+        chunk_size: int = 500,
+    ) -> None:
+        """
+        Prefetch the objects of the model that the given dictionaries may update. The
+        dictionaries must hold the values they'll be imported with, e.g. the ID of
+        their parent.
+        """
+        if (prefetched := session.info.get(IMPORT_PREFETCH_KEY)) is None:
+            return
+
+        prefetch = prefetched.setdefault(model, cls(model))
+        for i in range(0, len(dict_reps), chunk_size):
+            chunk = dict_reps[i : i + chunk_size]
+            filters = []
+            for columns in prefetch.constraints:
+                # a column missing from some dictionaries isn't filtered upon, the
+                # same as when looking them up
+                clauses = [
+                    getattr(model, column).in_(
+                        {_import_key(dict_rep[column]) for dict_rep in chunk}
+                    )
+                    for column in columns
+                    if all(dict_rep.get(column) is not None for dict_rep in chunk)
+                ]
+                if clauses:
+                    filters.append(and_(*clauses))
+            if filters:
+                for obj in session.query(model).filter(or_(*filters)):
+                    prefetch.add(obj)
+            prefetch.uuids.update(
+                str(dict_rep["uuid"]) for dict_rep in chunk if dict_rep.get("uuid")
+            )
+
+    def add(self, obj: Any) -> None:
+        """Index the object, or index it again after an update."""
+        key = id(obj)
+        for index, values in zip(self.indexes, self._keys.get(key, [])):
+            index[values].pop(key, None)
+
+        self.objects[key] = obj
+        self._keys[key] = []
+        for columns, index in zip(self.constraints, self.indexes):
+            values = tuple(_import_key(getattr(obj, column)) for column in columns)
+            index[values][key] = obj
+            self._keys[key].append(values)
+
+    def is_prefetched(self, dict_rep: dict[str, Any]) -> bool:
+        return dict_rep.get("uuid") is not None and str(dict_rep["uuid"]) in self.uuids
+
+    def get_by_uuid(self, uuid_: Any) -> Optional[Any]:
+        index = self.indexes[self.constraints.index(["uuid"])]
+        return next(iter(index.get((str(uuid_),), {}).values()), None)
+
+    def find(
+        self, dict_rep: dict[str, Any], parent_values: dict[str, Any]
+    ) -> list[Any]:
+        """
+        Find the objects matching the dictionary, as per `import_from_dict`: any of
+        their unique constraints on the columns set in the dictionary, and their
+        parent if given.
+        """
+        matches: dict[int, Any] = {}
+        for columns, index in zip(self.constraints, self.indexes):
+            values = {
+                column: _import_key(dict_rep[column])
+                for column in columns
+                if dict_rep.get(column) is not None
+            }
+            if not values:
+                continue
+            if len(values) == len(columns):
+                matches.update(index.get(tuple(values.values()), {}))
+            else:
+                matches.update(
+                    (key, obj)
+                    for key, obj in self.objects.items()
+                    if all(
+                        _import_key(getattr(obj, column)) == value
+                        for column, value in values.items()
+                    )
+                )
+        return [
+            obj
+            for obj in matches.values()
+            if all(getattr(obj, key) == value for key, value in parent_values.items())
+        ]
+
+
+@contextmanager
+def prefetching(session: Session) -> Iterator[None]:
+    """Keep the objects prefetched within the enclosed import, see `ImportPrefetch`."""
+    session.info[IMPORT_PREFETCH_KEY] = {}
+    try:
+        yield
+    finally:
+        session.info.pop(IMPORT_PREFETCH_KEY, None)
+
+
 class ImportExportMixin:
     uuid = sa.Column(
         UUIDType(binary=True), primary_key=False, unique=True, default=uuid.uuid4
@@ -195,6 +338,14 @@ class ImportExportMixin:
         )
         return unique
 
+    @classmethod
+    def find_by_uuid(cls, session: Session, uuid_: Any) -> Optional[Any]:
+        """Find the object with the UUID, among the prefetched ones if any"""
+        prefetch = ImportPrefetch.get(session, cls)
+        if prefetch and prefetch.is_prefetched({"uuid": uuid_}):
+            return prefetch.get_by_uuid(uuid_)
+        return session.query(cls).filter_by(uuid=uuid_).first()
+
     @classmethod
     def parent_foreign_key_mappings(cls) -> dict[str, str]:
         """Get a mapping of foreign name to the local name of foreign keys"""
@@ -246,8 +397,14 @@ class ImportExportMixin:
         recursive: bool = True,
         sync: Optional[list[str]] = None,
         allow_reparenting: bool = False,
+        is_new: bool = False,
     ) -> Any:
-        """Import obj from a dictionary"""
+        """
+        Import obj from a dictionary
+
+        :param is_new: The object is known not to exist and isn't looked up, e.g. as a
+            child of an object just created out of an `ImportPrefetch`
+        """
         if sync is None:
             sync = []
         parent_refs = cls.parent_foreign_key_mappings()
@@ -297,18 +454,37 @@ class ImportExportMixin:
         filters.append(or_(*ucs))
 
         # Check if object already exists in DB, break if more than one is found
-        try:
-            obj_query = session.query(cls).filter(and_(*filters))
-            obj = obj_query.one_or_none()
-        except MultipleResultsFound as ex:
-            logger.error(
-                "Error importing %s \n %s \n %s",
-                cls.__name__,
-                str(obj_query),
-                yaml.safe_dump(dict_rep),
-                exc_info=True,
+        prefetch = ImportPrefetch.get(session, cls)
+        if is_new:
+            obj = None
+        elif prefetch and prefetch.is_prefetched(dict_rep):
+            matches = prefetch.find(
+                dict_rep,
+                {}
+                if allow_reparenting
+                else {k: dict_rep.get(k) for k in parent_refs.keys()},
             )
-            raise ex
+            if len(matches) > 1:
+                logger.error(
+                    "Error importing %s \n %s",
+                    cls.__name__,
+                    yaml.safe_dump(dict_rep),
+                )
+                raise MultipleResultsFound()
+            obj = matches[0] if matches else None
+        else:
+            try:
+                obj_query = session.query(cls).filter(and_(*filters))
+                obj = obj_query.one_or_none()
+            except MultipleResultsFound as ex:
+                logger.error(
+                    "Error importing %s \n %s \n %s",
+                    cls.__name__,
+                    str(obj_query),
+                    yaml.safe_dump(dict_rep),
+                    exc_info=True,
+                )
+                raise ex
 
         if not obj:
             is_new_obj = True
@@ -325,6 +501,9 @@ class ImportExportMixin:
             for k, v in dict_rep.items():
                 setattr(obj, k, v)
 
+        if prefetch:
+            prefetch.add(obj)
+
         # Recursively create children
         if recursive:
             for child in cls.export_children:
@@ -336,7 +515,11 @@ class ImportExportMixin:
                 for c_obj in new_children.get(child, []):
                     added.append(
                         child_class.import_from_dict(
-                            session=session, dict_rep=c_obj, parent=obj, sync=sync
+                            session=session,
+                            dict_rep=c_obj,
+                            parent=obj,
+                            sync=sync,
+                            is_new=is_new_obj and (is_new or prefetch is not None),
                         )
                     )
                 # If children should get synced, delete the ones that did not
@@ -895,19 +1078,34 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
     def get_query_str_extended(
         self, query_obj: QueryObjectDict, mutate: bool = True
     ) -> QueryStringExtended:
-        sqlaq = self.get_sqla_query(**query_obj)
-        sql = self.database.compile_sqla_query(sqlaq.sqla_query)  # type: ignore
-        sql = self._apply_cte(sql, sqlaq.cte)
-        sql = sqlparse.format(sql, reindent=True)
-        if mutate:
-            sql = self.mutate_query_from_config(sql)
-        return QueryStringExtended(
-            applied_template_filters=sqlaq.applied_template_filters,
-            applied_filter_columns=sqlaq.applied_filter_columns,
-            rejected_filter_columns=sqlaq.rejected_filter_columns,
-            labels_expected=sqlaq.labels_expected,
-            prequeries=sqlaq.prequeries,
-            sql=sql,
+        def build() -> QueryStringExtended:
+            sqlaq = self.get_memoized_sqla_query(query_obj)
+            sql = self.database.compile_sqla_query(sqlaq.sqla_query)  # type: ignore
+            sql = self._apply_cte(sql, sqlaq.cte)
+            sql = sqlparse.format(sql, reindent=True)
+            if mutate:
+                sql = self.mutate_query_from_config(sql)
+            return QueryStringExtended(
+                applied_template_filters=sqlaq.applied_template_filters,
+                applied_filter_columns=sqlaq.applied_filter_columns,
+                rejected_filter_columns=sqlaq.rejected_filter_columns,
+                labels_expected=sqlaq.labels_expected,
+                prequeries=sqlaq.prequeries,
+                sql=sql,
+            )
+
+        return memoized(
+            ("query_str", self.uid, query_obj_key(query_obj), mutate), build
+        )
+
+    def get_memoized_sqla_query(self, query_obj: QueryObjectDict) -> SqlaQuery:
+        """
+        Return the SQLA query of the query object, built only once per
+        `query_memo` context.
+        """
+        return memoized(
+            ("sqla_query", self.uid, query_obj_key(query_obj)),
+            partial(self.get_sqla_query, **query_obj),
         )
 
     def _normalize_prequery_result_type(
@@ -1019,21 +1217,23 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
                 df.columns = labels_expected
             return df
 
-        try:
-            df = self.database.get_df(
-                sql, self.schema, mutator=assign_column_label  # type: ignore
-            )
-        except Exception as ex:  # pylint: disable=broad-except
-            df = pd.DataFrame()
-            status = QueryStatus.FAILED
-            logger.warning(
-                "Query %s on schema %s failed", sql, self.schema, exc_info=True
-            )
-            db_engine_spec = self.db_engine_spec
-            errors = [
-                dataclasses.asdict(error) for error in db_engine_spec.extract_errors(ex)
-            ]
-            error_message = utils.error_msg_from_exception(ex)
+        with admit_query(self.database):
+            try:
+                df = self.database.get_df(
+                    sql, self.schema, mutator=assign_column_label  # type: ignore
+                )
+            except Exception as ex:  # pylint: disable=broad-except
+                df = pd.DataFrame()
+                status = QueryStatus.FAILED
+                logger.warning(
+                    "Query %s on schema %s failed", sql, self.schema, exc_info=True
+                )
+                db_engine_spec = self.db_engine_spec
+                errors = [
+                    dataclasses.asdict(error)
+                    for error in db_engine_spec.extract_errors(ex)
+                ]
+                error_message = utils.error_msg_from_exception(ex)
 
         return QueryResult(
             applied_template_filters=query_str_ext.applied_template_filters,
@@ -1412,6 +1612,7 @@ class ExploreMixin:  # pylint: disable=too-many-public-methods
         col = self.make_sqla_column_compatible(col, label)
         return col
 
+    @traced("sqla.build_query")
     def get_sqla_query(  # pylint: disable=too-many-arguments,too-many-locals,too-many-branches,too-many-statements
         self,
         apply_fetch_values_predicate: bool = False,
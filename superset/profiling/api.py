@@ -0,0 +1,135 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import logging
+
+from flask import current_app, request, Response
+from flask_appbuilder.api import expose, protect, safe
+
+from superset.constants import MODEL_API_RW_METHOD_PERMISSION_MAP
+from superset.extensions import event_logger, results_backend_manager
+from superset.utils.profiler import get_collapsed_stacks, get_sampling_profiles
+from superset.views.base_api import BaseSupersetApi, statsd_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilingRestApi(BaseSupersetApi):
+    """
+    API for the profiles of the sampling profiler, see `SAMPLING_PROFILER_ENABLED`.
+    """
+
+    method_permission_name = MODEL_API_RW_METHOD_PERMISSION_MAP
+    allow_browser_login = True
+    class_permission_name = "Profiling"
+    resource_name = "profiling"
+    openapi_spec_tag = "Profiling"
+
+    @expose("/", methods=("GET",))
+    @protect()
+    @safe
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}.list",
+        log_to_statsd=False,
+    )
+    def list(self) -> Response:
+        """
+        List the profiles of the sampling profiler.
+        ---
+        get:
+          description: >-
+            Returns the latest profiles of the web servers and Celery workers, with
+            the number of samples of each endpoint and task.
+          responses:
+            200:
+              description: The profiles
+              content:
+                application/json:
+                  schema:
+                    type: object
+                    properties:
+                      result:
+                        type: array
+                        items:
+                          type: object
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            403:
+              $ref: '#/components/responses/403'
+        """
+        if not (results_backend := results_backend_manager.results_backend):
+            return self.response_400(message="No results backend is configured")
+        # the profiles are written by the processes profiling, maybe not this one
+        max_windows = current_app.config["SAMPLING_PROFILER_CONFIG"]["max_windows"]
+        return self.response(
+            200, result=get_sampling_profiles(results_backend, max_windows)
+        )
+
+    @expose("/<key>/", methods=("GET",))
+    @protect()
+    @safe
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}.get",
+        log_to_statsd=False,
+    )
+    def get(self, key: str) -> Response:
+        """
+        Get the collapsed stacks of profiles.
+        ---
+        get:
+          description: >-
+            Returns the collapsed stacks of the profiles, merged, one stack per line
+            followed by its number of samples. This is the input format of flame
+            graph tools such as flamegraph.pl or speedscope.
+          parameters:
+          - in: path
+            schema:
+              type: string
+            name: key
+            description: The key of a profile, or the comma separated keys of several
+          - in: query
+            schema:
+              type: string
+            name: label
+            description: The endpoint or task to keep the stacks of, e.g. `GET /api/v1/chart/data`
+          responses:
+            200:
+              description: The collapsed stacks
+              content:
+                text/plain:
+                  schema:
+                    type: string
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            403:
+              $ref: '#/components/responses/403'
+            404:
+              $ref: '#/components/responses/404'
+        """
+        if not (results_backend := results_backend_manager.results_backend):
+            return self.response_400(message="No results backend is configured")
+        stacks = get_collapsed_stacks(
+            results_backend, key.split(","), request.args.get("label")
+        )
+        if stacks is None:
+            return self.response_404()
+        return Response(stacks, status=200, mimetype="text/plain")
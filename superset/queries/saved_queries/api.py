@@ -17,11 +17,10 @@
 import json
 import logging
 from datetime import datetime
-from io import BytesIO
 from typing import Any
 from zipfile import is_zipfile, ZipFile
 
-from flask import g, request, Response, send_file
+from flask import g, request, Response
 from flask_appbuilder.api import expose, protect, rison, safe
 from flask_appbuilder.models.sqla.interface import SQLAInterface
 from flask_babel import ngettext
@@ -56,6 +55,7 @@ from superset.queries.saved_queries.schemas import (
     get_export_ids_schema,
     openapi_spec_methods_override,
 )
+from superset.views.base import zip_bundle_response
 from superset.views.base_api import (
     BaseSupersetModelRestApi,
     requires_form_data,
@@ -263,26 +263,14 @@ class SavedQueryRestApi(BaseSupersetModelRestApi):
         requested_ids = kwargs["rison"]
         timestamp = datetime.now().strftime("%Y%m%dT%H%M%S")
         root = f"saved_query_export_{timestamp}"
-        filename = f"{root}.zip"
 
-        buf = BytesIO()
-        with ZipFile(buf, "w") as bundle:
-            try:
-                for file_name, file_content in ExportSavedQueriesCommand(
-                    requested_ids
-                ).run():
-                    with bundle.open(f"{root}/{file_name}", "w") as fp:
-                        fp.write(file_content.encode())
-            except SavedQueryNotFoundError:
-                return self.response_404()
-        buf.seek(0)
+        try:
+            response = zip_bundle_response(
+                root, ExportSavedQueriesCommand(requested_ids).run()
+            )
+        except SavedQueryNotFoundError:
+            return self.response_404()
 
-        response = send_file(
-            buf,
-            mimetype="application/zip",
-            as_attachment=True,
-            download_name=filename,
-        )
         if token := request.args.get("token"):
             response.set_cookie(token, "done", max_age=600)
         return response
@@ -19,8 +19,10 @@
 import json
 import logging
 from collections.abc import Iterator
+from typing import Any
 
 import yaml
+from sqlalchemy.orm import selectinload
 from werkzeug.utils import secure_filename
 
 from superset.commands.export.models import ExportModelsCommand
@@ -80,3 +82,6 @@ class ExportSavedQueriesCommand(ExportModelsCommand):
 
             file_content = yaml.safe_dump(payload, sort_keys=False)
             yield file_name, file_content
+
+    def _load_options(self) -> list[Any]:
+        return [selectinload(SavedQuery.database)]
@@ -25,7 +25,7 @@ from superset.models.sql_lab import SavedQuery
 def import_saved_query(
     session: Session, config: dict[str, Any], overwrite: bool = False
 ) -> SavedQuery:
-    existing = session.query(SavedQuery).filter_by(uuid=config["uuid"]).first()
+    existing = SavedQuery.find_by_uuid(session, config["uuid"])
     if existing:
         if not overwrite:
             return existing
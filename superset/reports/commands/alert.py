@@ -20,15 +20,15 @@ import json
 import logging
 from operator import eq, ge, gt, le, lt, ne
 from timeit import default_timer
-from typing import Any
+from typing import Any, NamedTuple
 
 import numpy as np
-import pandas as pd
 from celery.exceptions import SoftTimeLimitExceeded
 from flask_babel import lazy_gettext as _
 
 from superset import app, jinja_context, security_manager
 from superset.commands.base import BaseCommand
+from superset.extensions import cache_manager
 from superset.reports.commands.exceptions import (
     AlertQueryError,
     AlertQueryInvalidTypeError,
@@ -39,6 +39,7 @@ from superset.reports.commands.exceptions import (
 )
 from superset.reports.models import ReportSchedule, ReportScheduleValidatorType
 from superset.tasks.utils import get_executor
+from superset.utils.cache import generate_cache_key, set_and_log_cache
 from superset.utils.core import override_user
 from superset.utils.retries import retry_call
 
@@ -51,6 +52,11 @@ ALERT_SQL_LIMIT = 2
 OPERATOR_FUNCTIONS = {">=": ge, ">": gt, "<=": le, "<": lt, "==": eq, "!=": ne}
 
 
+class AlertQueryResult(NamedTuple):
+    columns: list[str]
+    rows: list[tuple[Any, ...]]
+
+
 class AlertCommand(BaseCommand):
     def __init__(self, report_schedule: ReportSchedule):
         self._report_schedule = report_schedule
@@ -86,38 +92,38 @@ class AlertCommand(BaseCommand):
         except (KeyError, json.JSONDecodeError) as ex:
             raise AlertValidatorConfigError() from ex
 
-    def _validate_not_null(self, rows: np.recarray[Any, Any]) -> None:
-        self._validate_result(rows)
-        self._result = rows[0][1]
+    def _validate_not_null(self, result: AlertQueryResult) -> None:
+        self._validate_result(result)
+        self._result = result.rows[0][0]
 
     @staticmethod
-    def _validate_result(rows: np.recarray[Any, Any]) -> None:
+    def _validate_result(result: AlertQueryResult) -> None:
         # check if query return more than one row
-        if len(rows) > 1:
+        if len(result.rows) > 1:
             raise AlertQueryMultipleRowsError(
                 message=_(
                     "Alert query returned more than one row. %s rows returned"
-                    % len(rows),
+                    % len(result.rows),
                 )
             )
         # check if query returned more than one column
-        if len(rows[0]) > 2:
+        if len(result.columns) > 1:
             raise AlertQueryMultipleColumnsError(
-                # len is subtracted by 1 to discard pandas index column
                 _(
                     "Alert query returned more than one column. %s columns returned"
-                    % (len(rows[0]) - 1)
+                    % len(result.columns)
                 )
             )
 
-    def _validate_operator(self, rows: np.recarray[Any, Any]) -> None:
-        self._validate_result(rows)
-        if rows[0][1] in (0, None, np.nan):
+    def _validate_operator(self, result: AlertQueryResult) -> None:
+        self._validate_result(result)
+        value = result.rows[0][0]
+        if value in (0, None, np.nan):
             self._result = 0.0
             return
         try:
             # Check if it's float or if we can convert it
-            self._result = float(rows[0][1])
+            self._result = float(value)
             return
         except (AssertionError, TypeError, ValueError) as ex:
             raise AlertQueryInvalidTypeError() from ex
@@ -134,20 +140,24 @@ class AlertCommand(BaseCommand):
             self._report_schedule.validator_type == ReportScheduleValidatorType.OPERATOR
         )
 
-    def _execute_query(self) -> pd.DataFrame:
+    def _execute_query(self) -> AlertQueryResult:
         """
         Executes the actual alert SQL query template
 
-        :return: A pandas dataframe
+        Only the rows needed for validation are fetched. When
+        ``ALERT_REPORTS_QUERY_CACHE_TIMEOUT`` is set, alerts that render to the same
+        SQL on the same database, executed as the same user, share the result for
+        that many seconds.
+
+        :return: The column names and rows returned by the query
         :raises AlertQueryError: SQL query is not valid
         :raises AlertQueryTimeout: The SQL query received a celery soft timeout
         """
-        sql_template = jinja_context.get_template_processor(
-            database=self._report_schedule.database
-        )
+        database = self._report_schedule.database
+        sql_template = jinja_context.get_template_processor(database=database)
         rendered_sql = sql_template.process_template(self._report_schedule.sql)
         try:
-            limited_rendered_sql = self._report_schedule.database.apply_limit_to_sql(
+            limited_rendered_sql = database.apply_limit_to_sql(
                 rendered_sql, ALERT_SQL_LIMIT
             )
 
@@ -155,17 +165,49 @@ class AlertCommand(BaseCommand):
                 executor_types=app.config["ALERT_REPORTS_EXECUTE_AS"],
                 model=self._report_schedule,
             )
-            user = security_manager.find_user(username)
-            with override_user(user):
-                start = default_timer()
-                df = self._report_schedule.database.get_df(sql=limited_rendered_sql)
-                stop = default_timer()
+            stats_logger = app.config["STATS_LOGGER"]
+            cache_timeout = app.config["ALERT_REPORTS_QUERY_CACHE_TIMEOUT"]
+            cache_key = generate_cache_key(
+                {
+                    "database_id": database.id,
+                    "sql": limited_rendered_sql,
+                    "username": username,
+                },
+                key_prefix="alert_query_",
+            )
+            start = default_timer()
+            if cache_timeout and (cached := cache_manager.data_cache.get(cache_key)):
+                result = AlertQueryResult(cached["columns"], cached["rows"])
                 logger.info(
-                    "Query for %s took %.2f ms",
+                    "Query for %s took %.2f ms (cached)",
                     self._report_schedule.name,
-                    (stop - start) * 1000.0,
+                    (default_timer() - start) * 1000.0,
+                )
+                stats_logger.incr("alert_query_cache_hit")
+                return result
+
+            user = security_manager.find_user(username)
+            with override_user(user):
+                result = AlertQueryResult(
+                    *database.get_rows(sql=limited_rendered_sql, limit=ALERT_SQL_LIMIT)
+                )
+            stop = default_timer()
+            logger.info(
+                "Query for %s took %.2f ms",
+                self._report_schedule.name,
+                (stop - start) * 1000.0,
+            )
+            stats_logger.timing("alert_query.time", stop - start)
+
+            if cache_timeout:
+                stats_logger.incr("alert_query_cache_miss")
+                set_and_log_cache(
+                    cache_manager.data_cache,
+                    cache_key,
+                    {"columns": result.columns, "rows": result.rows},
+                    cache_timeout,
                 )
-                return df
+            return result
         except SoftTimeLimitExceeded as ex:
             logger.warning("A timeout occurred while executing the alert query: %s", ex)
             raise AlertQueryTimeout() from ex
@@ -174,24 +216,23 @@ class AlertCommand(BaseCommand):
 
     def validate(self) -> None:
         """
-        Validate the query result as a Pandas DataFrame
+        Validate the query result
         """
         # When there are transient errors when executing queries, users will get
         # notified with the error stacktrace which can be avoided by retrying
-        df = retry_call(
+        result = retry_call(
             self._execute_query,
             exception=AlertQueryError,
             max_tries=app.config["ALERT_REPORTS_QUERY_EXECUTION_MAX_TRIES"],
         )
 
-        if df.empty and self._is_validator_not_null:
+        if not result.rows and self._is_validator_not_null:
             self._result = None
             return
-        if df.empty and self._is_validator_operator:
+        if not result.rows and self._is_validator_operator:
             self._result = 0.0
             return
-        rows = df.to_records()
         if self._is_validator_not_null:
-            self._validate_not_null(rows)
+            self._validate_not_null(result)
             return
-        self._validate_operator(rows)
+        self._validate_operator(result)
@@ -134,6 +134,13 @@ class SupersetResultSet:
             data = [tuple(row) for row in data]
         array = np.array(data, dtype=numpy_dtype)
         if array.size > 0:
+            # normalize values column-wise, now that the rows have been transposed
+            for idx, func in db_engine_spec.get_column_mutators(
+                deduped_cursor_desc
+            ).items():
+                column = column_names[idx]
+                array[column] = np.frompyfunc(func, 1, 1)(array[column])
+
             for column in column_names:
                 try:
                     pa_data.append(pa.array(array[column].tolist()))
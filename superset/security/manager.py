@@ -20,10 +20,13 @@ import json
 import logging
 import re
 import time
+import uuid
 from collections import defaultdict
+from collections.abc import Iterable
+from functools import partial
 from typing import Any, Callable, cast, NamedTuple, Optional, TYPE_CHECKING, Union
 
-from flask import current_app, Flask, g, Request
+from flask import current_app, Flask, g, has_app_context, has_request_context, Request
 from flask_appbuilder import Model
 from flask_appbuilder.security.sqla.manager import SecurityManager
 from flask_appbuilder.security.sqla.models import (
@@ -46,7 +49,7 @@ from flask_appbuilder.widgets import ListWidget
 from flask_babel import lazy_gettext as _
 from flask_login import AnonymousUserMixin, LoginManager
 from jwt.api_jwt import _jwt_global_obj
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_, event, inspect, or_
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.mapper import Mapper
@@ -74,6 +77,8 @@ from superset.utils.core import (
     RowLevelSecurityFilterType,
 )
 from superset.utils.filters import get_dataset_access_filters
+from superset.utils.query_memo import memoized
+from superset.utils.tracing import traced
 from superset.utils.urls import get_url_host
 
 if TYPE_CHECKING:
@@ -96,6 +101,54 @@ class DatabaseAndSchema(NamedTuple):
     schema: str
 
 
+PERMISSIONS_CHANGED = "permissions_changed"
+PERMISSIONS_VERSION_KEY = "permissions_version"
+RLS_FILTERS_VERSION_KEY = "rls_filters_version"
+
+
+class RLSRule(NamedTuple):
+    id: int
+    filter_type: Optional[str]
+    group_key: Optional[str]
+    clause: str
+    role_ids: frozenset[int]
+    table_ids: frozenset[int]
+
+
+class RLSRulesIndex:
+    """
+    The row level security rules of a given version, indexed by table and roles.
+    """
+
+    def __init__(self, version: Optional[str], rules: list[RLSRule]) -> None:
+        self.version = version
+        self._rules_by_table: dict[int, list[RLSRule]] = defaultdict(list)
+        for rule in rules:
+            for table_id in rule.table_ids:
+                self._rules_by_table[table_id].append(rule)
+        self._filters: dict[tuple[int, frozenset[int]], list[RLSRule]] = {}
+
+    @staticmethod
+    def _applies(rule: RLSRule, role_ids: frozenset[int]) -> bool:
+        # regular filters apply to the roles of the rule, base filters to all roles
+        # except those of the rule
+        if rule.filter_type == RowLevelSecurityFilterType.REGULAR:
+            return not rule.role_ids.isdisjoint(role_ids)
+        if rule.filter_type == RowLevelSecurityFilterType.BASE:
+            return rule.role_ids.isdisjoint(role_ids)
+        return False
+
+    def get_filters(self, table_id: int, role_ids: Iterable[int]) -> list[RLSRule]:
+        key = (table_id, frozenset(role_ids))
+        if key not in self._filters:
+            self._filters[key] = [
+                rule
+                for rule in self._rules_by_table.get(table_id, [])
+                if self._applies(rule, key[1])
+            ]
+        return self._filters[key]
+
+
 class SupersetSecurityListWidget(ListWidget):  # pylint: disable=too-few-public-methods
     """
     Redeclaring to avoid circular imports
@@ -143,6 +196,9 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
     SecurityManager
 ):
     userstatschartview = None
+    _rls_rules_index: Optional[RLSRulesIndex] = None
+    _permissions_version: Optional[str] = None
+    _permission_indexes: dict[tuple[int, ...], dict[str, set[str]]] = {}
     READ_ONLY_MODEL_VIEWS = {"Database", "DynamicPlugin"}
 
     USER_MODEL_VIEWS = {
@@ -166,6 +222,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         "Log",
         "List Users",
         "List Roles",
+        "Profiling",
         "ResetPasswordView",
         "RoleModelView",
         "Row Level Security",
@@ -575,7 +632,109 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
 
         return True
 
+    def get_permission_index(self, role_ids: Iterable[int]) -> dict[str, set[str]]:
+        """
+        Retrieves the view menu names of each permission granted to a set of roles,
+        from memory or from the shared cache when possible, and otherwise from the
+        metadata database.
+
+        The index of every set of roles is stamped with a version, which changes
+        whenever roles or permissions are modified.
+
+        :param role_ids: The role ids
+        :returns: The view menu names indexed by permission name
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        role_ids = tuple(sorted(set(role_ids)))
+        if has_request_context() and "permissions_version" in g:
+            version = g.permissions_version
+        else:
+            version = self._get_cache_version(PERMISSIONS_VERSION_KEY)
+            if has_request_context():
+                g.permissions_version = version
+
+        if version != self._permissions_version:
+            self._permission_indexes = {}
+        if version is not None and role_ids in self._permission_indexes:
+            return self._permission_indexes[role_ids]
+
+        cache = cache_manager.cache
+        index_key = f"permissions_{version}_{'_'.join(map(str, role_ids))}"
+        index = cache.get(index_key) if version is not None else None
+        if index is None:
+            index = self._load_permission_index(role_ids)
+            if version is not None:
+                cache.set(index_key, index)
+
+        if version is not None:
+            self._permissions_version = version
+            self._permission_indexes[role_ids] = index
+        return index
+
+    def _load_permission_index(self, role_ids: tuple[int, ...]) -> dict[str, set[str]]:
+        query = (
+            self.get_session.query(self.permission_model.name, self.viewmenu_model.name)
+            .select_from(self.permissionview_model)
+            .join(
+                self.permission_model,
+                self.permission_model.id == self.permissionview_model.permission_id,
+            )
+            .join(
+                self.viewmenu_model,
+                self.viewmenu_model.id == self.permissionview_model.view_menu_id,
+            )
+            .join(
+                assoc_permissionview_role,
+                assoc_permissionview_role.c.permission_view_id
+                == self.permissionview_model.id,
+            )
+            .filter(assoc_permissionview_role.c.role_id.in_(role_ids))
+        )
+        index: dict[str, set[str]] = defaultdict(set)
+        for permission_name, view_menu_name in query:
+            index[permission_name].add(view_menu_name)
+        return dict(index)
+
+    def _flag_permissions_changed(self) -> None:
+        """
+        Flags the session, so that the cached permission indexes are invalidated once
+        the change is committed.
+        """
+        self.get_session.info[PERMISSIONS_CHANGED] = True
+
+    def on_permissions_changed(self) -> None:
+        """
+        Invalidates the cached permission indexes of all processes, by stamping them
+        with a new version.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        if current_app.config["CACHE_PERMISSIONS"]:
+            cache_manager.cache.set(PERMISSIONS_VERSION_KEY, uuid.uuid4().hex)
+            self._permission_indexes = {}
+            if has_request_context():
+                g.pop("permissions_version", None)
+
+    def exist_permission_on_roles(
+        self, view_name: str, permission_name: str, role_ids: list[int]
+    ) -> bool:
+        if current_app.config["CACHE_PERMISSIONS"]:
+            index = self.get_permission_index(role_ids)
+            return view_name in index.get(permission_name, ())
+        return super().exist_permission_on_roles(view_name, permission_name, role_ids)
+
     def user_view_menu_names(self, permission_name: str) -> set[str]:
+        if current_app.config["CACHE_PERMISSIONS"]:
+            if g.user.is_anonymous:
+                public_role = self.get_public_role()
+                role_ids = [public_role.id] if public_role else []
+            else:
+                role_ids = [role.id for role in g.user.roles]
+            return set(self.get_permission_index(role_ids).get(permission_name, ()))
+
         base_query = (
             self.get_session.query(self.viewmenu_model.name)
             .join(self.permissionview_model)
@@ -1128,6 +1287,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param target: The database object
         :return: A list of changed view menus (permission resource names)
         """
+        self._flag_permissions_changed()
         view_menu_table = self.viewmenu_model.__table__  # pylint: disable=no-member
         new_database_name = target.database_name
         old_view_menu_name = self.get_database_perm(target.id, old_database_name)
@@ -1182,6 +1342,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param target: The database object
         :return: A list of changed view menus (permission resource names)
         """
+        self._flag_permissions_changed()
         from superset.connectors.sqla.models import (  # pylint: disable=import-outside-toplevel
             SqlaTable,
         )
@@ -1473,6 +1634,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param target:
         :return:
         """
+        self._flag_permissions_changed()
         logger.info(
             "Updating dataset perm, old: %s, new: %s",
             old_permission_name,
@@ -1547,6 +1709,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param pvm: Can be called with the actual PVM already
         :return:
         """
+        self._flag_permissions_changed()
         view_menu_table = self.viewmenu_model.__table__  # pylint: disable=no-member
         permission_view_menu_table = (
             self.permissionview_model.__table__  # pylint: disable=no-member
@@ -2023,6 +2186,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             ]
         return []
 
+    @traced("security.rls_filters")
     def get_rls_filters(self, table: "BaseDatasource") -> list[SqlaQuery]:
         """
         Retrieves the appropriate row level security filters for the current user and
@@ -2035,6 +2199,23 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if not (hasattr(g, "user") and g.user is not None):
             return []
 
+        user_roles = sorted(role.id for role in self.get_user_roles(g.user))
+
+        # copy the memoized list, as callers are free to sort it
+        return list(
+            memoized(
+                ("rls_filters", table.id, tuple(user_roles)),
+                partial(self._get_rls_filters, table, user_roles),
+            )
+        )
+
+    def _get_rls_filters(
+        self, table: "BaseDatasource", user_roles: list[int]
+    ) -> list[Any]:
+        if current_app.config["CACHE_RLS_FILTERS"]:
+            index = memoized(("rls_rules_index",), self.get_rls_rules_index)
+            return index.get_filters(table.id, user_roles)
+
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterRoles,
@@ -2042,7 +2223,6 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.get_session()
             .query(RLSFilterRoles.c.rls_filter_id)
@@ -2091,6 +2271,102 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         )
         return query.all()
 
+    def get_rls_rules_index(self) -> RLSRulesIndex:
+        """
+        Retrieves the current version of the row level security rules, from memory or
+        from the shared cache when possible, and otherwise from the metadata database.
+
+        :returns: The row level security rules indexed by table and roles
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        cache = cache_manager.cache
+        version = self._get_cache_version(RLS_FILTERS_VERSION_KEY)
+        index = self._rls_rules_index
+        if index is not None and version is not None and index.version == version:
+            return index
+
+        rules_key = f"rls_rules_{version}"
+        rules = cache.get(rules_key) if version is not None else None
+        if rules is None:
+            rules = self._load_rls_rules()
+            if version is not None:
+                cache.set(rules_key, rules)
+
+        index = RLSRulesIndex(version, rules)
+        if version is not None:
+            self._rls_rules_index = index
+        return index
+
+    def _load_rls_rules(self) -> list[RLSRule]:
+        # pylint: disable=import-outside-toplevel
+        from superset.connectors.sqla.models import (
+            RLSFilterRoles,
+            RLSFilterTables,
+            RowLevelSecurityFilter,
+        )
+
+        session = self.get_session()
+        role_ids: dict[int, set[int]] = defaultdict(set)
+        for rls_filter_id, role_id in session.query(
+            RLSFilterRoles.c.rls_filter_id, RLSFilterRoles.c.role_id
+        ):
+            role_ids[rls_filter_id].add(role_id)
+        table_ids: dict[int, set[int]] = defaultdict(set)
+        for rls_filter_id, table_id in session.query(
+            RLSFilterTables.c.rls_filter_id, RLSFilterTables.c.table_id
+        ):
+            table_ids[rls_filter_id].add(table_id)
+
+        return [
+            RLSRule(
+                id=id_,
+                filter_type=filter_type,
+                group_key=group_key,
+                clause=clause,
+                role_ids=frozenset(role_ids[id_]),
+                table_ids=frozenset(table_ids[id_]),
+            )
+            for id_, filter_type, group_key, clause in session.query(
+                RowLevelSecurityFilter.id,
+                RowLevelSecurityFilter.filter_type,
+                RowLevelSecurityFilter.group_key,
+                RowLevelSecurityFilter.clause,
+            ).order_by(RowLevelSecurityFilter.id)
+        ]
+
+    def on_rls_filters_changed(self) -> None:
+        """
+        Invalidates the cached row level security rules of all processes, by stamping
+        the rules with a new version.
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        if current_app.config["CACHE_RLS_FILTERS"]:
+            cache_manager.cache.set(RLS_FILTERS_VERSION_KEY, uuid.uuid4().hex)
+            self._rls_rules_index = None
+
+    @staticmethod
+    def _get_cache_version(key: str) -> Optional[str]:
+        """
+        Retrieves the version stamp stored under the key in the shared cache, creating
+        it if needed.
+
+        :param key: The cache key of the version stamp
+        :returns: The version stamp, or None if the cache doesn't store anything
+        """
+        # pylint: disable=import-outside-toplevel
+        from superset.extensions import cache_manager
+
+        cache = cache_manager.cache
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, uuid.uuid4().hex)
+            version = cache.get(key)
+        return version
+
     def get_rls_sorted(self, table: "BaseDatasource") -> list["RowLevelSecurityFilter"]:
         """
         Retrieves a list RLS filters sorted by ID for
@@ -2320,3 +2596,26 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         return current_app.config["AUTH_ROLE_ADMIN"] in [
             role.name for role in self.get_user_roles()
         ]
+
+
+def flag_permissions_changed(
+    mapper: Mapper, connection: Connection, target: Model
+) -> None:
+    """
+    Flags the session of a changed role or permission, so that the cached permission
+    indexes are invalidated once the change is committed. Invalidating them earlier
+    would let other workers cache the permissions as they were before the change.
+    """
+    if session := inspect(target).session:
+        session.info[PERMISSIONS_CHANGED] = True
+
+
+def invalidate_permissions(session: Session) -> None:
+    if session.info.pop(PERMISSIONS_CHANGED, False) and has_app_context():
+        current_app.appbuilder.sm.on_permissions_changed()
+
+
+for model in (Role, Permission, PermissionView, ViewMenu):
+    for identifier in ("after_update", "after_delete"):
+        event.listen(model, identifier, flag_permissions_changed, propagate=True)
+event.listen(Session, "after_commit", invalidate_permissions)
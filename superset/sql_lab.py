@@ -61,6 +61,7 @@ from superset.utils.core import (
 )
 from superset.utils.dates import now_as_float
 from superset.utils.decorators import stats_timing
+from superset.utils.tracing import span, trace
 
 config = app.config
 stats_logger = config["STATS_LOGGER"]
@@ -180,7 +181,9 @@ def get_sql_results(  # pylint: disable=too-many-arguments
     log_params: Optional[dict[str, Any]] = None,
 ) -> Optional[dict[str, Any]]:
     """Executes the sql query returns the results."""
-    with session_scope(not ctask.request.called_directly) as session:
+    with session_scope(not ctask.request.called_directly) as session, trace(
+        "sqllab.get_sql_results", query_id=query_id
+    ):
         with override_user(security_manager.find_user(username)):
             try:
                 return execute_sql_statements(
@@ -326,7 +329,8 @@ def execute_sql_statement(  # pylint: disable=too-many-arguments,too-many-statem
 
     logger.debug("Query %d: Fetching cursor description", query.id)
     cursor_description = cursor.description
-    return SupersetResultSet(data, cursor_description, db_engine_spec)
+    with span("result_set.build"):
+        return SupersetResultSet(data, cursor_description, db_engine_spec)
 
 
 def apply_limit_if_exists(
@@ -370,17 +374,15 @@ def _serialize_and_expand_data(
 
         # expand when loading data from results backend
         all_columns, expanded_columns = (selected_columns, [])
+    elif expand_data:
+        all_columns, data, expanded_columns = db_engine_spec.expand_table(
+            selected_columns, result_set.pa_table
+        )
     else:
         df = result_set.to_pandas_df()
         data = df_to_records(df) or []
-
-        if expand_data:
-            all_columns, data, expanded_columns = db_engine_spec.expand_data(
-                selected_columns, data
-            )
-        else:
-            all_columns = selected_columns
-            expanded_columns = []
+        all_columns = selected_columns
+        expanded_columns = []
 
     return (data, selected_columns, all_columns, expanded_columns)
 
@@ -16,6 +16,12 @@
 # under the License.
 import json
 import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from typing import Any, Optional, Union
 from urllib import request
 from urllib.error import URLError
@@ -23,14 +29,20 @@ from urllib.error import URLError
 from celery.beat import SchedulingError
 from celery.utils.log import get_task_logger
 from sqlalchemy import and_, func
+from sqlalchemy.orm import Session
 
 from superset import app, db, security_manager
+from superset.charts.commands.warm_up_cache import ChartWarmUpCacheCommand
+from superset.connectors.sqla.models import SqlaTable
 from superset.extensions import celery_app
 from superset.models.core import Log
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.tags.models import Tag, TaggedObject
+from superset.tasks.utils import DASHBOARD_VIEW_ACTIONS
+from superset.utils.core import override_user
 from superset.utils.date_parser import parse_human_datetime
+from superset.utils.hashing import md5_sha_from_dict
 from superset.utils.machine_auth import MachineAuthProvider
 
 logger = get_task_logger(__name__)
@@ -74,6 +86,30 @@ class Strategy:  # pylint: disable=too-few-public-methods
     def get_payloads(self) -> list[dict[str, int]]:
         raise NotImplementedError("Subclasses must implement get_payloads!")
 
+    def warm_up(self) -> dict[str, Any]:
+        """Schedule a `fetch_url` task for each payload of the strategy."""
+        user = security_manager.get_user_by_username(
+            app.config["THUMBNAIL_SELENIUM_USER"]
+        )
+        cookies = MachineAuthProvider.get_auth_cookies(user)
+        headers = {
+            "Cookie": f"session={cookies.get('session', '')}",
+            "Content-Type": "application/json",
+        }
+
+        results: dict[str, list[str]] = {"scheduled": [], "errors": []}
+        for payload in self.get_payloads():
+            try:
+                payload = json.dumps(payload)
+                logger.info("Scheduling %s", payload)
+                fetch_url.delay(payload, headers)
+                results["scheduled"].append(payload)
+            except SchedulingError:
+                logger.exception("Error scheduling fetch_url for payload: %s", payload)
+                results["errors"].append(payload)
+
+        return results
+
 
 class DummyStrategy(Strategy):  # pylint: disable=too-few-public-methods
     """
@@ -223,7 +259,494 @@ class DashboardTagsStrategy(Strategy):  # pylint: disable=too-few-public-methods
         return payloads
 
 
-strategies = [DummyStrategy, TopNDashboardsStrategy, DashboardTagsStrategy]
+class ChartDataUsageStrategy(Strategy):  # pylint: disable=too-few-public-methods
+    """
+    Warm up the chart data requests made the most often, filters included.
+
+    The query contexts logged by the chart data endpoint are replayed in-process on
+    behalf of the user who last requested them, and only the results which are
+    missing from the cache or expire within `refresh_within` seconds are queried
+    again. At most `database_concurrency` queries run at once against each database,
+    and no query is started once `time_budget` seconds have elapsed.
+
+    The query contexts are only logged with `LOG_CHART_DATA_QUERY_CONTEXT = True`,
+    there's nothing to warm up otherwise.
+
+        beat_schedule = {
+            'cache-warmup-hourly': {
+                'task': 'cache-warmup',
+                'schedule': crontab(minute=1, hour='*'),  # @hourly
+                'kwargs': {
+                    'strategy_name': 'chart_data_usage',
+                    'top_n': 50,
+                    'since': '7 days ago',
+                    'refresh_within': 600,
+                    'database_concurrency': 2,
+                    'time_budget': 1800,
+                },
+            },
+        }
+
+    """
+
+    name = "chart_data_usage"
+    action = "ChartDataRestApi.data"
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        top_n: int = 50,
+        since: str = "7 days ago",
+        refresh_within: Optional[int] = 600,
+        database_concurrency: int = 2,
+        time_budget: Optional[int] = 1800,
+    ) -> None:
+        super().__init__()
+        self.top_n = top_n
+        self.since = parse_human_datetime(since) if since else None
+        self.refresh_within = refresh_within
+        self.database_concurrency = database_concurrency
+        self.time_budget = time_budget
+
+    @staticmethod
+    def _is_warmable(query_context: dict[str, Any]) -> bool:
+        """Whether the request returns the full results as JSON, as dashboards do."""
+        return query_context.get("result_format", "json") == "json" and all(
+            query.get("result_type", query_context.get("result_type", "full")) == "full"
+            for query in query_context.get("queries", [])
+        )
+
+    def get_logged_requests(
+        self, session: Session, *criteria: Any
+    ) -> Iterator[tuple[Any, dict[str, Any]]]:
+        """
+        Yield the log records of the warmable chart data requests matching the
+        criteria along with their query context, from the oldest one.
+        """
+        filters = [Log.action == self.action, Log.slice_id > 0, *criteria]
+        if self.since:
+            filters.append(Log.dttm >= self.since)
+        records = (
+            session.query(Log.user_id, Log.dashboard_id, Log.slice_id, Log.json)
+            .filter(and_(*filters))
+            .order_by(Log.dttm)
+            .yield_per(1000)
+        )
+        for record in records:
+            try:
+                query_context = json.loads(record.json)["query_context"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            if isinstance(query_context, dict) and self._is_warmable(query_context):
+                # requests which only differ by `force` read the same results
+                query_context.pop("force", None)
+                yield record, query_context
+
+    def get_payloads(self) -> list[dict[str, Any]]:
+        counts: Counter[str] = Counter()
+        payloads: dict[str, dict[str, Any]] = {}
+        session = db.create_scoped_session()
+
+        try:
+            for record, query_context in self.get_logged_requests(session):
+                key = md5_sha_from_dict(query_context)
+                counts[key] += 1
+                # the latest request wins, its user is the most likely to still
+                # have access to the chart
+                payloads[key] = {
+                    "chart_id": record.slice_id,
+                    "dashboard_id": record.dashboard_id,
+                    "user_id": record.user_id,
+                    "query_context": query_context,
+                }
+        finally:
+            session.close()
+
+        return [payloads[key] for key, _ in counts.most_common(self.top_n)]
+
+    def warm_up(self) -> dict[str, Any]:
+        """Warm up the payloads in-process, from the most requested one down."""
+        if not app.config["LOG_CHART_DATA_QUERY_CONTEXT"]:
+            logger.warning(
+                "The %s strategy replays the logged query contexts, which aren't "
+                "logged unless LOG_CHART_DATA_QUERY_CONTEXT is set",
+                self.name,
+            )
+        deadline = (
+            time.monotonic() + self.time_budget
+            if self.time_budget is not None
+            else None
+        )
+        payloads = self.get_payloads()
+
+        session = db.create_scoped_session()
+        try:
+            charts = session.query(Slice).filter(
+                Slice.id.in_({payload["chart_id"] for payload in payloads})
+            )
+            database_ids = {
+                chart.id: chart.datasource.database.id if chart.datasource else None
+                for chart in charts
+            }
+        finally:
+            session.close()
+
+        semaphores = {
+            database_id: threading.BoundedSemaphore(self.database_concurrency)
+            for database_id in database_ids.values()
+        }
+        flask_app = app._get_current_object()  # pylint: disable=protected-access
+
+        def run(payload: dict[str, Any]) -> str:
+            database_id = database_ids.get(payload["chart_id"])
+            with flask_app.app_context(), semaphores.get(database_id, nullcontext()):
+                if deadline is not None and time.monotonic() > deadline:
+                    return "skipped"
+
+                user = security_manager.get_user_by_id(payload["user_id"])
+                try:
+                    with override_user(user):
+                        result = ChartWarmUpCacheCommand(
+                            payload["chart_id"],
+                            payload["dashboard_id"],
+                            None,
+                            query_context=payload["query_context"],
+                            force=False,
+                            refresh_within=self.refresh_within,
+                        ).run()
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("Error warming up chart %s", payload["chart_id"])
+                    return "errors"
+                finally:
+                    db.session.remove()
+
+                return "errors" if result["viz_error"] else "warmed"
+
+        results: dict[str, list[str]] = {"warmed": [], "skipped": [], "errors": []}
+        if not payloads:
+            return results
+
+        max_workers = self.database_concurrency * max(len(semaphores), 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for payload, outcome in zip(payloads, executor.map(run, payloads)):
+                results[outcome].append(
+                    json.dumps(
+                        {
+                            "chart_id": payload["chart_id"],
+                            "dashboard_id": payload["dashboard_id"],
+                        }
+                    )
+                )
+
+        logger.info(
+            "Warmed up %s chart data requests, skipped %s, %s errors",
+            len(results["warmed"]),
+            len(results["skipped"]),
+            len(results["errors"]),
+        )
+        return results
+
+
+# a chart and the values of the dashboard filters applied to it
+ChartFilterState = tuple[int, frozenset[tuple[str, tuple[Any, ...]]]]
+
+
+class DashboardNativeFiltersStrategy(ChartDataUsageStrategy):
+    """
+    Warm up the charts of the top-n dashboards with their common native filter values.
+
+    Besides the default filter state of each dashboard, the charts in the scope of
+    each select filter are warmed up with each of the `top_k` values picked the most
+    often in the filter, as logged by the chart data endpoint, completed by values of
+    the filter column when too few were picked. The other filters keep their default
+    values. The filter states are queued from the most popular down, until
+    `max_queries` chart queries are, and they are warmed up as per the
+    `chart_data_usage` strategy.
+
+    The result reports the coverage of each dashboard, i.e. the share of its logged
+    chart data requests whose native filter state is one of the warmed up states.
+
+    The picked values are only logged with `LOG_CHART_DATA_QUERY_CONTEXT = True`,
+    only the default filter states and the column values are warmed up otherwise.
+
+        beat_schedule = {
+            'cache-warmup-hourly': {
+                'task': 'cache-warmup',
+                'schedule': crontab(minute=1, hour='*'),  # @hourly
+                'kwargs': {
+                    'strategy_name': 'dashboard_native_filters',
+                    'top_n': 5,
+                    'since': '7 days ago',
+                    'top_k': 5,
+                    'max_queries': 500,
+                },
+            },
+        }
+
+    """
+
+    name = "dashboard_native_filters"
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        top_n: int = 5,
+        since: str = "7 days ago",
+        top_k: int = 5,
+        max_queries: Optional[int] = 500,
+        refresh_within: Optional[int] = 600,
+        database_concurrency: int = 2,
+        time_budget: Optional[int] = 1800,
+    ) -> None:
+        super().__init__(
+            top_n=top_n,
+            since=since,
+            refresh_within=refresh_within,
+            database_concurrency=database_concurrency,
+            time_budget=time_budget,
+        )
+        self.top_k = top_k
+        self.max_queries = max_queries
+        self.coverage: dict[int, float] = {}
+
+    @staticmethod
+    def get_select_filters(dashboard: Dashboard) -> list[dict[str, Any]]:
+        """Return the native select filters of the dashboard targeting a column."""
+        try:
+            json_metadata = json.loads(dashboard.json_metadata or "{}")
+        except json.JSONDecodeError:
+            return []
+
+        return [
+            native_filter
+            for native_filter in json_metadata.get("native_filter_configuration", [])
+            if native_filter.get("filterType") == "filter_select"
+            and native_filter.get("targets")
+            and native_filter["targets"][0].get("datasetId")
+            and native_filter["targets"][0].get("column", {}).get("name")
+        ]
+
+    @staticmethod
+    def get_filter_state(query_context: dict[str, Any]) -> dict[str, tuple[Any, ...]]:
+        """Return the values of the dashboard filters a request was made with."""
+        form_data = query_context.get("form_data") or {}
+        extra_form_data = form_data.get("extra_form_data") or {}
+        return {
+            filter_["col"]: tuple(filter_["val"])
+            for filter_ in extra_form_data.get("filters", [])
+            if filter_.get("op") == "IN"
+            and isinstance(filter_.get("col"), str)
+            and isinstance(filter_.get("val"), list)
+        }
+
+    @staticmethod
+    def in_scope(native_filter: dict[str, Any], chart: Slice) -> bool:
+        scope = native_filter.get("scope") or {}
+        if chart.id in scope.get("excluded", []):
+            return False
+        if "chartsInScope" in native_filter:
+            return chart.id in native_filter["chartsInScope"]
+        return True
+
+    def get_top_values(
+        self,
+        session: Session,
+        native_filter: dict[str, Any],
+        counts: Counter[tuple[Any, ...]],
+    ) -> list[tuple[Any, ...]]:
+        """Return the `top_k` values of the filter, the most picked ones first."""
+        values = [value for value, _ in counts.most_common(self.top_k)]
+        if len(values) < self.top_k:
+            target = native_filter["targets"][0]
+            dataset = session.query(SqlaTable).get(target["datasetId"])
+            try:
+                column_values = (
+                    dataset.values_for_column(target["column"]["name"], self.top_k)
+                    if dataset
+                    else []
+                )
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("Error fetching the values of %s", target)
+                column_values = []
+            for column_value in column_values:
+                if len(values) < self.top_k and (column_value,) not in values:
+                    values.append((column_value,))
+        return values
+
+    def get_dashboard_payloads(
+        self, session: Session, dashboard: Dashboard
+    ) -> tuple[
+        list[tuple[int, ChartFilterState, dict[str, Any]]], list[ChartFilterState]
+    ]:
+        """
+        Return the payloads of the charts of the dashboard for each of its warmed up
+        filter states, along with the rank of the state and the chart filter state,
+        and the chart filter states of the logged requests.
+        """
+        native_filters = self.get_select_filters(dashboard)
+        columns = {
+            native_filter["id"]: native_filter["targets"][0]["column"]["name"]
+            for native_filter in native_filters
+        }
+        defaults: dict[str, tuple[Any, ...]] = {}
+        for native_filter in native_filters:
+            default_value = (
+                (native_filter.get("defaultDataMask") or {}).get("filterState") or {}
+            ).get("value")
+            if isinstance(default_value, list) and default_value:
+                defaults[columns[native_filter["id"]]] = tuple(default_value)
+
+        requests: list[ChartFilterState] = []
+        counts: dict[str, Counter[tuple[Any, ...]]] = defaultdict(Counter)
+        users: Counter[Optional[int]] = Counter()
+        for record, query_context in self.get_logged_requests(
+            session, Log.dashboard_id == dashboard.id
+        ):
+            state = {
+                column: value
+                for column, value in self.get_filter_state(query_context).items()
+                if column in columns.values()
+            }
+            requests.append((record.slice_id, frozenset(state.items())))
+            for column, value in state.items():
+                counts[column][value] += 1
+            users[record.user_id] += 1
+
+        # the default state first, then each filter with its top values in turn
+        states = [(0, defaults)]
+        for native_filter in native_filters:
+            column = columns[native_filter["id"]]
+            for rank, value in enumerate(
+                self.get_top_values(session, native_filter, counts[column]), start=1
+            ):
+                if value != defaults.get(column):
+                    states.append((rank, {**defaults, column: value}))
+
+        if users:
+            user_id = users.most_common(1)[0][0]
+        else:
+            user = security_manager.get_user_by_username(
+                app.config["THUMBNAIL_SELENIUM_USER"]
+            )
+            user_id = user.id if user else None
+
+        payloads = []
+        warmed: set[ChartFilterState] = set()
+        for rank, state in states:
+            for chart in dashboard.slices:
+                if not chart.query_context or not chart.datasource:
+                    continue
+
+                chart_columns = {
+                    column.column_name for column in chart.datasource.columns
+                }
+                filters = [
+                    {
+                        "col": columns[native_filter["id"]],
+                        "op": "IN",
+                        "val": list(value),
+                    }
+                    for native_filter in native_filters
+                    if (value := state.get(columns[native_filter["id"]]))
+                    and columns[native_filter["id"]] in chart_columns
+                    and self.in_scope(native_filter, chart)
+                ]
+                # states which only differ by filters out of the chart scope
+                key = (
+                    chart.id,
+                    frozenset(
+                        (filter_["col"], tuple(filter_["val"])) for filter_ in filters
+                    ),
+                )
+                if key in warmed:
+                    continue
+                warmed.add(key)
+
+                try:
+                    query_context = json.loads(chart.query_context)
+                except json.JSONDecodeError:
+                    continue
+                query_context.pop("force", None)
+                for query in query_context.get("queries", []):
+                    query["filters"] = [*(query.get("filters") or []), *filters]
+                query_context["form_data"] = {
+                    **(query_context.get("form_data") or {}),
+                    "dashboardId": dashboard.id,
+                    "extra_form_data": {"filters": filters},
+                }
+                payloads.append(
+                    (
+                        rank,
+                        key,
+                        {
+                            "chart_id": chart.id,
+                            "dashboard_id": dashboard.id,
+                            "user_id": user_id,
+                            "query_context": query_context,
+                        },
+                    )
+                )
+
+        return payloads, requests
+
+    def get_payloads(self) -> list[dict[str, Any]]:
+        payloads: list[tuple[int, ChartFilterState, dict[str, Any]]] = []
+        requests: dict[int, list[ChartFilterState]] = {}
+        session = db.create_scoped_session()
+
+        try:
+            # the views, not the requests made for each chart of the dashboards
+            filters = [
+                Log.dashboard_id.isnot(None),
+                Log.action.in_(DASHBOARD_VIEW_ACTIONS),
+            ]
+            if self.since:
+                filters.append(Log.dttm >= self.since)
+            records = (
+                session.query(Log.dashboard_id, func.count(Log.dashboard_id))
+                .filter(and_(*filters))
+                .group_by(Log.dashboard_id)
+                .order_by(func.count(Log.dashboard_id).desc())
+                .limit(self.top_n)
+                .all()
+            )
+            for record in records:
+                if dashboard := session.query(Dashboard).get(record.dashboard_id):
+                    (
+                        dashboard_payloads,
+                        requests[dashboard.id],
+                    ) = self.get_dashboard_payloads(session, dashboard)
+                    payloads.extend(dashboard_payloads)
+        finally:
+            session.close()
+
+        # the most popular states of every dashboard go first
+        payloads.sort(key=lambda payload: payload[0])
+        payloads = payloads[: self.max_queries]
+
+        warmed = {key for _, key, _ in payloads}
+        self.coverage = {
+            dashboard_id: sum(request in warmed for request in dashboard_requests)
+            / len(dashboard_requests)
+            for dashboard_id, dashboard_requests in requests.items()
+            if dashboard_requests
+        }
+        return [payload for _, _, payload in payloads]
+
+    def warm_up(self) -> dict[str, Any]:
+        results = super().warm_up()
+        results["coverage"] = self.coverage
+        logger.info("Dashboard native filters coverage: %s", self.coverage)
+        return results
+
+
+strategies = [
+    DummyStrategy,
+    TopNDashboardsStrategy,
+    DashboardTagsStrategy,
+    ChartDataUsageStrategy,
+    DashboardNativeFiltersStrategy,
+]
 
 
 @celery_app.task(name="fetch_url")
@@ -264,7 +787,7 @@ def fetch_url(data: str, headers: dict[str, str]) -> dict[str, str]:
 @celery_app.task(name="cache-warmup")
 def cache_warmup(
     strategy_name: str, *args: Any, **kwargs: Any
-) -> Union[dict[str, list[str]], str]:
+) -> Union[dict[str, Any], str]:
     """
     Warm up cache.
 
@@ -290,22 +813,4 @@ def cache_warmup(
         logger.exception(message)
         return message
 
-    user = security_manager.get_user_by_username(app.config["THUMBNAIL_SELENIUM_USER"])
-    cookies = MachineAuthProvider.get_auth_cookies(user)
-    headers = {
-        "Cookie": f"session={cookies.get('session', '')}",
-        "Content-Type": "application/json",
-    }
-
-    results: dict[str, list[str]] = {"scheduled": [], "errors": []}
-    for payload in strategy.get_payloads():
-        try:
-            payload = json.dumps(payload)
-            logger.info("Scheduling %s", payload)
-            fetch_url.delay(payload, headers)
-            results["scheduled"].append(payload)
-        except SchedulingError:
-            logger.exception("Error scheduling fetch_url for payload: %s", payload)
-            results["errors"].append(payload)
-
-    return results
+    return strategy.warm_up()
@@ -18,18 +18,34 @@
 """Utility functions used across Superset"""
 
 import logging
-from typing import cast, Optional
+import time
+from typing import Any, cast, Optional, TYPE_CHECKING, Union
 
+from celery.exceptions import SoftTimeLimitExceeded
 from flask import current_app
+from sqlalchemy import func
 
-from superset import security_manager, thumbnail_cache
+from superset import db, security_manager, thumbnail_cache
 from superset.extensions import celery_app
-from superset.tasks.utils import get_executor
+from superset.tasks.utils import (
+    CHART_VIEW_ACTIONS,
+    DASHBOARD_VIEW_ACTIONS,
+    get_executor,
+)
 from superset.utils.core import override_user
-from superset.utils.screenshots import ChartScreenshot, DashboardScreenshot
+from superset.utils.date_parser import parse_human_datetime
+from superset.utils.screenshots import (
+    BaseScreenshot,
+    ChartScreenshot,
+    DashboardScreenshot,
+)
 from superset.utils.urls import get_url_path
 from superset.utils.webdriver import WindowSize
 
+if TYPE_CHECKING:
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+
 logger = logging.getLogger(__name__)
 
 
@@ -102,3 +118,138 @@ def cache_dashboard_thumbnail(
             force=force,
             thumb_size=thumb_size,
         )
+
+
+def get_view_counts(
+    column: Any,
+    actions: list[str],
+    since: Optional[str] = None,
+) -> dict[int, int]:
+    """
+    Count the views of the charts or dashboards in the logs, by id.
+
+    :param column: The column of the logs holding the ids, e.g. `Log.slice_id`
+    :param actions: The actions logged when viewing them, e.g. `CHART_VIEW_ACTIONS`
+    :param since: Only count the views since then, e.g. "7 days ago"
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.models.core import Log
+
+    query = db.session.query(column, func.count(column)).filter(
+        column.isnot(None), Log.action.in_(actions)
+    )
+    if since:
+        query = query.filter(Log.dttm >= parse_human_datetime(since))
+    return dict(query.group_by(column).all())
+
+
+def get_screenshot(model: Union["Dashboard", "Slice"]) -> BaseScreenshot:
+    """Get the screenshot of a chart or dashboard, as per its current digest."""
+    # pylint: disable=import-outside-toplevel
+    from superset.models.dashboard import Dashboard
+
+    if isinstance(model, Dashboard):
+        url = get_url_path("Superset.dashboard", dashboard_id_or_slug=model.id)
+        return DashboardScreenshot(url, model.digest)
+    url = get_url_path("Superset.slice", slice_id=model.id)
+    return ChartScreenshot(url, model.digest)
+
+
+@celery_app.task(name="refresh_thumbnails", soft_time_limit=3600)
+def refresh_thumbnails(  # pylint: disable=too-many-locals
+    dashboards: bool = True,
+    charts: bool = True,
+    model_ids: Optional[list[int]] = None,
+    since: Optional[str] = "7 days ago",
+    asynchronous: bool = False,
+) -> dict[str, int]:
+    """
+    Render the thumbnails whose digest changed since they were last rendered, i.e.
+    which aren't cached under their current digest, the most viewed first. Along with
+    `THUMBNAIL_DIGEST_DATA_PARTS`, this refreshes the thumbnails showing stale data
+    without rendering all the others again, e.g.
+
+        beat_schedule = {
+            'thumbnails-refresh-hourly': {
+                'task': 'refresh_thumbnails',
+                'schedule': crontab(minute=30, hour='*'),
+                'kwargs': {'since': '7 days ago', 'asynchronous': True},
+            },
+        }
+
+    :param dashboards: Whether to refresh the thumbnails of the dashboards
+    :param charts: Whether to refresh the thumbnails of the charts
+    :param model_ids: Only refresh the thumbnails of the models with these ids
+    :param since: Prioritize the models by their views since then
+    :param asynchronous: Render the thumbnails on the workers rather than in place
+    :return: The number of thumbnails rendered, queued, skipped and failed
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.models.core import Log
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+
+    counts = {"rendered": 0, "queued": 0, "skipped": 0, "failed": 0}
+    if not thumbnail_cache:
+        logger.warning("No cache set, refusing to compute")
+        return counts
+
+    stats_logger = current_app.config["STATS_LOGGER"]
+    start = time.time()
+    kinds = []
+    if dashboards:
+        kinds.append(("dashboard", Dashboard, Log.dashboard_id, DASHBOARD_VIEW_ACTIONS))
+    if charts:
+        kinds.append(("chart", Slice, Log.slice_id, CHART_VIEW_ACTIONS))
+
+    for kind, model_cls, column, actions in kinds:
+        compute_func = (
+            cache_dashboard_thumbnail if kind == "dashboard" else cache_chart_thumbnail
+        )
+        query = db.session.query(model_cls)
+        if model_ids:
+            query = query.filter(model_cls.id.in_(model_ids))
+        views = get_view_counts(column, actions, since)
+        models = sorted(
+            query.all(), key=lambda model: views.get(model.id, 0), reverse=True
+        )
+        for model in models:
+            try:
+                cache_key = get_screenshot(model).cache_key()
+                if thumbnail_cache.has(cache_key):
+                    outcome = "skipped"
+                elif asynchronous:
+                    compute_func.delay(None, model.id, force=True)
+                    outcome = "queued"
+                else:
+                    compute_func(None, model.id, force=True)
+                    outcome = "rendered" if thumbnail_cache.has(cache_key) else "failed"
+            except SoftTimeLimitExceeded:
+                raise
+            except Exception:  # pylint: disable=broad-except
+                logger.warning(
+                    "Failed at refreshing %s thumbnail %s",
+                    kind,
+                    model.id,
+                    exc_info=True,
+                )
+                outcome = "failed"
+            counts[outcome] += 1
+            stats_logger.incr(f"thumbnail_refresh.{kind}.{outcome}")
+
+    elapsed = time.time() - start
+    stats_logger.timing("thumbnail_refresh.duration", elapsed * 1000)
+    # the thumbnails queued are rendered by the other workers, after this task
+    stats_logger.gauge(
+        "thumbnail_refresh.throughput", counts["rendered"] / elapsed if elapsed else 0
+    )
+    logger.info(
+        "Refreshed thumbnails in %.1f s: %d rendered, %d queued, %d skipped, "
+        "%d failed",
+        elapsed,
+        counts["rendered"],
+        counts["queued"],
+        counts["skipped"],
+        counts["failed"],
+    )
+    return counts
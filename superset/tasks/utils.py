@@ -29,6 +29,11 @@ if TYPE_CHECKING:
     from superset.models.slice import Slice
     from superset.reports.models import ReportSchedule
 
+# the actions logged when a dashboard or a chart is viewed, unlike the ones of the
+# requests made while viewing them, e.g. for the data of each chart of a dashboard
+DASHBOARD_VIEW_ACTIONS = ["dashboard"]
+CHART_VIEW_ACTIONS = ["explore", "ExploreRestApi.get"]
+
 
 # pylint: disable=too-many-branches
 def get_executor(
@@ -22,11 +22,14 @@ from typing import TYPE_CHECKING
 
 from flask import current_app
 
+from superset import security_manager
 from superset.tasks.types import ExecutorType
 from superset.tasks.utils import get_current_user, get_executor
+from superset.utils.core import override_user
 from superset.utils.hashing import md5_sha_from_str
 
 if TYPE_CHECKING:
+    from superset.connectors.base.models import BaseDatasource
     from superset.models.dashboard import Dashboard
     from superset.models.slice import Slice
 
@@ -49,6 +52,67 @@ def _adjust_string_for_executor(
     return unique_string
 
 
+def _get_chart_cache_keys(chart: Slice) -> str:
+    """
+    The cache keys of the data queries of the chart, or an empty string if they can't
+    be computed, e.g. for charts saved before the query context was stored.
+    """
+    try:
+        if not (query_context := chart.get_query_context()):
+            return ""
+        return ",".join(
+            query_context.query_cache_key(query_obj) or ""
+            for query_obj in query_context.queries
+        )
+    except Exception:  # pylint: disable=broad-except
+        logger.warning(
+            "Failed at computing the cache keys of chart %s", chart.id, exc_info=True
+        )
+        return ""
+
+
+def _adjust_string_for_data(
+    unique_string: str,
+    charts: list[Slice],
+    executor: str,
+) -> str:
+    """
+    Add the parts of `THUMBNAIL_DIGEST_DATA_PARTS` standing for the data the charts
+    show to the unique string, for the thumbnail to be refreshed when it changes.
+
+    The cache keys depend on the user, e.g. per row level security, so they're the
+    ones of the executor rendering the thumbnail, whoever requests the digest.
+    """
+    config = current_app.config
+    if not (data_parts := config["THUMBNAIL_DIGEST_DATA_PARTS"]):
+        return unique_string
+
+    datasources: dict[str, BaseDatasource] = {}
+    for chart in charts:
+        if datasource := chart.datasource:
+            datasources.setdefault(datasource.uid, datasource)
+
+    parts = []
+    for part in data_parts:
+        if part == "changed_on":
+            parts.extend(
+                f"{uid}:{datasource.changed_on}"
+                for uid, datasource in sorted(datasources.items())
+            )
+        elif part == "freshness" and (func := config["THUMBNAIL_DATA_FRESHNESS_FUNC"]):
+            parts.extend(
+                f"{uid}:{func(datasource)}"
+                for uid, datasource in sorted(datasources.items())
+            )
+        elif part == "cache_key":
+            with override_user(security_manager.find_user(executor)):
+                parts.extend(
+                    _get_chart_cache_keys(chart)
+                    for chart in sorted(charts, key=lambda chart: chart.id or 0)
+                )
+    return "\n".join([unique_string, *parts])
+
+
 def get_dashboard_digest(dashboard: Dashboard) -> str:
     config = current_app.config
     executor_type, executor = get_executor(
@@ -64,6 +128,7 @@ def get_dashboard_digest(dashboard: Dashboard) -> str:
         f"{dashboard.css}\n{dashboard.json_metadata}"
     )
 
+    unique_string = _adjust_string_for_data(unique_string, dashboard.slices, executor)
     unique_string = _adjust_string_for_executor(unique_string, executor_type, executor)
     return md5_sha_from_str(unique_string)
 
@@ -79,5 +144,6 @@ def get_chart_digest(chart: Slice) -> str:
         return func(chart, executor_type, executor)
 
     unique_string = f"{chart.params or ''}.{executor}"
+    unique_string = _adjust_string_for_data(unique_string, [chart], executor)
     unique_string = _adjust_string_for_executor(unique_string, executor_type, executor)
     return md5_sha_from_str(unique_string)
@@ -0,0 +1,305 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Admission control of the chart queries of each database.
+
+The number of chart queries running at once against a database can be capped with
+the ``concurrency_limit`` of its extra, e.g.
+
+    "concurrency_limit": {
+        "max_queries": 50,
+        "max_background_queries": 10,
+        "queue_timeout": 60
+    }
+
+Each running query holds one of the ``max_queries`` slots of the database, kept as
+keys of the cache of `CACHE_CONFIG` for the limit to hold across the web servers and
+the workers. The slots expire after `DATABASE_QUERY_SLOT_TIMEOUT` seconds in case the
+process holding them dies. Warm-up and report queries only get the first
+``max_background_queries`` slots, the others being kept for interactive queries.
+
+In each process, the queries waiting for a slot queue up: interactive queries go
+before background ones, then the queries of the users and dashboards with the fewest
+queries running, then the oldest. Only the first query of the queue looks for a free
+slot, and it fails after waiting ``queue_timeout`` seconds.
+"""
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+from flask import current_app, g, has_app_context, has_request_context, request
+from flask_babel import gettext as __
+
+from superset.errors import ErrorLevel, SupersetErrorType
+from superset.exceptions import SupersetTimeoutException
+from superset.extensions import cache_manager
+from superset.utils.core import get_user_id
+from superset.utils.tracing import span
+
+if TYPE_CHECKING:
+    from superset.models.core import Database
+
+logger = logging.getLogger(__name__)
+
+QUERY_PRIORITY_ATTRIBUTE = "query_priority"
+QUERY_PRIORITY_HEADER = "X-Superset-Query-Priority"
+
+
+class QueryPriority(IntEnum):
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+@contextmanager
+def query_priority(priority: QueryPriority) -> Iterator[None]:
+    """Run the enclosed chart queries with the given priority, e.g. to warm up caches"""
+    previous = g.get(QUERY_PRIORITY_ATTRIBUTE)
+    setattr(g, QUERY_PRIORITY_ATTRIBUTE, priority)
+    try:
+        yield
+    finally:
+        setattr(g, QUERY_PRIORITY_ATTRIBUTE, previous)
+
+
+def get_query_priority() -> QueryPriority:
+    """
+    The priority of the chart queries of the context, background when set so with
+    `query_priority` or by the `X-Superset-Query-Priority` header of the request.
+    """
+    if has_app_context() and (priority := g.get(QUERY_PRIORITY_ATTRIBUTE)) is not None:
+        return priority
+    if (
+        has_request_context()
+        and request.headers.get(QUERY_PRIORITY_HEADER, "").lower() == "background"
+    ):
+        return QueryPriority.BACKGROUND
+    return QueryPriority.INTERACTIVE
+
+
+def get_dashboard_id() -> int | None:
+    """The dashboard the chart data of the request is for, if any"""
+    if not has_request_context():
+        return None
+    payload = request.get_json(silent=True)
+    form_data = payload.get("form_data") if isinstance(payload, dict) else None
+    try:
+        return int((form_data or {}).get("dashboardId"))  # type: ignore
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class ConcurrencyLimit:
+    max_queries: int
+    max_background_queries: int
+    queue_timeout: float
+
+    @classmethod
+    def from_database(cls, database: Database) -> ConcurrencyLimit | None:
+        config = database.get_extra().get("concurrency_limit")
+        # the limit is validated when saving the database, see ConcurrencyLimitSchema
+        if not isinstance(config, dict) or not (
+            max_queries := config.get("max_queries")
+        ):
+            return None
+        return cls(
+            max_queries=max_queries,
+            max_background_queries=min(
+                config.get("max_background_queries") or max_queries, max_queries
+            ),
+            queue_timeout=config.get("queue_timeout", 60),
+        )
+
+    def max_queries_for(self, priority: QueryPriority) -> int:
+        if priority == QueryPriority.BACKGROUND:
+            return self.max_background_queries
+        return self.max_queries
+
+
+@dataclass
+class _Waiter:
+    priority: QueryPriority
+    group: tuple[int | None, int | None]
+    seq: int
+
+
+class DatabaseAdmission:
+    """The admission queue of the chart queries of a database, in this process"""
+
+    def __init__(self, database_id: int) -> None:
+        self.database_id = database_id
+        self.condition = threading.Condition()
+        self.waiters: list[_Waiter] = []
+        self.running: Counter[tuple[int | None, int | None]] = Counter()
+        self.running_by_priority: Counter[QueryPriority] = Counter()
+        self.seq = itertools.count()
+
+    def slot_key(self, index: int) -> str:
+        return f"database_query_slot_{self.database_id}_{index}"
+
+    def rank(self, waiter: _Waiter) -> tuple[int, int, int]:
+        return waiter.priority, self.running[waiter.group], waiter.seq
+
+    def _running(self, priority: QueryPriority) -> int:
+        if priority == QueryPriority.BACKGROUND:
+            return self.running_by_priority[priority]
+        return sum(self.running_by_priority.values())
+
+    def _acquire(self, limit: ConcurrencyLimit, priority: QueryPriority) -> str | None:
+        """
+        Take a free slot among the ones available to the priority, if any, the last
+        ones first for interactive queries to leave the others to background ones.
+        """
+        max_queries = limit.max_queries_for(priority)
+        if self._running(priority) >= max_queries:
+            return None
+
+        cache = cache_manager.cache
+        keys = [self.slot_key(index) for index in range(max_queries)]
+        if priority == QueryPriority.INTERACTIVE:
+            keys.reverse()
+        token = uuid.uuid4().hex
+        timeout = current_app.config["DATABASE_QUERY_SLOT_TIMEOUT"]
+        # the null cache doesn't hold any slot, only the limit of the process applies
+        for key, holder in zip(keys, cache.get_many(*keys)):  # type: ignore
+            if holder is None and cache.add(key, token, timeout=timeout):
+                return f"{key}:{token}"
+        return None
+
+    @staticmethod
+    def _release(slot: str) -> None:
+        key, token = slot.rsplit(":", 1)
+        cache = cache_manager.cache
+        # the slot may have expired and been taken by another query since
+        if cache.get(key) == token:
+            cache.delete(key)
+
+    def _gauge(self) -> None:
+        stats_logger = current_app.config["STATS_LOGGER"]
+        stats_logger.gauge(
+            f"database.{self.database_id}.query_queue_depth", len(self.waiters)
+        )
+
+    def _wait(self, limit: ConcurrencyLimit, waiter: _Waiter) -> str:
+        poll_interval = current_app.config["DATABASE_QUERY_QUEUE_POLL_INTERVAL"]
+        deadline = time.monotonic() + limit.queue_timeout
+        while True:
+            if min(self.waiters, key=self.rank) is waiter and (
+                slot := self._acquire(limit, waiter.priority)
+            ):
+                return slot
+            if (remaining := deadline - time.monotonic()) <= 0:
+                current_app.config["STATS_LOGGER"].incr(
+                    f"database.{self.database_id}.query_queue_timeout"
+                )
+                raise SupersetTimeoutException(
+                    error_type=SupersetErrorType.BACKEND_TIMEOUT_ERROR,
+                    message=__(
+                        "The database is running too many queries, and this one "
+                        "could not start within %(timeout)s seconds. Please try "
+                        "again later.",
+                        timeout=limit.queue_timeout,
+                    ),
+                    level=ErrorLevel.ERROR,
+                    extra={
+                        "database_id": self.database_id,
+                        "queue_depth": len(self.waiters),
+                    },
+                )
+            self.condition.wait(min(remaining, poll_interval))
+
+    @contextmanager
+    def admit(
+        self,
+        limit: ConcurrencyLimit,
+        priority: QueryPriority,
+        group: tuple[int | None, int | None],
+    ) -> Iterator[None]:
+        """Wait for a slot of the database and hold it while running the query"""
+        waiter = _Waiter(priority, group, next(self.seq))
+        start = time.monotonic()
+        with span("db.admission", database_id=self.database_id), self.condition:
+            self.waiters.append(waiter)
+            self._gauge()
+            try:
+                slot = self._wait(limit, waiter)
+            finally:
+                self.waiters.remove(waiter)
+                self._gauge()
+                self.condition.notify_all()
+            self.running[group] += 1
+            self.running_by_priority[priority] += 1
+
+        current_app.config["STATS_LOGGER"].timing(
+            f"database.{self.database_id}.query_queue_wait",
+            (time.monotonic() - start) * 1000,
+        )
+        try:
+            yield
+        finally:
+            try:
+                self._release(slot)
+            except Exception:  # pylint: disable=broad-except
+                logger.warning("Failed at releasing %s", slot, exc_info=True)
+            with self.condition:
+                self.running[group] -= 1
+                if not self.running[group]:
+                    del self.running[group]
+                self.running_by_priority[priority] -= 1
+                self.condition.notify_all()
+
+
+_admissions: dict[int, DatabaseAdmission] = {}
+_admissions_lock = threading.Lock()
+
+
+def get_admission(database_id: int) -> DatabaseAdmission:
+    with _admissions_lock:
+        if database_id not in _admissions:
+            _admissions[database_id] = DatabaseAdmission(database_id)
+        return _admissions[database_id]
+
+
+@contextmanager
+def admit_query(database: Database) -> Iterator[None]:
+    """
+    Wait for the turn of the chart query to run against the database, if it has a
+    concurrency limit, e.g.
+
+        with admit_query(database):
+            df = database.get_df(sql, schema)
+
+    :raises SupersetTimeoutException: If the query waited for too long
+    """
+    if not (limit := ConcurrencyLimit.from_database(database)):
+        yield
+        return
+
+    priority = get_query_priority()
+    group = (get_user_id(), get_dashboard_id())
+    with get_admission(database.id).admit(limit, priority, group):
+        yield
@@ -31,7 +31,7 @@ from superset import db
 from superset.extensions import cache_manager
 from superset.models.cache import CacheKey
 from superset.utils.core import json_int_dttm_ser
-from superset.utils.hashing import md5_sha_from_dict
+from superset.utils.hashing import hash_from_dict
 
 if TYPE_CHECKING:
     from superset.stats_logger import BaseStatsLogger
@@ -41,8 +41,14 @@ stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
 logger = logging.getLogger(__name__)
 
 
-def generate_cache_key(values_dict: dict[str, Any], key_prefix: str = "") -> str:
-    hash_str = md5_sha_from_dict(values_dict, default=json_int_dttm_ser)
+def generate_cache_key(
+    values_dict: dict[str, Any], key_prefix: str = "", version: int | None = None
+) -> str:
+    hash_str = hash_from_dict(
+        values_dict,
+        version=version or config["CACHE_KEY_VERSION"],
+        default=json_int_dttm_ser,
+    )
     return f"{key_prefix}{hash_str}"
 
 
@@ -46,7 +46,7 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import formatdate
 from enum import Enum, IntEnum
-from io import BytesIO
+from io import BytesIO, RawIOBase
 from timeit import default_timer
 from types import TracebackType
 from typing import Any, Callable, cast, NamedTuple, TYPE_CHECKING, TypeVar
@@ -1917,6 +1917,41 @@ def create_zip(files: dict[str, Any]) -> BytesIO:
     return buf
 
 
+class _ZipStream(RawIOBase):
+    """An unseekable stream for a ZIP file to be written to and read from as it goes"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._buffer.extend(data)
+        return len(data)
+
+    def take(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+def stream_zip(files: Iterable[tuple[str, bytes]]) -> Iterator[bytes]:
+    """
+    Stream a ZIP file with the given files, one chunk per file, so that only one of
+    them is held in memory at a time.
+    """
+    stream = _ZipStream()
+    with ZipFile(stream, "w") as bundle:  # type: ignore
+        for filename, contents in files:
+            with bundle.open(filename, "w") as fp:
+                fp.write(contents)
+            yield stream.take()
+    # the central directory
+    yield stream.take()
+
+
 def remove_extra_adhoc_filters(form_data: dict[str, Any]) -> None:
     """
     Remove filters from slice data that originate from a filter box or native filter
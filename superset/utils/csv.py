@@ -24,6 +24,7 @@ import numpy as np
 import pandas as pd
 import simplejson
 
+from superset.utils.admission import QUERY_PRIORITY_HEADER
 from superset.utils.core import GenericDataType
 
 logger = logging.getLogger(__name__)
@@ -88,6 +89,7 @@ def get_chart_csv_data(
         opener = urllib.request.build_opener()
         cookie_str = ";".join([f"{key}={val}" for key, val in auth_cookies.items()])
         opener.addheaders.append(("Cookie", cookie_str))
+        opener.addheaders.append((QUERY_PRIORITY_HEADER, "background"))
         response = opener.open(chart_url)
         content = response.read()
         if response.getcode() != 200:
@@ -17,10 +17,11 @@
 import calendar
 import logging
 import re
+import threading
 from datetime import datetime, timedelta
 from functools import lru_cache
 from time import struct_time
-from typing import Optional
+from typing import Any, Optional
 
 import pandas as pd
 import parsedatetime
@@ -53,8 +54,52 @@ ParserElement.enablePackrat()
 logger = logging.getLogger(__name__)
 
 
+# ISO 8601 dates and datetimes without a timezone, which are parsed without going
+# through dateutil
+ISO_DATETIME_REGEX = re.compile(
+    r"^\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?)?$"
+)
+
+_local = threading.local()
+
+
+def get_calendar() -> parsedatetime.Calendar:
+    """
+    Returns the parsedatetime calendar of the current thread. Calendars are costly to
+    build, but they can't be shared between threads.
+    """
+    if not hasattr(_local, "calendar"):
+        _local.calendar = parsedatetime.Calendar()
+    return _local.calendar
+
+
+def _parse_common_datetime(human_readable: str) -> Optional[datetime]:
+    """
+    Fast lane for the most common forms of human readable datetimes, which returns
+    the same datetime as the generic parsing, or None if the form isn't common.
+    """
+    value = human_readable.strip().lower()
+    if value == "now":
+        return datetime.now().replace(microsecond=0)
+    if value in ("today", "yesterday", "tomorrow"):
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        if value == "yesterday":
+            return today - timedelta(days=1)
+        if value == "tomorrow":
+            return today + timedelta(days=1)
+        return today
+    if ISO_DATETIME_REGEX.match(human_readable):
+        try:
+            return datetime.fromisoformat(human_readable)
+        except ValueError:
+            return None
+    return None
+
+
 def parse_human_datetime(human_readable: str) -> datetime:
     """Returns ``datetime.datetime`` from human readable strings"""
+    if dttm := _parse_common_datetime(human_readable):
+        return dttm
     x_periods = r"^\s*([0-9]+)\s+(second|minute|hour|day|week|month|quarter|year)s?\s*$"
     if re.search(x_periods, human_readable, re.IGNORECASE):
         raise TimeRangeAmbiguousError(human_readable)
@@ -62,8 +107,7 @@ def parse_human_datetime(human_readable: str) -> datetime:
         default = datetime(year=datetime.now().year, month=1, day=1)
         dttm = parse(human_readable, default=default)
     except (ValueError, OverflowError) as ex:
-        cal = parsedatetime.Calendar()
-        parsed_dttm, parsed_flags = cal.parseDT(human_readable)
+        parsed_dttm, parsed_flags = get_calendar().parseDT(human_readable)
         # 0 == not parsed at all
         if parsed_flags == 0:
             logger.debug(ex)
@@ -102,11 +146,12 @@ def get_past_or_future(
     human_readable: Optional[str],
     source_time: Optional[datetime] = None,
 ) -> datetime:
-    cal = parsedatetime.Calendar()
     source_dttm = dttm_from_timetuple(
         source_time.timetuple() if source_time else datetime.now().timetuple()
     )
-    return dttm_from_timetuple(cal.parse(human_readable or "", source_dttm)[0])
+    return dttm_from_timetuple(
+        get_calendar().parse(human_readable or "", source_dttm)[0]
+    )
 
 
 def parse_human_timedelta(
@@ -479,10 +524,20 @@ def datetime_parser() -> ParseResults:  # pylint: disable=too-many-locals
     return date_expr
 
 
+@lru_cache(maxsize=LRU_CACHE_MAX_SIZE)
+def parse_datetime_expression(datetime_expression: str) -> Any:
+    """
+    Parses a datetime expression into a tree of functions. The tree doesn't depend on
+    the current time, which is only read when it is evaluated, so the same expressions
+    used by every chart with a relative time range are only parsed once.
+    """
+    return datetime_parser().parseString(datetime_expression)[0]
+
+
 def datetime_eval(datetime_expression: Optional[str] = None) -> Optional[datetime]:
     if datetime_expression:
         try:
-            return datetime_parser().parseString(datetime_expression)[0].eval()
+            return parse_datetime_expression(datetime_expression).eval()
         except ParseException as ex:
             raise ValueError(ex) from ex
     return None
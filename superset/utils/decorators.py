@@ -25,6 +25,7 @@ from flask import current_app, Response
 
 from superset.utils import core as utils
 from superset.utils.dates import now_as_float
+from superset.utils.tracing import span
 
 if TYPE_CHECKING:
     from superset.stats_logger import BaseStatsLogger
@@ -66,7 +67,8 @@ def stats_timing(stats_key: str, stats_logger: BaseStatsLogger) -> Iterator[floa
     """Provide a transactional scope around a series of operations."""
     start_ts = now_as_float()
     try:
-        yield start_ts
+        with span(stats_key):
+            yield start_ts
     except Exception as ex:
         raise ex
     finally:
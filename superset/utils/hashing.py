@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import hashlib
+import json as stdlib_json
 from typing import Any, Callable, Optional
 
 import simplejson as json
@@ -32,3 +33,38 @@ def md5_sha_from_dict(
     json_data = json.dumps(obj, sort_keys=True, ignore_nan=ignore_nan, default=default)
 
     return md5_sha_from_str(json_data)
+
+
+def sha1_from_dict(
+    obj: dict[Any, Any],
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """
+    Returns the SHA-1 of the canonical encoding of a dictionary, its compact JSON
+    encoding with sorted keys. The C encoder of the standard library produces it
+    several times faster than simplejson, and SHA-1 is hardware accelerated on most
+    CPUs, which matters for the large dictionaries of some queries.
+    """
+    json_data = stdlib_json.dumps(
+        obj,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=default,
+    )
+    return hashlib.sha1(json_data.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def hash_from_dict(
+    obj: dict[Any, Any],
+    version: int = 1,
+    ignore_nan: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """
+    Returns the hash of a dictionary for the given version of cache keys, see
+    `CACHE_KEY_VERSION`.
+    """
+    if version == 1:
+        return md5_sha_from_dict(obj, ignore_nan=ignore_nan, default=default)
+    return sha1_from_dict(obj, default=default)
@@ -15,9 +15,19 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from typing import Any, Callable
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from types import CodeType, FrameType
+from typing import Any, Callable, Optional
 from unittest import mock
 
+from flask import Flask, request as flask_request
+from flask_caching.backends.base import BaseCache
 from werkzeug.wrappers import Request, Response
 
 try:
@@ -25,6 +35,12 @@ try:
 except ModuleNotFoundError:
     Profiler = None
 
+logger = logging.getLogger(__name__)
+
+SAMPLING_PROFILE_KEY_PREFIX = "sampling_profile_"
+SAMPLING_PROFILE_INDEX_KEY = "sampling_profile_index"
+SAMPLING_PROFILE_SEQUENCE_KEY = "sampling_profile_sequence"
+
 
 class SupersetProfiler:  # pylint: disable=too-few-public-methods
     """
@@ -59,3 +75,220 @@ class SupersetProfiler:  # pylint: disable=too-few-public-methods
 
         # return HTML profiling information
         return Response(profiler.output_html(), mimetype="text/html")
+
+
+class SamplingProfiler:  # pylint: disable=too-many-instance-attributes
+    """
+    Background sampling profiler of the web server and Celery workers.
+
+    A daemon thread samples the stacks of the threads serving a request or running a
+    task, and aggregates them per endpoint or task name as collapsed stacks, the
+    format of flame graph tools. Every `flush_interval` seconds the aggregates are
+    written to the results backend as a profile, listed in an index of the latest
+    `max_windows` profiles of all the processes.
+
+    The sampling thread sleeps at least `interval` seconds between two samples, and
+    longer if needed so that sampling uses at most `cpu_budget` of a CPU.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(
+        self,
+        interval: float = 0.01,
+        cpu_budget: float = 0.01,
+        flush_interval: int = 60,
+        max_depth: int = 128,
+        retention: int = 7 * 24 * 60 * 60,
+        max_windows: int = 500,
+    ) -> None:
+        self.interval = interval
+        self.cpu_budget = cpu_budget
+        self.flush_interval = flush_interval
+        self.max_depth = max_depth
+        self.retention = retention
+        self.max_windows = max_windows
+        self.results_backend: Optional[BaseCache] = None
+
+        # the endpoint or task of each thread being sampled
+        self.labels: dict[int, str] = {}
+        self.stacks: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        self.window_start = time.time()
+        self.samples = 0
+        self.sampling_time = 0.0
+        self._frame_names: dict[CodeType, str] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def init_app(self, app: Flask) -> None:
+        for key, value in app.config["SAMPLING_PROFILER_CONFIG"].items():
+            setattr(self, key, value)
+        self.results_backend = app.config["RESULTS_BACKEND"]
+
+        @app.before_request
+        def label_request() -> None:
+            self.label(f"{flask_request.method} {flask_request.url_rule or '-'}")
+
+        @app.teardown_request
+        def unlabel_request(_: Optional[BaseException] = None) -> None:
+            self.unlabel()
+
+        # pylint: disable=import-outside-toplevel
+        from celery.signals import task_postrun, task_prerun
+
+        task_prerun.connect(
+            lambda task, **kwargs: self.label(f"task {task.name}"), weak=False
+        )
+        task_postrun.connect(lambda **kwargs: self.unlabel(), weak=False)
+
+        # the thread doesn't survive forking, e.g. into gunicorn or Celery workers
+        os.register_at_fork(after_in_child=self._after_fork)
+        self.start()
+
+    def label(self, name: str) -> None:
+        self.labels[threading.get_ident()] = name
+
+    def unlabel(self) -> None:
+        self.labels.pop(threading.get_ident(), None)
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="sampling-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self.flush()
+
+    def _after_fork(self) -> None:
+        self._lock = threading.Lock()
+        self.labels = {}
+        self.stacks = defaultdict(Counter)
+        self.window_start = time.time()
+        self.samples = 0
+        self.sampling_time = 0.0
+        self.start()
+
+    def _run(self) -> None:
+        next_flush = time.monotonic() + self.flush_interval
+        delay = self.interval
+        while not self._stop.wait(delay):
+            start = time.thread_time()
+            self.sample()
+            cost = time.thread_time() - start
+            with self._lock:
+                self.sampling_time += cost
+            delay = max(self.interval, cost / self.cpu_budget)
+
+            if time.monotonic() >= next_flush:
+                next_flush = time.monotonic() + self.flush_interval
+                try:
+                    self.flush()
+                except Exception:  # pylint: disable=broad-except
+                    logger.exception("Error flushing the sampling profile")
+
+    def _frame_name(self, code: CodeType) -> str:
+        if (name := self._frame_names.get(code)) is None:
+            name = self._frame_names[
+                code
+            ] = f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+        return name
+
+    def sample(self) -> None:
+        """Add the stacks of the labelled threads to the aggregates."""
+        frames = sys._current_frames()  # pylint: disable=protected-access
+        stacks = []
+        for ident, label in list(self.labels.items()):
+            frame: Optional[FrameType] = frames.get(ident)
+            stack: list[str] = []
+            while frame is not None and len(stack) < self.max_depth:
+                stack.append(self._frame_name(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                stacks.append((label, ";".join(reversed(stack))))
+        del frames
+
+        with self._lock:
+            for label, stack_ in stacks:
+                self.stacks[label][stack_] += 1
+            self.samples += 1
+
+    def flush(self) -> None:
+        """Write the aggregates of the current window to the results backend."""
+        with self._lock:
+            stacks, self.stacks = self.stacks, defaultdict(Counter)
+            start, self.window_start = self.window_start, time.time()
+            samples, self.samples = self.samples, 0
+            sampling_time, self.sampling_time = self.sampling_time, 0.0
+
+        if not stacks or not self.results_backend:
+            return
+
+        end = self.window_start
+        key = (
+            f"{SAMPLING_PROFILE_KEY_PREFIX}{socket.gethostname()}_{os.getpid()}_{start}"
+        )
+        summary = {
+            "key": key,
+            "host": socket.gethostname(),
+            "pid": os.getpid(),
+            "start": start,
+            "end": end,
+            "samples": samples,
+            "cpu_usage": sampling_time / (end - start) if end > start else 0.0,
+            "labels": {label: sum(counts.values()) for label, counts in stacks.items()},
+        }
+        self.results_backend.set(
+            key,
+            {
+                **summary,
+                "stacks": {label: dict(counts) for label, counts in stacks.items()},
+            },
+            timeout=self.retention,
+        )
+        # the index is a ring of entries written by a single process each, at the
+        # position given by a sequence the backends increment atomically
+        sequence = self.results_backend.inc(SAMPLING_PROFILE_SEQUENCE_KEY) or 0
+        self.results_backend.set(
+            f"{SAMPLING_PROFILE_INDEX_KEY}_{sequence % self.max_windows}",
+            summary,
+            timeout=self.retention,
+        )
+
+
+def get_sampling_profiles(
+    results_backend: BaseCache, max_windows: int
+) -> list[dict[str, Any]]:
+    """Return the summaries of the profiles in the results backend, oldest first."""
+    summaries = results_backend.get_many(
+        *(f"{SAMPLING_PROFILE_INDEX_KEY}_{index}" for index in range(max_windows))
+    )
+    return sorted(filter(None, summaries), key=lambda summary: summary["end"])
+
+
+def get_collapsed_stacks(
+    results_backend: BaseCache, keys: list[str], label: Optional[str] = None
+) -> Optional[str]:
+    """
+    Return the collapsed stacks of the given profiles merged, of a single endpoint or
+    task if `label` is given, or None if none of them exists.
+    """
+    merged: Counter[str] = Counter()
+    found = False
+    for key in keys:
+        if not key.startswith(SAMPLING_PROFILE_KEY_PREFIX):
+            continue
+        # the entries of the index aren't profiles
+        if not (profile := results_backend.get(key)) or "stacks" not in profile:
+            continue
+        found = True
+        for label_, counts in profile["stacks"].items():
+            if label is None or label_ == label:
+                merged.update(counts)
+    if not found:
+        return None
+    return "".join(f"{stack} {count}\n" for stack, count in merged.most_common())
@@ -0,0 +1,96 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Memoization of the queries built while processing a single chart data request.
+
+Computing the cache key of a query object and running it both need the SQLA query
+of the datasource, and the RLS filters of the datasource are needed in several places
+along the way. Within a `query_memo` context these are only built once.
+"""
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+from typing import Any, Callable, TypeVar
+
+from flask import current_app, g, has_app_context
+
+from superset.utils.dates import now_as_float
+from superset.utils.hashing import md5_sha_from_dict
+
+T = TypeVar("T")
+
+MEMO_ATTRIBUTE = "query_memo"
+
+
+class QueryMemo:  # pylint: disable=too-few-public-methods
+    def __init__(self) -> None:
+        self.values: dict[Hashable, Any] = {}
+        self.build_time = 0.0
+        self.depth = 0
+
+
+@contextmanager
+def query_memo(stats_key: str = "query_memo.build_time") -> Iterator[None]:
+    """
+    Memoize the queries built inside the context.
+
+    Contexts can be nested, in which case the outermost one owns the memo. When it
+    exits, the total time spent building queries is sent to the stats logger.
+    """
+    if not has_app_context() or g.get(MEMO_ATTRIBUTE) is not None:
+        yield
+        return
+
+    memo = QueryMemo()
+    setattr(g, MEMO_ATTRIBUTE, memo)
+    try:
+        yield
+    finally:
+        g.pop(MEMO_ATTRIBUTE, None)
+        if memo.values:
+            current_app.config["STATS_LOGGER"].timing(stats_key, memo.build_time)
+
+
+def memoized(key: Hashable, func: Callable[[], T]) -> T:
+    """
+    Return the memoized value of `key`, calling `func` to build it if needed. Outside
+    of a `query_memo` context `func` is always called.
+    """
+    memo: QueryMemo | None = g.get(MEMO_ATTRIBUTE) if has_app_context() else None
+    if memo is None:
+        return func()
+
+    if key not in memo.values:
+        # values can be built from other memoized values, only the outermost build
+        # is timed so that the time isn't counted twice
+        start_ts = now_as_float()
+        memo.depth += 1
+        try:
+            memo.values[key] = func()
+        finally:
+            memo.depth -= 1
+            if not memo.depth:
+                memo.build_time += now_as_float() - start_ts
+    return memo.values[key]
+
+
+def query_obj_key(query_obj: dict[str, Any]) -> str:
+    """
+    Return a key identifying a query object dictionary in the memo.
+    """
+    return md5_sha_from_dict(query_obj, default=str)
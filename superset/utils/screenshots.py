@@ -17,10 +17,12 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from typing import TYPE_CHECKING
 
 from flask import current_app
+from werkzeug.datastructures import MIMEAccept
 
 from superset.utils.hashing import md5_sha_from_dict
 from superset.utils.urls import modify_url_query
@@ -38,6 +40,7 @@ DEFAULT_SCREENSHOT_THUMBNAIL_SIZE = 400, 300
 DEFAULT_CHART_WINDOW_SIZE = DEFAULT_CHART_THUMBNAIL_SIZE = 800, 600
 DEFAULT_DASHBOARD_WINDOW_SIZE = 1600, 1200
 DEFAULT_DASHBOARD_THUMBNAIL_SIZE = 800, 600
+DEFAULT_IMAGE_FORMAT = "png"
 
 try:
     from PIL import Image
@@ -49,6 +52,19 @@ if TYPE_CHECKING:
     from flask_caching import Cache
 
 
+def get_image_formats(accept: MIMEAccept) -> list[str]:
+    """
+    The formats of the thumbnails to serve, in order of preference: the ones of
+    `THUMBNAIL_IMAGE_FORMATS` that the client explicitly accepts, then PNG.
+    """
+    accepted = set(accept.values())
+    return [
+        image_format
+        for image_format in current_app.config["THUMBNAIL_IMAGE_FORMATS"]
+        if f"image/{image_format}" in accepted
+    ] + [DEFAULT_IMAGE_FORMAT]
+
+
 class BaseScreenshot:
     driver_type = current_app.config["WEBDRIVER_TYPE"]
     thumbnail_type: str = ""
@@ -69,6 +85,7 @@ class BaseScreenshot:
         self,
         window_size: bool | WindowSize | None = None,
         thumb_size: bool | WindowSize | None = None,
+        image_format: str = DEFAULT_IMAGE_FORMAT,
     ) -> str:
         window_size = window_size or self.window_size
         thumb_size = thumb_size or self.thumb_size
@@ -79,7 +96,22 @@ class BaseScreenshot:
             "window_size": window_size,
             "thumb_size": thumb_size,
         }
-        return md5_sha_from_dict(args)
+        return self.format_cache_key(md5_sha_from_dict(args), image_format)
+
+    @staticmethod
+    def format_cache_key(cache_key: str, image_format: str) -> str:
+        """The cache key of a thumbnail in another format than PNG"""
+        if image_format == DEFAULT_IMAGE_FORMAT:
+            return cache_key
+        return f"{cache_key}.{image_format}"
+
+    def thumb_sizes(self, thumb_size: WindowSize) -> list[WindowSize]:
+        """The sizes of the thumbnails generated along with the requested one"""
+        sizes = [tuple(thumb_size)]
+        for size in current_app.config["THUMBNAIL_SIZES"].get(self.thumbnail_type, []):
+            if tuple(size) not in sizes:
+                sizes.append(tuple(size))
+        return sizes  # type: ignore
 
     def get_screenshot(
         self, user: User, window_size: WindowSize | None = None
@@ -120,10 +152,20 @@ class BaseScreenshot:
         cache: Cache,
         window_size: WindowSize | None = None,
         thumb_size: WindowSize | None = None,
+        image_format: str = DEFAULT_IMAGE_FORMAT,
     ) -> BytesIO | None:
-        cache_key = self.cache_key(window_size, thumb_size)
+        cache_key = self.cache_key(window_size, thumb_size, image_format)
         return self.get_from_cache_key(cache, cache_key)
 
+    def get_from_cache_in_formats(
+        self, cache: Cache, image_formats: list[str]
+    ) -> tuple[BytesIO, str] | None:
+        """Get the thumbnail in the first of the formats it's cached in, if any"""
+        for image_format in image_formats:
+            if image := self.get_from_cache(cache, image_format=image_format):
+                return image, image_format
+        return None
+
     @staticmethod
     def get_from_cache_key(cache: Cache, cache_key: str) -> BytesIO | None:
         logger.info("Attempting to get from cache: %s", cache_key)
@@ -141,7 +183,11 @@ class BaseScreenshot:
         force: bool = True,
     ) -> bytes | None:
         """
-        Fetches the screenshot, computes the thumbnail and caches the result
+        Fetches the screenshot, computes the thumbnails and caches the results
+
+        The thumbnails of the sizes of `THUMBNAIL_SIZES` are computed out of the same
+        screenshot as the requested one, and encoded in the formats of
+        `THUMBNAIL_IMAGE_FORMATS` as well as in PNG.
 
         :param user: If no user is given will use the current context
         :param cache: The cache to keep the thumbnail payload
@@ -166,18 +212,71 @@ class BaseScreenshot:
         except Exception as ex:  # pylint: disable=broad-except
             logger.warning("Failed at generating thumbnail %s", ex, exc_info=True)
 
-        if payload and window_size != thumb_size:
+        if not payload:
+            return None
+
+        thumbnails = self.compute_thumbnails(
+            payload, window_size, self.thumb_sizes(thumb_size)
+        )
+        if payload := thumbnails.get(cache_key):
+            logger.info("Caching thumbnails: %s", ", ".join(thumbnails))
+            cache.set_many(thumbnails)  # type: ignore
+            logger.info("Done caching thumbnails")
+        return payload
+
+    def compute_thumbnails(
+        self,
+        screenshot: bytes,
+        window_size: WindowSize,
+        thumb_sizes: list[WindowSize],
+    ) -> dict[str, bytes]:
+        """
+        Resize and encode the screenshot in all the sizes and formats, in a pool of
+        `THUMBNAIL_IMAGE_THREADS` threads, returning the thumbnails by cache key.
+        """
+        image_formats = [DEFAULT_IMAGE_FORMAT] + [
+            image_format
+            for image_format in current_app.config["THUMBNAIL_IMAGE_FORMATS"]
+            if self.can_encode(image_format)
+        ]
+        tasks = [
+            (thumb_size, image_format)
+            for thumb_size in thumb_sizes
+            for image_format in image_formats
+        ]
+
+        def compute(thumb_size: WindowSize, image_format: str) -> bytes | None:
+            if (
+                tuple(thumb_size) == tuple(window_size)
+                and image_format == DEFAULT_IMAGE_FORMAT
+            ):
+                return screenshot
             try:
-                payload = self.resize_image(payload, thumb_size=thumb_size)
+                return self.resize_image(
+                    screenshot, output=image_format, thumb_size=thumb_size
+                )
             except Exception as ex:  # pylint: disable=broad-except
                 logger.warning("Failed at resizing thumbnail %s", ex, exc_info=True)
-                payload = None
+                return None
 
-        if payload:
-            logger.info("Caching thumbnail: %s", cache_key)
-            cache.set(cache_key, payload)
-            logger.info("Done caching thumbnail")
-        return payload
+        with ThreadPoolExecutor(
+            max_workers=current_app.config["THUMBNAIL_IMAGE_THREADS"]
+        ) as executor:
+            payloads = list(executor.map(compute, *zip(*tasks)))
+
+        return {
+            self.cache_key(window_size, thumb_size, image_format): payload
+            for (thumb_size, image_format), payload in zip(tasks, payloads)
+            if payload
+        }
+
+    @staticmethod
+    def can_encode(image_format: str) -> bool:
+        Image.init()
+        if image_format.upper() in Image.SAVE:
+            return True
+        logger.warning("Pillow can't encode thumbnails as %s", image_format)
+        return False
 
     @classmethod
     def resize_image(
@@ -0,0 +1,389 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Tracing of the steps a request goes through.
+
+A trace records the spans of a request, i.e. its named and timed steps, nested in
+one another: the request itself, then e.g. loading the query context, computing the
+cache keys, rendering the Jinja templates, building and compiling the SQLA query,
+executing it and so on. When the request ends, its spans are handed to the exporters
+of `TRACING_SPAN_EXPORTERS`.
+
+Without exporters no trace is started, and `span` and `traced` do close to nothing.
+"""
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Any, Callable, ContextManager, TypeVar
+from urllib import request as urllib_request
+
+from flask import current_app, Flask, g, has_app_context, request
+
+from superset.stats_logger import BaseStatsLogger
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+TRACE_ATTRIBUTE = "trace"
+SPAN_ATTRIBUTE = "trace_span"
+
+_noop = nullcontext()
+
+
+def _new_id(size: int) -> str:
+    return os.urandom(size).hex()
+
+
+@dataclass
+class Span:  # pylint: disable=too-many-instance-attributes
+    name: str
+    trace_id: str
+    parent_id: str | None = None
+    span_id: str = field(default_factory=lambda: _new_id(8))
+    start_time_ns: int = field(default_factory=time.time_ns)
+    end_time_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end_time_ns or time.time_ns()) - self.start_time_ns) / 1e6
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class Trace:
+    """The spans of a request, the first one being the root span."""
+
+    def __init__(self, name: str, **attributes: Any) -> None:
+        self.trace_id = _new_id(16)
+        self.root = Span(name, self.trace_id, attributes=attributes)
+        self.spans = [self.root]
+        self._lock = threading.Lock()
+
+    def start_span(self, name: str, parent: Span | None, **attributes: Any) -> Span:
+        span_ = Span(
+            name,
+            self.trace_id,
+            parent_id=(parent or self.root).span_id,
+            attributes=attributes,
+        )
+        with self._lock:
+            self.spans.append(span_)
+        return span_
+
+
+class _SpanContext:
+    """Make the span current in the context, the span of the context being its parent."""
+
+    def __init__(self, trace_: Trace, name: str, attributes: dict[str, Any]) -> None:
+        self.trace = trace_
+        self.name = name
+        self.attributes = attributes
+        self.parent: Span | None = None
+        self.span: Span | None = None
+
+    def __enter__(self) -> Span:
+        self.parent = g.get(SPAN_ATTRIBUTE)
+        self.span = self.trace.start_span(self.name, self.parent, **self.attributes)
+        setattr(g, SPAN_ATTRIBUTE, self.span)
+        return self.span
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        span_: Span = self.span  # type: ignore
+        span_.end_time_ns = time.time_ns()
+        if exc_val is not None:
+            span_.error = f"{exc_type.__name__}: {exc_val}"  # type: ignore
+        setattr(g, SPAN_ATTRIBUTE, self.parent)
+
+
+def current_trace() -> Trace | None:
+    return g.get(TRACE_ATTRIBUTE) if has_app_context() else None
+
+
+def span(name: str, **attributes: Any) -> ContextManager[Span | None]:
+    """
+    Record the enclosed code as a span of the current trace, if any, e.g.
+
+        with span("db.execute", database=database.name):
+            cursor.execute(sql)
+    """
+    if (trace_ := current_trace()) is None:
+        return _noop
+    return _SpanContext(trace_, name, attributes)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Record the calls of the decorated function as spans of the current trace."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if (trace_ := current_trace()) is None:
+                return func(*args, **kwargs)
+            with _SpanContext(trace_, name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore
+
+    return decorator
+
+
+def with_current_span(func: F) -> F:
+    """
+    Bind the function to the current trace and span, for it to be called in the app
+    context of another thread.
+    """
+    if (trace_ := current_trace()) is None:
+        return func
+    parent = g.get(SPAN_ATTRIBUTE)
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        previous = g.get(TRACE_ATTRIBUTE), g.get(SPAN_ATTRIBUTE)
+        setattr(g, TRACE_ATTRIBUTE, trace_)
+        setattr(g, SPAN_ATTRIBUTE, parent)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            setattr(g, TRACE_ATTRIBUTE, previous[0])
+            setattr(g, SPAN_ATTRIBUTE, previous[1])
+
+    return wrapper  # type: ignore
+
+
+def start_trace(name: str, **attributes: Any) -> Trace | None:
+    """Start a trace in the app context if exporters are configured."""
+    if not current_app.config["TRACING_SPAN_EXPORTERS"]:
+        return None
+    trace_ = Trace(name, **attributes)
+    setattr(g, TRACE_ATTRIBUTE, trace_)
+    setattr(g, SPAN_ATTRIBUTE, trace_.root)
+    return trace_
+
+
+def end_trace(error: BaseException | None = None) -> None:
+    """End the trace of the app context, if any, and export its spans."""
+    trace_: Trace | None = g.pop(TRACE_ATTRIBUTE, None)
+    g.pop(SPAN_ATTRIBUTE, None)
+    if trace_ is None:
+        return
+
+    trace_.root.end_time_ns = time.time_ns()
+    if error is not None:
+        trace_.root.error = f"{error.__class__.__name__}: {error}"
+    for exporter in current_app.config["TRACING_SPAN_EXPORTERS"]:
+        try:
+            exporter.export(trace_.spans)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Error exporting the spans of trace %s", trace_.trace_id)
+
+
+@contextmanager
+def trace(name: str, **attributes: Any) -> Iterator[Trace | None]:
+    """Trace the enclosed code, e.g. the body of a Celery task."""
+    if not has_app_context():
+        yield None
+        return
+
+    if current_trace() is not None:
+        with span(name, **attributes):
+            yield current_trace()
+        return
+
+    trace_ = start_trace(name, **attributes)
+    error = None
+    try:
+        yield trace_
+    except BaseException as ex:
+        error = ex
+        raise
+    finally:
+        end_trace(error)
+
+
+def init_app(app: Flask) -> None:
+    """Trace the requests of the app."""
+
+    @app.before_request
+    def start_request_trace() -> None:
+        start_trace(
+            f"{request.method} {request.url_rule or request.path}",
+            **{"http.method": request.method, "http.target": request.path},
+        )
+
+    @app.teardown_request
+    def end_request_trace(error: BaseException | None = None) -> None:
+        end_trace(error)
+
+
+class BaseSpanExporter:  # pylint: disable=too-few-public-methods
+    """Base class for the exporters of the spans of a trace"""
+
+    def export(self, spans: list[Span]) -> None:
+        raise NotImplementedError()
+
+
+class LoggingSpanExporter(BaseSpanExporter):  # pylint: disable=too-few-public-methods
+    """Log the spans of each trace as an indented tree, with their durations."""
+
+    def __init__(self, level: int = logging.INFO) -> None:
+        self.level = level
+
+    def export(self, spans: list[Span]) -> None:
+        children: dict[str | None, list[Span]] = {}
+        for span_ in spans:
+            children.setdefault(span_.parent_id, []).append(span_)
+
+        lines = []
+        stack = [(span_, 0) for span_ in reversed(children.get(None, []))]
+        while stack:
+            span_, depth = stack.pop()
+            lines.append(
+                f"{'  ' * depth}{span_.name}: {span_.duration_ms:.1f} ms"
+                + (f" [{span_.error}]" if span_.error else "")
+            )
+            stack.extend(
+                (child, depth + 1)
+                for child in reversed(children.get(span_.span_id, []))
+            )
+        logger.log(self.level, "Trace %s\n%s", spans[0].trace_id, "\n".join(lines))
+
+
+class StatsdSpanExporter(BaseSpanExporter):  # pylint: disable=too-few-public-methods
+    """Send the duration of each span to the stats logger, in milliseconds."""
+
+    def __init__(
+        self, stats_logger: BaseStatsLogger | None = None, prefix: str = "span."
+    ) -> None:
+        self.stats_logger = stats_logger
+        self.prefix = prefix
+
+    def export(self, spans: list[Span]) -> None:
+        stats_logger = self.stats_logger or current_app.config["STATS_LOGGER"]
+        # the root span is named after the URL rule of the request
+        for span_ in spans[1:]:
+            stats_logger.timing(f"{self.prefix}{span_.name}", span_.duration_ms)
+
+
+class OTLPJsonSpanExporter(BaseSpanExporter):  # pylint: disable=too-few-public-methods
+    """
+    Post the spans of each trace to an OpenTelemetry collector, as per the JSON
+    encoding of the OTLP/HTTP protocol, e.g.
+
+        TRACING_SPAN_EXPORTERS = [
+            OTLPJsonSpanExporter("http://localhost:4318/v1/traces"),
+        ]
+
+    The spans are posted from a background thread, out of the request.
+    """
+
+    def __init__(
+        self,
+        endpoint: str = "http://localhost:4318/v1/traces",
+        service_name: str = "superset",
+        timeout: float = 5,
+    ) -> None:
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.timeout = timeout
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    @staticmethod
+    def _attribute(key: str, value: Any) -> dict[str, Any]:
+        if isinstance(value, bool):
+            return {"key": key, "value": {"boolValue": value}}
+        if isinstance(value, int):
+            return {"key": key, "value": {"intValue": str(value)}}
+        if isinstance(value, float):
+            return {"key": key, "value": {"doubleValue": value}}
+        return {"key": key, "value": {"stringValue": str(value)}}
+
+    def encode(self, spans: list[Span]) -> dict[str, Any]:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            self._attribute("service.name", self.service_name)
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [
+                                {
+                                    "traceId": span_.trace_id,
+                                    "spanId": span_.span_id,
+                                    "parentSpanId": span_.parent_id or "",
+                                    "name": span_.name,
+                                    # server for the request, internal otherwise
+                                    "kind": 1 if span_.parent_id else 2,
+                                    "startTimeUnixNano": str(span_.start_time_ns),
+                                    "endTimeUnixNano": str(
+                                        span_.end_time_ns or span_.start_time_ns
+                                    ),
+                                    "attributes": [
+                                        self._attribute(key, value)
+                                        for key, value in span_.attributes.items()
+                                    ],
+                                    "status": (
+                                        {"code": 2, "message": span_.error}
+                                        if span_.error
+                                        else {"code": 0}
+                                    ),
+                                }
+                                for span_ in spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+    def post(self, data: bytes) -> None:
+        req = urllib_request.Request(
+            self.endpoint,
+            data=data,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib_request.urlopen(req, timeout=self.timeout):
+                pass
+        except OSError:
+            logger.warning("Error posting spans to %s", self.endpoint, exc_info=True)
+
+    def export(self, spans: list[Span]) -> None:
+        self.executor.submit(self.post, json.dumps(self.encode(spans)).encode("utf-8"))
@@ -16,9 +16,11 @@
 # under the License.
 import dataclasses
 import functools
+import itertools
 import logging
 import os
 import traceback
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any, Callable, cast, Optional, Union
 
@@ -34,6 +36,7 @@ from flask import (
     Response,
     send_file,
     session,
+    stream_with_context,
 )
 from flask_appbuilder import BaseView, Model, ModelView
 from flask_appbuilder.actions import action
@@ -189,6 +192,28 @@ def generate_download_headers(
     return headers
 
 
+def zip_bundle_response(root: str, files: Iterable[tuple[str, str]]) -> FlaskResponse:
+    """
+    Stream the files of an export bundle as a ZIP file, with the files in the root
+    directory, as the export command produces them.
+
+    The first file is read up front, for the errors of the validation of the command
+    to be raised before the response starts.
+    """
+    files = iter(files)
+    head = list(itertools.islice(files, 1))
+    contents = utils.stream_zip(
+        (f"{root}/{file_name}", file_content.encode())
+        for file_name, file_content in itertools.chain(head, files)
+    )
+    return Response(
+        stream_with_context(contents),
+        mimetype="application/zip",
+        headers=generate_download_headers("zip", root),
+        direct_passthrough=True,
+    )
+
+
 def deprecated(
     eol_version: str = "4.0.0",
     new_target: Optional[str] = None,
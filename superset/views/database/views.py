@@ -40,6 +40,7 @@ from superset.extensions import event_logger
 from superset.sql_parse import Table
 from superset.superset_typing import FlaskResponse
 from superset.utils import core as utils
+from superset.utils.decorators import stats_timing
 from superset.views.base import DeleteMixin, SupersetModelView, YamlExportMixin
 
 from .forms import ColumnarToDatabaseForm, CsvToDatabaseForm, ExcelToDatabaseForm
@@ -192,28 +193,26 @@ class CsvToDatabaseView(CustomFormView):
 
         try:
             kwargs = {"dtype": json.loads(form.dtype.data)} if form.dtype.data else {}
-            df = pd.concat(
-                pd.read_csv(
-                    chunksize=1000,
-                    encoding="utf-8",
-                    filepath_or_buffer=form.csv_file.data,
-                    header=form.header.data if form.header.data else 0,
-                    index_col=form.index_col.data,
-                    infer_datetime_format=form.infer_datetime_format.data,
-                    dayfirst=form.day_first.data,
-                    iterator=True,
-                    keep_default_na=not form.null_values.data,
-                    mangle_dupe_cols=form.overwrite_duplicate.data,
-                    usecols=form.use_cols.data if form.use_cols.data else None,
-                    na_values=form.null_values.data if form.null_values.data else None,
-                    nrows=form.nrows.data,
-                    parse_dates=form.parse_dates.data,
-                    sep=delimiter_input,
-                    skip_blank_lines=form.skip_blank_lines.data,
-                    skipinitialspace=form.skip_initial_space.data,
-                    skiprows=form.skiprows.data,
-                    **kwargs,
-                )
+            chunks = pd.read_csv(
+                chunksize=config["CSV_UPLOAD_CHUNK_SIZE"],
+                encoding="utf-8",
+                filepath_or_buffer=form.csv_file.data,
+                header=form.header.data if form.header.data else 0,
+                index_col=form.index_col.data,
+                infer_datetime_format=form.infer_datetime_format.data,
+                dayfirst=form.day_first.data,
+                iterator=True,
+                keep_default_na=not form.null_values.data,
+                mangle_dupe_cols=form.overwrite_duplicate.data,
+                usecols=form.use_cols.data if form.use_cols.data else None,
+                na_values=form.null_values.data if form.null_values.data else None,
+                nrows=form.nrows.data,
+                parse_dates=form.parse_dates.data,
+                sep=delimiter_input,
+                skip_blank_lines=form.skip_blank_lines.data,
+                skipinitialspace=form.skip_initial_space.data,
+                skiprows=form.skiprows.data,
+                **kwargs,
             )
 
             database = (
@@ -222,17 +221,18 @@ class CsvToDatabaseView(CustomFormView):
                 .one()
             )
 
-            database.db_engine_spec.df_to_sql(
-                database,
-                csv_table,
-                df,
-                to_sql_kwargs={
-                    "chunksize": 1000,
-                    "if_exists": form.if_exists.data,
-                    "index": form.dataframe_index.data,
-                    "index_label": form.index_label.data,
-                },
-            )
+            with stats_timing("csv_upload.time", stats_logger):
+                database.db_engine_spec.chunked_df_to_sql(
+                    database,
+                    csv_table,
+                    chunks,
+                    to_sql_kwargs={
+                        "chunksize": 1000,
+                        "if_exists": form.if_exists.data,
+                        "index": form.dataframe_index.data,
+                        "index_label": form.index_label.data,
+                    },
+                )
 
             # Connect table to the database that should be used for exploration.
             # E.g. if hive was used to upload a csv, presto will be a better option
@@ -491,8 +491,7 @@ class ColumnarToDatabaseView(SimpleFormView):
             return redirect("/columnartodatabaseview/form")
 
         try:
-            chunks = [read(file, **kwargs) for file in files]
-            df = pd.concat(chunks)
+            chunks = (read(file, **kwargs) for file in files)
 
             database = (
                 db.session.query(models.Database)
@@ -500,17 +499,18 @@ class ColumnarToDatabaseView(SimpleFormView):
                 .one()
             )
 
-            database.db_engine_spec.df_to_sql(
-                database,
-                columnar_table,
-                df,
-                to_sql_kwargs={
-                    "chunksize": 1000,
-                    "if_exists": form.if_exists.data,
-                    "index": form.index.data,
-                    "index_label": form.index_label.data,
-                },
-            )
+            with stats_timing("columnar_upload.time", stats_logger):
+                database.db_engine_spec.chunked_df_to_sql(
+                    database,
+                    columnar_table,
+                    chunks,
+                    to_sql_kwargs={
+                        "chunksize": 1000,
+                        "if_exists": form.if_exists.data,
+                        "index": form.index.data,
+                        "index_label": form.index_label.data,
+                    },
+                )
 
             # Connect table to the database that should be used for exploration.
             # E.g. if hive was used to upload a csv, presto will be a better option
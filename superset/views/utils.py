@@ -31,7 +31,7 @@ from sqlalchemy.orm.exc import NoResultFound
 from werkzeug.wrappers.response import Response
 
 import superset.models.core as models
-from superset import app, dataframe, db, result_set, viz
+from superset import app, db, viz
 from superset.common.db_query_status import QueryStatus
 from superset.daos.datasource import DatasourceDAO
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -542,16 +542,13 @@ def _deserialize_results_payload(
             except pa.ArrowSerializationError as ex:
                 raise SerializationError("Unable to deserialize table") from ex
 
-        df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
-        ds_payload["data"] = dataframe.df_to_records(df) or []
-
         for column in ds_payload["selected_columns"]:
             if "name" in column:
                 column["column_name"] = column.get("name")
 
         db_engine_spec = query.database.db_engine_spec
-        all_columns, data, expanded_columns = db_engine_spec.expand_data(
-            ds_payload["selected_columns"], ds_payload["data"]
+        all_columns, data, expanded_columns = db_engine_spec.expand_table(
+            ds_payload["selected_columns"], pa_table
         )
         ds_payload.update(
             {"data": data, "columns": all_columns,
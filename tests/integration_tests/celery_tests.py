@@ -365,10 +365,10 @@ def test_default_data_serialization():
     results = SupersetResultSet(SERIALIZATION_DATA, CURSOR_DESCR, db_engine_spec)
 
     with mock.patch.object(
-        db_engine_spec, "expand_data", wraps=db_engine_spec.expand_data
-    ) as expand_data:
+        db_engine_spec, "expand_table", wraps=db_engine_spec.expand_table
+    ) as expand_table:
         data = sql_lab._serialize_and_expand_data(results, db_engine_spec, False, True)
-        expand_data.assert_called_once()
+        expand_table.assert_called_once()
     assert isinstance(data[0], list)
 
 
@@ -377,10 +377,10 @@ def test_new_data_serialization():
     results = SupersetResultSet(SERIALIZATION_DATA, CURSOR_DESCR, db_engine_spec)
 
     with mock.patch.object(
-        db_engine_spec, "expand_data", wraps=db_engine_spec.expand_data
-    ) as expand_data:
+        db_engine_spec, "expand_table", wraps=db_engine_spec.expand_table
+    ) as expand_table:
         data = sql_lab._serialize_and_expand_data(results, db_engine_spec, True)
-        expand_data.assert_not_called()
+        expand_table.assert_not_called()
     assert isinstance(data[0], bytes)
 
 
@@ -55,6 +55,7 @@ from superset.utils.core import (
     get_example_default_schema,
     AdhocMetricExpressionType,
     ExtraFiltersReasonType,
+    QueryStatus,
 )
 from superset.utils.database import get_example_database, get_main_database
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
@@ -305,6 +306,23 @@ class TestPostChartDataApi(BaseTestChartDataApi):
         zipfile = ZipFile(BytesIO(rv.data), "r")
         assert zipfile.namelist() == ["query_1.csv", "query_2.csv"]
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @mock.patch.dict(app.config, {"CHART_DATA_QUERY_CONCURRENCY": 2})
+    def test_with_multi_query_concurrency(self):
+        """
+        Chart data API: Test chart data with multiple queries running concurrently
+        """
+        self.query_context_payload["force"] = True
+        for row_limit in (3, 4, 5):
+            query = copy.deepcopy(self.query_context_payload["queries"][0])
+            query["row_limit"] = row_limit
+            self.query_context_payload["queries"].append(query)
+        rv = self.post_assert_metric(CHART_DATA_URI, self.query_context_payload, "data")
+        assert rv.status_code == 200
+        result = rv.json["result"]
+        assert [query["status"] for query in result] == [QueryStatus.SUCCESS] * 4
+        assert [query["rowcount"] for query in result][1:] == [3, 4, 5]
+
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     def test_with_multi_query_excel_result_format(self):
         """
@@ -1407,3 +1425,87 @@ def test_chart_data_subquery_allowed(
     rv = test_client.post(CHART_DATA_URI, json=physical_query_context)
 
     assert rv.status_code == status_code
+
+
+def test_chart_data_response_cache(
+    simple_data_cache, test_client, login_as_admin, physical_query_context
+):
+    physical_query_context["force"] = False
+    chart = Slice(
+        slice_name="physical_dataset_chart",
+        datasource_type=physical_query_context["datasource"]["type"],
+        datasource_id=physical_query_context["datasource"]["id"],
+        viz_type="table",
+        params="{}",
+        query_context=json.dumps(physical_query_context),
+    )
+    db.session.add(chart)
+    db.session.commit()
+    uri = f"api/v1/chart/{chart.id}/data/"
+    try:
+        with mock.patch.dict(app.config, {"CACHE_CHART_DATA_RESPONSES": True}):
+            # the first response is loaded from the source, the second one from the
+            # data cache, which is then encoded once for all
+            rv = test_client.get(uri)
+            assert not rv.json["result"][0]["is_cached"]
+            assert rv.headers.get("ETag") is None
+            rv = test_client.get(uri)
+            assert rv.json["result"][0]["is_cached"]
+            etag = rv.headers["ETag"]
+
+            with mock.patch.object(
+                ChartDataCommand,
+                "run",
+                autospec=True,
+                side_effect=ChartDataCommand.run,
+            ) as run:
+                cached_rv = test_client.get(uri)
+                assert cached_rv.data == rv.data
+                assert cached_rv.headers["ETag"] == etag
+                cached_rv = test_client.post(
+                    CHART_DATA_URI, json=physical_query_context
+                )
+                assert cached_rv.data == rv.data
+                cached_rv = test_client.get(uri, headers={"If-None-Match": etag})
+                assert cached_rv.status_code == 304
+                assert run.call_count == 0
+
+                # forcing the query drops the encoded results of the previous result
+                test_client.post(
+                    CHART_DATA_URI, json={**physical_query_context, "force": True}
+                )
+                assert run.call_count == 1
+                test_client.get(uri)
+                assert run.call_count == 2
+    finally:
+        db.session.delete(chart)
+        db.session.commit()
+
+
+def test_chart_data_tracing(
+    simple_data_cache, test_client, login_as_admin, physical_query_context
+):
+    exporter = mock.MagicMock()
+    with mock.patch.dict(app.config, {"TRACING_SPAN_EXPORTERS": [exporter]}):
+        rv = test_client.post(CHART_DATA_URI, json=physical_query_context)
+        assert rv.status_code == 200
+
+    exporter.export.assert_called_once()
+    spans = exporter.export.call_args[0][0]
+    assert spans[0].name == "POST /api/v1/chart/data"
+    assert {
+        "chart_data.load_query_context",
+        "chart_data.cache_key",
+        "chart_data.query_object",
+        "security.rls_filters",
+        "sqla.build_query",
+        "sqla.compile",
+        "db.create_engine",
+        "db.connect",
+        "db.execute",
+        "db.fetch",
+        "result_set.build",
+        "chart_data.serialize",
+    } <= {span.name for span in spans}
+    span_ids = {span.span_id for span in spans}
+    assert all(span.parent_id in span_ids for span in spans[1:])
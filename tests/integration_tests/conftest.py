@@ -19,6 +19,7 @@ from __future__ import annotations
 import contextlib
 import functools
 import os
+from collections.abc import Iterator
 from typing import Any, Callable, TYPE_CHECKING
 from unittest.mock import patch
 
@@ -28,13 +29,14 @@ from flask_appbuilder.security.sqla import models as ab_models
 from sqlalchemy.engine import Engine
 
 from superset import db, security_manager
-from superset.extensions import feature_flag_manager
+from superset.extensions import cache_manager, feature_flag_manager
 from superset.utils.core import json_dumps_w_dates
 from superset.utils.database import get_example_database, remove_database
 from tests.integration_tests.test_app import app, login
 
 if TYPE_CHECKING:
     from flask.testing import FlaskClient
+    from flask_caching import Cache
 
     from superset.connectors.sqla.models import Database
 
@@ -54,6 +56,17 @@ def test_client(app_context: AppContext):
         yield client
 
 
+@pytest.fixture
+def simple_data_cache(app_context: AppContext) -> Iterator[Cache]:
+    """
+    Use an in-memory data cache, for the tests of the results being cached.
+    """
+    with patch.dict(app.config, {"DATA_CACHE_CONFIG": {"CACHE_TYPE": "SimpleCache"}}):
+        cache_manager.init_app(app)
+        yield cache_manager.data_cache
+    cache_manager.init_app(app)
+
+
 @pytest.fixture
 def login_as(test_client: FlaskClient[Any]):
     """Fixture with app context and logged in admin user."""
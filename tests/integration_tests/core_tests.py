@@ -1041,10 +1041,10 @@ class TestCore(SupersetTestCase, InsertChartMixin):
         self.assertIsInstance(serialized_payload, bytes)
 
         with mock.patch.object(
-            db_engine_spec, "expand_data", wraps=db_engine_spec.expand_data
-        ) as expand_data:
+            db_engine_spec, "expand_table", wraps=db_engine_spec.expand_table
+        ) as expand_table:
             query_mock = mock.Mock()
-            query_mock.database.db_engine_spec.expand_data = expand_data
+            query_mock.database.db_engine_spec.expand_table = expand_table
 
             deserialized_payload = superset.views.utils._deserialize_results_payload(
                 serialized_payload, query_mock, use_new_deserialization
@@ -1053,7 +1053,7 @@ class TestCore(SupersetTestCase, InsertChartMixin):
             payload["data"] = dataframe.df_to_records(df)
 
             self.assertDictEqual(deserialized_payload, payload)
-            expand_data.assert_called_once()
+            expand_table.assert_called_once()
 
     @mock.patch.dict(
         "superset.extensions.feature_flag_manager._feature_flags",
@@ -17,6 +17,7 @@
 from textwrap import dedent
 from unittest import mock
 
+import pandas as pd
 from flask.ctx import AppContext
 from sqlalchemy import column, literal_column
 from sqlalchemy.dialects import postgresql
@@ -25,6 +26,7 @@ from superset.db_engine_specs import load_engine_specs
 from superset.db_engine_specs.postgres import PostgresEngineSpec
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.models.sql_lab import Query
+from superset.sql_parse import Table
 from superset.utils.database import get_example_database
 from tests.integration_tests.db_engine_specs.base_tests import TestDbEngineSpec
 from tests.integration_tests.fixtures.certificates import ssl_certificate
@@ -535,3 +537,40 @@ def test_get_catalog_names(app_context: AppContext) -> None:
             "postgres",
             "superset",
         ]
+
+
+def test_chunked_df_to_sql(app_context: AppContext) -> None:
+    """
+    Test uploading chunks with ``COPY ... FROM STDIN``.
+    """
+    database = get_example_database()
+
+    if database.backend != "postgresql":
+        return
+
+    table = Table("chunked_upload_test")
+    chunks = [
+        pd.DataFrame({"a": [1, 2], "b": ['x, "y"', None]}),
+        pd.DataFrame({"a": [None, 4], "b": ["", "multi\nline"]}),
+    ]
+    try:
+        for _ in range(2):
+            rows = PostgresEngineSpec.chunked_df_to_sql(
+                database,
+                table,
+                iter(chunks),
+                {"if_exists": "replace", "index": False},
+            )
+            assert rows == 4
+            df = database.get_df(
+                "SELECT pg_typeof(a)::text AS type, a::text AS a, b "
+                "FROM chunked_upload_test"
+            )
+            assert df.to_dict(orient="list") == {
+                "type": ["bigint"] * 4,
+                "a": ["1", "2", None, "4"],
+                "b": ['x, "y"', None, "", "multi\nline"],
+            }
+    finally:
+        with database.get_sqla_engine_with_context() as engine:
+            engine.execute("DROP TABLE IF EXISTS chunked_upload_test")
@@ -0,0 +1,87 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from unittest import mock
+
+from flask_caching.backends import SimpleCache
+
+from superset.utils.profiler import SAMPLING_PROFILE_SEQUENCE_KEY, SamplingProfiler
+from tests.integration_tests.test_app import app
+
+
+def test_profiling_api(test_client, login_as_admin):
+    results_backend = SimpleCache()
+    profiler = SamplingProfiler()
+    profiler.results_backend = results_backend
+    profiler.labels[0] = "task load"
+    profiler.stacks["task load"]["main (app.py:1);load (app.py:5)"] = 3
+    profiler.flush()
+
+    with mock.patch(
+        "superset.extensions.results_backend_manager._results_backend",
+        results_backend,
+    ):
+        resp = test_client.get("api/v1/profiling/")
+        assert resp.status_code == 200
+        [profile] = resp.json["result"]
+        assert profile["labels"] == {"task load": 3}
+
+        resp = test_client.get(f"api/v1/profiling/{profile['key']}/?label=task load")
+        assert resp.status_code == 200
+        assert resp.mimetype == "text/plain"
+        assert resp.data.decode("utf-8") == "main (app.py:1);load (app.py:5) 3\n"
+
+        resp = test_client.get("api/v1/profiling/sampling_profile_missing/")
+        assert resp.status_code == 404
+
+    resp = test_client.get("api/v1/profiling/")
+    assert resp.status_code == 400
+
+
+def test_profiling_api_max_windows(test_client, login_as_admin):
+    """
+    Test that the profiles are listed as per the config, whether this process
+    profiles or not.
+    """
+    results_backend = SimpleCache()
+    results_backend.set(SAMPLING_PROFILE_SEQUENCE_KEY, 700)
+    profiler = SamplingProfiler(max_windows=1000)
+    profiler.results_backend = results_backend
+    profiler.labels[0] = "task load"
+    profiler.stacks["task load"]["main (app.py:1)"] = 1
+    profiler.flush()
+
+    with mock.patch(
+        "superset.extensions.results_backend_manager._results_backend",
+        results_backend,
+    ), mock.patch.dict(
+        app.config,
+        {
+            "SAMPLING_PROFILER_CONFIG": {
+                **app.config["SAMPLING_PROFILER_CONFIG"],
+                "max_windows": 1000,
+            }
+        },
+    ):
+        resp = test_client.get("api/v1/profiling/")
+        assert resp.status_code == 200
+        assert len(resp.json["result"]) == 1
+
+
+def test_profiling_api_admin_only(test_client, login_as):
+    login_as("gamma")
+    resp = test_client.get("api/v1/profiling/")
+    assert resp.status_code == 403
@@ -23,14 +23,16 @@ import pandas as pd
 import pytest
 from pandas import DateOffset
 
-from superset import db
+from superset import app, db
 from superset.charts.schemas import ChartDataQueryContextSchema
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.query_context import QueryContext
 from superset.common.query_context_factory import QueryContextFactory
+from superset.common.query_context_processor import QueryContextProcessor
 from superset.common.query_object import QueryObject
 from superset.connectors.sqla.models import SqlMetric
 from superset.daos.datasource import DatasourceDAO
+from superset.exceptions import QueryObjectValidationError
 from superset.extensions import cache_manager
 from superset.superset_typing import AdhocColumn
 from superset.utils.core import (
@@ -1098,3 +1100,175 @@ def test_time_offset_with_temporal_range_filter(app_context, physical_dataset):
         re.search(r"WHERE col6 >= .*2001-10-01", sqls[1])
         and re.search(r"AND col6 < .*2002-10-01", sqls[1])
     ) is not None
+
+
+def test_concurrent_query_objects(app_context, physical_dataset, mocker):
+    mocker.patch.dict(app.config, {"CHART_DATA_QUERY_CONCURRENCY": 2})
+
+    def create_query_context():
+        return QueryContextFactory().create(
+            datasource={
+                "type": physical_dataset.type,
+                "id": physical_dataset.id,
+            },
+            queries=[
+                {
+                    "columns": ["col1"],
+                    "metrics": ["count"],
+                    "orderby": [["col1", True]],
+                    "row_limit": row_limit,
+                }
+                for row_limit in (1, 2, 3)
+            ],
+            result_type=ChartDataResultType.FULL,
+            force=True,
+        )
+
+    get_query_results = mocker.spy(QueryContextProcessor, "_get_query_object_results")
+    queries = create_query_context().get_payload()["queries"]
+    assert get_query_results.call_count == 3
+    assert [query["rowcount"] for query in queries] == [1, 2, 3]
+    assert all(query["status"] == QueryStatus.SUCCESS for query in queries)
+
+    mocker.patch.object(
+        QueryContextProcessor,
+        "_get_query_object_results",
+        side_effect=[{}, QueryObjectValidationError("error"), {}],
+    )
+    with pytest.raises(QueryObjectValidationError):
+        create_query_context().get_payload()
+
+
+def test_query_built_once_per_query_object(app_context, physical_dataset, mocker):
+    query_context = QueryContextFactory().create(
+        datasource={
+            "type": physical_dataset.type,
+            "id": physical_dataset.id,
+        },
+        queries=[
+            {
+                "columns": ["col1"],
+                "metrics": ["count"],
+                "extras": {"where": "col1 >= {{ url_param('min_col1', 0) }}"},
+                "row_limit": 10,
+            }
+        ],
+        result_type=ChartDataResultType.FULL,
+        force=True,
+    )
+
+    get_sqla_query = mocker.spy(type(physical_dataset), "get_sqla_query")
+    query = query_context.get_payload()["queries"][0]
+    assert get_sqla_query.call_count == 1
+    assert query["status"] == QueryStatus.SUCCESS
+    assert query["rowcount"] == 10
+
+
+def test_raw_query_result_cache(simple_data_cache, physical_dataset, mocker):
+    mocker.patch.dict(app.config, {"CACHE_RAW_QUERY_RESULTS": True})
+
+    def get_payload(post_processing):
+        return (
+            QueryContextFactory()
+            .create(
+                datasource={
+                    "type": physical_dataset.type,
+                    "id": physical_dataset.id,
+                },
+                queries=[
+                    {
+                        "columns": ["col1"],
+                        "metrics": ["count"],
+                        "orderby": [["col1", True]],
+                        "row_limit": 10,
+                        "post_processing": post_processing,
+                    }
+                ],
+                result_type=ChartDataResultType.FULL,
+            )
+            .get_payload()["queries"][0]
+        )
+
+    query = mocker.spy(type(physical_dataset), "query")
+    ascending = get_payload([])
+    descending = get_payload(
+        [{"operation": "sort", "options": {"by": "col1", "ascending": False}}]
+    )
+    assert query.call_count == 1
+    assert not descending["is_cached"]
+    assert descending["cache_key"] != ascending["cache_key"]
+    assert descending["data"] == ascending["data"][::-1]
+
+
+def test_derived_query_result(simple_data_cache, physical_dataset, mocker):
+    mocker.patch.dict(
+        app.config, {"CACHE_RAW_QUERY_RESULTS": True, "DERIVE_QUERY_RESULTS": True}
+    )
+
+    def get_payload(columns, filters):
+        return (
+            QueryContextFactory()
+            .create(
+                datasource={
+                    "type": physical_dataset.type,
+                    "id": physical_dataset.id,
+                },
+                queries=[
+                    {
+                        "columns": columns,
+                        "metrics": ["count"],
+                        "filters": filters,
+                        "row_limit": 100,
+                    }
+                ],
+                result_type=ChartDataResultType.FULL,
+            )
+            .get_payload()["queries"][0]
+        )
+
+    query = mocker.spy(type(physical_dataset), "query")
+    get_payload(["col1", "col2"], [])
+    filtered = get_payload(["col2"], [{"col": "col1", "op": "IN", "val": [1, 2, 3]}])
+    assert query.call_count == 1
+    assert filtered["data"] == [
+        {"col2": "b", "count": 1},
+        {"col2": "c", "count": 1},
+        {"col2": "d", "count": 1},
+    ]
+
+    # filters on columns the cached result isn't grouped by need a new query
+    get_payload(["col2"], [{"col": "col4", "op": "IS NULL"}])
+    assert query.call_count == 2
+
+
+def test_cache_key_fallback_version(simple_data_cache, physical_dataset, mocker):
+    def get_payload():
+        return (
+            QueryContextFactory()
+            .create(
+                datasource={
+                    "type": physical_dataset.type,
+                    "id": physical_dataset.id,
+                },
+                queries=[{"columns": ["col1"], "metrics": ["count"]}],
+                result_type=ChartDataResultType.FULL,
+            )
+            .get_payload()["queries"][0]
+        )
+
+    legacy = get_payload()
+    mocker.patch.dict(app.config, {"CACHE_KEY_VERSION": 2})
+    query = get_payload()
+    assert query["cache_key"] != legacy["cache_key"]
+    assert not query["is_cached"]
+
+    # results cached with the previous version are still read
+    simple_data_cache.clear()
+    mocker.patch.dict(app.config, {"CACHE_KEY_VERSION": 1})
+    legacy = get_payload()
+    mocker.patch.dict(
+        app.config, {"CACHE_KEY_VERSION": 2, "CACHE_KEY_FALLBACK_VERSION": 1}
+    )
+    query = get_payload()
+    assert query["cache_key"] != legacy["cache_key"]
+    assert query["is_cached"]
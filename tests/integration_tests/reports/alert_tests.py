@@ -18,7 +18,6 @@
 from contextlib import nullcontext
 from typing import Optional, Union
 
-import pandas as pd
 import pytest
 from pytest_mock import MockFixture
 
@@ -103,11 +102,11 @@ def test_execute_query_as_report_executor(
 def test_execute_query_succeeded_no_retry(
     mocker: MockFixture, app_context: None
 ) -> None:
-    from superset.reports.commands.alert import AlertCommand
+    from superset.reports.commands.alert import AlertCommand, AlertQueryResult
 
     execute_query_mock = mocker.patch(
         "superset.reports.commands.alert.AlertCommand._execute_query",
-        side_effect=lambda: pd.DataFrame([{"sample_col": 0}]),
+        side_effect=lambda: AlertQueryResult(["sample_col"], [(0,)]),
     )
 
     command = AlertCommand(report_schedule=mocker.Mock())
@@ -120,7 +119,11 @@ def test_execute_query_succeeded_no_retry(
 def test_execute_query_succeeded_with_retries(
     mocker: MockFixture, app_context: None
 ) -> None:
-    from superset.reports.commands.alert import AlertCommand, AlertQueryError
+    from superset.reports.commands.alert import (
+        AlertCommand,
+        AlertQueryError,
+        AlertQueryResult,
+    )
 
     execute_query_mock = mocker.patch(
         "superset.reports.commands.alert.AlertCommand._execute_query"
@@ -130,14 +133,14 @@ def test_execute_query_succeeded_with_retries(
     # Should match the value defined in superset_test_config.py
     expected_max_retries = 3
 
-    def _mocked_execute_query() -> pd.DataFrame:
+    def _mocked_execute_query() -> AlertQueryResult:
         nonlocal query_executed_count
         query_executed_count += 1
 
         if query_executed_count < expected_max_retries:
             raise AlertQueryError()
         else:
-            return pd.DataFrame([{"sample_col": 0}])
+            return AlertQueryResult(["sample_col"], [(0,)])
 
     execute_query_mock.side_effect = _mocked_execute_query
     execute_query_mock.__name__ = "mocked_execute_query"
@@ -196,3 +199,66 @@ def test_execute_query_failed_max_retries(
 
     # Should match the value defined in superset_test_config.py
     assert execute_query_mock.call_count == 3
+
+
+def test_execute_query_cached_result(mocker: MockFixture, app_context: None) -> None:
+    from superset.reports.commands.alert import AlertCommand
+
+    cache: dict[str, dict] = {}
+    cache_manager = mocker.patch("superset.reports.commands.alert.cache_manager")
+    cache_manager.data_cache.get.side_effect = cache.get
+    mocker.patch(
+        "superset.reports.commands.alert.set_and_log_cache",
+        side_effect=lambda _, key, value, timeout: cache.__setitem__(key, value),
+    )
+    mocker.patch("superset.reports.commands.alert.get_executor").return_value = (
+        ExecutorType.OWNER,
+        "admin",
+    )
+    mocker.patch.dict(app.config, {"ALERT_REPORTS_QUERY_CACHE_TIMEOUT": 60})
+    database = mocker.MagicMock()
+    database.id = 1
+    database.apply_limit_to_sql.return_value = "SELECT 1 LIMIT 2"
+    database.get_rows.return_value = (["sample_col"], [(1,)])
+    report_schedule = mocker.MagicMock(
+        database=database,
+        sql="SELECT 1",
+        validator_type="operator",
+        validator_config_json='{"op": "==", "threshold": 1}',
+    )
+
+    assert AlertCommand(report_schedule=report_schedule).run() is True
+    assert AlertCommand(report_schedule=report_schedule).run() is True
+    database.get_rows.assert_called_once_with(sql="SELECT 1 LIMIT 2", limit=2)
+
+    mocker.patch.dict(app.config, {"ALERT_REPORTS_QUERY_CACHE_TIMEOUT": 0})
+    assert AlertCommand(report_schedule=report_schedule).run() is True
+    assert database.get_rows.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "columns,rows,exception",
+    [
+        (["a"], [(1,), (2,)], "AlertQueryMultipleRowsError"),
+        (["a", "b"], [(1, 2)], "AlertQueryMultipleColumnsError"),
+        (["a"], [("foo",)], "AlertQueryInvalidTypeError"),
+    ],
+)
+def test_validate_invalid_result(
+    columns: list[str],
+    rows: list[tuple],
+    exception: str,
+    mocker: MockFixture,
+    app_context: None,
+) -> None:
+    from superset.reports.commands import exceptions
+    from superset.reports.commands.alert import AlertCommand, AlertQueryResult
+
+    mocker.patch(
+        "superset.reports.commands.alert.AlertCommand._execute_query",
+        return_value=AlertQueryResult(columns, rows),
+    )
+    report_schedule = mocker.MagicMock(validator_type="operator")
+
+    with pytest.raises(getattr(exceptions, exception)):
+        AlertCommand(report_schedule=report_schedule).validate()
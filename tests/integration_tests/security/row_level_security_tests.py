@@ -25,6 +25,7 @@ import json
 import prison
 
 from superset import db, security_manager, app
+from superset.extensions import cache_manager
 from superset.connectors.sqla.models import RowLevelSecurityFilter, SqlaTable
 from superset.security.guest_token import (
     GuestTokenResourceType,
@@ -320,6 +321,46 @@ class TestRowLevelSecurity(SupersetTestCase):
             "gender = 'boy'-gender",
         ]
 
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    def test_cached_rls_filters(self):
+        tbl = self.get_table(name="birth_names")
+        users = ["admin", "gamma", "NoRlsRoleUser"]
+        expected = {}
+        for username in users:
+            g.user = self.get_user(username=username)
+            expected[username] = security_manager.get_rls_cache_key(tbl)
+
+        cache_config = app.config["CACHE_CONFIG"]
+        app.config["CACHE_CONFIG"] = {"CACHE_TYPE": "SimpleCache"}
+        cache_manager.init_app(app)
+        load_rls_rules = mock.patch.object(
+            security_manager,
+            "_load_rls_rules",
+            wraps=security_manager._load_rls_rules,
+        )
+        try:
+            with mock.patch.dict(
+                app.config, {"CACHE_RLS_FILTERS": True}
+            ), load_rls_rules as load:
+                for username in users:
+                    g.user = self.get_user(username=username)
+                    assert security_manager.get_rls_cache_key(tbl) == expected[username]
+                assert load.call_count == 1
+
+                self.rls_entry3.clause = "name like 'R%'"
+                db.session.commit()
+                g.user = self.get_user(username="gamma")
+                assert security_manager.get_rls_cache_key(tbl) == [
+                    "name like 'A%' or name like 'B%'-name",
+                    "name like 'R%'-name",
+                    "gender = 'boy'-gender",
+                ]
+                assert load.call_count == 2
+        finally:
+            app.config["CACHE_CONFIG"] = cache_config
+            cache_manager.init_app(app)
+            security_manager._rls_rules_index = None
+
 
 class TestRowLevelSecurityCreateAPI(SupersetTestCase):
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
@@ -28,7 +28,7 @@ import jwt
 import prison
 import pytest
 
-from flask import current_app
+from flask import current_app, g
 from flask_appbuilder.security.sqla.models import Role
 from superset.daos.datasource import DatasourceDAO
 from superset.models.dashboard import Dashboard
@@ -36,6 +36,7 @@ from superset import app, appbuilder, db, security_manager, viz
 from superset.connectors.sqla.models import SqlaTable
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 from superset.exceptions import SupersetSecurityException
+from superset.extensions import cache_manager
 from superset.models.core import Database
 from superset.models.slice import Slice
 from superset.sql_parse import Table
@@ -1224,6 +1225,53 @@ class TestRolePermission(SupersetTestCase):
         self.assertIsNotNone(vm)
         delete_schema_perm("[examples].[2]")
 
+    def test_cached_permissions(self):
+        cache_config = app.config["CACHE_CONFIG"]
+        app.config["CACHE_CONFIG"] = {"CACHE_TYPE": "SimpleCache"}
+        cache_manager.init_app(app)
+        load_permission_index = patch.object(
+            security_manager,
+            "_load_permission_index",
+            wraps=security_manager._load_permission_index,
+        )
+        try:
+            with patch.dict(
+                app.config, {"CACHE_PERMISSIONS": True}
+            ), load_permission_index as load, self.client.application.test_request_context():
+                g.user = security_manager.find_user("gamma")
+                database = get_example_database()
+                for _ in range(2):
+                    schemas = security_manager.get_schemas_accessible_by_user(
+                        database, ["1", "2", "3"]
+                    )
+                    self.assertEqual(schemas, [])
+                self.assertEqual(load.call_count, 1)
+
+                create_schema_perm("[examples].[1]")
+                schemas = security_manager.get_schemas_accessible_by_user(
+                    database, ["1", "2", "3"]
+                )
+                self.assertEqual(schemas, ["1"])
+                self.assertEqual(load.call_count, 2)
+
+                pv = security_manager.find_permission_view_menu(
+                    "schema_access", "[examples].[1]"
+                )
+                security_manager.del_permission_role(
+                    security_manager.find_role(SCHEMA_ACCESS_ROLE), pv
+                )
+                security_manager.del_permission_view_menu(
+                    "schema_access", "[examples].[1]"
+                )
+                schemas = security_manager.get_schemas_accessible_by_user(
+                    database, ["1", "2", "3"]
+                )
+                self.assertEqual(schemas, [])
+                self.assertEqual(load.call_count, 3)
+        finally:
+            app.config["CACHE_CONFIG"] = cache_config
+            cache_manager.init_app(app)
+
     @pytest.mark.usefixtures("load_world_bank_dashboard_with_slices")
     def test_gamma_user_schema_access_to_dashboards(self):
         dash = db.session.query(Dashboard).filter_by(slug="world_health").first()
@@ -16,7 +16,8 @@
 # under the License.
 # isort:skip_file
 """Unit tests for Superset cache warmup"""
-from unittest.mock import MagicMock
+import json
+from unittest.mock import MagicMock, patch
 from tests.integration_tests.fixtures.birth_names_dashboard import (
     load_birth_names_dashboard_with_slices,
     load_birth_names_data,
@@ -34,13 +35,17 @@ from superset import db
 
 from superset.models.core import Log
 from superset.tags.models import get_tag, ObjectTypes, TaggedObject, TagTypes
+from superset.extensions import cache_manager
 from superset.tasks.cache import (
+    ChartDataUsageStrategy,
+    DashboardNativeFiltersStrategy,
     DashboardTagsStrategy,
     TopNDashboardsStrategy,
 )
 from superset.utils.urls import get_url_host
 
 from .base_tests import SupersetTestCase
+from .fixtures.query_context import get_query_context
 from .dashboard_utils import create_dashboard, create_slice, create_table_metadata
 from .fixtures.unicode_dashboard import (
     load_unicode_dashboard_with_slice,
@@ -82,6 +87,172 @@ class TestCacheWarmUp(SupersetTestCase):
         ]
         self.assertCountEqual(result, expected)
 
+    @pytest.mark.usefixtures(
+        "load_birth_names_dashboard_with_slices", "simple_data_cache"
+    )
+    def test_chart_data_usage_strategy(self):
+        db.session.query(Log).delete()
+        db.session.commit()
+        self.login(username="admin")
+        chart = db.session.query(Slice).filter_by(slice_name="Genders").first()
+        dash = self.get_dash_by_slug("births")
+
+        def get_payload(row_limit):
+            payload = get_query_context(
+                "birth_names",
+                form_data={"slice_id": chart.id, "dashboardId": dash.id},
+            )
+            payload["queries"][0]["row_limit"] = row_limit
+            return payload
+
+        # the query context isn't logged by default
+        rv = self.client.post("/api/v1/chart/data", json=get_payload(10))
+        self.assertEqual(rv.status_code, 200)
+        log = db.session.query(Log).filter_by(action="ChartDataRestApi.data").one()
+        self.assertEqual((log.slice_id, log.dashboard_id), (chart.id, dash.id))
+        self.assertNotIn("query_context", json.loads(log.json))
+        self.assertEqual(ChartDataUsageStrategy(top_n=1).get_payloads(), [])
+
+        # the same filters requested twice, with or without force, and others once
+        with patch.dict(self.app.config, {"LOG_CHART_DATA_QUERY_CONTEXT": True}):
+            for row_limit, force in ((10, False), (10, True), (5, False)):
+                payload = get_payload(row_limit)
+                payload["force"] = force
+                rv = self.client.post("/api/v1/chart/data", json=payload)
+                self.assertEqual(rv.status_code, 200)
+
+        strategy = ChartDataUsageStrategy(top_n=1)
+        payloads = strategy.get_payloads()
+        self.assertEqual(len(payloads), 1)
+        self.assertEqual(payloads[0]["chart_id"], chart.id)
+        self.assertEqual(payloads[0]["dashboard_id"], dash.id)
+        self.assertEqual(payloads[0]["query_context"]["queries"][0]["row_limit"], 10)
+
+        cache_manager.data_cache.clear()
+        warmed = json.dumps({"chart_id": chart.id, "dashboard_id": dash.id})
+        self.assertEqual(
+            strategy.warm_up(), {"warmed": [warmed], "skipped": [], "errors": []}
+        )
+        rv = self.client.post("/api/v1/chart/data", json=get_payload(10))
+        self.assertTrue(rv.json["result"][0]["is_cached"])
+
+        # out of time budget, nothing is warmed up
+        strategy = ChartDataUsageStrategy(top_n=1, time_budget=-1)
+        self.assertEqual(
+            strategy.warm_up(), {"warmed": [], "skipped": [warmed], "errors": []}
+        )
+
+    @pytest.mark.usefixtures(
+        "load_birth_names_dashboard_with_slices", "simple_data_cache"
+    )
+    def test_dashboard_native_filters_strategy(self):
+        dash = self.get_dash_by_slug("births")
+        chart = db.session.query(Slice).filter_by(slice_name="Genders").first()
+        json_metadata, query_context = dash.json_metadata, chart.query_context
+        try:
+            db.session.query(Log).delete()
+            table = self.get_table(name="birth_names")
+            dash.json_metadata = json.dumps(
+                {
+                    "native_filter_configuration": [
+                        {
+                            "id": "NATIVE_FILTER-1",
+                            "filterType": "filter_select",
+                            "targets": [
+                                {"datasetId": table.id, "column": {"name": "gender"}}
+                            ],
+                            "scope": {"rootPath": ["ROOT_ID"], "excluded": []},
+                        },
+                        # a filter without dataset isn't warmed up
+                        {
+                            "id": "NATIVE_FILTER-2",
+                            "filterType": "filter_select",
+                            "targets": [{"column": {"name": "state"}}],
+                            "scope": {"rootPath": ["ROOT_ID"], "excluded": []},
+                        },
+                    ]
+                }
+            )
+            chart.query_context = json.dumps(get_query_context("birth_names"))
+            db.session.commit()
+            self.login(username="admin")
+
+            # two requests filtered on boys, one unfiltered
+            boys = [{"col": "gender", "op": "IN", "val": ["boy"]}]
+            for filters in (boys, boys, []):
+                payload = get_query_context(
+                    "birth_names",
+                    form_data={
+                        "slice_id": chart.id,
+                        "dashboardId": dash.id,
+                        "extra_form_data": {"filters": filters},
+                    },
+                )
+                payload["queries"][0]["filters"] += filters
+                with patch.dict(
+                    self.app.config, {"LOG_CHART_DATA_QUERY_CONTEXT": True}
+                ):
+                    rv = self.client.post("/api/v1/chart/data", json=payload)
+                self.assertEqual(rv.status_code, 200)
+
+            select_filters = DashboardNativeFiltersStrategy.get_select_filters(dash)
+            self.assertEqual(
+                [native_filter["id"] for native_filter in select_filters],
+                ["NATIVE_FILTER-1"],
+            )
+
+            # the chart data requests aren't views of the dashboard
+            strategy = DashboardNativeFiltersStrategy(top_n=1, top_k=2)
+            self.assertEqual(strategy.get_payloads(), [])
+            rv = self.client.get(f"/superset/dashboard/{dash.id}/")
+            self.assertEqual(rv.status_code, 200)
+
+            # the picked value is completed by the other value of the column
+            payloads = strategy.get_payloads()
+            self.assertEqual(
+                [
+                    payload["query_context"]["form_data"]["extra_form_data"]["filters"]
+                    for payload in payloads
+                    if payload["chart_id"] == chart.id
+                ],
+                [
+                    [],
+                    [{"col": "gender", "op": "IN", "val": ["boy"]}],
+                    [{"col": "gender", "op": "IN", "val": ["girl"]}],
+                ],
+            )
+            self.assertEqual(
+                {payload["chart_id"] for payload in payloads},
+                {slc.id for slc in dash.slices if slc.query_context},
+            )
+            self.assertEqual(strategy.coverage, {dash.id: 1.0})
+
+            # out of budget, only the default filter state is warmed up
+            strategy = DashboardNativeFiltersStrategy(
+                top_n=1, top_k=2, max_queries=len(payloads) // 3
+            )
+            self.assertEqual(
+                strategy.get_payloads(),
+                [
+                    payload
+                    for payload in payloads
+                    if not payload["query_context"]["form_data"]["extra_form_data"][
+                        "filters"
+                    ]
+                ],
+            )
+            self.assertEqual(strategy.coverage, {dash.id: 1 / 3})
+
+            cache_manager.data_cache.clear()
+            strategy = DashboardNativeFiltersStrategy(top_n=1, top_k=2)
+            results = strategy.warm_up()
+            self.assertEqual(len(results["warmed"]), len(payloads))
+            self.assertEqual(results["errors"], [])
+            self.assertEqual(results["coverage"], {dash.id: 1.0})
+        finally:
+            dash.json_metadata, chart.query_context = json_metadata, query_context
+            db.session.commit()
+
     def reset_tag(self, tag):
         """Remove associated object from tag, used to reset tests"""
         if tag.objects:
@@ -407,6 +407,36 @@ class TestThumbnails(SupersetTestCase):
             rv = self.client.get(thumbnail_url)
             self.assertEqual(rv.status_code, 200)
             self.assertEqual(rv.data, self.mock_image)
+            self.assertNotIn("Accept", rv.vary)
+
+    @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
+    @with_feature_flags(THUMBNAILS=True)
+    @patch.dict(app.config, {"THUMBNAIL_IMAGE_FORMATS": ["webp"]})
+    def test_get_cached_screenshot_image_formats(self):
+        """
+        Thumbnails: Get cached screenshots varying with the accepted image formats
+        """
+        with patch.object(
+            ChartScreenshot, "get_from_cache", return_value=BytesIO(self.mock_image)
+        ), patch.object(
+            DashboardScreenshot, "get_from_cache", return_value=BytesIO(self.mock_image)
+        ), patch.object(
+            ChartScreenshot,
+            "get_from_cache_key",
+            return_value=BytesIO(self.mock_image),
+        ):
+            self.login(username="admin")
+            id_, chart_thumbnail_url = self._get_id_and_thumbnail_url(CHART_URL)
+            _, dashboard_thumbnail_url = self._get_id_and_thumbnail_url(DASHBOARD_URL)
+            for url in (
+                chart_thumbnail_url,
+                dashboard_thumbnail_url,
+                f"api/v1/chart/{id_}/screenshot/1234/",
+            ):
+                rv = self.client.get(url, headers={"Accept": "image/webp"})
+                self.assertEqual(rv.status_code, 200)
+                self.assertEqual(rv.mimetype, "image/webp")
+                self.assertIn("Accept", rv.vary)
 
     @pytest.mark.usefixtures("load_birth_names_dashboard_with_slices")
     @with_feature_flags(THUMBNAILS=True)
@@ -18,6 +18,7 @@
 
 from freezegun import freeze_time
 from pytest_mock import MockFixture
+from sqlalchemy.orm.session import Session
 
 
 def test_export_assets_command(mocker: MockFixture) -> None:
@@ -92,3 +93,119 @@ def test_export_assets_command(mocker: MockFixture) -> None:
         ("dashboards/sales.yaml", "<DASHBOARD CONTENTS>"),
         ("queries/example/metric.yaml", "<SAVED QUERY CONTENTS>"),
     ]
+
+
+def test_export_models_in_chunks(mocker: MockFixture, session: Session) -> None:
+    """
+    Test that models are exported in chunks, along with the related objects of each
+    chunk at once.
+    """
+    from superset.charts.commands import export
+    from superset.commands.export import models
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.daos.chart import ChartDAO
+    from superset.models.core import Database
+    from superset.models.slice import Slice
+
+    Slice.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    database = Database(database_name="my_database", sqlalchemy_uri="sqlite://")
+    dataset = SqlaTable(table_name="my_table", database=database)
+    charts = [
+        Slice(
+            slice_name=f"chart_{i}",
+            datasource_type="table",
+            table=dataset,
+            viz_type="table",
+            params="{}",
+        )
+        for i in range(3)
+    ]
+    session.add_all(charts)
+    session.flush()
+
+    mocker.patch.object(models, "CHUNK_SIZE", 2)
+    mocker.patch.object(ChartDAO, "find_by_ids", return_value=charts)
+    ExportDatasetsCommand = mocker.patch.object(export, "ExportDatasetsCommand")
+    ExportDatasetsCommand.return_value.run.return_value = [
+        ("metadata.yaml", "<METADATA>"),
+        ("datasets/my_database/my_table.yaml", "<DATASET CONTENTS>"),
+    ]
+
+    command = export.ExportChartsCommand([chart.id for chart in charts])
+    file_names = [file_name for file_name, _ in command.run()]
+
+    assert file_names == [
+        "metadata.yaml",
+        f"charts/chart_0_{charts[0].id}.yaml",
+        f"charts/chart_1_{charts[1].id}.yaml",
+        "datasets/my_database/my_table.yaml",
+        f"charts/chart_2_{charts[2].id}.yaml",
+    ]
+    assert ExportDatasetsCommand.call_args_list == [
+        mocker.call([dataset.id]),
+        mocker.call([dataset.id]),
+    ]
+
+
+def test_export_dashboards_native_filter_datasets(
+    mocker: MockFixture, session: Session
+) -> None:
+    """
+    Test that the datasets of the native filters are looked up once per chunk of
+    dashboards, rather than once per filter.
+    """
+    import json
+
+    import yaml
+
+    from superset.commands.export import models
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.daos.dashboard import DashboardDAO
+    from superset.daos.dataset import DatasetDAO
+    from superset.dashboards.commands import export
+    from superset.models.core import Database
+    from superset.models.dashboard import Dashboard
+
+    Dashboard.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    database = Database(database_name="my_database", sqlalchemy_uri="sqlite://")
+    dataset = SqlaTable(table_name="my_table", database=database)
+    session.add(dataset)
+    session.flush()
+    native_filter = {
+        "id": "NATIVE_FILTER-1",
+        "targets": [{"datasetId": dataset.id, "column": {"name": "a"}}],
+    }
+    dashboards = [
+        Dashboard(
+            dashboard_title=f"dashboard_{i}",
+            json_metadata=json.dumps({"native_filter_configuration": [native_filter]}),
+        )
+        for i in range(3)
+    ]
+    session.add_all(dashboards)
+    session.flush()
+
+    mocker.patch.object(models, "CHUNK_SIZE", 2)
+    mocker.patch.object(DashboardDAO, "find_by_ids", return_value=dashboards)
+    find_by_id = mocker.spy(DatasetDAO, "find_by_id")
+    find_by_ids = mocker.patch.object(DatasetDAO, "find_by_ids", return_value=[dataset])
+    ExportDatasetsCommand = mocker.patch.object(export, "ExportDatasetsCommand")
+    ExportDatasetsCommand.return_value.run.return_value = []
+
+    command = export.ExportDashboardsCommand([dashboard.id for dashboard in dashboards])
+    contents = dict(command.run())
+
+    for i, dashboard in enumerate(dashboards):
+        file_name = f"dashboards/dashboard_{i}_{dashboard.id}.yaml"
+        payload = yaml.safe_load(contents[file_name])
+        [target] = payload["metadata"]["native_filter_configuration"][0]["targets"]
+        assert target == {"datasetUuid": str(dataset.uuid), "column": {"name": "a"}}
+    find_by_id.assert_not_called()
+    assert find_by_ids.call_args_list == [
+        mocker.call([dataset.id]),
+        mocker.call([dataset.id]),
+    ]
+    assert ExportDatasetsCommand.call_args_list == [
+        mocker.call([dataset.id]),
+        mocker.call([dataset.id]),
+    ]
@@ -139,3 +139,46 @@ def test_import_removes_dashboard_charts(mocker: MockFixture, session: Session)
 
     assert len(chart_ids) == expected_number_of_charts
     assert len(dashboard_ids) == expected_number_of_dashboards
+
+
+def test_import_assets_prefetching(mocker: MockFixture, session: Session) -> None:
+    """
+    Test that importing assets again with the existing models prefetched updates
+    them instead of duplicating them, as without prefetching.
+    """
+    from superset import security_manager
+    from superset.commands.importers.v1.assets import ImportAssetsCommand
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.core import Database
+    from superset.models.dashboard import Dashboard, dashboard_slices
+    from superset.models.helpers import prefetching
+    from superset.models.slice import Slice
+
+    mocker.patch.object(security_manager, "can_access", return_value=True)
+
+    engine = session.get_bind()
+    Slice.metadata.create_all(engine)  # pylint: disable=no-member
+    configs = {
+        **copy.deepcopy(databases_config),
+        **copy.deepcopy(datasets_config),
+        **copy.deepcopy(charts_config_1),
+        **copy.deepcopy(dashboards_config_1),
+    }
+
+    def get_ids() -> dict[str, list[int]]:
+        return {
+            model.__name__: sorted(id_ for (id_,) in session.query(model.id))
+            for model in (Database, SqlaTable, Slice, Dashboard)
+        }
+
+    ImportAssetsCommand._import(session, copy.deepcopy(configs))
+    ids = get_ids()
+    relationships = session.execute(select(dashboard_slices)).fetchall()
+
+    with prefetching(session):
+        ImportAssetsCommand._import(session, copy.deepcopy(configs))
+
+    assert get_ids() == ids
+    assert len(ids["Slice"]) == len(charts_config_1)
+    assert len(ids["Dashboard"]) == len(dashboards_config_1)
+    assert session.execute(select(dashboard_slices)).fetchall() == relationships
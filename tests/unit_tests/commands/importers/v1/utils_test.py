@@ -0,0 +1,71 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+
+import copy
+
+import yaml
+from pytest_mock import MockFixture
+from sqlalchemy.orm.session import Session
+
+from tests.unit_tests.fixtures.assets_configs import (
+    charts_config_1,
+    dashboards_config_1,
+    datasets_config,
+)
+
+
+def test_load_configs(mocker: MockFixture, session: Session) -> None:
+    """
+    Test that the configs are loaded with the C YAML parser, when available.
+    """
+    from superset.charts.schemas import ImportV1ChartSchema
+    from superset.commands.importers.v1 import utils
+    from superset.dashboards.schemas import ImportV1DashboardSchema
+    from superset.datasets.schemas import ImportV1DatasetSchema
+    from superset.models.core import Database
+
+    Database.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+
+    contents = {
+        file_name: yaml.safe_dump(
+            {
+                key: str(value) if key.endswith("uuid") else value
+                for key, value in config.items()
+            }
+        )
+        for file_name, config in copy.deepcopy(
+            {**datasets_config, **charts_config_1, **dashboards_config_1}
+        ).items()
+    }
+    contents["charts/invalid.yaml"] = "slice_name: [1, 2]"
+    schemas = {
+        "charts/": ImportV1ChartSchema(),
+        "dashboards/": ImportV1DashboardSchema(),
+        "datasets/": ImportV1DatasetSchema(),
+    }
+
+    load_yaml = mocker.spy(utils.yaml, "load")
+    exceptions: list = []
+    configs = utils.load_configs(contents, schemas, {}, exceptions, {}, {}, {})
+
+    assert len(configs) == len(contents) - 1
+    assert [list(exc.messages) for exc in exceptions] == [["charts/invalid.yaml"]]
+    assert load_yaml.call_count == len(contents)
+    assert load_yaml.call_args.kwargs["Loader"] is getattr(
+        yaml, "CSafeLoader", yaml.SafeLoader
+    )
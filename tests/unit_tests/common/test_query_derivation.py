@@ -0,0 +1,390 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=invalid-name
+import sqlite3
+from datetime import datetime
+from typing import Any, Optional
+
+import pandas as pd
+import pytest
+
+from superset.common.utils.query_derivation import get_derivation, get_reaggregation
+from superset.utils.core import get_column_name, get_metric_name
+
+
+def simple_metric(aggregate: str, column: str = "num") -> dict[str, Any]:
+    return {
+        "expressionType": "SIMPLE",
+        "aggregate": aggregate,
+        "column": {"column_name": column},
+        "label": f"{aggregate}({column})",
+    }
+
+
+def axis(time_grain: Optional[str]) -> dict[str, Any]:
+    return {
+        "columnType": "BASE_AXIS",
+        "expressionType": "SQL",
+        "label": "ts",
+        "sqlExpression": "ts",
+        "timeGrain": time_grain,
+    }
+
+
+SUM = simple_metric("SUM")
+MIN = simple_metric("MIN")
+MAX = simple_metric("MAX")
+AVG = simple_metric("AVG")
+COUNT_DISTINCT = simple_metric("COUNT_DISTINCT")
+SAVED_METRICS = {"count": "COUNT(*)", "distinct": "COUNT(DISTINCT num)"}
+
+AGGREGATES = {
+    "SUM(num)": "SUM(num)",
+    "count": "COUNT(*)",
+    "MIN(num)": "MIN(num)",
+    "MAX(num)": "MAX(num)",
+    "AVG(num)": "AVG(num)",
+}
+TIME_GRAINS = {None: "ts", "P1D": "date(ts)", "P1M": "strftime('%Y-%m-01', ts)"}
+
+ROWS = [
+    ("a", "boy", "2020-01-01 10:00:00", 1),
+    ("a", "girl", "2020-01-01 11:00:00", 2),
+    ("a", "girl", "2020-01-02 11:00:00", None),
+    ("a", None, "2020-02-03 11:00:00", 4),
+    ("b", "boy", "2020-01-31 23:00:00", 5),
+    ("b", "boy", "2020-03-01 00:00:00", 6),
+    ("b", "girl", "2020-03-15 00:00:00", None),
+    (None, "girl", "2020-01-05 00:00:00", 8),
+    (None, None, "2020-04-05 00:00:00", 9),
+]
+
+
+def query_obj(**kwargs: Any) -> dict[str, Any]:
+    return {
+        "apply_fetch_values_predicate": False,
+        "columns": ["country", "gender", axis("P1D")],
+        "extras": {"having": "", "where": ""},
+        "filter": [],
+        "from_dttm": datetime(2020, 1, 1),
+        "granularity": "ts",
+        "inner_from_dttm": None,
+        "inner_to_dttm": None,
+        "is_rowcount": False,
+        "is_timeseries": False,
+        "metrics": [SUM, "count", MIN, MAX, AVG],
+        "order_desc": True,
+        "orderby": [],
+        "row_limit": 1000,
+        "row_offset": 0,
+        "series_columns": [],
+        "series_limit": 0,
+        "series_limit_metric": None,
+        "to_dttm": datetime(2021, 1, 1),
+        "time_shift": None,
+        **kwargs,
+    }
+
+
+def get_labels(obj: dict[str, Any]) -> list[str]:
+    return [get_column_name(column) for column in obj["columns"]] + [
+        get_metric_name(metric) for metric in obj["metrics"]
+    ]
+
+
+def to_sql(obj: dict[str, Any]) -> str:
+    """
+    Compile the query objects of these tests to SQLite.
+    """
+    columns = [
+        f"{TIME_GRAINS[column['timeGrain']]} AS ts"
+        if isinstance(column, dict)
+        else column
+        for column in obj["columns"]
+    ]
+    metrics = [
+        f'{AGGREGATES[get_metric_name(metric)]} AS "{get_metric_name(metric)}"'
+        for metric in obj["metrics"]
+    ]
+    where = []
+    for flt in obj["filter"]:
+        values = flt.get("val")
+        values = values if isinstance(values, list) else [values]
+        values_sql = ", ".join(
+            f"'{value}'" if isinstance(value, str) else str(value) for value in values
+        )
+        where.append(
+            f"{flt['col']} {flt['op']}"
+            if flt["op"] in ("IS NULL", "IS NOT NULL")
+            else f"{flt['col']} {flt['op']} ({values_sql})"
+        )
+    sql = f"SELECT {', '.join(columns + metrics)} FROM t"
+    if where:
+        sql += f" WHERE {' AND '.join(where)}"
+    if obj["columns"]:
+        sql += f" GROUP BY {', '.join(column.split(' AS ')[0] for column in columns)}"
+    if obj["orderby"]:
+        sql += " ORDER BY " + ", ".join(
+            f'"{get_metric_name(metric)}" {"ASC" if ascending else "DESC"}'
+            for metric, ascending in obj["orderby"]
+        )
+    if obj["row_limit"]:
+        sql += f" LIMIT {obj['row_limit']}"
+    return sql
+
+
+@pytest.fixture
+def connection() -> sqlite3.Connection:
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE t (country TEXT, gender TEXT, ts TEXT, num INT)")
+    connection.executemany("INSERT INTO t VALUES (?, ?, ?, ?)", ROWS)
+    return connection
+
+
+def run(connection: sqlite3.Connection, obj: dict[str, Any]) -> pd.DataFrame:
+    df = pd.read_sql_query(to_sql(obj), connection)
+    df.columns = get_labels(obj)
+    return df
+
+
+def normalize(df: pd.DataFrame, ordered: bool) -> list[tuple[Any, ...]]:
+    df = df.copy()
+    if "ts" in df:
+        df["ts"] = pd.to_datetime(df["ts"])
+    df = df.astype(object).where(df.notna(), None)
+    rows = [
+        tuple(float(value) if isinstance(value, int) else value for value in row)
+        for row in df.itertuples(index=False, name=None)
+    ]
+    return rows if ordered else sorted(rows, key=repr)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        # fewer groupby columns
+        {"columns": ["country"], "metrics": [SUM, "count", MIN, MAX]},
+        {"columns": ["gender", axis("P1D")], "metrics": [SUM, "count"]},
+        # no groupby columns
+        {"columns": [], "metrics": [SUM, "count", MIN, MAX]},
+        # extra filters
+        {"filter": [{"col": "country", "op": "IN", "val": ["a", "b"]}]},
+        {"filter": [{"col": "country", "op": "==", "val": "a"}]},
+        {
+            "columns": ["country"],
+            "metrics": [SUM, "count"],
+            "filter": [{"col": "gender", "op": "!=", "val": "boy"}],
+        },
+        {
+            "columns": ["country"],
+            "metrics": ["count"],
+            "filter": [{"col": "gender", "op": "NOT IN", "val": ["boy"]}],
+        },
+        {
+            "columns": ["gender"],
+            "metrics": [SUM],
+            "filter": [{"col": "country", "op": "IS NULL"}],
+        },
+        {
+            "columns": [],
+            "metrics": [SUM, "count", MAX],
+            "filter": [{"col": "country", "op": "==", "val": "c"}],
+        },
+        # coarser time grain
+        {"columns": ["country", axis("P1M")], "metrics": [SUM, "count", MIN, MAX]},
+        {"columns": [axis("P1M")], "metrics": ["count"]},
+        # no rows are collapsed, so any metric can be derived
+        {"metrics": [AVG], "filter": [{"col": "gender", "op": "==", "val": "girl"}]},
+        {"metrics": [AVG, "count"], "row_limit": 10000},
+    ],
+)
+def test_derived_result(connection: sqlite3.Connection, kwargs: dict[str, Any]) -> None:
+    cached_obj = query_obj()
+    cached_df = run(connection, cached_obj)
+    obj = query_obj(**kwargs)
+
+    derivation = get_derivation(
+        obj,
+        get_labels(obj),
+        cached_obj,
+        list(cached_df.columns),
+        len(cached_df),
+        SAVED_METRICS,
+    )
+
+    assert derivation is not None
+    derived_df = derivation.apply(cached_df)
+    assert derived_df is not None
+    assert list(derived_df.columns) == get_labels(obj)
+    assert normalize(derived_df, False) == normalize(run(connection, obj), False)
+
+
+def test_derived_result_from_raw_timestamps(connection: sqlite3.Connection) -> None:
+    cached_obj = query_obj(columns=["country", axis(None)])
+    cached_df = run(connection, cached_obj)
+    obj = query_obj(columns=[axis("P1M")], metrics=[SUM, MIN])
+
+    derivation = get_derivation(
+        obj,
+        get_labels(obj),
+        cached_obj,
+        list(cached_df.columns),
+        len(cached_df),
+        SAVED_METRICS,
+    )
+
+    assert derivation is not None
+    derived_df = derivation.apply(cached_df)
+    assert normalize(derived_df, False) == normalize(run(connection, obj), False)
+
+
+def test_derived_result_order_and_limit(connection: sqlite3.Connection) -> None:
+    cached_obj = query_obj()
+    cached_df = run(connection, cached_obj)
+    obj = query_obj(
+        columns=["country"],
+        metrics=["count", MAX],
+        orderby=[("count", False)],
+        row_limit=2,
+    )
+
+    derivation = get_derivation(
+        obj,
+        get_labels(obj),
+        cached_obj,
+        list(cached_df.columns),
+        len(cached_df),
+        SAVED_METRICS,
+    )
+
+    assert derivation is not None
+    derived_df = derivation.apply(cached_df)
+    assert normalize(derived_df, True) == normalize(run(connection, obj), True)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        # metrics that can't be aggregated again
+        {"columns": ["country"], "metrics": [AVG]},
+        {"columns": ["country"], "metrics": [COUNT_DISTINCT]},
+        {"columns": ["country"], "metrics": ["distinct"]},
+        # metric not in the cached result
+        {"metrics": [simple_metric("SUM", "other")]},
+        # column not in the cached result
+        {"columns": ["country", "state"]},
+        # filter on a column the cached result isn't grouped by
+        {"filter": [{"col": "state", "op": "==", "val": "a"}]},
+        # filter on the time column
+        {"filter": [{"col": "ts", "op": "==", "val": "2020-01-01"}]},
+        # filters that aren't evaluated in pandas
+        {"filter": [{"col": "country", "op": "LIKE", "val": "a%"}]},
+        {"filter": [{"col": "country", "op": ">", "val": "a"}]},
+        {"filter": [{"col": "country", "op": "IN", "val": []}]},
+        {"filter": [{"col": "country", "op": "IN", "val": ["<NULL>"]}]},
+        # different time range, granularity or extras
+        {"to_dttm": datetime(2020, 6, 1)},
+        {"granularity": None},
+        {"extras": {"having": "", "where": "num > 1"}},
+        {"extras": {"having": "SUM(num) > 1", "where": ""}},
+        # time grains that don't nest
+        {"columns": ["country", "gender", axis("P1W")]},
+        {"columns": ["country", "gender", axis("PT1H")]},
+        # ordering by a column
+        {"orderby": [("country", True)]},
+        # series limits, offsets and row counts
+        {"series_limit": 10, "series_columns": ["country"]},
+        {"row_offset": 10},
+        {"is_rowcount": True},
+        {"is_timeseries": True},
+        # raw records
+        {"metrics": []},
+    ],
+)
+def test_not_derivable(connection: sqlite3.Connection, kwargs: dict[str, Any]) -> None:
+    cached_obj = query_obj()
+    cached_df = run(connection, cached_obj)
+    obj = query_obj(**kwargs)
+
+    assert (
+        get_derivation(
+            obj,
+            get_labels(obj),
+            cached_obj,
+            list(cached_df.columns),
+            len(cached_df),
+            SAVED_METRICS,
+        )
+        is None
+    )
+
+
+def test_not_derivable_from_truncated_result(connection: sqlite3.Connection) -> None:
+    cached_obj = query_obj(row_limit=len(ROWS) - 1)
+    cached_df = run(connection, cached_obj)
+    obj = query_obj(columns=["country"], metrics=[SUM])
+
+    assert len(cached_df) == cached_obj["row_limit"]
+    assert (
+        get_derivation(
+            obj,
+            get_labels(obj),
+            cached_obj,
+            list(cached_df.columns),
+            len(cached_df),
+            SAVED_METRICS,
+        )
+        is None
+    )
+
+
+def test_not_derivable_when_types_differ(connection: sqlite3.Connection) -> None:
+    cached_obj = query_obj()
+    cached_df = run(connection, cached_obj)
+    obj = query_obj(filter=[{"col": "country", "op": "==", "val": 1}])
+
+    derivation = get_derivation(
+        obj,
+        get_labels(obj),
+        cached_obj,
+        list(cached_df.columns),
+        len(cached_df),
+        SAVED_METRICS,
+    )
+
+    assert derivation is not None
+    assert derivation.apply(cached_df) is None
+
+
+@pytest.mark.parametrize(
+    "metric,expected",
+    [
+        (SUM, "SUM"),
+        (simple_metric("count"), "COUNT"),
+        (AVG, None),
+        (COUNT_DISTINCT, None),
+        ({"expressionType": "SQL", "sqlExpression": "sum(num)"}, "SUM"),
+        ({"expressionType": "SQL", "sqlExpression": 'MAX("num")'}, "MAX"),
+        ({"expressionType": "SQL", "sqlExpression": "SUM(num) / 2"}, None),
+        ({"expressionType": "SQL", "sqlExpression": "COUNT(DISTINCT num)"}, None),
+        ("count", "COUNT"),
+        ("distinct", None),
+        ("unknown", None),
+    ],
+)
+def test_get_reaggregation(metric: Any, expected: Optional[str]) -> None:
+    assert get_reaggregation(metric, SAVED_METRICS) == expected
@@ -17,7 +17,8 @@
 
 # pylint: disable=import-outside-toplevel, invalid-name, unused-argument, redefined-outer-name
 
-from typing import TYPE_CHECKING
+import json
+from typing import Any, TYPE_CHECKING
 
 import pytest
 from marshmallow import fields, Schema, ValidationError
@@ -225,3 +226,56 @@ def test_rename_encrypted_extra() -> None:
         "configuration_method": ConfigurationMethod.SQLALCHEMY_FORM,
         "masked_encrypted_extra": "{}",
     }
+
+
+@pytest.mark.parametrize(
+    "concurrency_limit",
+    [
+        [50],
+        None,
+        {"max_queries": True},
+        {"max_queries": 1.5},
+        {"max_queries": "50"},
+        {"max_queries": 0},
+        {"max_background_queries": -1},
+        {"queue_timeout": 0},
+        {"queue_timeout": "60"},
+        {"queue_timeout": False},
+        {"max_running_queries": 10},
+    ],
+)
+def test_invalid_concurrency_limit(concurrency_limit: Any) -> None:
+    """
+    Test that invalid concurrency limits are rejected, when saving and importing.
+    """
+    from superset.databases.schemas import (
+        extra_validator,
+        ImportV1DatabaseExtraSchema,
+    )
+
+    with pytest.raises(ValidationError):
+        extra_validator(json.dumps({"concurrency_limit": concurrency_limit}))
+    with pytest.raises(ValidationError):
+        ImportV1DatabaseExtraSchema().load({"concurrency_limit": concurrency_limit})
+
+
+def test_valid_concurrency_limit() -> None:
+    """
+    Test that valid concurrency limits are accepted, when saving and importing.
+    """
+    from superset.databases.schemas import (
+        extra_validator,
+        ImportV1DatabaseExtraSchema,
+    )
+
+    concurrency_limit = {
+        "max_queries": 50,
+        "max_background_queries": 10,
+        "queue_timeout": 0.5,
+    }
+    extra = json.dumps({"concurrency_limit": concurrency_limit})
+
+    assert extra_validator(extra) == extra
+    assert ImportV1DatabaseExtraSchema().load(
+        {"concurrency_limit": concurrency_limit}
+    ) == {"concurrency_limit": concurrency_limit}
@@ -502,6 +502,77 @@ def test_import_column_allowed_data_url(
     ).fetchall()
 
 
+@patch("superset.datasets.commands.importers.v1.utils.request")
+def test_import_dataset_data_loads(
+    request: Mock,
+    mocker: MockFixture,
+    session: Session,
+) -> None:
+    """
+    Test that the data of datasets is loaded concurrently after their import.
+    """
+    import io
+
+    from superset import security_manager
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.datasets.commands.importers.v1.utils import (
+        import_dataset,
+        load_data_concurrently,
+    )
+    from superset.datasets.schemas import ImportV1DatasetSchema
+    from superset.models.core import Database
+
+    request.urlopen.side_effect = lambda data_uri: io.StringIO(
+        f"col1\n{data_uri.rsplit('/', 1)[-1]}\n"
+    )
+
+    mocker.patch.object(security_manager, "can_access", return_value=True)
+
+    engine = session.get_bind()
+    SqlaTable.metadata.create_all(engine)  # pylint: disable=no-member
+
+    database = Database(database_name="my_database", sqlalchemy_uri="sqlite://")
+    session.add(database)
+    session.flush()
+
+    schema = ImportV1DatasetSchema()
+    data_loads: list[tuple[str, SqlaTable]] = []
+    for table_name in ("my_table", "my_other_table"):
+        dataset_config = schema.load(
+            {
+                "version": "1.0.0",
+                "table_name": table_name,
+                "schema": None,
+                "sql": None,
+                "uuid": uuid.uuid4(),
+                "metrics": [],
+                "columns": [
+                    {
+                        "column_name": "col1",
+                        "is_dttm": False,
+                        "type": "TEXT",
+                    }
+                ],
+                "database_uuid": database.uuid,
+                "data": f"https://some-external-url.com/{table_name}",
+            }
+        )
+        dataset_config["database_id"] = database.id
+        import_dataset(session, dataset_config, force_data=True, data_loads=data_loads)
+
+    assert [data_uri for data_uri, _ in data_loads] == [
+        "https://some-external-url.com/my_table",
+        "https://some-external-url.com/my_other_table",
+    ]
+    request.urlopen.assert_not_called()
+
+    load_data_concurrently(data_loads, session)
+    for table_name in ("my_table", "my_other_table"):
+        assert session.execute(f"SELECT * FROM {table_name}").fetchall() == [
+            (table_name,)
+        ]
+
+
 def test_import_dataset_managed_externally(
     mocker: MockFixture,
     session: Session,
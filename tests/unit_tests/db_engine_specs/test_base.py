@@ -16,10 +16,13 @@
 # under the License.
 # pylint: disable=unused-argument, import-outside-toplevel, protected-access
 
+from pathlib import Path
 from textwrap import dedent
 from typing import Any, Optional
 
+import pandas as pd
 import pytest
+from pytest_mock import MockerFixture
 from sqlalchemy import types
 
 from superset.superset_typing import ResultSetColumnType, SQLAColumnType
@@ -168,3 +171,140 @@ def test_convert_inspector_columns(
     from superset.db_engine_specs.base import convert_inspector_columns
 
     assert convert_inspector_columns(cols) == expected_result
+
+
+def test_chunked_df_to_sql(tmp_path: Path) -> None:
+    """
+    Test that chunked uploads honor ``if_exists`` and append the following chunks.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.models.core import Database
+    from superset.sql_parse import Table
+
+    database = Database(
+        database_name="db", sqlalchemy_uri=f"sqlite:///{tmp_path / 'test.db'}"
+    )
+    table = Table("tbl")
+    chunks = [
+        pd.DataFrame({"a": [1, 2], "b": ["x", None]}),
+        pd.DataFrame({"a": [3], "b": ["z"]}),
+    ]
+
+    for _ in range(2):
+        rows = BaseEngineSpec.chunked_df_to_sql(
+            database,
+            table,
+            iter(chunks),
+            {"if_exists": "replace", "index": False},
+        )
+        assert rows == 3
+        assert database.get_df("SELECT * FROM tbl").to_dict(orient="list") == {
+            "a": [1, 2, 3],
+            "b": ["x", None, "z"],
+        }
+
+
+def test_chunked_df_to_sql_not_supported(mocker: MockerFixture) -> None:
+    """
+    Test that engines which can't append receive a single DataFrame.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.sql_parse import Table
+
+    mocker.patch.object(BaseEngineSpec, "supports_chunked_upload", False)
+    df_to_sql = mocker.patch.object(BaseEngineSpec, "df_to_sql")
+    database = mocker.MagicMock()
+    chunks = [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3]})]
+
+    rows = BaseEngineSpec.chunked_df_to_sql(
+        database, Table("tbl"), iter(chunks), {"if_exists": "fail"}
+    )
+
+    assert rows == 3
+    df_to_sql.assert_called_once()
+    assert df_to_sql.call_args[0][2]["a"].tolist() == [1, 2, 3]
+    assert df_to_sql.call_args[0][3] == {"if_exists": "fail"}
+
+
+def test_column_type_mutators() -> None:
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+
+    class MutatingEngineSpec(BaseEngineSpec):
+        column_type_mutators = {types.Integer: lambda val: val * 10}
+
+    data = [(1, "a", 2), (3, "b", 4)]
+    description = [("x", "INTEGER"), ("y", "VARCHAR"), ("x", "INTEGER")]
+
+    column_mutators = MutatingEngineSpec.get_column_mutators(description)
+    assert list(column_mutators) == [0, 2]
+    assert MutatingEngineSpec.mutate_columns(data, column_mutators) == [
+        (10, "a", 20),
+        (30, "b", 40),
+    ]
+    assert MutatingEngineSpec.mutate_columns([], column_mutators) == []
+
+    result_set = SupersetResultSet(data, description, MutatingEngineSpec)
+    assert result_set.to_pandas_df().to_dict(orient="records") == [
+        {"x": 10, "y": "a", "x__1": 20},
+        {"x": 30, "y": "b", "x__1": 40},
+    ]
+
+
+def test_chunked_df_to_sql_dtypes(tmp_path: Path) -> None:
+    """
+    Test that all the chunks are uploaded with the dtypes of the first one.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.models.core import Database
+    from superset.sql_parse import Table
+
+    database = Database(
+        database_name="db", sqlalchemy_uri=f"sqlite:///{tmp_path / 'test.db'}"
+    )
+    chunks = [
+        pd.DataFrame({"a": [1, 2], "b": [None, None]}),
+        pd.DataFrame({"a": [None, 4.0], "b": ["y", "z"]}),
+    ]
+
+    rows = BaseEngineSpec.chunked_df_to_sql(
+        database, Table("tbl"), iter(chunks), {"if_exists": "fail", "index": False}
+    )
+
+    assert rows == 4
+    assert database.get_df("SELECT typeof(a) AS a, b FROM tbl").to_dict(
+        orient="list"
+    ) == {"a": ["integer", "integer", "null", "integer"], "b": [None, None, "y", "z"]}
+
+
+def test_chunked_df_to_sql_replace_failure(tmp_path: Path) -> None:
+    """
+    Test that a table is left untouched when the upload replacing it fails.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.exceptions import SupersetException
+    from superset.models.core import Database
+    from superset.sql_parse import Table
+
+    database = Database(
+        database_name="db", sqlalchemy_uri=f"sqlite:///{tmp_path / 'test.db'}"
+    )
+    table = Table("tbl")
+    BaseEngineSpec.chunked_df_to_sql(
+        database,
+        table,
+        iter([pd.DataFrame({"a": [1]})]),
+        {"if_exists": "fail", "index": False},
+    )
+
+    with pytest.raises(SupersetException, match="Rows 3 to 3 don't match"):
+        BaseEngineSpec.chunked_df_to_sql(
+            database,
+            table,
+            iter([pd.DataFrame({"a": [2, 3]}), pd.DataFrame({"a": ["x"]})]),
+            {"if_exists": "replace", "index": False},
+        )
+
+    with database.get_inspector_with_context() as inspector:
+        assert inspector.get_table_names() == ["tbl"]
+    assert database.get_df("SELECT * FROM tbl")["a"].tolist() == [1]
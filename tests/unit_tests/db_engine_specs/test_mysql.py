@@ -255,8 +255,5 @@ def test_column_type_mutator(
 ):
     from superset.db_engine_specs.mysql import MySQLEngineSpec as spec
 
-    mock_cursor = Mock()
-    mock_cursor.fetchall.return_value = data
-    mock_cursor.description = description
-
-    assert spec.fetch_data(mock_cursor) == expected_result
+    column_mutators = spec.get_column_mutators(description)
+    assert spec.mutate_columns(data, column_mutators) == expected_result
@@ -173,3 +173,51 @@ SELECT * FROM some_table;
         str(excinfo.value)
         == "Users are not allowed to set a search path for security reasons."
     )
+
+
+def test_get_df_to_sql_method(mocker: MockFixture) -> None:
+    """
+    Test that uploads use ``COPY`` only with psycopg2.
+    """
+    from superset.db_engine_specs.cockroachdb import CockroachDbEngineSpec
+    from superset.db_engine_specs.postgres import copy_from_stdin, PostgresEngineSpec
+
+    engine = mocker.MagicMock()
+    engine.dialect.driver = "psycopg2"
+    assert PostgresEngineSpec.get_df_to_sql_method(engine) is copy_from_stdin
+    assert CockroachDbEngineSpec.get_df_to_sql_method(engine) != copy_from_stdin
+
+    engine.dialect.driver = "pg8000"
+    engine.dialect.supports_multivalues_insert = True
+    assert PostgresEngineSpec.get_df_to_sql_method(engine) == "multi"
+
+
+def test_copy_from_stdin(mocker: MockFixture) -> None:
+    """
+    Test the ``COPY ... FROM STDIN`` insertion method.
+    """
+    from sqlalchemy.dialects.postgresql.base import PGDialect
+
+    from superset.db_engine_specs.postgres import copy_from_stdin
+
+    pd_table = mocker.MagicMock()
+    pd_table.name = "my table"
+    pd_table.schema = "public"
+    conn = mocker.MagicMock()
+    conn.dialect = PGDialect()
+    cursor = conn.connection.cursor.return_value.__enter__.return_value
+    buffers = []
+    cursor.copy_expert.side_effect = lambda sql, buffer: buffers.append(buffer.read())
+
+    copy_from_stdin(
+        pd_table,
+        conn,
+        ["a", "b"],
+        iter([(1, "x"), (2, None), (3, ""), (4, 'with "quotes", commas')]),
+    )
+
+    cursor.copy_expert.assert_called_once()
+    assert cursor.copy_expert.call_args[0][0] == (
+        "COPY public.\"my table\" (a, b) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    )
+    assert buffers == ['1,x\r\n2,\\N\r\n3,\r\n4,"with ""quotes"", commas"\r\n']
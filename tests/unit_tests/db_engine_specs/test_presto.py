@@ -14,16 +14,20 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from copy import deepcopy
 from datetime import datetime
 from typing import Any, Optional
 from unittest import mock
 
+import pandas as pd
 import pytest
 import pytz
 from pyhive.sqlalchemy_presto import PrestoDialect
+from pytest_mock import MockerFixture
 from sqlalchemy import sql, text, types
 from sqlalchemy.engine.url import make_url
 
+from superset.exceptions import SupersetTemplateException
 from superset.superset_typing import ResultSetColumnType
 from superset.utils.core import GenericDataType
 from tests.unit_tests.db_engine_specs.utils import (
@@ -151,3 +155,137 @@ def test_where_latest_partition(
     )
 
     assert str(actual) == expected
+
+
+def test_latest_partition_cache(mocker: MockerFixture) -> None:
+    """
+    Test that partition lookups are cached per table and can be invalidated.
+    """
+    from cachelib.simple import SimpleCache
+
+    from superset.db_engine_specs.presto import PrestoEngineSpec as spec
+
+    cache_manager = mocker.patch("superset.db_engine_specs.presto.cache_manager")
+    cache_manager.data_cache = SimpleCache()
+
+    database = mocker.MagicMock()
+    database.id = 1
+    database.get_extra.return_value = {}
+    database.get_indexes.return_value = [{"column_names": ["ds", "event_type"]}]
+    database.get_df.return_value = pd.DataFrame(
+        {"ds": ["2023-05-01"], "event_type": ["click"]}
+    )
+
+    expected = (["ds", "event_type"], ("2023-05-01", "click"))
+    assert spec.latest_partition("table", "schema", database, True) == expected
+    assert spec.latest_partition("table", "schema", database, True) == expected
+    assert database.get_df.call_count == 1
+
+    # the cached value is still validated against the partition keys
+    with pytest.raises(SupersetTemplateException):
+        spec.latest_partition("table", "schema", database)
+    assert database.get_df.call_count == 1
+
+    assert (
+        spec.latest_sub_partition("table", "schema", database, event_type="click")
+        == "2023-05-01"
+    )
+    assert (
+        spec.latest_sub_partition("table", "schema", database, event_type="click")
+        == "2023-05-01"
+    )
+    assert database.get_df.call_count == 2
+
+    # other tables have their own entries
+    spec.latest_partition("other_table", "schema", database, True)
+    assert database.get_df.call_count == 3
+
+    spec.invalidate_partition_cache("table", "schema", database)
+    spec.latest_partition("table", "schema", database, True)
+    assert database.get_df.call_count == 4
+
+
+@pytest.mark.parametrize("app", [{"PARTITION_CACHE_TIMEOUT": 0}], indirect=True)
+def test_latest_partition_cache_disabled(mocker: MockerFixture) -> None:
+    """
+    Test that partition lookups are not cached when the timeout is 0.
+    """
+    from superset.db_engine_specs.presto import PrestoEngineSpec as spec
+
+    cache_manager = mocker.patch("superset.db_engine_specs.presto.cache_manager")
+
+    database = mocker.MagicMock()
+    database.get_extra.return_value = {}
+    database.get_indexes.return_value = [{"column_names": ["ds"]}]
+    database.get_df.return_value = pd.DataFrame({"ds": ["2023-05-01"]})
+
+    spec.latest_partition("table", "schema", database)
+    spec.latest_partition("table", "schema", database)
+    assert database.get_df.call_count == 2
+    cache_manager.data_cache.get.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "columns,rows",
+    [
+        (
+            [
+                ("row_column", "ROW(NESTED_OBJ VARCHAR)"),
+                ("array_column", "ARRAY(BIGINT)"),
+            ],
+            [(["a"], [1, 2, 3]), (["b"], [4, 5, 6]), (None, []), (["c"], None)],
+        ),
+        (
+            [
+                ("int_column", "BIGINT"),
+                (
+                    "array_column",
+                    "ARRAY(ROW(NESTED_ARRAY ARRAY(ROW(NESTED_OBJ VARCHAR))))",
+                ),
+            ],
+            [
+                (1, [[[["a"], ["b"]]], [[["c"], ["d"]]]]),
+                (2, [[[["e"], ["f"]]], [[["g"], ["h"]]]]),
+                (3, None),
+            ],
+        ),
+        (
+            [("row_column", "ROW(NESTED_ROW ROW(NESTED_OBJ VARCHAR))")],
+            [([["a"]],), ([[None]],), ([None],), (None,)],
+        ),
+        (
+            [("a", "ARRAY(BIGINT)"), ("b", "ARRAY(VARCHAR)"), ("c", "VARCHAR")],
+            [([1, 2, 3], ["x"], "p"), ([4], ["y"], "q"), ([5, 6], ["w"], "r")],
+        ),
+        (
+            [("a", "ARRAY(ARRAY(BIGINT))"), ("c", "VARCHAR")],
+            [([[1, 2], [3]], "p"), ([[4]], "q"), ([], "r")],
+        ),
+    ],
+)
+def test_expand_table(
+    mocker: MockerFixture, columns: list[tuple[str, str]], rows: list[tuple[Any, ...]]
+) -> None:
+    """
+    Test that ``expand_table`` matches ``expand_data`` on the same result set.
+    """
+    from superset.dataframe import df_to_records
+    from superset.db_engine_specs.presto import PrestoEngineSpec as spec
+    from superset.result_set import SupersetResultSet
+
+    mocker.patch.dict(
+        "superset.extensions.feature_flag_manager._feature_flags",
+        {"PRESTO_EXPAND_DATA": True},
+        clear=True,
+    )
+
+    result_set = SupersetResultSet(rows, [(name, None) for name, _ in columns], spec)
+    cols: list[ResultSetColumnType] = [
+        {"column_name": name, "name": name, "type": type_, "is_dttm": False}
+        for name, type_ in columns
+    ]
+    expected = spec.expand_data(
+        deepcopy(cols), df_to_records(result_set.to_pandas_df())
+    )
+
+    assert spec.expand_table(deepcopy(cols), result_set.pa_table) == expected
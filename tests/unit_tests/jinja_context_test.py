@@ -22,7 +22,12 @@ import pytest
 from pytest_mock import MockFixture
 
 from superset.datasets.commands.exceptions import DatasetNotFoundError
-from superset.jinja_context import dataset_macro, where_in
+from superset.jinja_context import (
+    BaseTemplateProcessor,
+    compile_template,
+    dataset_macro,
+    where_in,
+)
 
 
 def test_where_in() -> None:
@@ -153,3 +158,36 @@ SELECT 1
 -- end
 ) AS dataset_1"""
     )
+
+
+def test_compile_template_cached() -> None:
+    """
+    Test that compiled templates are reused across calls.
+    """
+    sql = "SELECT * FROM t WHERE c IN {{ values|where_in }}"
+    assert compile_template(sql) is compile_template(sql)
+    assert compile_template(sql) is not compile_template(f"{sql} LIMIT 1")
+
+
+def test_process_template_shared_environment(
+    mocker: MockFixture, app_context: None
+) -> None:
+    """
+    Test that processors share the compiled template but not their context.
+    """
+    database = mocker.MagicMock()
+    sql = "SELECT * FROM t WHERE c IN {{ values|where_in }} AND d = {{ missing }}"
+
+    first = BaseTemplateProcessor(database=database, values=[1, "a"])
+    second = BaseTemplateProcessor(database=database, values=["b"])
+
+    assert first._env is second._env
+    assert (
+        first.process_template(sql)
+        == "SELECT * FROM t WHERE c IN (1, 'a') AND d = {{ missing }}"
+    )
+    assert (
+        second.process_template(sql)
+        == "SELECT * FROM t WHERE c IN ('b') AND d = {{ missing }}"
+    )
+    assert compile_template.cache_info().hits >= 1
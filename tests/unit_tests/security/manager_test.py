@@ -20,7 +20,7 @@ from pytest_mock import MockFixture
 
 from superset.exceptions import SupersetSecurityException
 from superset.extensions import appbuilder
-from superset.security.manager import SupersetSecurityManager
+from superset.security.manager import RLSRule, RLSRulesIndex, SupersetSecurityManager
 
 
 def test_security_manager(app_context: None) -> None:
@@ -88,3 +88,21 @@ def test_raise_for_access_query_default_schema(
         == """You need access to the following tables: `public.ab_user`,
             `all_database_access` or `all_datasource_access` permission"""
     )
+
+
+def test_rls_rules_index() -> None:
+    """
+    Test that regular filters apply to the roles of the rule and base filters to all
+    other roles.
+    """
+    regular = RLSRule(1, "Regular", "a", "a = 1", frozenset({1, 2}), frozenset({10}))
+    base = RLSRule(2, "Base", None, "b = 1", frozenset({1}), frozenset({10, 11}))
+    index = RLSRulesIndex("version", [regular, base])
+
+    assert index.get_filters(10, [1]) == [regular]
+    assert index.get_filters(10, [2, 3]) == [regular, base]
+    assert index.get_filters(10, [3]) == [base]
+    assert index.get_filters(10, []) == [base]
+    assert index.get_filters(11, [1]) == []
+    assert index.get_filters(11, [2]) == [base]
+    assert index.get_filters(12, [2]) == []
@@ -0,0 +1,133 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+import pytest
+from cachelib import SimpleCache
+from celery.exceptions import SoftTimeLimitExceeded
+from flask import Flask
+from pytest_mock import MockFixture
+from sqlalchemy.orm.session import Session
+
+
+def test_refresh_thumbnails(app: Flask, mocker: MockFixture, session: Session) -> None:
+    """
+    Test that only the stale thumbnails are rendered, the most viewed first.
+    """
+    from superset.models.core import Log
+    from superset.models.slice import Slice
+    from superset.tasks.thumbnails import get_screenshot, refresh_thumbnails
+
+    Slice.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    charts = [
+        Slice(id=id_, slice_name="Chart", datasource_type="table", params=f"[{id_}]")
+        for id_ in (1, 2, 3)
+    ]
+    session.add_all(charts)
+    session.add_all(
+        [
+            Log(action="explore", slice_id=2),
+            Log(action="ExploreRestApi.get", slice_id=2),
+            Log(action="ExploreRestApi.get", slice_id=3),
+            # the data requests aren't views
+            *(Log(action="ChartDataRestApi.data", slice_id=1) for _ in range(3)),
+        ]
+    )
+    session.flush()
+
+    cache = SimpleCache()
+    mocker.patch("superset.tasks.thumbnails.thumbnail_cache", cache)
+    cache.set(get_screenshot(charts[2]).cache_key(), b"thumbnail")
+    rendered = []
+
+    def cache_chart_thumbnail(_: Any, chart_id: int, force: bool) -> None:
+        rendered.append(chart_id)
+        if chart_id == 2:
+            cache.set(get_screenshot(session.query(Slice).get(2)).cache_key(), b"")
+
+    mocker.patch(
+        "superset.tasks.thumbnails.cache_chart_thumbnail", cache_chart_thumbnail
+    )
+    stats_logger = mocker.MagicMock()
+    mocker.patch.dict(
+        app.config,
+        {"STATS_LOGGER": stats_logger},
+    )
+
+    counts = refresh_thumbnails.run(dashboards=False, since=None)
+
+    assert rendered == [2, 1]
+    assert counts == {"rendered": 1, "queued": 0, "skipped": 1, "failed": 1}
+    stats_logger.incr.assert_any_call("thumbnail_refresh.chart.rendered")
+    stats_logger.incr.assert_any_call("thumbnail_refresh.chart.skipped")
+    stats_logger.incr.assert_any_call("thumbnail_refresh.chart.failed")
+
+
+def test_refresh_thumbnails_asynchronous(
+    app: Flask, mocker: MockFixture, session: Session
+) -> None:
+    """
+    Test that the thumbnails rendered on the workers are counted as queued, and not
+    in the throughput.
+    """
+    from superset.models.slice import Slice
+    from superset.tasks.thumbnails import refresh_thumbnails
+
+    Slice.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    session.add(Slice(id=1, slice_name="Chart", datasource_type="table"))
+    session.flush()
+
+    mocker.patch("superset.tasks.thumbnails.thumbnail_cache", SimpleCache())
+    cache_chart_thumbnail = mocker.patch(
+        "superset.tasks.thumbnails.cache_chart_thumbnail"
+    )
+    stats_logger = mocker.MagicMock()
+    mocker.patch.dict(app.config, {"STATS_LOGGER": stats_logger})
+
+    counts = refresh_thumbnails.run(dashboards=False, since=None, asynchronous=True)
+
+    cache_chart_thumbnail.delay.assert_called_once_with(None, 1, force=True)
+    assert counts == {"rendered": 0, "queued": 1, "skipped": 0, "failed": 0}
+    stats_logger.incr.assert_called_once_with("thumbnail_refresh.chart.queued")
+    stats_logger.gauge.assert_called_once_with("thumbnail_refresh.throughput", 0)
+
+
+def test_refresh_thumbnails_soft_time_limit(
+    app: Flask, mocker: MockFixture, session: Session
+) -> None:
+    """
+    Test that the task stops at its soft time limit rather than counting failures.
+    """
+    from superset.models.slice import Slice
+    from superset.tasks.thumbnails import refresh_thumbnails
+
+    Slice.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    session.add_all(
+        [Slice(id=id_, slice_name="Chart", datasource_type="table") for id_ in (1, 2)]
+    )
+    session.flush()
+
+    mocker.patch("superset.tasks.thumbnails.thumbnail_cache", SimpleCache())
+    cache_chart_thumbnail = mocker.patch(
+        "superset.tasks.thumbnails.cache_chart_thumbnail",
+        side_effect=SoftTimeLimitExceeded(),
+    )
+    mocker.patch.dict(app.config, {"STATS_LOGGER": mocker.MagicMock()})
+
+    with pytest.raises(SoftTimeLimitExceeded):
+        refresh_thumbnails.run(dashboards=False, since=None)
+    cache_chart_thumbnail.assert_called_once()
@@ -256,3 +256,96 @@ def test_chart_digest(
         )
         with cm:
             assert get_chart_digest(chart=chart) == expected_result
+
+
+def test_chart_digest_data_parts() -> None:
+    """
+    Test that the data parts of the digest change it along with the data.
+    """
+    from datetime import datetime
+    from unittest.mock import MagicMock, PropertyMock
+
+    from superset import app
+    from superset.models.slice import Slice
+    from superset.thumbnails.digest import get_chart_digest
+
+    chart = Slice(**_DEFAULT_CHART_KWARGS)
+    datasource = MagicMock(uid="1__table", changed_on=datetime(2023, 1, 1))
+    query_context = MagicMock(queries=[MagicMock()])
+    query_context.query_cache_key.return_value = "abc"
+    freshness = MagicMock(return_value="v1")
+
+    def digest(data_parts: list[str]) -> str:
+        with patch.dict(
+            app.config,
+            {
+                "THUMBNAIL_EXECUTE_AS": [ExecutorType.SELENIUM],
+                "THUMBNAIL_CHART_DIGEST_FUNC": None,
+                "THUMBNAIL_DIGEST_DATA_PARTS": data_parts,
+                "THUMBNAIL_DATA_FRESHNESS_FUNC": freshness,
+            },
+        ), patch.object(
+            Slice, "datasource", new_callable=PropertyMock, return_value=datasource
+        ), patch.object(
+            Slice, "get_query_context", return_value=query_context
+        ):
+            return get_chart_digest(chart=chart)
+
+    assert digest([]) == "47d852b5c4df211c115905617bb722c1"
+    for data_parts, change in (
+        (["changed_on"], lambda: setattr(datasource, "changed_on", datetime.now())),
+        (
+            ["cache_key"],
+            lambda: setattr(query_context.query_cache_key, "return_value", "def"),
+        ),
+        (["freshness"], lambda: setattr(freshness, "return_value", "v2")),
+    ):
+        before = digest(data_parts)
+        assert before != digest([])
+        change()
+        assert digest(data_parts) != before
+
+
+def test_chart_digest_cache_key_executor() -> None:
+    """
+    Test that the cache keys in the digest are the ones of the executor, whoever
+    requests the digest.
+    """
+    from unittest.mock import MagicMock, PropertyMock
+
+    from flask import g
+
+    from superset import app, security_manager
+    from superset.models.slice import Slice
+    from superset.thumbnails.digest import get_chart_digest
+
+    chart = Slice(**_DEFAULT_CHART_KWARGS)
+    query_context = MagicMock(queries=[MagicMock()])
+    # the cache key depends on the user, e.g. per row level security
+    query_context.query_cache_key.side_effect = lambda query_obj: g.user.username
+    executor = User(id=1, username="admin")
+
+    def digest(user: User) -> str:
+        with patch.dict(
+            app.config,
+            {
+                "THUMBNAIL_EXECUTE_AS": [ExecutorType.SELENIUM],
+                "THUMBNAIL_SELENIUM_USER": "admin",
+                "THUMBNAIL_CHART_DIGEST_FUNC": None,
+                "THUMBNAIL_DIGEST_DATA_PARTS": ["cache_key"],
+            },
+        ), patch.object(
+            Slice, "datasource", new_callable=PropertyMock, return_value=None
+        ), patch.object(
+            Slice, "get_query_context", return_value=query_context
+        ), patch.object(
+            security_manager, "find_user", return_value=executor
+        ) as find_user, override_user(
+            user
+        ):
+            result = get_chart_digest(chart=chart)
+            assert g.user == user
+        find_user.assert_called_once_with("admin")
+        return result
+
+    assert digest(User(id=2, username="viewer")) == digest(executor)
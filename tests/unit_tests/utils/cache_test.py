@@ -49,3 +49,34 @@ def test_memoized_func(mocker: MockerFixture) -> None:
     cache.get.return_value = 43
     result = decorated(self, "public", cache=True)
     assert result == 43
+
+
+def test_generate_cache_key_versions(mocker: MockerFixture) -> None:
+    """
+    Test the versions of the hashes of ``generate_cache_key``.
+    """
+    from datetime import datetime
+
+    from superset.utils.cache import generate_cache_key
+    from superset.utils.core import json_int_dttm_ser
+    from superset.utils.hashing import md5_sha_from_dict
+
+    values = {
+        "datasource": "1__table",
+        "filter": [{"col": "name", "op": "IN", "val": ["a", "é", 1, 1.5, None]}],
+        "changed_on": datetime(2020, 1, 1),
+    }
+    reordered = dict(reversed(values.items()))
+
+    assert generate_cache_key(values, "qc-", version=1) == "qc-" + md5_sha_from_dict(
+        values, default=json_int_dttm_ser
+    )
+
+    key = generate_cache_key(values, "qc-", version=2)
+    assert key.startswith("qc-")
+    assert key != generate_cache_key(values, "qc-", version=1)
+    assert key == generate_cache_key(reordered, "qc-", version=2)
+    assert key != generate_cache_key({**values, "changed_on": None}, "qc-", version=2)
+
+    mocker.patch.dict("superset.utils.cache.config", {"CACHE_KEY_VERSION": 2})
+    assert generate_cache_key(values, "qc-") == key
@@ -21,6 +21,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 from dateutil.relativedelta import relativedelta
+from freezegun import freeze_time
 
 from superset.charts.commands.exceptions import (
     TimeRangeAmbiguousError,
@@ -31,6 +32,7 @@ from superset.utils.date_parser import (
     datetime_eval,
     get_past_or_future,
     get_since_until,
+    parse_datetime_expression,
     parse_human_datetime,
     parse_human_timedelta,
     parse_past_timedelta,
@@ -355,6 +357,49 @@ def test_parse_human_datetime() -> None:
     )
 
 
+@freeze_time("2016-11-07 09:30:10.123456")
+def test_parse_human_datetime_common_forms() -> None:
+    """
+    Test that the fast lane for common forms returns the same as the generic parsing.
+    """
+    values = [
+        "now",
+        "Today",
+        "yesterday",
+        "tomorrow",
+        "2015-04-03",
+        "2015-04-03T10:20",
+        "2015-04-03 10:20:30",
+        "2015-04-03T10:20:30.123456",
+    ]
+    for value in values:
+        with patch(
+            "superset.utils.date_parser._parse_common_datetime", return_value=None
+        ):
+            expected = parse_human_datetime(value)
+        assert parse_human_datetime(value) == expected
+
+    assert parse_human_datetime("now") == datetime(2016, 11, 7, 9, 30, 10)
+    assert parse_human_datetime("tomorrow") == datetime(2016, 11, 8)
+    with pytest.raises(TimeRangeParseFailError):
+        parse_human_datetime("2015-02-30")
+
+
+def test_parse_datetime_expression_cached() -> None:
+    """
+    Test that datetime expressions are parsed once, but evaluated on every call.
+    """
+    expression = "DATEADD(DATETIME('today'), -1, day)"
+    assert parse_datetime_expression(expression) is parse_datetime_expression(
+        expression
+    )
+
+    with freeze_time("2016-11-07 09:30:10"):
+        assert datetime_eval(expression) == datetime(2016, 11, 6)
+    with freeze_time("2020-03-01 09:30:10"):
+        assert datetime_eval(expression) == datetime(2020, 2, 29)
+
+
 def test_date_range_migration() -> None:
     params = '{"time_range": "   8 days     : 2020-03-10T00:00:00"}'
     assert re.search(DateRangeMigration.x_dateunit_in_since, params)
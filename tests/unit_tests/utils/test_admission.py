@@ -0,0 +1,142 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=redefined-outer-name
+import threading
+import time
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from cachelib import SimpleCache
+from flask import Flask
+from pytest_mock import MockFixture
+
+from superset.exceptions import SupersetTimeoutException
+from superset.utils.admission import (
+    admit_query,
+    ConcurrencyLimit,
+    DatabaseAdmission,
+    get_query_priority,
+    query_priority,
+    QueryPriority,
+)
+
+
+@pytest.fixture
+def cache(app: Flask, mocker: MockFixture) -> SimpleCache:
+    cache = SimpleCache()
+    mocker.patch("superset.utils.admission.cache_manager", MagicMock(cache=cache))
+    mocker.patch.dict(
+        app.config,
+        {"DATABASE_QUERY_QUEUE_POLL_INTERVAL": 0.01, "STATS_LOGGER": MagicMock()},
+    )
+    return cache
+
+
+def get_database(**concurrency_limit: Any) -> MagicMock:
+    database = MagicMock(id=1)
+    database.get_extra.return_value = {"concurrency_limit": concurrency_limit}
+    return database
+
+
+def test_admit_query_without_limit(cache: SimpleCache) -> None:
+    """
+    Test that the queries of the databases without a limit don't take any slot.
+    """
+    with admit_query(get_database()):
+        assert not cache.get("database_query_slot_1_0")
+
+
+def test_admit_query_timeout(app: Flask, cache: SimpleCache) -> None:
+    """
+    Test that the queries waiting for too long fail with a clear error.
+    """
+    database = get_database(max_queries=1, queue_timeout=0.05)
+    with admit_query(database):
+        assert cache.get("database_query_slot_1_0")
+        with pytest.raises(SupersetTimeoutException) as excinfo:
+            with admit_query(database):
+                pass
+
+    assert "could not start within 0.05 seconds" in excinfo.value.error.message
+    assert not cache.get("database_query_slot_1_0")
+    app.config["STATS_LOGGER"].incr.assert_called_once_with(
+        "database.1.query_queue_timeout"
+    )
+
+
+def test_admission_order(app: Flask, cache: SimpleCache) -> None:
+    """
+    Test that interactive queries go first, then the ones of the users and
+    dashboards with the fewest queries running.
+    """
+    admission = DatabaseAdmission(2)
+    limit = ConcurrencyLimit(max_queries=2, max_background_queries=1, queue_timeout=5)
+    admitted = []
+
+    def run(name: str, priority: QueryPriority, user_id: int) -> None:
+        with app.app_context():
+            with admission.admit(limit, priority, (user_id, None)):
+                admitted.append(name)
+
+    threads = [
+        threading.Thread(target=run, args=args)
+        for args in (
+            ("background", QueryPriority.BACKGROUND, 2),
+            ("busy user", QueryPriority.INTERACTIVE, 1),
+            ("idle user", QueryPriority.INTERACTIVE, 2),
+        )
+    ]
+    with admission.admit(limit, QueryPriority.INTERACTIVE, (1, None)):
+        with admission.admit(limit, QueryPriority.INTERACTIVE, (3, None)):
+            for thread in threads:
+                thread.start()
+            while len(admission.waiters) < len(threads):
+                time.sleep(0.01)
+        for thread in threads:
+            thread.join()
+
+    assert admitted == ["idle user", "busy user", "background"]
+
+
+def test_background_slots(cache: SimpleCache) -> None:
+    """
+    Test that background queries leave the last slots to interactive queries.
+    """
+    admission = DatabaseAdmission(3)
+    limit = ConcurrencyLimit(max_queries=2, max_background_queries=1, queue_timeout=0)
+
+    with admission.admit(limit, QueryPriority.BACKGROUND, (1, None)):
+        assert cache.get("database_query_slot_3_0")
+        with pytest.raises(SupersetTimeoutException):
+            with admission.admit(limit, QueryPriority.BACKGROUND, (2, None)):
+                pass
+        with admission.admit(limit, QueryPriority.INTERACTIVE, (2, None)):
+            assert cache.get("database_query_slot_3_1")
+
+
+def test_query_priority(app: Flask) -> None:
+    """
+    Test that queries are background ones when set so or requested by the header.
+    """
+    assert get_query_priority() == QueryPriority.INTERACTIVE
+    with query_priority(QueryPriority.BACKGROUND):
+        assert get_query_priority() == QueryPriority.BACKGROUND
+    assert get_query_priority() == QueryPriority.INTERACTIVE
+
+    with app.test_request_context(headers={"X-Superset-Query-Priority": "background"}):
+        assert get_query_priority() == QueryPriority.BACKGROUND
@@ -15,7 +15,9 @@
 # specific language governing permissions and limitations
 # under the License.
 import os
+from io import BytesIO
 from typing import Any, Optional
+from zipfile import ZipFile
 
 import pytest
 
@@ -25,6 +27,7 @@ from superset.utils.core import (
     parse_boolean_string,
     QueryObjectFilterClause,
     remove_extra_adhoc_filters,
+    stream_zip,
 )
 
 ADHOC_FILTER: QueryObjectFilterClause = {
@@ -171,3 +174,14 @@ def test_other_values():
     assert cast_to_boolean([]) is False
     assert cast_to_boolean({}) is False
     assert cast_to_boolean(object()) is False
+
+
+def test_stream_zip():
+    """
+    Test that the ZIP file is streamed one file at a time.
+    """
+    files = {"bundle/metadata.yaml": b"version: 1.0.0\n", "bundle/a.yaml": b"a: 1\n"}
+    chunks = list(stream_zip(files.items()))
+    assert len(chunks) == len(files) + 1
+    with ZipFile(BytesIO(b"".join(chunks))) as bundle:
+        assert {name: bundle.read(name) for name in bundle.namelist()} == files
@@ -0,0 +1,82 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from flask import Flask
+from pytest_mock import MockFixture
+
+from superset.utils.query_memo import memoized, query_memo, query_obj_key
+
+
+def test_memoized_outside_context(app_context: None) -> None:
+    """
+    Test that values aren't memoized outside of a ``query_memo`` context.
+    """
+    func = MagicMock(side_effect=[1, 2])
+    assert memoized("key", func) == 1
+    assert memoized("key", func) == 2
+
+
+def test_memoized(app: Flask, app_context: None, mocker: MockFixture) -> None:
+    """
+    Test that values are built once per ``query_memo`` context.
+    """
+    stats_logger = mocker.patch.dict(app.config, {"STATS_LOGGER": MagicMock()})[
+        "STATS_LOGGER"
+    ]
+    func = MagicMock(side_effect=[1, 2, 3])
+    with query_memo("build_time"):
+        assert memoized("key", func) == 1
+        with query_memo():
+            assert memoized("key", func) == 1
+        assert memoized("other", func) == 2
+    assert func.call_count == 2
+    stats_logger.timing.assert_called_once()
+    assert stats_logger.timing.call_args[0][0] == "build_time"
+
+    with query_memo():
+        assert memoized("key", func) == 3
+
+
+def test_query_memo_decorator(app_context: None) -> None:
+    """
+    Test that ``query_memo`` can decorate functions.
+    """
+    func = MagicMock(side_effect=[1, 2])
+
+    @query_memo()
+    def build() -> int:
+        return memoized("key", func) + memoized("key", func)
+
+    assert build() == 2
+    assert build() == 4
+
+
+def test_query_obj_key() -> None:
+    """
+    Test that query objects are keyed by their content.
+    """
+    query_obj = {
+        "columns": ["a"],
+        "filter": [{"col": "b", "op": "==", "val": 1}],
+        "from_dttm": datetime(2023, 1, 1),
+    }
+    assert query_obj_key(query_obj) == query_obj_key(dict(reversed(query_obj.items())))
+    assert query_obj_key(query_obj) != query_obj_key(
+        {**query_obj, "from_dttm": datetime(2023, 1, 2)}
+    )
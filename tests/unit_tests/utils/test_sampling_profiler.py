@@ -0,0 +1,148 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import threading
+from collections.abc import Iterator
+
+import pytest
+from flask_caching.backends import SimpleCache
+from pytest_mock import MockFixture
+
+from superset.utils.profiler import (
+    get_collapsed_stacks,
+    get_sampling_profiles,
+    SamplingProfiler,
+)
+
+
+@pytest.fixture
+def waiting_thread() -> Iterator[threading.Thread]:
+    done = threading.Event()
+
+    def wait_for_query() -> None:
+        done.wait()
+
+    thread = threading.Thread(target=wait_for_query)
+    thread.start()
+    yield thread
+    done.set()
+    thread.join()
+
+
+def test_sample(waiting_thread: threading.Thread) -> None:
+    """
+    Test that the stacks of the labelled threads only are aggregated per label.
+    """
+    profiler = SamplingProfiler()
+    profiler.labels[waiting_thread.ident] = "GET /api/v1/chart/data"  # type: ignore
+    profiler.sample()
+    profiler.sample()
+
+    assert list(profiler.stacks) == ["GET /api/v1/chart/data"]
+    [(stack, count)] = profiler.stacks["GET /api/v1/chart/data"].items()
+    assert count == 2
+    frames = stack.split(";")
+    assert frames[0].startswith("_bootstrap (")
+    assert any(frame.startswith("wait_for_query (") for frame in frames)
+    assert profiler.samples == 2
+
+    profiler.max_depth = 2
+    profiler.stacks.clear()
+    profiler.sample()
+    [stack] = profiler.stacks["GET /api/v1/chart/data"]
+    assert len(stack.split(";")) == 2
+
+
+def test_flush(waiting_thread: threading.Thread) -> None:
+    """
+    Test that the profiles are written to the results backend and listed in the index.
+    """
+    results_backend = SimpleCache()
+    profiler = SamplingProfiler(max_windows=2)
+    profiler.results_backend = results_backend
+
+    # nothing is written without samples
+    profiler.flush()
+    assert get_sampling_profiles(results_backend, profiler.max_windows) == []
+
+    for label in ("GET /api/v1/chart/data", "task load", "task load"):
+        profiler.labels[waiting_thread.ident] = label  # type: ignore
+        profiler.sample()
+        profiler.flush()
+
+    profiles = get_sampling_profiles(results_backend, profiler.max_windows)
+    assert len(profiles) == 2
+    assert [profile["labels"] for profile in profiles] == [{"task load": 1}] * 2
+
+    keys = [profile["key"] for profile in profiles]
+    collapsed = get_collapsed_stacks(results_backend, keys)
+    [line] = collapsed.splitlines()  # type: ignore
+    stack, count = line.rsplit(" ", 1)
+    assert "wait_for_query (" in stack
+    assert count == "2"
+
+    assert get_collapsed_stacks(results_backend, keys, "GET /api/v1/chart/data") == ""
+    assert get_collapsed_stacks(results_backend, ["sampling_profile_missing"]) is None
+    assert get_collapsed_stacks(results_backend, ["other_key"]) is None
+    assert get_collapsed_stacks(results_backend, ["sampling_profile_index_0"]) is None
+
+
+def test_flush_processes(mocker: MockFixture) -> None:
+    """
+    Test that the profiles of several processes are all listed, without the
+    processes reading and rewriting a shared index.
+    """
+    results_backend = SimpleCache()
+    get = mocker.spy(results_backend, "get")
+    profilers = [SamplingProfiler(max_windows=3) for _ in range(2)]
+    for profiler in profilers:
+        profiler.results_backend = results_backend
+
+    for idx in range(4):
+        profiler = profilers[idx % 2]
+        profiler.stacks[f"task {idx}"]["main (app.py:1)"] = 1
+        profiler.flush()
+
+    # only the sequence is read, which e.g. Redis increments atomically instead
+    assert {call.args for call in get.call_args_list} == {
+        ("sampling_profile_sequence",)
+    }
+    profiles = get_sampling_profiles(results_backend, 3)
+    assert [list(profile["labels"]) for profile in profiles] == [
+        ["task 1"],
+        ["task 2"],
+        ["task 3"],
+    ]
+
+
+def test_cpu_budget(mocker: MockFixture) -> None:
+    """
+    Test that sampling slows down to stay within the CPU budget.
+    """
+    profiler = SamplingProfiler(interval=0.01, cpu_budget=0.01)
+    mocker.patch.object(profiler, "sample")
+    mocker.patch(
+        "superset.utils.profiler.time.thread_time",
+        side_effect=[0.0, 0.00005, 1.0, 1.002],
+    )
+    wait = mocker.patch.object(profiler._stop, "wait", side_effect=[False, False, True])
+
+    profiler._run()
+
+    # 50 µs samples fit within the budget, but 2 ms ones need 200 ms between them
+    assert [call.args[0] for call in wait.call_args_list] == pytest.approx(
+        [0.01, 0.01, 0.2]
+    )
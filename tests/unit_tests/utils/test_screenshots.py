@@ -0,0 +1,81 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel
+
+from io import BytesIO
+from unittest.mock import MagicMock
+
+from flask import Flask
+from PIL import Image
+from pytest_mock import MockFixture
+from werkzeug.datastructures import MIMEAccept
+
+
+def test_compute_and_cache(mocker: MockFixture, app: Flask) -> None:
+    """
+    Test that all the sizes and formats of thumbnails are computed from one capture.
+    """
+    from superset.utils.screenshots import ChartScreenshot
+
+    mocker.patch.dict(
+        app.config,
+        {
+            "THUMBNAIL_SIZES": {"chart": [(400, 300), (800, 600)]},
+            "THUMBNAIL_IMAGE_FORMATS": ["webp", "unknown"],
+        },
+    )
+    capture = BytesIO()
+    Image.new("RGB", (800, 600), "red").save(capture, "png")
+    with app.test_request_context():
+        screenshot = ChartScreenshot("http://localhost/chart/", "digest")
+        get_screenshot = mocker.patch.object(
+            screenshot, "get_screenshot", return_value=capture.getvalue()
+        )
+        cache = MagicMock()
+        payload = screenshot.compute_and_cache(
+            cache=cache, window_size=(800, 600), thumb_size=(200, 150)
+        )
+
+    get_screenshot.assert_called_once()
+    [thumbnails], _ = cache.set_many.call_args
+    assert payload == thumbnails[screenshot.cache_key((800, 600), (200, 150))]
+    expected = {
+        screenshot.cache_key((800, 600), size, image_format): (size, image_format)
+        for size in [(200, 150), (400, 300), (800, 600)]
+        for image_format in ["png", "webp"]
+    }
+    assert set(thumbnails) == set(expected)
+    for cache_key, (size, image_format) in expected.items():
+        image = Image.open(BytesIO(thumbnails[cache_key]))
+        assert (image.size, image.format) == (size, image_format.upper())
+    assert thumbnails[screenshot.cache_key((800, 600), (800, 600))] == (
+        capture.getvalue()
+    )
+
+
+def test_get_image_formats(mocker: MockFixture, app: Flask) -> None:
+    """
+    Test that the formats explicitly accepted by the client are preferred to PNG.
+    """
+    from superset.utils.screenshots import get_image_formats
+
+    mocker.patch.dict(app.config, {"THUMBNAIL_IMAGE_FORMATS": ["avif", "webp"]})
+    with app.app_context():
+        assert get_image_formats(
+            MIMEAccept([("image/webp", 1), ("image/png", 1), ("*/*", 0.8)])
+        ) == ["webp", "png"]
+        assert get_image_formats(MIMEAccept([("*/*", 1)])) == ["png"]
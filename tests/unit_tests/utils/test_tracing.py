@@ -0,0 +1,181 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from flask import Flask
+from pytest_mock import MockFixture
+
+from superset.utils.tracing import (
+    BaseSpanExporter,
+    OTLPJsonSpanExporter,
+    span,
+    Span,
+    StatsdSpanExporter,
+    trace,
+    traced,
+    with_current_span,
+)
+
+
+class ListSpanExporter(BaseSpanExporter):
+    def __init__(self) -> None:
+        self.traces: list[list[Span]] = []
+
+    def export(self, spans: list[Span]) -> None:
+        self.traces.append(spans)
+
+
+@pytest.fixture
+def exporter(app: Flask, mocker: MockFixture) -> ListSpanExporter:
+    exporter = ListSpanExporter()
+    mocker.patch.dict(app.config, {"TRACING_SPAN_EXPORTERS": [exporter]})
+    return exporter
+
+
+def test_span_without_trace(app_context: None) -> None:
+    """
+    Test that spans are no-ops outside of a trace.
+    """
+    with span("step") as span_:
+        assert span_ is None
+
+    assert traced("step")(lambda: 1)() == 1
+
+
+def test_trace_without_exporters(app_context: None) -> None:
+    """
+    Test that no trace is started without exporters.
+    """
+    with trace("task") as trace_:
+        assert trace_ is None
+        with span("step") as span_:
+            assert span_ is None
+
+
+def test_trace(app_context: None, exporter: ListSpanExporter) -> None:
+    """
+    Test that spans are nested and exported at the end of the trace.
+    """
+
+    @traced("build")
+    def build() -> int:
+        with span("compile", dialect="sqlite"):
+            pass
+        return 1
+
+    with trace("task", query_id=1):
+        with span("load"):
+            assert build() == 1
+        with pytest.raises(ValueError):
+            with span("execute"):
+                raise ValueError("failed")
+
+    [spans] = exporter.traces
+    assert [span_.name for span_ in spans] == [
+        "task",
+        "load",
+        "build",
+        "compile",
+        "execute",
+    ]
+    task, load, build_, compile_, execute = spans
+    assert task.parent_id is None
+    assert task.attributes == {"query_id": 1}
+    assert load.parent_id == task.span_id
+    assert build_.parent_id == load.span_id
+    assert compile_.parent_id == build_.span_id
+    assert compile_.attributes == {"dialect": "sqlite"}
+    assert execute.parent_id == task.span_id
+    assert execute.error == "ValueError: failed"
+    assert {span_.trace_id for span_ in spans} == {task.trace_id}
+    assert all(span_.end_time_ns >= span_.start_time_ns for span_ in spans)
+
+
+def test_with_current_span(app: Flask, exporter: ListSpanExporter) -> None:
+    """
+    Test that spans recorded in other threads join the trace.
+    """
+
+    def query() -> None:
+        with span("query"):
+            pass
+
+    with trace("request"):
+        with span("queries"):
+            query = with_current_span(query)
+
+            def run() -> None:
+                with app.app_context():
+                    query()
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                for future in [executor.submit(run) for _ in range(2)]:
+                    future.result()
+
+    [spans] = exporter.traces
+    _, queries, *query_spans = spans
+    assert [span_.parent_id for span_ in query_spans] == [queries.span_id] * 2
+
+
+def test_statsd_span_exporter(app_context: None) -> None:
+    """
+    Test that the duration of the spans but the root one is sent to the stats logger.
+    """
+    stats_logger = MagicMock()
+    spans = [
+        Span("GET /api/v1/chart/data", "trace", start_time_ns=0, end_time_ns=3000000),
+        Span("db.execute", "trace", "root", start_time_ns=0, end_time_ns=2000000),
+    ]
+    StatsdSpanExporter(stats_logger).export(spans)
+    stats_logger.timing.assert_called_once_with("span.db.execute", 2.0)
+
+
+def test_otlp_json_span_exporter() -> None:
+    """
+    Test the OTLP JSON encoding of the spans.
+    """
+    spans = [
+        Span("request", "t" * 32, span_id="a" * 16, start_time_ns=1, end_time_ns=3),
+        Span(
+            "db.execute",
+            "t" * 32,
+            "a" * 16,
+            span_id="b" * 16,
+            start_time_ns=1,
+            end_time_ns=2,
+            attributes={"rows": 10},
+            error="ValueError: failed",
+        ),
+    ]
+    [resource_spans] = OTLPJsonSpanExporter().encode(spans)["resourceSpans"]
+    assert resource_spans["resource"]["attributes"] == [
+        {"key": "service.name", "value": {"stringValue": "superset"}}
+    ]
+    [scope_spans] = resource_spans["scopeSpans"]
+    assert scope_spans["spans"][1] == {
+        "traceId": "t" * 32,
+        "spanId": "b" * 16,
+        "parentSpanId": "a" * 16,
+        "name": "db.execute",
+        "kind": 1,
+        "startTimeUnixNano": "1",
+        "endTimeUnixNano": "2",
+        "attributes": [{"key": "rows", "value": {"intValue": "10"}}],
+        "status": {"code": 2, "message": "ValueError: failed"},
+    }